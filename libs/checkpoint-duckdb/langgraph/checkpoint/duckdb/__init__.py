@@ -1,6 +1,6 @@
 import threading
 from contextlib import contextmanager
-from typing import Any, Iterator, Optional, Sequence
+from typing import Any, Iterator, List, Optional, Sequence
 
 from langchain_core.runnables import RunnableConfig
 
@@ -10,7 +10,9 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
+    PruneStrategy,
     get_checkpoint_id,
 )
 from langgraph.checkpoint.duckdb.base import BaseDuckDBSaver
@@ -155,6 +157,64 @@ class DuckDBSaver(BaseDuckDBSaver):
                     self._load_writes(pending_writes),
                 )
 
+    def list_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints from the database.
+
+        Like `list`, but only the metadata of the checkpoints is read from the database,
+        not the checkpoints, their channel values and their pending writes. Use `get_tuple` to load a full checkpoint.
+
+        Args:
+            config (RunnableConfig): The config to use for listing the checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata. Defaults to None.
+            before (Optional[RunnableConfig]): If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
+            limit (Optional[int]): The maximum number of checkpoints to return. Defaults to None.
+
+        Yields:
+            Iterator[CheckpointMetadataTuple]: An iterator of checkpoint metadata tuples.
+        """
+        where, args = self._search_where(config, filter, before)
+        query = self.SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        with self._cursor() as cur:
+            cur.execute(query, args)
+            for value in cur.fetchall():
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    parent_checkpoint_id,
+                    metadata,
+                ) = value
+                yield CheckpointMetadataTuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    self._load_metadata(metadata),
+                    (
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
+                        }
+                        if parent_checkpoint_id
+                        else None
+                    ),
+                )
+
     def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database.
 
@@ -247,6 +307,72 @@ class DuckDBSaver(BaseDuckDBSaver):
                     self._load_writes(pending_writes),
                 )
 
+    def get_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Get the checkpoint tuples of several configs from the database.
+
+        Like `get_tuple` for each config, but the checkpoints of all configs are
+        read from the DuckDB database with a single query.
+
+        Args:
+            configs (Sequence[RunnableConfig]): The configs to use for retrieving the checkpoints.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The retrieved checkpoint tuples, in the order of the configs, with None for each checkpoint not found.
+        """  # noqa
+        if not configs:
+            return []
+        where, args = self._get_tuples_where(configs)
+        with self._cursor() as cur:
+            cur.execute(self.SELECT_SQL + where, args)
+            rows = {(row[0], row[2], row[3]): row for row in cur.fetchall()}
+
+        keys = self._requested_checkpoints(configs, rows.keys())
+        tuples: dict[tuple[str, str, str], CheckpointTuple] = {}
+        for key in keys:
+            if key is None or key in tuples:
+                continue
+            (
+                thread_id,
+                checkpoint,
+                checkpoint_ns,
+                checkpoint_id,
+                parent_checkpoint_id,
+                metadata,
+                channel_values,
+                pending_writes,
+                pending_sends,
+            ) = rows[key]
+            tuples[key] = CheckpointTuple(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint_id,
+                    }
+                },
+                self._load_checkpoint(
+                    checkpoint,
+                    channel_values,
+                    pending_sends,
+                ),
+                self._load_metadata(metadata),
+                (
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": parent_checkpoint_id,
+                        }
+                    }
+                    if parent_checkpoint_id
+                    else None
+                ),
+                self._load_writes(pending_writes),
+            )
+        return [tuples[key] if key else None for key in keys]
+
     def put(
         self,
         config: RunnableConfig,
@@ -347,6 +473,43 @@ class DuckDBSaver(BaseDuckDBSaver):
                 ),
             )
 
+    def put_writes_many(
+        self, writes: Sequence[tuple[RunnableConfig, Sequence[tuple[str, Any]], str]]
+    ) -> None:
+        """Store the intermediate writes of several tasks at once.
+
+        The writes are saved to the DuckDB database with a single cursor.
+
+        Args:
+            writes (Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]):
+                (config, writes, task_id) tuples, as passed to `put_writes`.
+        """
+        upserts, inserts = self._dump_writes_many(writes)
+        with self._cursor() as cur:
+            if upserts:
+                cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upserts)
+            if inserts:
+                cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, inserts)
+
+    def prune(self, thread_ids: Sequence[str], *, strategy: PruneStrategy) -> None:
+        """Delete old checkpoints of the given threads from the database.
+
+        The pending writes of deleted checkpoints, and any channel values no
+        longer referenced by a remaining checkpoint, are deleted too.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+        """
+        checkpoints_args, writes_args, blobs_args = self._prune_args(
+            thread_ids, strategy
+        )
+        with self._cursor() as cur:
+            cur.execute(self.PRUNE_CHECKPOINTS_SQL, checkpoints_args)
+            cur.execute(self.PRUNE_CHECKPOINT_WRITES_SQL, writes_args)
+            cur.execute(self.PRUNE_CHECKPOINT_BLOBS_SQL, blobs_args)
+
     @contextmanager
     def _cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
         with self.lock, self.conn.cursor() as cur:
@@ -1,6 +1,15 @@
 import asyncio
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Iterator, Optional, Sequence
+from typing import (
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    cast,
+)
 
 from langchain_core.runnables import RunnableConfig
 
@@ -10,7 +19,9 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
+    PruneStrategy,
     get_checkpoint_id,
 )
 from langgraph.checkpoint.duckdb.base import BaseDuckDBSaver
@@ -150,6 +161,65 @@ class AsyncDuckDBSaver(BaseDuckDBSaver):
                     await asyncio.to_thread(self._load_writes, pending_writes),
                 )
 
+    async def alist_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints from the database asynchronously.
+
+        Like `alist`, but only the metadata of the checkpoints is read from the database,
+        not the checkpoints, their channel values and their pending writes. Use `aget_tuple` to load a full checkpoint.
+
+        Args:
+            config (Optional[RunnableConfig]): Base configuration for filtering checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata.
+            before (Optional[RunnableConfig]): If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            AsyncIterator[CheckpointMetadataTuple]: An asynchronous iterator of matching checkpoint metadata tuples.
+        """
+        where, args = self._search_where(config, filter, before)
+        query = self.SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        async with self._cursor() as cur:
+            await asyncio.to_thread(cur.execute, query, args)
+            results = await asyncio.to_thread(cur.fetchall)
+            for value in results:
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    parent_checkpoint_id,
+                    metadata,
+                ) = value
+                yield CheckpointMetadataTuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    self._load_metadata(metadata),
+                    (
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
+                        }
+                        if parent_checkpoint_id
+                        else None
+                    ),
+                )
+
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -223,6 +293,76 @@ class AsyncDuckDBSaver(BaseDuckDBSaver):
                     await asyncio.to_thread(self._load_writes, pending_writes),
                 )
 
+    async def aget_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Get the checkpoint tuples of several configs from the database asynchronously.
+
+        Like `aget_tuple` for each config, but the checkpoints of all configs are
+        read from the DuckDB database with a single query.
+
+        Args:
+            configs (Sequence[RunnableConfig]): The configs to use for retrieving the checkpoints.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The retrieved checkpoint tuples, in the order of the configs, with None for each checkpoint not found.
+        """  # noqa
+        if not configs:
+            return []
+        where, args = self._get_tuples_where(configs)
+        async with self._cursor() as cur:
+            await asyncio.to_thread(cur.execute, self.SELECT_SQL + where, args)
+            rows = {
+                (row[0], row[2], row[3]): row
+                for row in await asyncio.to_thread(cur.fetchall)
+            }
+
+        keys = self._requested_checkpoints(configs, rows.keys())
+        tuples: dict[tuple[str, str, str], CheckpointTuple] = {}
+        for key in keys:
+            if key is None or key in tuples:
+                continue
+            (
+                thread_id,
+                checkpoint,
+                checkpoint_ns,
+                checkpoint_id,
+                parent_checkpoint_id,
+                metadata,
+                channel_values,
+                pending_writes,
+                pending_sends,
+            ) = rows[key]
+            tuples[key] = CheckpointTuple(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint_id,
+                    }
+                },
+                await asyncio.to_thread(
+                    self._load_checkpoint,
+                    checkpoint,
+                    channel_values,
+                    pending_sends,
+                ),
+                self._load_metadata(metadata),
+                (
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": parent_checkpoint_id,
+                        }
+                    }
+                    if parent_checkpoint_id
+                    else None
+                ),
+                await asyncio.to_thread(self._load_writes, pending_writes),
+            )
+        return [tuples[key] if key else None for key in keys]
+
     async def aput(
         self,
         config: RunnableConfig,
@@ -318,6 +458,55 @@ class AsyncDuckDBSaver(BaseDuckDBSaver):
         async with self._cursor() as cur:
             await asyncio.to_thread(cur.executemany, query, params)
 
+    async def aput_writes_many(
+        self, writes: Sequence[tuple[RunnableConfig, Sequence[tuple[str, Any]], str]]
+    ) -> None:
+        """Store the intermediate writes of several tasks at once, asynchronously.
+
+        The writes are saved to the database with a single cursor.
+
+        Args:
+            writes (Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]):
+                (config, writes, task_id) tuples, as passed to `aput_writes`.
+        """
+        upserts, inserts = await asyncio.to_thread(self._dump_writes_many, writes)
+        async with self._cursor() as cur:
+            if upserts:
+                await asyncio.to_thread(
+                    cur.executemany, self.UPSERT_CHECKPOINT_WRITES_SQL, upserts
+                )
+            if inserts:
+                await asyncio.to_thread(
+                    cur.executemany, self.INSERT_CHECKPOINT_WRITES_SQL, inserts
+                )
+
+    async def aprune(
+        self, thread_ids: Sequence[str], *, strategy: PruneStrategy
+    ) -> None:
+        """Delete old checkpoints of the given threads from the database asynchronously.
+
+        The pending writes of deleted checkpoints, and any channel values no
+        longer referenced by a remaining checkpoint, are deleted too.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+        """
+        checkpoints_args, writes_args, blobs_args = self._prune_args(
+            thread_ids, strategy
+        )
+        async with self._cursor() as cur:
+            await asyncio.to_thread(
+                cur.execute, self.PRUNE_CHECKPOINTS_SQL, checkpoints_args
+            )
+            await asyncio.to_thread(
+                cur.execute, self.PRUNE_CHECKPOINT_WRITES_SQL, writes_args
+            )
+            await asyncio.to_thread(
+                cur.execute, self.PRUNE_CHECKPOINT_BLOBS_SQL, blobs_args
+            )
+
     @asynccontextmanager
     async def _cursor(self) -> AsyncIterator[duckdb.DuckDBPyConnection]:
         async with self.lock:
@@ -350,7 +539,36 @@ class AsyncDuckDBSaver(BaseDuckDBSaver):
         while True:
             try:
                 yield asyncio.run_coroutine_threadsafe(
-                    anext(aiter_),
+                    cast(Coroutine[Any, Any, CheckpointTuple], anext(aiter_)),
+                    self.loop,
+                ).result()
+            except StopAsyncIteration:
+                break
+
+    def list_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints from the database.
+
+        Args:
+            config (Optional[RunnableConfig]): Base configuration for filtering checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata.
+            before (Optional[RunnableConfig]): If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            Iterator[CheckpointMetadataTuple]: An iterator of matching checkpoint metadata tuples.
+        """
+        aiter_ = self.alist_metadata(config, filter=filter, before=before, limit=limit)
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(
+                    cast(Coroutine[Any, Any, CheckpointMetadataTuple], anext(aiter_)),
                     self.loop,
                 ).result()
             except StopAsyncIteration:
@@ -386,6 +604,21 @@ class AsyncDuckDBSaver(BaseDuckDBSaver):
             self.aget_tuple(config), self.loop
         ).result()
 
+    def get_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Get the checkpoint tuples of several configs from the database.
+
+        Args:
+            configs (Sequence[RunnableConfig]): The configs to use for retrieving the checkpoints.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The retrieved checkpoint tuples, in the order of the configs, with None for each checkpoint not found.
+        """  # noqa
+        return asyncio.run_coroutine_threadsafe(
+            self.aget_tuples(configs), self.loop
+        ).result()
+
     def put(
         self,
         config: RunnableConfig,
@@ -429,3 +662,28 @@ class AsyncDuckDBSaver(BaseDuckDBSaver):
         return asyncio.run_coroutine_threadsafe(
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
+
+    def put_writes_many(
+        self, writes: Sequence[tuple[RunnableConfig, Sequence[tuple[str, Any]], str]]
+    ) -> None:
+        """Store the intermediate writes of several tasks at once.
+
+        Args:
+            writes (Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]):
+                (config, writes, task_id) tuples, as passed to `put_writes`.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_many(writes), self.loop
+        ).result()
+
+    def prune(self, thread_ids: Sequence[str], *, strategy: PruneStrategy) -> None:
+        """Delete old checkpoints of the given threads from the database.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aprune(thread_ids, strategy=strategy), self.loop
+        ).result()
@@ -1,6 +1,6 @@
 import json
 import random
-from typing import Any, List, Optional, Sequence, Tuple, cast
+from typing import Any, Collection, List, Optional, Sequence, Tuple, cast
 
 from langchain_core.runnables import RunnableConfig
 
@@ -10,6 +10,8 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    LazyChannelValues,
+    PruneStrategy,
     get_checkpoint_id,
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
@@ -94,6 +96,15 @@ select
     ) as pending_sends
 from checkpoints """
 
+SELECT_METADATA_SQL = """
+select
+    thread_id,
+    checkpoint_ns,
+    checkpoint_id,
+    parent_checkpoint_id,
+    metadata
+from checkpoints """
+
 UPSERT_CHECKPOINT_BLOBS_SQL = """
     INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob)
     VALUES (?, ?, ?, ?, ?, ?)
@@ -124,14 +135,67 @@ INSERT_CHECKPOINT_WRITES_SQL = """
     ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id, task_id, idx) DO NOTHING
 """
 
+PRUNE_CHECKPOINTS_SQL = """
+    delete from checkpoints
+    where list_contains(?, thread_id)
+        and checkpoint_id in (
+            select ranked.checkpoint_id
+            from (
+                select
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    cast(json_extract_string(checkpoint, '$.ts') as timestamptz) as ts,
+                    row_number() over (
+                        partition by thread_id, checkpoint_ns
+                        order by checkpoint_id desc
+                    ) as rank
+                from checkpoints
+                where list_contains(?, thread_id)
+            ) ranked
+            where ranked.thread_id = checkpoints.thread_id
+                and ranked.checkpoint_ns = checkpoints.checkpoint_ns
+                and ranked.rank > ?
+                and (?::timestamptz is null or ranked.ts < ?::timestamptz)
+        )
+"""
+
+PRUNE_CHECKPOINT_WRITES_SQL = """
+    delete from checkpoint_writes
+    where list_contains(?, thread_id)
+        and not exists (
+            select 1
+            from checkpoints c
+            where c.thread_id = checkpoint_writes.thread_id
+                and c.checkpoint_ns = checkpoint_writes.checkpoint_ns
+                and checkpoint_writes.checkpoint_id in (c.checkpoint_id, c.parent_checkpoint_id)
+        )
+"""
+
+PRUNE_CHECKPOINT_BLOBS_SQL = """
+    delete from checkpoint_blobs
+    where list_contains(?, thread_id)
+        and not exists (
+            select 1
+            from checkpoints c
+            where c.thread_id = checkpoint_blobs.thread_id
+                and c.checkpoint_ns = checkpoint_blobs.checkpoint_ns
+                and json_extract_string(c.checkpoint, '$.channel_versions.' || checkpoint_blobs.channel) = checkpoint_blobs.version
+        )
+"""
+
 
 class BaseDuckDBSaver(BaseCheckpointSaver[str]):
     SELECT_SQL = SELECT_SQL
+    SELECT_METADATA_SQL = SELECT_METADATA_SQL
     MIGRATIONS = MIGRATIONS
     UPSERT_CHECKPOINT_BLOBS_SQL = UPSERT_CHECKPOINT_BLOBS_SQL
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
     UPSERT_CHECKPOINT_WRITES_SQL = UPSERT_CHECKPOINT_WRITES_SQL
     INSERT_CHECKPOINT_WRITES_SQL = INSERT_CHECKPOINT_WRITES_SQL
+    PRUNE_CHECKPOINTS_SQL = PRUNE_CHECKPOINTS_SQL
+    PRUNE_CHECKPOINT_WRITES_SQL = PRUNE_CHECKPOINT_WRITES_SQL
+    PRUNE_CHECKPOINT_BLOBS_SQL = PRUNE_CHECKPOINT_BLOBS_SQL
 
     jsonplus_serde = JsonPlusSerializer()
 
@@ -158,11 +222,15 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
     ) -> dict[str, Any]:
         if not blob_values:
             return {}
-        return {
-            k.decode(): self.serde.loads_typed((t.decode(), v))
-            for k, t, v in blob_values
-            if t.decode() != "empty"
-        }
+        # values are deserialized when first read
+        return LazyChannelValues(
+            self.serde,
+            {
+                k.decode(): (t.decode(), v)
+                for k, t, v in blob_values
+                if t.decode() != "empty"
+            },
+        )
 
     def _dump_blobs(
         self,
@@ -189,6 +257,18 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
             for k, ver in versions.items()
         ]
 
+    def _prune_args(
+        self, thread_ids: Sequence[str], strategy: PruneStrategy
+    ) -> tuple[list[Any], list[Any], list[Any]]:
+        """Get the parameters of the PRUNE_CHECKPOINTS_SQL, PRUNE_CHECKPOINT_WRITES_SQL
+        and PRUNE_CHECKPOINT_BLOBS_SQL queries."""
+        ids = [str(thread_id) for thread_id in thread_ids]
+        return (
+            [ids, ids, strategy.keep or 0, strategy.before, strategy.before],
+            [ids],
+            [ids],
+        )
+
     def _load_writes(
         self, writes: list[tuple[bytes, bytes, bytes, bytes]]
     ) -> list[tuple[str, str, Any]]:
@@ -226,6 +306,30 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
             for idx, (channel, value) in enumerate(writes)
         ]
 
+    def _dump_writes_many(
+        self, writes: Sequence[tuple[RunnableConfig, Sequence[tuple[str, Any]], str]]
+    ) -> tuple[
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+    ]:
+        """Get the arguments of the UPSERT_CHECKPOINT_WRITES_SQL and
+        INSERT_CHECKPOINT_WRITES_SQL queries for the writes of several tasks."""
+        upserts: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        inserts: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        for config, task_writes, task_id in writes:
+            (
+                upserts if all(w[0] in WRITES_IDX_MAP for w in task_writes) else inserts
+            ).extend(
+                self._dump_writes(
+                    config["configurable"]["thread_id"],
+                    config["configurable"]["checkpoint_ns"],
+                    config["configurable"]["checkpoint_id"],
+                    task_id,
+                    task_writes,
+                )
+            )
+        return upserts, inserts
+
     def _load_metadata(self, metadata_json_str: str) -> CheckpointMetadata:
         return self.jsonplus_serde.loads(metadata_json_str.encode())
 
@@ -288,3 +392,62 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
             "WHERE " + " AND ".join(wheres) if wheres else "",
             param_values,
         )
+
+    def _get_tuples_where(
+        self, configs: Sequence[RunnableConfig]
+    ) -> Tuple[str, List[Any]]:
+        """Return WHERE clause predicates for get_tuples() given configs.
+
+        The predicate matches the checkpoints with one of the checkpoint IDs of the
+        configs, and the latest checkpoint of each thread and namespace, in the threads
+        and namespaces of the configs. This can match more checkpoints than requested,
+        see _requested_checkpoints().
+        """
+        thread_ids = list(
+            dict.fromkeys(str(c["configurable"]["thread_id"]) for c in configs)
+        )
+        checkpoint_nss = list(
+            dict.fromkeys(c["configurable"].get("checkpoint_ns", "") for c in configs)
+        )
+        checkpoint_ids = [cid for c in configs if (cid := get_checkpoint_id(c))]
+        matches = []
+        if checkpoint_ids:
+            matches.append(
+                f"checkpoint_id IN ({', '.join('?' for _ in checkpoint_ids)})"
+            )
+        if len(checkpoint_ids) < len(configs):
+            matches.append(
+                "checkpoint_id = (select max(latest.checkpoint_id) from checkpoints latest "
+                "where latest.thread_id = checkpoints.thread_id "
+                "and latest.checkpoint_ns = checkpoints.checkpoint_ns)"
+            )
+        return (
+            f"WHERE thread_id IN ({', '.join('?' for _ in thread_ids)}) "
+            f"AND checkpoint_ns IN ({', '.join('?' for _ in checkpoint_nss)}) "
+            f"AND ({' OR '.join(matches)})",
+            [*thread_ids, *checkpoint_nss, *checkpoint_ids],
+        )
+
+    def _requested_checkpoints(
+        self,
+        configs: Sequence[RunnableConfig],
+        found: Collection[tuple[str, str, str]],
+    ) -> List[Optional[tuple[str, str, str]]]:
+        """Return the (thread_id, checkpoint_ns, checkpoint_id) of the checkpoint
+        requested by each config among the found ones, or None if not found."""
+        latest: dict[tuple[str, str], str] = {}
+        for thread_id, checkpoint_ns, checkpoint_id in found:
+            if checkpoint_id > latest.get((thread_id, checkpoint_ns), ""):
+                latest[(thread_id, checkpoint_ns)] = checkpoint_id
+        keys: List[Optional[tuple[str, str, str]]] = []
+        for config in configs:
+            thread_id = str(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+            if checkpoint_id := get_checkpoint_id(config):
+                key = (thread_id, checkpoint_ns, checkpoint_id)
+                keys.append(key if key in found else None)
+            elif checkpoint_id := latest.get((thread_id, checkpoint_ns)):
+                keys.append((thread_id, checkpoint_ns, checkpoint_id))
+            else:
+                keys.append(None)
+        return keys
@@ -4,18 +4,31 @@ from contextlib import asynccontextmanager
 from typing import (
     AsyncIterator,
     Iterable,
+    Optional,
     Sequence,
     cast,
 )
 
 import duckdb
-from langgraph.store.base import GetOp, ListNamespacesOp, Op, PutOp, Result, SearchOp
+from langgraph.store.base import (
+    GetOp,
+    IndexConfig,
+    ListNamespacesOp,
+    Op,
+    PutOp,
+    Result,
+    SearchOp,
+)
 from langgraph.store.base.batch import AsyncBatchedBaseStore
 from langgraph.store.duckdb.base import (
     BaseDuckDBStore,
     _convert_ns,
+    _ensure_index_config,
+    _fill_placeholders,
     _group_ops,
+    _render_migration,
     _row_to_item,
+    _row_to_search_item,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,10 +38,19 @@ class AsyncDuckDBStore(AsyncBatchedBaseStore, BaseDuckDBStore):
     def __init__(
         self,
         conn: duckdb.DuckDBPyConnection,
+        *,
+        index: Optional[IndexConfig] = None,
+        max_batch_size: Optional[int] = None,
+        max_linger_ms: float = 0,
     ) -> None:
-        super().__init__()
+        super().__init__(max_batch_size=max_batch_size, max_linger_ms=max_linger_ms)
         self.conn = conn
         self.loop = asyncio.get_running_loop()
+        self.index_config = index
+        if self.index_config:
+            self.embeddings, self.index_config = _ensure_index_config(self.index_config)
+        else:
+            self.embeddings = None
 
     async def abatch(self, ops: Iterable[Op]) -> list[Result]:
         grouped_ops, num_ops = _group_ops(ops)
@@ -101,7 +123,12 @@ class AsyncDuckDBStore(AsyncBatchedBaseStore, BaseDuckDBStore):
         self,
         put_ops: Sequence[tuple[int, PutOp]],
     ) -> None:
-        queries = self._get_batch_PUT_queries(put_ops)
+        queries, embedding_request = self._prepare_batch_PUT_queries(put_ops)
+        if embedding_request and self.embeddings:
+            vectors = await self.embeddings.aembed_documents(
+                [text for *_, text in embedding_request]
+            )
+            queries.append(self._get_vector_insert_query(embedding_request, vectors))
         for query, params in queries:
             cur = self.conn.cursor()
             await asyncio.to_thread(cur.execute, query, params)
@@ -111,7 +138,16 @@ class AsyncDuckDBStore(AsyncBatchedBaseStore, BaseDuckDBStore):
         search_ops: Sequence[tuple[int, SearchOp]],
         results: list[Result],
     ) -> None:
-        queries = self._get_batch_search_queries(search_ops)
+        queries, embedding_requests = self._prepare_batch_search_queries(search_ops)
+        if embedding_requests and self.embeddings:
+            vectors = await asyncio.gather(
+                *(
+                    self.embeddings.aembed_query(query)
+                    for _, query in embedding_requests
+                )
+            )
+            for (idx, _), vector in zip(embedding_requests, vectors):
+                _fill_placeholders(queries[idx][1], vector)
         cursors: list[tuple[duckdb.DuckDBPyConnection, int]] = []
 
         for (query, params), (idx, _) in zip(queries, search_ops):
@@ -121,7 +157,7 @@ class AsyncDuckDBStore(AsyncBatchedBaseStore, BaseDuckDBStore):
 
         for cur, idx in cursors:
             rows = await asyncio.to_thread(cur.fetchall)
-            items = [_row_to_item(_convert_ns(row[0]), row) for row in rows]
+            items = [_row_to_search_item(_convert_ns(row[0]), row) for row in rows]
             results[idx] = items
 
     async def _batch_list_namespaces_ops(
@@ -146,17 +182,20 @@ class AsyncDuckDBStore(AsyncBatchedBaseStore, BaseDuckDBStore):
     async def from_conn_string(
         cls,
         conn_string: str,
+        *,
+        index: Optional[IndexConfig] = None,
     ) -> AsyncIterator["AsyncDuckDBStore"]:
         """Create a new AsyncDuckDBStore instance from a connection string.
 
         Args:
             conn_string (str): The DuckDB connection info string.
+            index (Optional[IndexConfig]): The embedding configuration, for vector search.
 
         Returns:
             AsyncDuckDBStore: A new AsyncDuckDBStore instance.
         """
         with duckdb.connect(conn_string) as conn:
-            yield cls(conn)
+            yield cls(conn, index=index)
 
     async def setup(self) -> None:
         """Set up the store database asynchronously.
@@ -165,27 +204,32 @@ class AsyncDuckDBStore(AsyncBatchedBaseStore, BaseDuckDBStore):
         already exist and runs database migrations. It is called automatically when needed and should not be called
         directly by the user.
         """
-        cur = self.conn.cursor()
-        try:
-            await asyncio.to_thread(
-                cur.execute, "SELECT v FROM store_migrations ORDER BY v DESC LIMIT 1"
-            )
-            row = await asyncio.to_thread(cur.fetchone)
-            if row is None:
+
+        async def _get_version(cur: duckdb.DuckDBPyConnection, table: str) -> int:
+            try:
+                await asyncio.to_thread(
+                    cur.execute, f"SELECT v FROM {table} ORDER BY v DESC LIMIT 1"
+                )
+                row = await asyncio.to_thread(cur.fetchone)
+                if row is None:
+                    version = -1
+                else:
+                    version = row[0]
+            except duckdb.CatalogException:
                 version = -1
-            else:
-                version = row[0]
-        except duckdb.CatalogException:
-            version = -1
-            # Create store_migrations table if it doesn't exist
-            await asyncio.to_thread(
-                cur.execute,
-                """
-                CREATE TABLE IF NOT EXISTS store_migrations (
-                    v INTEGER PRIMARY KEY
+                # Create the migrations table if it doesn't exist
+                await asyncio.to_thread(
+                    cur.execute,
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        v INTEGER PRIMARY KEY
+                    )
+                    """,
                 )
-                """,
-            )
+            return version
+
+        cur = self.conn.cursor()
+        version = await _get_version(cur, table="store_migrations")
         for v, migration in enumerate(
             self.MIGRATIONS[version + 1 :], start=version + 1
         ):
@@ -193,3 +237,15 @@ class AsyncDuckDBStore(AsyncBatchedBaseStore, BaseDuckDBStore):
             await asyncio.to_thread(
                 cur.execute, "INSERT INTO store_migrations (v) VALUES (?)", (v,)
             )
+
+        if self.index_config:
+            version = await _get_version(cur, table="vector_migrations")
+            for v, vector_migration in enumerate(
+                self.VECTOR_MIGRATIONS[version + 1 :], start=version + 1
+            ):
+                await asyncio.to_thread(
+                    cur.execute, _render_migration(self, vector_migration)
+                )
+                await asyncio.to_thread(
+                    cur.execute, "INSERT INTO vector_migrations (v) VALUES (?)", (v,)
+                )
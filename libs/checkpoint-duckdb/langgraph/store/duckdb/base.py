@@ -4,10 +4,15 @@ import logging
 from collections import defaultdict
 from contextlib import contextmanager
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     Generic,
     Iterable,
     Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
     Sequence,
     TypeVar,
     Union,
@@ -16,20 +21,35 @@ from typing import (
 
 import duckdb
 from langgraph.store.base import (
-    BaseStore,
     GetOp,
+    IndexConfig,
     Item,
     ListNamespacesOp,
     Op,
     PutOp,
     Result,
+    SearchCursor,
     SearchItem,
     SearchOp,
+    ensure_embeddings,
+    get_text_at_path,
+    tokenize_path,
 )
+from langgraph.store.base.batch import SyncBatchedBaseStore
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
 
 logger = logging.getLogger(__name__)
 
 
+class Migration(NamedTuple):
+    """A database migration with optional parameters."""
+
+    sql: str
+    params: Optional[dict[str, Callable[["BaseDuckDBStore"], Any]]] = None
+
+
 MIGRATIONS = [
     """
 CREATE TABLE IF NOT EXISTS store (
@@ -46,12 +66,32 @@ CREATE INDEX IF NOT EXISTS store_prefix_idx ON store (prefix);
 """,
 ]
 
+VECTOR_MIGRATIONS: Sequence[Migration] = [
+    Migration(
+        """
+CREATE TABLE IF NOT EXISTS store_vectors (
+    prefix TEXT NOT NULL,
+    key TEXT NOT NULL,
+    field_name TEXT NOT NULL,
+    embedding FLOAT[%(dims)s],
+    created_at TIMESTAMP DEFAULT now(),
+    updated_at TIMESTAMP DEFAULT now(),
+    PRIMARY KEY (prefix, key, field_name)
+);
+""",
+        params={"dims": lambda store: cast(IndexConfig, store.index_config)["dims"]},
+    ),
+]
+
 C = TypeVar("C", bound=duckdb.DuckDBPyConnection)
 
 
 class BaseDuckDBStore(Generic[C]):
     MIGRATIONS = MIGRATIONS
+    VECTOR_MIGRATIONS = VECTOR_MIGRATIONS
     conn: C
+    index_config: Optional[IndexConfig]
+    embeddings: Optional["Embeddings"]
 
     def _get_batch_GET_ops_queries(
         self,
@@ -73,13 +113,21 @@ class BaseDuckDBStore(Generic[C]):
             results.append((query, params, namespace, items))
         return results
 
-    def _get_batch_PUT_queries(
+    def _prepare_batch_PUT_queries(
         self,
         put_ops: Sequence[tuple[int, PutOp]],
-    ) -> list[tuple[str, Sequence]]:
+    ) -> tuple[
+        list[tuple[str, Sequence]],
+        Optional[list[tuple[str, str, str, str]]],
+    ]:
+        # Last-write wins
+        dedupped_ops: dict[tuple[tuple[str, ...], str], PutOp] = {}
+        for _, op in put_ops:
+            dedupped_ops[(op.namespace, op.key)] = op
+
         inserts: list[PutOp] = []
         deletes: list[PutOp] = []
-        for _, op in put_ops:
+        for op in dedupped_ops.values():
             if op.value is None:
                 deletes.append(op)
             else:
@@ -87,6 +135,21 @@ class BaseDuckDBStore(Generic[C]):
 
         queries: list[tuple[str, Sequence]] = []
 
+        if self.index_config:
+            # Drop the vectors of every written item, the fields to embed
+            # may have changed
+            vector_groups: dict[tuple[str, ...], list[str]] = defaultdict(list)
+            for namespace, key in dedupped_ops:
+                vector_groups[namespace].append(key)
+            for namespace, keys in vector_groups.items():
+                placeholders = ",".join(["?"] * len(keys))
+                query = (
+                    "DELETE FROM store_vectors "
+                    f"WHERE prefix = ? AND key IN ({placeholders})"
+                )
+                params = (_namespace_to_text(namespace), *keys)
+                queries.append((query, params))
+
         if deletes:
             namespace_groups: dict[tuple[str, ...], list[str]] = defaultdict(list)
             for op in deletes:
@@ -98,6 +161,7 @@ class BaseDuckDBStore(Generic[C]):
                 )
                 params = (_namespace_to_text(namespace), *keys)
                 queries.append((query, params))
+        embedding_request: Optional[list[tuple[str, str, str, str]]] = None
         if inserts:
             values = []
             insertion_params = []
@@ -119,33 +183,145 @@ class BaseDuckDBStore(Generic[C]):
             """
             queries.append((query, insertion_params))
 
-        return queries
+            if self.index_config:
+                embedding_request = []
+                for op in inserts:
+                    if op.index is False:
+                        continue
+                    if op.index is None:
+                        paths = self.index_config["__tokenized_fields"]
+                    else:
+                        paths = [(ix, tokenize_path(ix)) for ix in op.index]
+                    ns = _namespace_to_text(op.namespace)
+                    for path, tokenized_path in paths:
+                        texts = get_text_at_path(op.value, tokenized_path)
+                        for i, text in enumerate(texts):
+                            pathname = f"{path}.{i}" if len(texts) > 1 else path
+                            embedding_request.append((ns, op.key, pathname, text))
 
-    def _get_batch_search_queries(
+        return queries, embedding_request
+
+    def _get_vector_insert_query(
+        self,
+        txt_params: Sequence[tuple[str, str, str, str]],
+        vectors: Sequence[Sequence[float]],
+    ) -> tuple[str, Sequence]:
+        values_str = ",".join(["(?, ?, ?, ?, now(), now())"] * len(txt_params))
+        query = f"""
+            INSERT INTO store_vectors (prefix, key, field_name, embedding, created_at, updated_at)
+            VALUES {values_str}
+        """
+        return (
+            query,
+            [
+                p
+                for (ns, k, pathname, _), vector in zip(txt_params, vectors)
+                for p in (ns, k, pathname, vector)
+            ],
+        )
+
+    def _prepare_batch_search_queries(
         self,
         search_ops: Sequence[tuple[int, SearchOp]],
-    ) -> list[tuple[str, Sequence]]:
-        queries: list[tuple[str, Sequence]] = []
-        for _, op in search_ops:
-            query = """
-                SELECT prefix, key, value, created_at, updated_at
-                FROM store
-                WHERE prefix LIKE ?
-            """
-            params: list = [f"{_namespace_to_text(op.namespace_prefix)}%"]
-
+    ) -> tuple[
+        list[tuple[str, list[Any]]],  # queries, params
+        list[tuple[int, str]],  # idx, query_text pairs to embed
+    ]:
+        queries: list[tuple[str, list[Any]]] = []
+        embedding_requests: list[tuple[int, str]] = []
+        for idx, (_, op) in enumerate(search_ops):
+            cursor = SearchCursor.decode(op.after) if op.after else None
+            filter_conditions = []
+            filter_params: list[Any] = []
             if op.filter:
-                filter_conditions = []
                 for key, value in op.filter.items():
-                    filter_conditions.append(f"json_extract(value, '$.{key}') = ?")
-                    params.append(json.dumps(value))
-                query += " AND " + " AND ".join(filter_conditions)
+                    if isinstance(value, dict) and any(
+                        k.startswith("$") for k in value
+                    ):
+                        for op_name, val in value.items():
+                            condition, filter_params_ = self._get_filter_condition(
+                                key, op_name, val
+                            )
+                            filter_conditions.append(condition)
+                            filter_params.extend(filter_params_)
+                    else:
+                        condition, filter_params_ = self._get_filter_condition(
+                            key, "$eq", value
+                        )
+                        filter_conditions.append(condition)
+                        filter_params.extend(filter_params_)
+
+            # Vector search branch
+            if op.query and self.index_config:
+                embedding_requests.append((idx, op.query))
+                conditions = list(filter_conditions)
+                params: list[Any] = [
+                    _PLACEHOLDER,
+                    f"{_namespace_to_text(op.namespace_prefix)}%",
+                    *filter_params,
+                ]
+                if cursor is not None:
+                    if cursor.score is None:
+                        raise ValueError(
+                            "Cannot continue a search with a query after the cursor "
+                            "of a search without one."
+                        )
+                    conditions.append("(scored.score, s.prefix, s.key) < (?, ?, ?)")
+                    params.extend(
+                        [
+                            cursor.score,
+                            _namespace_to_text(cursor.namespace),
+                            cursor.key,
+                        ]
+                    )
+                where_str = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                # Items are scored by their best matching field
+                query = f"""
+                    WITH scored AS (
+                        SELECT prefix, key, MAX(array_cosine_similarity(embedding, ?::FLOAT[{int(self.index_config["dims"])}])) AS score
+                        FROM store_vectors
+                        WHERE prefix LIKE ?
+                        GROUP BY prefix, key
+                    )
+                    SELECT s.prefix, s.key, s.value, s.created_at, s.updated_at, scored.score
+                    FROM scored
+                    JOIN store s ON s.prefix = scored.prefix AND s.key = scored.key
+                    {where_str}
+                    ORDER BY scored.score DESC, s.prefix DESC, s.key DESC
+                    LIMIT ? OFFSET ?
+                """
+                params.extend([op.limit, op.offset])
 
-            query += " ORDER BY updated_at DESC LIMIT ? OFFSET ?"
-            params.extend([op.limit, op.offset])
+            # Regular search branch
+            else:
+                query = """
+                    SELECT prefix, key, value, created_at, updated_at
+                    FROM store
+                    WHERE prefix LIKE ?
+                """
+                params = [f"{_namespace_to_text(op.namespace_prefix)}%"]
+
+                if filter_conditions:
+                    query += " AND " + " AND ".join(filter_conditions)
+                    params.extend(filter_params)
+
+                if cursor is not None:
+                    query += " AND (updated_at, prefix, key) < (?, ?, ?)"
+                    params.extend(
+                        [
+                            cursor.updated_at,
+                            _namespace_to_text(cursor.namespace),
+                            cursor.key,
+                        ]
+                    )
+
+                query += (
+                    " ORDER BY updated_at DESC, prefix DESC, key DESC LIMIT ? OFFSET ?"
+                )
+                params.extend([op.limit, op.offset])
 
             queries.append((query, params))
-        return queries
+        return queries, embedding_requests
 
     def _get_batch_list_namespaces_queries(
         self,
@@ -198,14 +374,43 @@ class BaseDuckDBStore(Generic[C]):
 
         return queries
 
+    def _get_filter_condition(self, key: str, op: str, value: Any) -> tuple[str, list]:
+        """Helper to generate filter conditions."""
+        if op == "$eq":
+            return "json_extract(value, ?) = ?", [f"$.{key}", json.dumps(value)]
+        elif op == "$ne":
+            return "json_extract(value, ?) != ?", [f"$.{key}", json.dumps(value)]
+        elif op in _COMPARISON_OPERATORS:
+            operator = _COMPARISON_OPERATORS[op]
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return (
+                    f"TRY_CAST(json_extract(value, ?) AS DOUBLE) {operator} ?",
+                    [f"$.{key}", value],
+                )
+            return f"json_extract_string(value, ?) {operator} ?", [
+                f"$.{key}",
+                str(value),
+            ]
+        else:
+            raise ValueError(f"Unsupported operator: {op}")
 
-class DuckDBStore(BaseStore, BaseDuckDBStore[duckdb.DuckDBPyConnection]):
+
+class DuckDBStore(SyncBatchedBaseStore, BaseDuckDBStore[duckdb.DuckDBPyConnection]):
     def __init__(
         self,
         conn: duckdb.DuckDBPyConnection,
+        *,
+        index: Optional[IndexConfig] = None,
+        max_batch_size: Optional[int] = None,
+        max_linger_ms: float = 0,
     ) -> None:
-        super().__init__()
+        super().__init__(max_batch_size=max_batch_size, max_linger_ms=max_linger_ms)
         self.conn = conn
+        self.index_config = index
+        if self.index_config:
+            self.embeddings, self.index_config = _ensure_index_config(self.index_config)
+        else:
+            self.embeddings = None
 
     def batch(self, ops: Iterable[Op]) -> list[Result]:
         grouped_ops, num_ops = _group_ops(ops)
@@ -264,7 +469,12 @@ class DuckDBStore(BaseStore, BaseDuckDBStore[duckdb.DuckDBPyConnection]):
         self,
         put_ops: Sequence[tuple[int, PutOp]],
     ) -> None:
-        queries = self._get_batch_PUT_queries(put_ops)
+        queries, embedding_request = self._prepare_batch_PUT_queries(put_ops)
+        if embedding_request and self.embeddings:
+            vectors = self.embeddings.embed_documents(
+                [text for *_, text in embedding_request]
+            )
+            queries.append(self._get_vector_insert_query(embedding_request, vectors))
         for query, params in queries:
             cur = self.conn.cursor()
             cur.execute(query, params)
@@ -274,7 +484,10 @@ class DuckDBStore(BaseStore, BaseDuckDBStore[duckdb.DuckDBPyConnection]):
         search_ops: Sequence[tuple[int, SearchOp]],
         results: list[Result],
     ) -> None:
-        queries = self._get_batch_search_queries(search_ops)
+        queries, embedding_requests = self._prepare_batch_search_queries(search_ops)
+        if embedding_requests and self.embeddings:
+            for idx, query in embedding_requests:
+                _fill_placeholders(queries[idx][1], self.embeddings.embed_query(query))
         cursors: list[tuple[duckdb.DuckDBPyConnection, int]] = []
 
         for (query, params), (idx, _) in zip(queries, search_ops):
@@ -309,17 +522,20 @@ class DuckDBStore(BaseStore, BaseDuckDBStore[duckdb.DuckDBPyConnection]):
     def from_conn_string(
         cls,
         conn_string: str,
+        *,
+        index: Optional[IndexConfig] = None,
     ) -> Iterator["DuckDBStore"]:
         """Create a new BaseDuckDBStore instance from a connection string.
 
         Args:
             conn_string (str): The DuckDB connection info string.
+            index (Optional[IndexConfig]): The embedding configuration, for vector search.
 
         Returns:
             DuckDBStore: A new DuckDBStore instance.
         """
         with duckdb.connect(conn_string) as conn:
-            yield cls(conn=conn)
+            yield cls(conn=conn, index=index)
 
     def setup(self) -> None:
         """Set up the store database.
@@ -328,30 +544,43 @@ class DuckDBStore(BaseStore, BaseDuckDBStore[duckdb.DuckDBPyConnection]):
         already exist and runs database migrations. It is called automatically when needed and should not be called
         directly by the user.
         """
-        with self.conn.cursor() as cur:
+
+        def _get_version(cur: duckdb.DuckDBPyConnection, table: str) -> int:
             try:
-                cur.execute("SELECT v FROM store_migrations ORDER BY v DESC LIMIT 1")
-                row = cast(dict, cur.fetchone())
+                cur.execute(f"SELECT v FROM {table} ORDER BY v DESC LIMIT 1")
+                row = cast(tuple, cur.fetchone())
                 if row is None:
                     version = -1
                 else:
-                    version = row["v"]
+                    version = row[0]
             except duckdb.CatalogException:
                 version = -1
-                # Create store_migrations table if it doesn't exist
+                # Create the migrations table if it doesn't exist
                 cur.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS store_migrations (
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
                         v INTEGER PRIMARY KEY
                     )
                 """
                 )
+            return version
+
+        with self.conn.cursor() as cur:
+            version = _get_version(cur, table="store_migrations")
             for v, migration in enumerate(
                 self.MIGRATIONS[version + 1 :], start=version + 1
             ):
                 cur.execute(migration)
                 cur.execute("INSERT INTO store_migrations (v) VALUES (?)", (v,))
 
+            if self.index_config:
+                version = _get_version(cur, table="vector_migrations")
+                for v, vector_migration in enumerate(
+                    self.VECTOR_MIGRATIONS[version + 1 :], start=version + 1
+                ):
+                    cur.execute(_render_migration(self, vector_migration))
+                    cur.execute("INSERT INTO vector_migrations (v) VALUES (?)", (v,))
+
 
 def _namespace_to_text(
     namespace: tuple[str, ...], handle_wildcards: bool = False
@@ -382,14 +611,14 @@ def _row_to_search_item(
     row: tuple,
 ) -> SearchItem:
     """Convert a row from the database into an SearchItem."""
-    # TODO: Add support for search
-    _, key, val, created_at, updated_at = row
+    _, key, val, created_at, updated_at, *rest = row
     return SearchItem(
         value=val if isinstance(val, dict) else json.loads(val),
         key=key,
         namespace=namespace,
         created_at=created_at,
         updated_at=updated_at,
+        score=float(rest[0]) if rest and rest[0] is not None else None,
     )
 
 
@@ -406,3 +635,38 @@ def _convert_ns(namespace: Union[str, list]) -> tuple[str, ...]:
     if isinstance(namespace, list):
         return tuple(namespace)
     return tuple(namespace.split("."))
+
+
+def _render_migration(store: BaseDuckDBStore, migration: Migration) -> str:
+    if not migration.params:
+        return migration.sql
+    return migration.sql % {k: v(store) for k, v in migration.params.items()}
+
+
+def _ensure_index_config(
+    index_config: IndexConfig,
+) -> tuple[Optional["Embeddings"], IndexConfig]:
+    index_config = index_config.copy()
+    tokenized: list[tuple[str, Union[Literal["$"], list[str]]]] = []
+    for p in index_config.get("fields") or ["$"]:
+        if p == "$":
+            tokenized.append((p, "$"))
+        else:
+            tokenized.append((p, tokenize_path(p)))
+    index_config["__tokenized_fields"] = tokenized
+    embeddings = ensure_embeddings(
+        index_config.get("embed"),
+        cache=index_config.get("cache"),
+    )
+    return embeddings, index_config
+
+
+def _fill_placeholders(params: list[Any], vector: list[float]) -> None:
+    for i, param in enumerate(params):
+        if param is _PLACEHOLDER:
+            params[i] = vector
+
+
+_COMPARISON_OPERATORS = {"$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+_PLACEHOLDER = object()
@@ -7,7 +7,9 @@ from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
     create_checkpoint,
+    delete_thread,
     empty_checkpoint,
+    keep_since,
 )
 from langgraph.checkpoint.duckdb.aio import AsyncDuckDBSaver
 
@@ -110,3 +112,55 @@ class TestAsyncDuckDBSaver:
             assert [c async for c in saver.alist(None, filter={"my_key": "abc"})][
                 0
             ].metadata["my_key"] == "abc"
+
+    async def test_aprune(self) -> None:
+        async with AsyncDuckDBSaver.from_conn_string(":memory:") as saver:
+            await saver.setup()
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            configs = []
+            version = None
+            for i in range(1, 4):
+                version = saver.get_next_version(version, None)
+                checkpoint = create_checkpoint(empty_checkpoint(), None, i)
+                checkpoint["channel_values"] = {"count": i}
+                checkpoint["channel_versions"] = {"count": version}
+                # isoformat() omits the microseconds of whole seconds
+                checkpoint["ts"] = f"2024-01-0{i}T00:00:00+00:00"
+                config = await saver.aput(config, checkpoint, {}, {"count": version})
+                configs.append(config)
+            ts = (await saver.aget_tuple(configs[1])).checkpoint["ts"]
+
+            await saver.aprune(["thread-1"], strategy=keep_since(ts))
+
+            remaining = [c async for c in saver.alist(None)]
+            assert [c.config for c in remaining] == [configs[2], configs[1]]
+            assert remaining[0].checkpoint["channel_values"] == {"count": 3}
+
+            await saver.aprune(["thread-1"], strategy=delete_thread)
+
+            assert [c async for c in saver.alist(None)] == []
+
+    async def test_aget_tuples(self) -> None:
+        async with AsyncDuckDBSaver.from_conn_string(":memory:") as saver:
+            await saver.setup()
+            config_1 = await saver.aput(
+                self.config_1, self.chkpnt_1, self.metadata_1, {}
+            )
+            config_2 = await saver.aput(
+                self.config_2, self.chkpnt_2, self.metadata_2, {}
+            )
+
+            tuples = await saver.aget_tuples(
+                [
+                    config_2,
+                    {"configurable": {"thread_id": "thread-3"}},
+                    {"configurable": {"thread_id": "thread-1"}},
+                ]
+            )
+            assert [t.config if t else None for t in tuples] == [
+                config_2,
+                None,
+                config_1,
+            ]
@@ -8,6 +8,7 @@ import pytest
 
 from langgraph.store.base import GetOp, Item, ListNamespacesOp, PutOp, SearchOp
 from langgraph.store.duckdb import AsyncDuckDBStore
+from tests.embed_test_utils import CharacterEmbeddings
 
 
 class MockCursor:
@@ -515,3 +516,25 @@ async def test_search():
 
         for namespace in test_namespaces:
             await store.adelete(namespace, f"item_{namespace[-1]}")
+
+
+async def test_vector_search() -> None:
+    embeddings = CharacterEmbeddings(dims=500)
+    async with AsyncDuckDBStore.from_conn_string(
+        ":memory:",
+        index={"dims": embeddings.dims, "embed": embeddings, "fields": ["text"]},
+    ) as store:
+        await store.setup()
+        await store.aput(("docs",), "doc1", {"text": "zany zebra Xerxes"})
+        await store.aput(("docs",), "doc2", {"text": "something about dogs"})
+        await store.aput(("docs",), "doc3", {"text": "text about birds"})
+
+        results = await store.asearch(("docs",), query="zany zebra Xerxes")
+        assert results[0].key == "doc1"
+        assert results[0].score == pytest.approx(1.0)
+        assert all(a.score >= b.score for a, b in zip(results, results[1:]))
+
+        results = await store.asearch(
+            ("docs",), query="zany zebra Xerxes", filter={"text": "text about birds"}
+        )
+        assert [item.key for item in results] == ["doc3"]
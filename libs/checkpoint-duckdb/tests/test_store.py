@@ -8,6 +8,7 @@ import pytest
 
 from langgraph.store.base import GetOp, Item, ListNamespacesOp, PutOp, SearchOp
 from langgraph.store.duckdb import DuckDBStore
+from tests.embed_test_utils import CharacterEmbeddings
 
 
 class MockCursor:
@@ -453,5 +454,63 @@ def test_search():
         assert len(all_items) == 4
         assert len(set(item.key for item in all_items)) == 4
 
+        cursor_page1 = store.search(["test_search"], limit=3)
+        cursor_page2 = store.search(
+            ["test_search"], limit=3, after=cursor_page1[-1].cursor
+        )
+        assert cursor_page1 + cursor_page2 == store.search(["test_search"])
+        assert len(cursor_page2) == 1
+
         for namespace in test_namespaces:
             store.delete(namespace, f"item_{namespace[-1]}")
+
+
+def test_vector_search() -> None:
+    embeddings = CharacterEmbeddings(dims=500)
+    with DuckDBStore.from_conn_string(
+        ":memory:",
+        index={"dims": embeddings.dims, "embed": embeddings, "fields": ["text"]},
+    ) as store:
+        store.setup()
+        docs = [
+            ("doc1", {"text": "zany zebra Xerxes", "score": 4.5}),
+            ("doc2", {"text": "something about dogs", "score": 3.0}),
+            ("doc3", {"text": "text about birds", "score": 2.0}),
+        ]
+        for key, value in docs:
+            store.put(("docs",), key, value)
+        store.put(("docs",), "doc4", {"text": "zany zebra Xerxes"}, index=False)
+
+        results = store.search(("docs",), query="zany zebra Xerxes")
+        assert [item.key for item in results][0] == "doc1"
+        assert results[0].score == pytest.approx(1.0)
+        assert "doc4" not in [item.key for item in results]
+        assert all(a.score >= b.score for a, b in zip(results, results[1:]))
+
+        results = store.search(
+            ("docs",), query="zany zebra Xerxes", filter={"score": {"$lt": 4.0}}
+        )
+        assert sorted(item.key for item in results) == ["doc2", "doc3"]
+        results = store.search(("docs",), filter={"score": {"$gte": 3.0}})
+        assert sorted(item.key for item in results) == ["doc1", "doc2"]
+        results = store.search(("docs",), filter={"text": {"$ne": "text about birds"}})
+        assert sorted(item.key for item in results) == ["doc1", "doc2", "doc4"]
+
+        # Updates replace the vectors of the item
+        store.put(("docs",), "doc1", {"text": "new text about dogs"})
+        results = store.search(("docs",), query="new text about dogs", limit=1)
+        assert results[0].key == "doc1"
+        assert results[0].score == pytest.approx(1.0)
+
+        # Fields to embed can be chosen per item
+        store.put(("docs",), "doc5", {"title": "zany zebra Xerxes"}, index=["title"])
+        results = store.search(("docs",), query="zany zebra Xerxes", limit=1)
+        assert results[0].key == "doc5"
+
+        page1 = store.search(("docs",), query="about", limit=2)
+        page2 = store.search(("docs",), query="about", after=page1[-1].cursor)
+        assert page1 + page2 == store.search(("docs",), query="about")
+
+        store.delete(("docs",), "doc5")
+        results = store.search(("docs",), query="zany zebra Xerxes")
+        assert "doc5" not in [item.key for item in results]
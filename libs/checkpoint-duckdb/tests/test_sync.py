@@ -6,8 +6,11 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     create_checkpoint,
+    delete_thread,
     empty_checkpoint,
+    keep_latest,
 )
 from langgraph.checkpoint.duckdb import DuckDBSaver
 
@@ -109,3 +112,122 @@ class TestDuckDBSaver:
                 list(saver.list(None, filter={"my_key": "abc"}))[0].metadata["my_key"]  # type: ignore
                 == "abc"
             )
+
+    def test_prune(self) -> None:
+        with DuckDBSaver.from_conn_string(":memory:") as saver:
+            saver.setup()
+            configs = []
+            for thread_id in ("thread-1", "thread-2"):
+                config: RunnableConfig = {
+                    "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+                }
+                version = None
+                for i in range(1, 5):
+                    version = saver.get_next_version(version, None)
+                    checkpoint = create_checkpoint(empty_checkpoint(), None, i)
+                    checkpoint["channel_values"] = {"count": i}
+                    checkpoint["channel_versions"] = {"count": version}
+                    config = saver.put(config, checkpoint, {}, {"count": version})
+                    saver.put_writes(config, [("count", i)], f"task-{i}")
+                    configs.append(config)
+
+            saver.prune(["thread-1"], strategy=keep_latest(2))
+
+            remaining = list(saver.list({"configurable": {"thread_id": "thread-1"}}))
+            assert [c.config for c in remaining] == [configs[3], configs[2]]
+            assert remaining[0].checkpoint["channel_values"] == {"count": 4}
+            assert remaining[0].pending_writes == [("task-4", "count", 4)]
+            # writes of the parent of the oldest remaining checkpoint are kept
+            assert saver.conn.execute(
+                "SELECT checkpoint_id FROM checkpoint_writes WHERE thread_id = 'thread-1' ORDER BY checkpoint_id"
+            ).fetchall() == [
+                (c["configurable"]["checkpoint_id"],) for c in configs[1:4]
+            ]
+            assert (
+                saver.conn.execute(
+                    "SELECT count(*) FROM checkpoint_blobs WHERE thread_id = 'thread-1'"
+                ).fetchone()[0]
+                == 2
+            )
+            # other threads are not affected
+            assert (
+                len(list(saver.list({"configurable": {"thread_id": "thread-2"}}))) == 4
+            )
+
+            saver.prune(["thread-1", "thread-2"], strategy=delete_thread)
+
+            assert list(saver.list(None)) == []
+            for table in ("checkpoints", "checkpoint_writes", "checkpoint_blobs"):
+                assert saver.conn.execute(f"SELECT * FROM {table}").fetchall() == []
+
+    def test_list_metadata(self) -> None:
+        with DuckDBSaver.from_conn_string(":memory:") as saver:
+            saver.setup()
+            chkpnt = create_checkpoint(self.chkpnt_1, {"count": 1}, 1)
+            chkpnt["channel_versions"] = {"count": "1"}
+            config = saver.put(self.config_1, chkpnt, self.metadata_1, {"count": "1"})
+            saver.put_writes(config, [("count", 2)], "task-1")
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+            listed = list(saver.list_metadata(None, filter={"source": "input"}))
+            assert len(listed) == 1
+            assert listed[0].config == config
+            assert listed[0].metadata == self.metadata_1
+            assert isinstance(listed[0], CheckpointMetadataTuple)
+
+    def test_put_writes_many(self) -> None:
+        with DuckDBSaver.from_conn_string(":memory:") as saver:
+            saver.setup()
+            config = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put_writes_many(
+                [
+                    (config, [("foo", 1), ("bar", 2)], "task-1"),
+                    (config, [("__error__", "boom")], "task-2"),
+                    (config, [("foo", 3)], "task-3"),
+                ]
+            )
+
+            assert sorted(saver.get_tuple(config).pending_writes) == [
+                ("task-1", "bar", 2),
+                ("task-1", "foo", 1),
+                ("task-2", "__error__", "boom"),
+                ("task-3", "foo", 3),
+            ]
+
+    def test_get_tuples(self) -> None:
+        with DuckDBSaver.from_conn_string(":memory:") as saver:
+            saver.setup()
+            assert saver.get_tuples([]) == []
+            config_1 = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put_writes(config_1, [("foo", 1)], "task-1")
+            config_2 = saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            config_3 = saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+            chkpnt_4 = create_checkpoint(self.chkpnt_1, None, 2)
+            chkpnt_4["channel_values"] = {"count": 1}
+            chkpnt_4["channel_versions"] = {"count": "1"}
+            config_4 = saver.put(config_1, chkpnt_4, self.metadata_2, {"count": "1"})
+
+            requested: list[RunnableConfig] = [
+                {"configurable": {"thread_id": "thread-1"}},
+                config_1,
+                {"configurable": {"thread_id": "thread-2", "checkpoint_ns": "inner"}},
+                {"configurable": {"thread_id": "thread-3"}},
+                config_2,
+            ]
+            tuples = saver.get_tuples(requested)
+            assert [t.config if t else None for t in tuples] == [
+                config_4,
+                config_1,
+                config_3,
+                None,
+                config_2,
+            ]
+            assert tuples[0].checkpoint["channel_values"] == {"count": 1}
+            assert tuples[1].pending_writes == [("task-1", "foo", 1)]
+            assert [t.metadata if t else None for t in tuples] == [
+                self.metadata_2,
+                self.metadata_1,
+                self.metadata_3,
+                None,
+                self.metadata_2,
+            ]
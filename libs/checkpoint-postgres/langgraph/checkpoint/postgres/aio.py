@@ -1,7 +1,7 @@
 import asyncio
-from collections.abc import AsyncIterator, Iterator, Sequence
+from collections.abc import AsyncIterator, Coroutine, Iterator, Sequence
 from contextlib import asynccontextmanager
-from typing import Any, Optional
+from typing import Any, List, Optional, cast
 
 from langchain_core.runnables import RunnableConfig
 from psycopg import AsyncConnection, AsyncCursor, AsyncPipeline, Capabilities
@@ -14,7 +14,9 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
+    PruneStrategy,
     get_checkpoint_id,
 )
 from langgraph.checkpoint.postgres import _ainternal
@@ -136,11 +138,16 @@ class AsyncPostgresSaver(BasePostgresSaver):
                             "checkpoint_id": value["checkpoint_id"],
                         }
                     },
-                    await asyncio.to_thread(
-                        self._load_checkpoint,
-                        value["checkpoint"],
-                        value["channel_values"],
-                        value["pending_sends"],
+                    await self._aload_checkpoint_deltas(
+                        cur,
+                        value["thread_id"],
+                        value["checkpoint_ns"],
+                        await asyncio.to_thread(
+                            self._load_checkpoint,
+                            value["checkpoint"],
+                            value["channel_values"],
+                            value["pending_sends"],
+                        ),
                     ),
                     self._load_metadata(value["metadata"]),
                     (
@@ -157,6 +164,57 @@ class AsyncPostgresSaver(BasePostgresSaver):
                     await asyncio.to_thread(self._load_writes, value["pending_writes"]),
                 )
 
+    async def alist_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints from the database asynchronously.
+
+        Like `alist`, but only the metadata of the checkpoints is read from the database,
+        not the checkpoints, their channel values and their pending writes. Use `aget_tuple` to load a full checkpoint.
+
+        Args:
+            config (Optional[RunnableConfig]): Base configuration for filtering checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata.
+            before (Optional[RunnableConfig]): If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            AsyncIterator[CheckpointMetadataTuple]: An asynchronous iterator of matching checkpoint metadata tuples.
+        """
+        where, args = self._search_where(config, filter, before)
+        query = self.SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        async with self._cursor() as cur:
+            await cur.execute(query, args, binary=True)
+            async for value in cur:
+                yield CheckpointMetadataTuple(
+                    {
+                        "configurable": {
+                            "thread_id": value["thread_id"],
+                            "checkpoint_ns": value["checkpoint_ns"],
+                            "checkpoint_id": value["checkpoint_id"],
+                        }
+                    },
+                    self._load_metadata(value["metadata"]),
+                    (
+                        {
+                            "configurable": {
+                                "thread_id": value["thread_id"],
+                                "checkpoint_ns": value["checkpoint_ns"],
+                                "checkpoint_id": value["parent_checkpoint_id"],
+                            }
+                        }
+                        if value["parent_checkpoint_id"]
+                        else None
+                    ),
+                )
+
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -197,11 +255,16 @@ class AsyncPostgresSaver(BasePostgresSaver):
                             "checkpoint_id": value["checkpoint_id"],
                         }
                     },
-                    await asyncio.to_thread(
-                        self._load_checkpoint,
-                        value["checkpoint"],
-                        value["channel_values"],
-                        value["pending_sends"],
+                    await self._aload_checkpoint_deltas(
+                        cur,
+                        thread_id,
+                        checkpoint_ns,
+                        await asyncio.to_thread(
+                            self._load_checkpoint,
+                            value["checkpoint"],
+                            value["channel_values"],
+                            value["pending_sends"],
+                        ),
                     ),
                     self._load_metadata(value["metadata"]),
                     (
@@ -218,6 +281,74 @@ class AsyncPostgresSaver(BasePostgresSaver):
                     await asyncio.to_thread(self._load_writes, value["pending_writes"]),
                 )
 
+    async def aget_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Get the checkpoint tuples of several configs from the database asynchronously.
+
+        Like `aget_tuple` for each config, but the checkpoints of all configs are
+        read from the Postgres database with a single query.
+
+        Args:
+            configs (Sequence[RunnableConfig]): The configs to use for retrieving the checkpoints.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The retrieved checkpoint tuples, in the order of the configs, with None for each checkpoint not found.
+        """  # noqa
+        if not configs:
+            return []
+        where, args = self._get_tuples_where(configs)
+        tuples: dict[tuple[str, str, str], CheckpointTuple] = {}
+        async with self._cursor() as cur:
+            await cur.execute(self.SELECT_SQL + where, args, binary=True)
+            rows = {
+                (
+                    value["thread_id"],
+                    value["checkpoint_ns"],
+                    value["checkpoint_id"],
+                ): value
+                for value in await cur.fetchall()
+            }
+            keys = self._requested_checkpoints(configs, rows.keys())
+            for key in keys:
+                if key is None or key in tuples:
+                    continue
+                value = rows[key]
+                tuples[key] = CheckpointTuple(
+                    {
+                        "configurable": {
+                            "thread_id": value["thread_id"],
+                            "checkpoint_ns": value["checkpoint_ns"],
+                            "checkpoint_id": value["checkpoint_id"],
+                        }
+                    },
+                    await self._aload_checkpoint_deltas(
+                        cur,
+                        value["thread_id"],
+                        value["checkpoint_ns"],
+                        await asyncio.to_thread(
+                            self._load_checkpoint,
+                            value["checkpoint"],
+                            value["channel_values"],
+                            value["pending_sends"],
+                        ),
+                    ),
+                    self._load_metadata(value["metadata"]),
+                    (
+                        {
+                            "configurable": {
+                                "thread_id": value["thread_id"],
+                                "checkpoint_ns": value["checkpoint_ns"],
+                                "checkpoint_id": value["parent_checkpoint_id"],
+                            }
+                        }
+                        if value["parent_checkpoint_id"]
+                        else None
+                    ),
+                    await asyncio.to_thread(self._load_writes, value["pending_writes"]),
+                )
+        return [tuples[key] if key else None for key in keys]
+
     async def aput(
         self,
         config: RunnableConfig,
@@ -310,6 +441,65 @@ class AsyncPostgresSaver(BasePostgresSaver):
         async with self._cursor(pipeline=True) as cur:
             await cur.executemany(query, params)
 
+    async def aput_writes_many(
+        self, writes: Sequence[tuple[RunnableConfig, Sequence[tuple[str, Any]], str]]
+    ) -> None:
+        """Store the intermediate writes of several tasks at once, asynchronously.
+
+        The writes are saved to the database in a single pipeline.
+
+        Args:
+            writes (Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]):
+                (config, writes, task_id) tuples, as passed to `aput_writes`.
+        """
+        upserts, inserts = await asyncio.to_thread(self._dump_writes_many, writes)
+        async with self._cursor(pipeline=True) as cur:
+            if upserts:
+                await cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upserts)
+            if inserts:
+                await cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, inserts)
+
+    async def aprune(
+        self, thread_ids: Sequence[str], *, strategy: PruneStrategy
+    ) -> None:
+        """Delete old checkpoints of the given threads from the database asynchronously.
+
+        The pending writes of deleted checkpoints, and any channel values no
+        longer referenced by a remaining checkpoint, are deleted too.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+        """
+        checkpoints_args, writes_args, blobs_args = self._prune_args(
+            thread_ids, strategy
+        )
+        async with self._cursor(pipeline=True) as cur:
+            await cur.execute(self.PRUNE_CHECKPOINTS_SQL, checkpoints_args)
+            await cur.execute(self.PRUNE_CHECKPOINT_WRITES_SQL, writes_args)
+            await cur.execute(self.PRUNE_CHECKPOINT_BLOBS_SQL, blobs_args)
+
+    async def _aload_checkpoint_deltas(
+        self,
+        cur: AsyncCursor[DictRow],
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint: Checkpoint,
+    ) -> Checkpoint:
+        channels, versions = self._delta_bases(checkpoint)
+        if not channels:
+            return self._load_deltas(checkpoint, [])
+        # use a separate cursor, as `cur` may still be iterating over checkpoints
+        async with cur.connection.cursor(binary=True, row_factory=dict_row) as bcur:
+            await bcur.execute(
+                self.SELECT_DELTA_BASES_SQL,
+                (thread_id, checkpoint_ns, channels, versions),
+            )
+            return await asyncio.to_thread(
+                self._load_deltas, checkpoint, await bcur.fetchall()
+            )
+
     @asynccontextmanager
     async def _cursor(
         self, *, pipeline: bool = False
@@ -383,7 +573,36 @@ class AsyncPostgresSaver(BasePostgresSaver):
         while True:
             try:
                 yield asyncio.run_coroutine_threadsafe(
-                    anext(aiter_),  # noqa: F821
+                    cast(Coroutine[Any, Any, CheckpointTuple], anext(aiter_)),  # noqa: F821
+                    self.loop,
+                ).result()
+            except StopAsyncIteration:
+                break
+
+    def list_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints from the database.
+
+        Args:
+            config (Optional[RunnableConfig]): Base configuration for filtering checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata.
+            before (Optional[RunnableConfig]): If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            Iterator[CheckpointMetadataTuple]: An iterator of matching checkpoint metadata tuples.
+        """
+        aiter_ = self.alist_metadata(config, filter=filter, before=before, limit=limit)
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(
+                    cast(Coroutine[Any, Any, CheckpointMetadataTuple], anext(aiter_)),  # noqa: F821
                     self.loop,
                 ).result()
             except StopAsyncIteration:
@@ -419,6 +638,21 @@ class AsyncPostgresSaver(BasePostgresSaver):
             self.aget_tuple(config), self.loop
         ).result()
 
+    def get_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Get the checkpoint tuples of several configs from the database.
+
+        Args:
+            configs (Sequence[RunnableConfig]): The configs to use for retrieving the checkpoints.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The retrieved checkpoint tuples, in the order of the configs, with None for each checkpoint not found.
+        """  # noqa
+        return asyncio.run_coroutine_threadsafe(
+            self.aget_tuples(configs), self.loop
+        ).result()
+
     def put(
         self,
         config: RunnableConfig,
@@ -463,5 +697,30 @@ class AsyncPostgresSaver(BasePostgresSaver):
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
 
+    def put_writes_many(
+        self, writes: Sequence[tuple[RunnableConfig, Sequence[tuple[str, Any]], str]]
+    ) -> None:
+        """Store the intermediate writes of several tasks at once.
+
+        Args:
+            writes (Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]):
+                (config, writes, task_id) tuples, as passed to `put_writes`.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_many(writes), self.loop
+        ).result()
+
+    def prune(self, thread_ids: Sequence[str], *, strategy: PruneStrategy) -> None:
+        """Delete old checkpoints of the given threads from the database.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aprune(thread_ids, strategy=strategy), self.loop
+        ).result()
+
 
 __all__ = ["AsyncPostgresSaver", "Conn"]
@@ -1,5 +1,5 @@
 import random
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from typing import Any, Optional, cast
 
 from langchain_core.runnables import RunnableConfig
@@ -11,7 +11,12 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    DeltaValue,
+    LazyChannelValues,
+    PruneStrategy,
+    dump_delta,
     get_checkpoint_id,
+    load_delta,
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
@@ -57,6 +62,7 @@ MIGRATIONS = [
     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
 );""",
     "ALTER TABLE checkpoint_blobs ALTER COLUMN blob DROP not null;",
+    "ALTER TABLE checkpoint_blobs ADD COLUMN IF NOT EXISTS base TEXT[];",
 ]
 
 SELECT_SQL = f"""
@@ -68,7 +74,7 @@ select
     parent_checkpoint_id,
     metadata,
     (
-        select array_agg(array[bl.channel::bytea, bl.type::bytea, bl.blob])
+        select array_agg(array[bl.channel::bytea, bl.type::bytea, bl.blob, (bl.base is not null)::text::bytea])
         from jsonb_each_text(checkpoint -> 'channel_versions')
         inner join checkpoint_blobs bl
             on bl.thread_id = checkpoints.thread_id
@@ -94,12 +100,29 @@ select
     ) as pending_sends
 from checkpoints """
 
+SELECT_METADATA_SQL = """
+select
+    thread_id,
+    checkpoint_ns,
+    checkpoint_id,
+    parent_checkpoint_id,
+    metadata
+from checkpoints """
+
 UPSERT_CHECKPOINT_BLOBS_SQL = """
-    INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob)
-    VALUES (%s, %s, %s, %s, %s, %s)
+    INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, base)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
     ON CONFLICT (thread_id, checkpoint_ns, channel, version) DO NOTHING
 """
 
+SELECT_DELTA_BASES_SQL = """
+    select channel, version, type, blob
+    from checkpoint_blobs
+    where thread_id = %s
+        and checkpoint_ns = %s
+        and (channel, version) in (select * from unnest(%s::text[], %s::text[]))
+"""
+
 UPSERT_CHECKPOINTS_SQL = """
     INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint, metadata)
     VALUES (%s, %s, %s, %s, %s, %s)
@@ -124,14 +147,76 @@ INSERT_CHECKPOINT_WRITES_SQL = """
     ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id, task_id, idx) DO NOTHING
 """
 
+PRUNE_CHECKPOINTS_SQL = """
+    delete from checkpoints
+    where (thread_id, checkpoint_ns, checkpoint_id) in (
+        select thread_id, checkpoint_ns, checkpoint_id
+        from (
+            select
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                (checkpoint ->> 'ts')::timestamptz as ts,
+                row_number() over (
+                    partition by thread_id, checkpoint_ns
+                    order by checkpoint_id desc
+                ) as rank
+            from checkpoints
+            where thread_id = any(%s)
+        ) ranked
+        where rank > %s and (%s::timestamptz is null or ts < %s::timestamptz)
+    )
+"""
+
+PRUNE_CHECKPOINT_WRITES_SQL = """
+    delete from checkpoint_writes cw
+    where cw.thread_id = any(%s)
+        and not exists (
+            select 1
+            from checkpoints c
+            where c.thread_id = cw.thread_id
+                and c.checkpoint_ns = cw.checkpoint_ns
+                and cw.checkpoint_id in (c.checkpoint_id, c.parent_checkpoint_id)
+        )
+"""
+
+PRUNE_CHECKPOINT_BLOBS_SQL = """
+    with referenced as (
+        select c.thread_id, c.checkpoint_ns, cv.key as channel, cv.value as version
+        from checkpoints c, jsonb_each_text(c.checkpoint -> 'channel_versions') cv
+        where c.thread_id = any(%s)
+    ), needed as (
+        select thread_id, checkpoint_ns, channel, version from referenced
+        union
+        select bl.thread_id, bl.checkpoint_ns, bl.channel, unnest(bl.base)
+        from checkpoint_blobs bl
+        inner join referenced r using (thread_id, checkpoint_ns, channel, version)
+    )
+    delete from checkpoint_blobs bl
+    where bl.thread_id = any(%s)
+        and not exists (
+            select 1
+            from needed n
+            where n.thread_id = bl.thread_id
+                and n.checkpoint_ns = bl.checkpoint_ns
+                and n.channel = bl.channel
+                and n.version = bl.version
+        )
+"""
+
 
 class BasePostgresSaver(BaseCheckpointSaver[str]):
     SELECT_SQL = SELECT_SQL
+    SELECT_METADATA_SQL = SELECT_METADATA_SQL
     MIGRATIONS = MIGRATIONS
     UPSERT_CHECKPOINT_BLOBS_SQL = UPSERT_CHECKPOINT_BLOBS_SQL
+    SELECT_DELTA_BASES_SQL = SELECT_DELTA_BASES_SQL
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
     UPSERT_CHECKPOINT_WRITES_SQL = UPSERT_CHECKPOINT_WRITES_SQL
     INSERT_CHECKPOINT_WRITES_SQL = INSERT_CHECKPOINT_WRITES_SQL
+    PRUNE_CHECKPOINTS_SQL = PRUNE_CHECKPOINTS_SQL
+    PRUNE_CHECKPOINT_WRITES_SQL = PRUNE_CHECKPOINT_WRITES_SQL
+    PRUNE_CHECKPOINT_BLOBS_SQL = PRUNE_CHECKPOINT_BLOBS_SQL
 
     jsonplus_serde = JsonPlusSerializer()
     supports_pipeline: bool
@@ -154,15 +239,21 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         return {**checkpoint, "pending_sends": []}
 
     def _load_blobs(
-        self, blob_values: list[tuple[bytes, bytes, bytes]]
+        self, blob_values: list[tuple[bytes, bytes, bytes, bytes]]
     ) -> dict[str, Any]:
         if not blob_values:
             return {}
-        return {
-            k.decode(): self.serde.loads_typed((t.decode(), v))
-            for k, t, v in blob_values
-            if t.decode() != "empty"
-        }
+        # values are deserialized when first read, except delta-encoded ones,
+        # which are reassembled from their base blobs right away
+        values = LazyChannelValues(self.serde)
+        for k, t, v, is_delta in blob_values:
+            if t.decode() == "empty":
+                continue
+            if is_delta == b"true":
+                values.loaded[k.decode()] = self.serde.loads_typed((t.decode(), v))
+            else:
+                values.serialized[k.decode()] = (t.decode(), v)
+        return values
 
     def _dump_blobs(
         self,
@@ -170,7 +261,7 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         checkpoint_ns: str,
         values: dict[str, Any],
         versions: ChannelVersions,
-    ) -> list[tuple[str, str, str, str, str, Optional[bytes]]]:
+    ) -> list[tuple[str, str, str, str, str, Optional[bytes], Optional[list[str]]]]:
         if not versions:
             return []
 
@@ -181,14 +272,71 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
                 k,
                 cast(str, ver),
                 *(
-                    self.serde.dumps_typed(values[k])
+                    self.serde.dumps_typed(
+                        dump_delta(values[k])
+                        if isinstance(values[k], DeltaValue)
+                        else values[k]
+                    )
                     if k in values
                     else ("empty", None)
                 ),
+                (
+                    [str(b) for b in values[k].base]
+                    if isinstance(values.get(k), DeltaValue)
+                    else None
+                ),
             )
             for k, ver in versions.items()
         ]
 
+    def _prune_args(
+        self, thread_ids: Sequence[str], strategy: PruneStrategy
+    ) -> tuple[tuple[Any, ...], tuple[Any, ...], tuple[Any, ...]]:
+        """Get the arguments of the PRUNE_CHECKPOINTS_SQL, PRUNE_CHECKPOINT_WRITES_SQL
+        and PRUNE_CHECKPOINT_BLOBS_SQL queries."""
+        ids = [str(thread_id) for thread_id in thread_ids]
+        return (
+            (ids, strategy.keep or 0, strategy.before, strategy.before),
+            (ids,),
+            (ids, ids),
+        )
+
+    def _delta_bases(self, checkpoint: Checkpoint) -> tuple[list[str], list[str]]:
+        """Get the (channels, versions) of the base blobs of the delta-encoded
+        channel values of a checkpoint, as arguments for SELECT_DELTA_BASES_SQL."""
+        keys = [
+            (k, str(b))
+            for k, v in self._loaded_values(checkpoint).items()
+            if isinstance(v, DeltaValue)
+            for b in v.base
+        ]
+        return [k for k, _ in keys], [b for _, b in keys]
+
+    def _load_deltas(
+        self, checkpoint: Checkpoint, base_blobs: Sequence[dict[str, Any]]
+    ) -> Checkpoint:
+        """Reassemble the delta-encoded channel values of a checkpoint, from the
+        rows returned by SELECT_DELTA_BASES_SQL."""
+        loaded = {
+            (row["channel"], row["version"]): self.serde.loads_typed(
+                (row["type"], row["blob"])
+            )
+            for row in base_blobs
+        }
+        values = checkpoint["channel_values"]
+        for k, v in list(self._loaded_values(checkpoint).items()):
+            if isinstance(v, DeltaValue):
+                bases = [loaded[(k, str(b))] for b in v.base if (k, str(b)) in loaded]
+                values[k] = load_delta(v, checkpoint["channel_versions"][k], bases)
+        return checkpoint
+
+    def _loaded_values(self, checkpoint: Checkpoint) -> dict[str, Any]:
+        """Get the channel values of a checkpoint which are already deserialized."""
+        values = checkpoint["channel_values"]
+        if isinstance(values, LazyChannelValues):
+            return values.loaded
+        return values
+
     def _load_writes(
         self, writes: list[tuple[bytes, bytes, bytes, bytes]]
     ) -> list[tuple[str, str, Any]]:
@@ -226,6 +374,30 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             for idx, (channel, value) in enumerate(writes)
         ]
 
+    def _dump_writes_many(
+        self, writes: Sequence[tuple[RunnableConfig, Sequence[tuple[str, Any]], str]]
+    ) -> tuple[
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+    ]:
+        """Get the arguments of the UPSERT_CHECKPOINT_WRITES_SQL and
+        INSERT_CHECKPOINT_WRITES_SQL queries for the writes of several tasks."""
+        upserts: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        inserts: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        for config, task_writes, task_id in writes:
+            (
+                upserts if all(w[0] in WRITES_IDX_MAP for w in task_writes) else inserts
+            ).extend(
+                self._dump_writes(
+                    config["configurable"]["thread_id"],
+                    config["configurable"]["checkpoint_ns"],
+                    config["configurable"]["checkpoint_id"],
+                    task_id,
+                    task_writes,
+                )
+            )
+        return upserts, inserts
+
     def _load_metadata(self, metadata: dict[str, Any]) -> CheckpointMetadata:
         return self.jsonplus_serde.loads(self.jsonplus_serde.dumps(metadata))
 
@@ -288,3 +460,61 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             "WHERE " + " AND ".join(wheres) if wheres else "",
             param_values,
         )
+
+    def _get_tuples_where(
+        self, configs: Sequence[RunnableConfig]
+    ) -> tuple[str, list[Any]]:
+        """Return WHERE clause predicates for get_tuples() given configs.
+
+        The predicate matches the checkpoints with one of the checkpoint IDs of the
+        configs, and the latest checkpoint of each thread and namespace, in the threads
+        and namespaces of the configs. This can match more checkpoints than requested,
+        see _requested_checkpoints().
+        """
+        thread_ids = list(
+            dict.fromkeys(str(c["configurable"]["thread_id"]) for c in configs)
+        )
+        checkpoint_nss = list(
+            dict.fromkeys(c["configurable"].get("checkpoint_ns", "") for c in configs)
+        )
+        checkpoint_ids = [cid for c in configs if (cid := get_checkpoint_id(c))]
+        matches = []
+        param_values: list[Any] = [thread_ids, checkpoint_nss]
+        if checkpoint_ids:
+            matches.append("checkpoint_id = ANY(%s)")
+            param_values.append(checkpoint_ids)
+        if len(checkpoint_ids) < len(configs):
+            matches.append(
+                "checkpoint_id = (select max(latest.checkpoint_id) from checkpoints latest "
+                "where latest.thread_id = checkpoints.thread_id "
+                "and latest.checkpoint_ns = checkpoints.checkpoint_ns)"
+            )
+        return (
+            "WHERE thread_id = ANY(%s) AND checkpoint_ns = ANY(%s) "
+            f"AND ({' OR '.join(matches)})",
+            param_values,
+        )
+
+    def _requested_checkpoints(
+        self,
+        configs: Sequence[RunnableConfig],
+        found: Collection[tuple[str, str, str]],
+    ) -> list[Optional[tuple[str, str, str]]]:
+        """Return the (thread_id, checkpoint_ns, checkpoint_id) of the checkpoint
+        requested by each config among the found ones, or None if not found."""
+        latest: dict[tuple[str, str], str] = {}
+        for thread_id, checkpoint_ns, checkpoint_id in found:
+            if checkpoint_id > latest.get((thread_id, checkpoint_ns), ""):
+                latest[(thread_id, checkpoint_ns)] = checkpoint_id
+        keys: list[Optional[tuple[str, str, str]]] = []
+        for config in configs:
+            thread_id = str(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+            if checkpoint_id := get_checkpoint_id(config):
+                key = (thread_id, checkpoint_ns, checkpoint_id)
+                keys.append(key if key in found else None)
+            elif checkpoint_id := latest.get((thread_id, checkpoint_ns)):
+                keys.append((thread_id, checkpoint_ns, checkpoint_id))
+            else:
+                keys.append(None)
+        return keys
@@ -124,12 +124,14 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
             Callable[[Union[bytes, orjson.Fragment]], dict[str, Any]]
         ] = None,
         index: Optional[PostgresIndexConfig] = None,
+        max_batch_size: Optional[int] = None,
+        max_linger_ms: float = 0,
     ) -> None:
         if isinstance(conn, AsyncConnectionPool) and pipe is not None:
             raise ValueError(
                 "Pipeline should be used only with a single AsyncConnection, not AsyncConnectionPool."
             )
-        super().__init__()
+        super().__init__(max_batch_size=max_batch_size, max_linger_ms=max_linger_ms)
         self._deserializer = deserializer
         self.conn = conn
         self.pipe = pipe
@@ -332,19 +334,16 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
                     f"Please provide an EmbeddingConfig when initializing the {self.__class__.__name__}."
                 )
             query, txt_params = embedding_request
-            vectors = await self.embeddings.aembed_documents(
-                [param[-1] for param in txt_params]
+            # Only embed the fields whose text changed since they were last embedded
+            await cur.execute(query, [p for param in txt_params for p in param[:4]])
+            txt_params = self._filter_unchanged_vectors(
+                txt_params, await cur.fetchall()
             )
-            queries.append(
-                (
-                    query,
-                    [
-                        p
-                        for (ns, k, pathname, _), vector in zip(txt_params, vectors)
-                        for p in (ns, k, pathname, vector)
-                    ],
+            if txt_params:
+                vectors = await self.embeddings.aembed_documents(
+                    [param[-1] for param in txt_params]
                 )
-            )
+                queries.append(self._get_vector_upsert_query(txt_params, vectors))
 
         for query, params in queries:
             await cur.execute(query, params)
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import json
 import logging
 import threading
@@ -30,7 +31,6 @@ from typing_extensions import TypedDict
 from langgraph.checkpoint.postgres import _ainternal as _ainternal
 from langgraph.checkpoint.postgres import _internal as _pg_internal
 from langgraph.store.base import (
-    BaseStore,
     GetOp,
     IndexConfig,
     Item,
@@ -38,12 +38,14 @@ from langgraph.store.base import (
     Op,
     PutOp,
     Result,
+    SearchCursor,
     SearchItem,
     SearchOp,
     ensure_embeddings,
     get_text_at_path,
     tokenize_path,
 )
+from langgraph.store.base.batch import SyncBatchedBaseStore
 
 if TYPE_CHECKING:
     from langchain_core.embeddings import Embeddings
@@ -74,6 +76,10 @@ CREATE TABLE IF NOT EXISTS store (
     """
 -- For faster lookups by prefix
 CREATE INDEX IF NOT EXISTS store_prefix_idx ON store USING btree (prefix text_pattern_ops);
+""",
+    """
+-- For keyset pagination of searches
+CREATE INDEX IF NOT EXISTS store_updated_at_idx ON store USING btree (updated_at DESC, prefix DESC, key DESC);
 """,
 ]
 
@@ -125,6 +131,11 @@ CREATE INDEX IF NOT EXISTS store_vectors_embedding_idx ON store_vectors
             ),
         },
     ),
+    Migration(
+        """
+ALTER TABLE store_vectors ADD COLUMN IF NOT EXISTS text_hash text;
+""",
+    ),
 ]
 
 
@@ -246,7 +257,7 @@ class BasePostgresStore(Generic[C]):
         put_ops: Sequence[tuple[int, PutOp]],
     ) -> tuple[
         list[tuple[str, Sequence]],
-        Optional[tuple[str, Sequence[tuple[str, str, str, str]]]],
+        Optional[tuple[str, Sequence[tuple[str, str, str, str, str]]]],
     ]:
         # Last-write wins
         dedupped_ops: dict[tuple[tuple[str, ...], str], PutOp] = {}
@@ -274,9 +285,9 @@ class BasePostgresStore(Generic[C]):
                 )
                 params = (_namespace_to_text(namespace), *keys)
                 queries.append((query, params))
-        embedding_request: Optional[tuple[str, Sequence[tuple[str, str, str, str]]]] = (
-            None
-        )
+        embedding_request: Optional[
+            tuple[str, Sequence[tuple[str, str, str, str, str]]]
+        ] = None
         if inserts:
             values = []
             insertion_params = []
@@ -312,10 +323,18 @@ class BasePostgresStore(Generic[C]):
                         texts = get_text_at_path(value, tokenized_path)
                         for i, text in enumerate(texts):
                             pathname = f"{path}.{i}" if len(texts) > 1 else path
-                            vector_values.append(
-                                "(%s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                            vector_values.append("(%s, %s, %s, %s)")
+                            embedding_request_params.append(
+                                (
+                                    ns,
+                                    k,
+                                    pathname,
+                                    _text_hash(
+                                        text, self.index_config["__embed_fingerprint"]
+                                    ),
+                                    text,
+                                )
                             )
-                            embedding_request_params.append((ns, k, pathname, text))
 
             values_str = ",".join(values)
             query = f"""
@@ -328,29 +347,65 @@ class BasePostgresStore(Generic[C]):
             queries.append((query, insertion_params))
 
             if vector_values:
+                # Look up the fields whose text is unchanged since it was last
+                # embedded, so that they can be skipped.
                 values_str = ",".join(vector_values)
                 query = f"""
-                    INSERT INTO store_vectors (prefix, key, field_name, embedding, created_at, updated_at)
-                    VALUES {values_str}
-                    ON CONFLICT (prefix, key, field_name) DO UPDATE
-                    SET embedding = EXCLUDED.embedding,
-                        updated_at = CURRENT_TIMESTAMP
+                    SELECT prefix, key, field_name FROM store_vectors
+                    WHERE (prefix, key, field_name, text_hash) IN (VALUES {values_str})
                 """
                 embedding_request = (query, embedding_request_params)
 
         return queries, embedding_request
 
+    def _filter_unchanged_vectors(
+        self,
+        txt_params: Sequence[tuple[str, str, str, str, str]],
+        unchanged: Iterable[DictRow],
+    ) -> list[tuple[str, str, str, str, str]]:
+        """Return the fields that need to be (re-)embedded, given the rows
+        of the stored fields whose text hash is unchanged."""
+        skip = {(row["prefix"], row["key"], row["field_name"]) for row in unchanged}
+        return [param for param in txt_params if param[:3] not in skip]
+
+    def _get_vector_upsert_query(
+        self,
+        txt_params: Sequence[tuple[str, str, str, str, str]],
+        vectors: Sequence[Sequence[float]],
+    ) -> tuple[str, Sequence]:
+        values_str = ",".join(
+            ["(%s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"]
+            * len(txt_params)
+        )
+        query = f"""
+            INSERT INTO store_vectors (prefix, key, field_name, text_hash, embedding, created_at, updated_at)
+            VALUES {values_str}
+            ON CONFLICT (prefix, key, field_name) DO UPDATE
+            SET embedding = EXCLUDED.embedding,
+                text_hash = EXCLUDED.text_hash,
+                updated_at = CURRENT_TIMESTAMP
+        """
+        return (
+            query,
+            [
+                p
+                for (ns, k, pathname, text_hash, _), vector in zip(txt_params, vectors)
+                for p in (ns, k, pathname, text_hash, vector)
+            ],
+        )
+
     def _prepare_batch_search_queries(
         self,
         search_ops: Sequence[tuple[int, SearchOp]],
     ) -> tuple[
-        list[tuple[str, list[Union[None, str, list[float]]]]],  # queries, params
+        list[tuple[str, list[Any]]],  # queries, params
         list[tuple[int, str]],  # idx, query_text pairs to embed
     ]:
         queries = []
         embedding_requests = []
 
         for idx, (_, op) in enumerate(search_ops):
+            cursor = SearchCursor.decode(op.after) if op.after else None
             # Build filter conditions first
             filter_params = []
             filter_conditions = []
@@ -372,10 +427,8 @@ class BasePostgresStore(Generic[C]):
                 embedding_requests.append((idx, op.query))
 
                 score_operator, post_operator = _get_distance_operator(self)
-                vector_type = (
-                    cast(PostgresIndexConfig, self.index_config)
-                    .get("ann_index_config", {})
-                    .get("vector_type", "vector")
+                vector_type = self.index_config.get("ann_index_config", {}).get(
+                    "vector_type", "vector"
                 )
 
                 if (
@@ -396,20 +449,41 @@ class BasePostgresStore(Generic[C]):
                 expanded_limit = (op.limit * vectors_per_doc_estimate * 2) + 1
 
                 # Vector search with CTE for proper score handling
-                filter_str = (
-                    ""
-                    if not filter_conditions
-                    else " AND " + " AND ".join(filter_conditions)
-                )
+                conditions = list(filter_conditions)
+                ns_args: Sequence = ()
                 if op.namespace_prefix:
-                    prefix_filter_str = f"WHERE s.prefix LIKE %s {filter_str} "
-                    ns_args: Sequence = (f"{_namespace_to_text(op.namespace_prefix)}%",)
-                else:
-                    ns_args = ()
-                    if filter_str:
-                        prefix_filter_str = f"WHERE {filter_str} "
-                    else:
-                        prefix_filter_str = ""
+                    conditions.insert(0, "s.prefix LIKE %s")
+                    ns_args = (f"{_namespace_to_text(op.namespace_prefix)}%",)
+                cursor_args: Sequence = ()
+                after_str = ""
+                if cursor is not None:
+                    if cursor.score is None:
+                        raise ValueError(
+                            "Cannot continue a search with a query after the cursor "
+                            "of a search without one."
+                        )
+                    # Documents with any vector scoring better than the cursor
+                    # come before it, as their score is their best vector's
+                    vector_score = post_operator.replace(
+                        "scored.neg_score",
+                        f"({score_operator.replace('sv.', 'osv.')})",
+                    )
+                    conditions.append(
+                        "NOT EXISTS (SELECT 1 FROM store_vectors osv "
+                        "WHERE osv.prefix = s.prefix AND osv.key = s.key "
+                        f"AND {vector_score} > %s)"
+                    )
+                    cursor_args = (
+                        _PLACEHOLDER,
+                        cursor.score,
+                        cursor.score,
+                        _namespace_to_text(cursor.namespace),
+                        cursor.key,
+                    )
+                    after_str = "WHERE (score, prefix, key) < (%s, %s, %s)"
+                prefix_filter_str = (
+                    f"WHERE {' AND '.join(conditions)} " if conditions else ""
+                )
 
                 base_query = f"""
                     WITH scored AS (
@@ -426,16 +500,19 @@ class BasePostgresStore(Generic[C]):
                         FROM scored 
                         ORDER BY prefix, key, score DESC
                     ) AS unique_docs
-                    ORDER BY score DESC
+                    {after_str}
+                    ORDER BY score DESC, prefix DESC, key DESC
                     LIMIT %s
                     OFFSET %s
                 """
-                params = [
+                params: list[Any] = [
                     _PLACEHOLDER,  # Vector placeholder
                     *ns_args,
                     *filter_params,
+                    *cursor_args[:2],
                     _PLACEHOLDER,
                     expanded_limit,
+                    *cursor_args[2:],
                     op.limit,
                     op.offset,
                 ]
@@ -453,7 +530,17 @@ class BasePostgresStore(Generic[C]):
                     params.extend(filter_params)
                     base_query += " AND " + " AND ".join(filter_conditions)
 
-                base_query += " ORDER BY updated_at DESC"
+                if cursor is not None:
+                    base_query += " AND (updated_at, prefix, key) < (%s, %s, %s)"
+                    params.extend(
+                        [
+                            cursor.updated_at,
+                            _namespace_to_text(cursor.namespace),
+                            cursor.key,
+                        ]
+                    )
+
+                base_query += " ORDER BY updated_at DESC, prefix DESC, key DESC"
                 base_query += " LIMIT %s OFFSET %s"
                 params.extend([op.limit, op.offset])
 
@@ -533,7 +620,7 @@ class BasePostgresStore(Generic[C]):
             raise ValueError(f"Unsupported operator: {op}")
 
 
-class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
+class PostgresStore(SyncBatchedBaseStore, BasePostgresStore[_pg_internal.Conn]):
     """Postgres-backed store with optional vector search using pgvector.
 
     !!! example "Examples"
@@ -604,8 +691,10 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
             Callable[[Union[bytes, orjson.Fragment]], dict[str, Any]]
         ] = None,
         index: Optional[PostgresIndexConfig] = None,
+        max_batch_size: Optional[int] = None,
+        max_linger_ms: float = 0,
     ) -> None:
-        super().__init__()
+        super().__init__(max_batch_size=max_batch_size, max_linger_ms=max_linger_ms)
         self._deserializer = deserializer
         self.conn = conn
         self.pipe = pipe
@@ -777,20 +866,14 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                     f"Please provide an Embeddings when initializing the {self.__class__.__name__}."
                 )
             query, txt_params = embedding_request
-            # Update the params to replace the raw text with the vectors
-            vectors = self.embeddings.embed_documents(
-                [param[-1] for param in txt_params]
-            )
-            queries.append(
-                (
-                    query,
-                    [
-                        p
-                        for (ns, k, pathname, _), vector in zip(txt_params, vectors)
-                        for p in (ns, k, pathname, vector)
-                    ],
+            # Only embed the fields whose text changed since they were last embedded
+            cur.execute(query, [p for param in txt_params for p in param[:4]])
+            txt_params = self._filter_unchanged_vectors(txt_params, cur.fetchall())
+            if txt_params:
+                vectors = self.embeddings.embed_documents(
+                    [param[-1] for param in txt_params]
                 )
-            )
+                queries.append(self._get_vector_upsert_query(txt_params, vectors))
 
         for query, params in queries:
             cur.execute(query, params)
@@ -909,7 +992,7 @@ def _get_vector_type_ops(store: BasePostgresStore) -> str:
     if not store.index_config:
         return "vector_cosine_ops"
 
-    config = cast(PostgresIndexConfig, store.index_config)
+    config = store.index_config
     index_config = config.get("ann_index_config", _DEFAULT_ANN_CONFIG).copy()
     vector_type = cast(str, index_config.get("vector_type", "vector"))
     if vector_type not in ("vector", "halfvec"):
@@ -948,6 +1031,29 @@ def _get_index_params(store: Any) -> tuple[str, dict[str, Any]]:
     return kind, index_config
 
 
+def _text_hash(text: str, fingerprint: str) -> str:
+    """Hash a text together with the fingerprint of the index config embedding it,
+    so that stored vectors are recomputed when the embedding model changes."""
+    return hashlib.sha256(
+        f"{fingerprint}\0{text}".encode("utf-8", "surrogatepass")
+    ).hexdigest()
+
+
+def _embed_fingerprint(index_config: PostgresIndexConfig) -> str:
+    """Identify the embedding model and dimensions of an index config."""
+    embed = index_config.get("embed")
+    if isinstance(embed, str):
+        name = embed
+    else:
+        kind: Any = embed if hasattr(embed, "__qualname__") else type(embed)
+        name = f"{kind.__module__}.{kind.__qualname__}"
+        for attr in ("model", "model_name", "deployment"):
+            if isinstance(model := getattr(embed, attr, None), str):
+                name = f"{name}:{model}"
+                break
+    return f"{name}:{index_config['dims']}"
+
+
 def _namespace_to_text(
     namespace: tuple[str, ...], handle_wildcards: bool = False
 ) -> str:
@@ -1100,8 +1206,10 @@ def _ensure_index_config(
             tot += len(toks)
     index_config["__tokenized_fields"] = tokenized
     index_config["__estimated_num_vectors"] = tot
+    index_config["__embed_fingerprint"] = _embed_fingerprint(index_config)
     embeddings = ensure_embeddings(
         index_config.get("embed"),
+        cache=index_config.get("cache"),
     )
     return embeddings, index_config
 
@@ -14,7 +14,9 @@ from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
     create_checkpoint,
+    delete_thread,
     empty_checkpoint,
+    keep_latest,
 )
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from tests.conftest import DEFAULT_POSTGRES_URI
@@ -226,3 +228,34 @@ async def test_null_chars(request, saver_name: str, test_data) -> None:
         assert [c async for c in saver.alist(None, filter={"my_key": "abc"})][
             0
         ].metadata["my_key"] == "abc"
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+async def test_aprune(saver_name: str) -> None:
+    async with _saver(saver_name) as saver:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+        }
+        configs = []
+        version = None
+        for i in range(1, 4):
+            version = saver.get_next_version(version, None)
+            checkpoint = create_checkpoint(empty_checkpoint(), None, i)
+            checkpoint["channel_values"] = {"count": i}
+            checkpoint["channel_versions"] = {"count": version}
+            config = await saver.aput(config, checkpoint, {}, {"count": version})
+            await saver.aput_writes(config, [("count", i)], f"task-{i}")
+            configs.append(config)
+
+        await saver.aprune(["thread-1"], strategy=keep_latest(1))
+
+        remaining = [c async for c in saver.alist(None)]
+        assert [c.config for c in remaining] == [configs[2]]
+        assert remaining[0].checkpoint["channel_values"] == {"count": 3}
+        async with saver._cursor() as cur:
+            await cur.execute("select version from checkpoint_blobs")
+            assert [r["version"] for r in await cur.fetchall()] == [version]
+
+        await saver.aprune(["thread-1"], strategy=delete_thread)
+
+        assert [c async for c in saver.alist(None)] == []
@@ -473,6 +473,38 @@ def test_vector_update_with_embedding(vector_store: PostgresStore) -> None:
     assert not any(r.key == "doc4" for r in results_new)
 
 
+def test_vector_update_skips_unchanged_fields(
+    fake_embeddings: CharacterEmbeddings,
+) -> None:
+    """Test that only fields whose text changed are re-embedded on update."""
+    embedded: list[str] = []
+
+    class RecordingEmbeddings(CharacterEmbeddings):
+        def embed_documents(self, texts: list[str]) -> list[list[float]]:
+            embedded.extend(texts)
+            return super().embed_documents(texts)
+
+    with _create_vector_store(
+        "vector",
+        "cosine",
+        RecordingEmbeddings(dims=fake_embeddings.dims),
+        text_fields=["title", "body"],
+    ) as store:
+        store.put(("test",), "doc1", {"title": "zebras", "body": "stripes"})
+        assert sorted(embedded) == ["stripes", "zebras"]
+
+        embedded.clear()
+        store.put(("test",), "doc1", {"title": "zebras", "body": "stripes"})
+        assert embedded == []
+
+        store.put(("test",), "doc1", {"title": "zebras", "body": "spots"})
+        assert embedded == ["spots"]
+
+        results = store.search(("test",), query="spots")
+        assert results[0].key == "doc1"
+        assert results[0].value == {"title": "zebras", "body": "spots"}
+
+
 def test_vector_search_with_filters(vector_store: PostgresStore) -> None:
     """Test combining vector search with filters."""
     # Insert test documents
@@ -526,6 +558,54 @@ def test_vector_search_pagination(vector_store: PostgresStore) -> None:
     all_results = vector_store.search(("test",), query="test", limit=10)
     assert len(all_results) == 5
 
+    # Page with cursors, with and without a query
+    for query in ("test", None):
+        pages = []
+        after = None
+        while page := vector_store.search(("test",), query=query, limit=2, after=after):
+            pages.append(page)
+            after = page[-1].cursor
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [item for page in pages for item in page] == vector_store.search(
+            ("test",), query=query, limit=10
+        )
+
+
+def test_vector_search_pagination_multi_field(
+    fake_embeddings: CharacterEmbeddings,
+) -> None:
+    """Test that cursors page over documents, not their field vectors."""
+    with _create_vector_store(
+        "vector",
+        "cosine",
+        fake_embeddings,
+        text_fields=["title", "body"],
+    ) as store:
+        docs = [
+            ("doc1", "zebra", "nothing alike"),
+            ("doc2", "unrelated words", "zebra stripes"),
+            ("doc3", "zebras", "zebra"),
+            ("doc4", "horses", "zebra crossing"),
+            ("doc5", "lorem ipsum", "dolor sit"),
+        ]
+        for key, title, body in docs:
+            store.put(("test",), key, {"title": title, "body": body})
+
+        expected = store.search(("test",), query="zebra", limit=10)
+        assert len(expected) == 5
+
+        for limit in (1, 2):
+            pages = []
+            after = None
+            while page := store.search(
+                ("test",), query="zebra", limit=limit, after=after
+            ):
+                pages.append(page)
+                after = page[-1].cursor
+            items = [item for page in pages for item in page]
+            assert len({item.key for item in items}) == len(items)
+            assert items == expected
+
 
 def test_vector_search_edge_cases(vector_store: PostgresStore) -> None:
     """Test edge cases in vector search."""
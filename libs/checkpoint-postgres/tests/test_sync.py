@@ -13,8 +13,12 @@ from psycopg_pool import ConnectionPool
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
+    DeltaValue,
     create_checkpoint,
+    delete_thread,
     empty_checkpoint,
+    keep_latest,
 )
 from langgraph.checkpoint.postgres import PostgresSaver
 from tests.conftest import DEFAULT_POSTGRES_URI
@@ -213,3 +217,128 @@ def test_null_chars(saver_name: str, test_data) -> None:
             list(saver.list(None, filter={"my_key": "abc"}))[0].metadata["my_key"]
             == "abc"
         )
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+def test_prune(saver_name: str) -> None:
+    with _saver(saver_name) as saver:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+        }
+        configs = []
+        items: list[int] = []
+        versions: list[str] = []
+        for i in range(1, 5):
+            items = [*items, i]
+            version = saver.get_next_version(versions[-1] if versions else None, None)
+            checkpoint = create_checkpoint(empty_checkpoint(), None, i)
+            checkpoint["channel_values"] = {
+                "items": DeltaValue(items, tuple(versions), i - 1),
+                "count": i,
+            }
+            checkpoint["channel_versions"] = {"items": version, "count": version}
+            config = saver.put(
+                config, checkpoint, {}, {"items": version, "count": version}
+            )
+            saver.put_writes(config, [("count", i)], f"task-{i}")
+            configs.append(config)
+            versions.append(version)
+
+        saver.prune(["thread-1"], strategy=keep_latest(2))
+
+        remaining = list(saver.list({"configurable": {"thread_id": "thread-1"}}))
+        assert [c.config for c in remaining] == [configs[3], configs[2]]
+        # delta-encoded values are still reassembled from their base blobs
+        assert remaining[0].checkpoint["channel_values"]["items"].items == [1, 2, 3, 4]
+        assert remaining[0].pending_writes == [("task-4", "count", 4)]
+        with saver._cursor() as cur:
+            cur.execute(
+                "select channel, version from checkpoint_blobs order by channel, version"
+            )
+            assert [(r["channel"], r["version"]) for r in cur.fetchall()] == [
+                ("count", versions[2]),
+                ("count", versions[3]),
+                *(("items", v) for v in versions),
+            ]
+
+        saver.prune(["thread-1"], strategy=delete_thread)
+
+        assert list(saver.list(None)) == []
+        with saver._cursor() as cur:
+            cur.execute("select * from checkpoint_blobs")
+            assert cur.fetchall() == []
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+def test_list_metadata(saver_name: str, test_data) -> None:
+    with _saver(saver_name) as saver:
+        configs = test_data["configs"]
+        metadata = test_data["metadata"]
+
+        checkpoint = create_checkpoint(test_data["checkpoints"][0], {"count": 1}, 1)
+        checkpoint["channel_versions"] = {"count": "1"}
+        config = saver.put(configs[0], checkpoint, metadata[0], {"count": "1"})
+        saver.put_writes(config, [("count", 2)], "task-1")
+        saver.put(configs[1], test_data["checkpoints"][1], metadata[1], {})
+
+        listed = list(saver.list_metadata(None, filter={"source": "input"}))
+        assert len(listed) == 1
+        assert listed[0].config == config
+        assert listed[0].metadata == metadata[0]
+        assert isinstance(listed[0], CheckpointMetadataTuple)
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+def test_put_writes_many(saver_name: str, test_data) -> None:
+    with _saver(saver_name) as saver:
+        configs = test_data["configs"]
+        metadata = test_data["metadata"]
+
+        config = saver.put(configs[0], test_data["checkpoints"][0], metadata[0], {})
+        saver.put_writes_many(
+            [
+                (config, [("foo", 1), ("bar", 2)], "task-1"),
+                (config, [("__error__", "boom")], "task-2"),
+                (config, [("foo", 3)], "task-3"),
+            ]
+        )
+
+        assert saver.get_tuple(config).pending_writes == [
+            ("task-1", "foo", 1),
+            ("task-1", "bar", 2),
+            ("task-2", "__error__", "boom"),
+            ("task-3", "foo", 3),
+        ]
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+def test_get_tuples(saver_name: str, test_data) -> None:
+    with _saver(saver_name) as saver:
+        configs = test_data["configs"]
+        checkpoints = test_data["checkpoints"]
+        metadata = test_data["metadata"]
+
+        config_1 = saver.put(configs[0], checkpoints[0], metadata[0], {})
+        saver.put_writes(config_1, [("foo", 1)], "task-1")
+        config_2 = saver.put(configs[1], checkpoints[1], metadata[1], {})
+        config_3 = saver.put(configs[2], checkpoints[2], metadata[2], {})
+        checkpoint_4 = create_checkpoint(checkpoints[0], None, 2)
+        config_4 = saver.put(config_1, checkpoint_4, metadata[1], {})
+
+        requested: list[RunnableConfig] = [
+            {"configurable": {"thread_id": "thread-1"}},
+            config_1,
+            {"configurable": {"thread_id": "thread-2", "checkpoint_ns": "inner"}},
+            {"configurable": {"thread_id": "thread-3"}},
+            config_2,
+        ]
+        tuples = saver.get_tuples(requested)
+        assert [t.config if t else None for t in tuples] == [
+            config_4,
+            config_1,
+            config_3,
+            None,
+            config_2,
+        ]
+        assert tuples[1].pending_writes == [("task-1", "foo", 1)]
+        assert tuples == [saver.get_tuple(config) for config in requested]
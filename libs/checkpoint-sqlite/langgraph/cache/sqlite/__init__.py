@@ -0,0 +1,172 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace, ValueT
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+
+class SqliteCache(BaseCache[ValueT]):
+    """A cache of node writes persisted in a SQLite database.
+
+    Entries survive process restarts, which makes this cache suitable for
+    deterministic preprocessing and retrieval nodes whose results can be reused
+    across runs.
+
+    Note:
+        Async methods delegate to the sync implementation, since SQLite lookups
+        by primary key are fast and the connection is shared behind a lock.
+
+    Args:
+        conn (sqlite3.Connection): The SQLite database connection.
+        serde (Optional[SerializerProtocol]): The serializer to use for cached values.
+
+    Examples:
+
+        >>> from langgraph.cache.sqlite import SqliteCache
+        >>> with SqliteCache.from_conn_string("cache.sqlite") as cache:
+        ...     graph = builder.compile(cache=cache)
+    """
+
+    conn: sqlite3.Connection
+    is_setup: bool
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.conn = conn
+        self.is_setup = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def from_conn_string(cls, conn_string: str) -> Iterator["SqliteCache"]:
+        """Create a new SqliteCache instance from a connection string.
+
+        Args:
+            conn_string (str): The SQLite connection string.
+
+        Yields:
+            SqliteCache: A new SqliteCache instance.
+        """
+        with closing(
+            sqlite3.connect(
+                conn_string,
+                # https://ricardoanderegg.com/posts/python-sqlite-thread-safety/
+                check_same_thread=False,
+            )
+        ) as conn:
+            yield cls(conn)
+
+    def setup(self) -> None:
+        """Set up the cache database.
+
+        This method creates the necessary tables in the SQLite database if they don't
+        already exist. It is called automatically when needed and should not be called
+        directly by the user.
+        """
+        if self.is_setup:
+            return
+
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS cache (
+                ns TEXT NOT NULL,
+                key TEXT NOT NULL,
+                expiry REAL,
+                type TEXT NOT NULL,
+                value BLOB NOT NULL,
+                PRIMARY KEY (ns, key)
+            );
+            """
+        )
+
+        self.is_setup = True
+
+    @contextmanager
+    def cursor(self, transaction: bool = True) -> Iterator[sqlite3.Cursor]:
+        """Get a cursor for the SQLite database.
+
+        Args:
+            transaction (bool): Whether to commit the transaction when the cursor is closed. Defaults to True.
+
+        Yields:
+            sqlite3.Cursor: A cursor for the SQLite database.
+        """
+        with self.lock:
+            self.setup()
+            cur = self.conn.cursor()
+            try:
+                yield cur
+            finally:
+                if transaction:
+                    self.conn.commit()
+                cur.close()
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Get the cached values for the given keys."""
+        if not keys:
+            return {}
+        now = time.time()
+        values: dict[FullKey, Any] = {}
+        by_ns = {_ns_str(ns): ns for ns, _ in keys}
+        expired: list[tuple[str, str]] = []
+        with self.cursor() as cur:
+            # stay well below SQLITE_MAX_VARIABLE_NUMBER
+            for i in range(0, len(keys), 400):
+                chunk = keys[i : i + 400]
+                cur.execute(
+                    "SELECT ns, key, expiry, type, value FROM cache WHERE "
+                    + " OR ".join("(ns = ? AND key = ?)" for _ in chunk),
+                    [p for ns, key in chunk for p in (_ns_str(ns), key)],
+                )
+                for ns, key, expiry, type_, value in cur.fetchall():
+                    if expiry is not None and expiry <= now:
+                        expired.append((ns, key))
+                        continue
+                    values[(by_ns[ns], key)] = (type_, value)
+            if expired:
+                cur.executemany("DELETE FROM cache WHERE ns = ? AND key = ?", expired)
+        self._record(len(keys), len(values))
+        return {k: self.serde.loads_typed(v) for k, v in values.items()}
+
+    def set(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        """Set the cached values for the given keys."""
+        now = time.time()
+        params = []
+        for (ns, key), (value, ttl) in pairs.items():
+            type_, data = self.serde.dumps_typed(value)
+            expiry = now + ttl if ttl is not None else None
+            params.append((_ns_str(ns), key, expiry, type_, data))
+        with self.cursor() as cur:
+            cur.executemany(
+                "INSERT OR REPLACE INTO cache (ns, key, expiry, type, value) "
+                "VALUES (?, ?, ?, ?, ?)",
+                params,
+            )
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Delete the cached values for the given namespaces, or all if None."""
+        with self.cursor() as cur:
+            if namespaces is None:
+                cur.execute("DELETE FROM cache")
+            else:
+                cur.executemany(
+                    "DELETE FROM cache WHERE ns = ?",
+                    [(_ns_str(ns),) for ns in namespaces],
+                )
+
+
+def _ns_str(ns: Namespace) -> str:
+    return json.dumps(list(ns))
+
+
+__all__ = ["SqliteCache"]
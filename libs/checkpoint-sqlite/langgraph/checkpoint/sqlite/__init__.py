@@ -2,7 +2,17 @@ import random
 import sqlite3
 import threading
 from contextlib import closing, contextmanager
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple
+from collections import defaultdict
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from langchain_core.runnables import RunnableConfig
 
@@ -12,13 +22,31 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
+    PendingWrite,
+    PruneStrategy,
     SerializerProtocol,
     get_checkpoint_id,
+    load_delta,
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    INSERT_WRITES_SQL,
+    UPSERT_WRITES_SQL,
+    add_delta_channels_sql,
+    blobs_queries,
+    delta_keys,
+    prune_targets,
+    requested_checkpoints,
+    search_where,
+    split_deltas,
+    tuples_queries,
+    unreferenced_blobs,
+    writes_queries,
+    writes_rows,
+)
 
 _AIO_ERROR_MSG = (
     "The SqliteSaver does not support async methods. "
@@ -133,6 +161,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 type TEXT,
                 checkpoint BLOB,
                 metadata BLOB,
+                delta_channels TEXT,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
             );
             CREATE TABLE IF NOT EXISTS writes (
@@ -146,8 +175,22 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 value BLOB,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
             );
+            CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                channel TEXT NOT NULL,
+                version TEXT NOT NULL,
+                type TEXT NOT NULL,
+                blob BLOB,
+                base TEXT,
+                PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+            );
             """
         )
+        if sql := add_delta_channels_sql(
+            row[1] for row in self.conn.execute("PRAGMA table_info(checkpoints)")
+        ):
+            self.conn.execute(sql)
 
         self.is_setup = True
 
@@ -214,7 +257,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             # find the latest checkpoint for the thread_id
             if checkpoint_id := get_checkpoint_id(config):
                 cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, delta_channels FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
                     (
                         str(config["configurable"]["thread_id"]),
                         checkpoint_ns,
@@ -223,7 +266,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 )
             else:
                 cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, delta_channels FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
                     (str(config["configurable"]["thread_id"]), checkpoint_ns),
                 )
             # if a checkpoint is found, return it
@@ -235,6 +278,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     type,
                     checkpoint,
                     metadata,
+                    delta_channels,
                 ) = value
                 if not get_checkpoint_id(config):
                     config = {
@@ -244,6 +288,11 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # deserialize the checkpoint
+                loaded = self.serde.loads_typed((type, checkpoint))
+                self._load_blobs(
+                    cur, [(thread_id, checkpoint_ns, loaded, delta_channels)]
+                )
                 # find any pending writes
                 cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -253,10 +302,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
+                # deserialize the metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -275,6 +324,90 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     ],
                 )
 
+    def get_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Get the checkpoint tuples of several configs from the database.
+
+        Like `get_tuple` for each config, but the checkpoints of all configs are
+        read with a single query, and their pending writes with another one.
+
+        Args:
+            configs (Sequence[RunnableConfig]): The configs to use for retrieving the checkpoints.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The retrieved checkpoint tuples, in the order of the configs, with None for each checkpoint not found.
+        """  # noqa
+        if not configs:
+            return []
+        with self.cursor(transaction=False) as cur:
+            rows = {}
+            for query in tuples_queries(configs):
+                cur.execute(*query)
+                rows.update({tuple(row[:3]): row for row in cur.fetchall()})
+            keys = requested_checkpoints(configs, rows)
+            found = list({key for key in keys if key})
+            writes: Dict[Tuple[str, str, str], List[PendingWrite]] = defaultdict(list)
+            for query in writes_queries(found):
+                cur.execute(*query)
+                for thread_id, checkpoint_ns, checkpoint_id, *write in cur:
+                    task_id, channel, type, value = write
+                    writes[(thread_id, checkpoint_ns, checkpoint_id)].append(
+                        (task_id, channel, self.serde.loads_typed((type, value)))
+                    )
+            tuples: Dict[Tuple[str, str, str], CheckpointTuple] = {}
+            for key in found:
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    parent_checkpoint_id,
+                    type,
+                    checkpoint,
+                    metadata,
+                    _,
+                ) = rows[key]
+                tuples[key] = CheckpointTuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    self.serde.loads_typed((type, checkpoint)),
+                    self.jsonplus_serde.loads(metadata) if metadata is not None else {},
+                    (
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
+                        }
+                        if parent_checkpoint_id
+                        else None
+                    ),
+                    writes[key],
+                )
+            # reassemble delta-encoded values, with the blobs of all checkpoints
+            self._load_blobs(
+                cur,
+                [
+                    (key[0], key[1], t.checkpoint, rows[key][7])
+                    for key, t in tuples.items()
+                ],
+            )
+        # configs with a checkpoint_id are returned as given, like in get_tuple
+        return [
+            None
+            if key is None
+            else tuples[key]._replace(config=config)
+            if get_checkpoint_id(config)
+            else tuples[key]
+            for config, key in zip(configs, keys)
+        ]
+
     def list(
         self,
         config: Optional[RunnableConfig],
@@ -315,7 +448,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             [CheckpointTuple(...), ...]
         """
         where, param_values = search_where(config, filter, before)
-        query = f"""SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata
+        query = f"""SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, delta_channels
         FROM checkpoints
         {where}
         ORDER BY checkpoint_id DESC"""
@@ -331,7 +464,12 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 type,
                 checkpoint,
                 metadata,
+                delta_channels,
             ) in cur:
+                loaded = self.serde.loads_typed((type, checkpoint))
+                self._load_blobs(
+                    wcur, [(thread_id, checkpoint_ns, loaded, delta_channels)]
+                )
                 wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -344,7 +482,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -363,6 +501,66 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     ],
                 )
 
+    def list_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints from the database.
+
+        Like `list`, but the checkpoints, their channel blobs and their pending writes
+        are not read from the database. Use `get_tuple` to load a full checkpoint.
+
+        Args:
+            config (RunnableConfig): The config to use for listing the checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata. Defaults to None.
+            before (Optional[RunnableConfig]): If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
+            limit (Optional[int]): The maximum number of checkpoints to return. Defaults to None.
+
+        Yields:
+            Iterator[CheckpointMetadataTuple]: An iterator of checkpoint metadata tuples.
+        """
+        where, param_values = search_where(config, filter, before)
+        query = f"""SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, metadata
+        FROM checkpoints
+        {where}
+        ORDER BY checkpoint_id DESC"""
+        if limit:
+            query += f" LIMIT {limit}"
+        with self.cursor(transaction=False) as cur:
+            cur.execute(query, param_values)
+            for (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                parent_checkpoint_id,
+                metadata,
+            ) in cur:
+                yield CheckpointMetadataTuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    self.jsonplus_serde.loads(metadata) if metadata is not None else {},
+                    (
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
+                        }
+                        if parent_checkpoint_id
+                        else None
+                    ),
+                )
+
     def put(
         self,
         config: RunnableConfig,
@@ -396,11 +594,19 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        checkpoint, delta_channels, blobs = split_deltas(
+            self.serde, str(thread_id), checkpoint_ns, checkpoint
+        )
         type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
         serialized_metadata = self.jsonplus_serde.dumps(metadata)
         with self.cursor() as cur:
+            if blobs:
+                cur.executemany(
+                    "INSERT OR IGNORE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, base) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    blobs,
+                )
             cur.execute(
-                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, delta_channels) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
                 (
                     str(config["configurable"]["thread_id"]),
                     checkpoint_ns,
@@ -409,6 +615,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     type_,
                     serialized_checkpoint,
                     serialized_metadata,
+                    delta_channels,
                 ),
             )
         return {
@@ -456,6 +663,122 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 ],
             )
 
+    def put_writes_many(
+        self, writes: Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]
+    ) -> None:
+        """Store the intermediate writes of several tasks at once.
+
+        The writes are saved to the SQLite database in a single transaction.
+
+        Args:
+            writes (Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]):
+                (config, writes, task_id) tuples, as passed to `put_writes`.
+        """
+        upserts, inserts = writes_rows(self.serde, writes)
+        with self.cursor() as cur:
+            if upserts:
+                cur.executemany(UPSERT_WRITES_SQL, upserts)
+            if inserts:
+                cur.executemany(INSERT_WRITES_SQL, inserts)
+
+    def prune(self, thread_ids: Sequence[str], *, strategy: PruneStrategy) -> None:
+        """Delete old checkpoints of the given threads from the database.
+
+        The pending writes of deleted checkpoints, and any stored channel values
+        no longer referenced by a remaining checkpoint, are deleted too.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+
+        Examples:
+            >>> from langgraph.checkpoint.base import keep_latest
+            >>> from langgraph.checkpoint.sqlite import SqliteSaver
+            >>> with SqliteSaver.from_conn_string("checkpoints.sqlite") as memory:
+            >>>     memory.prune(["1", "2"], strategy=keep_latest(10))
+        """
+        params = [str(thread_id) for thread_id in thread_ids]
+        if not params:
+            return
+        in_threads = f"thread_id IN ({', '.join('?' * len(params))})"
+        with self.cursor() as cur:
+            cur.execute(
+                f"SELECT thread_id, checkpoint_ns, checkpoint_id, type, checkpoint FROM (SELECT *, row_number() OVER (PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC) AS rank FROM checkpoints WHERE {in_threads}) WHERE rank > ?",
+                (*params, strategy.keep or 0),
+            )
+            cur.executemany(
+                "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                prune_targets(self.serde, strategy, cur.fetchall()),
+            )
+            # keep the writes of the parents of remaining checkpoints,
+            # which hold their pending sends
+            cur.execute(
+                f"DELETE FROM writes WHERE {in_threads} AND NOT EXISTS (SELECT 1 FROM checkpoints c WHERE c.thread_id = writes.thread_id AND c.checkpoint_ns = writes.checkpoint_ns AND writes.checkpoint_id IN (c.checkpoint_id, c.parent_checkpoint_id))",
+                params,
+            )
+            cur.execute(
+                f"SELECT thread_id, checkpoint_ns, channel, version, base FROM checkpoint_blobs WHERE {in_threads}",
+                params,
+            )
+            if blobs := cur.fetchall():
+                cur.execute(
+                    f"SELECT thread_id, checkpoint_ns, type, checkpoint FROM checkpoints WHERE {in_threads}",
+                    params,
+                )
+                cur.executemany(
+                    "DELETE FROM checkpoint_blobs WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+                    unreferenced_blobs(self.serde, cur.fetchall(), blobs),
+                )
+
+    def _load_blobs(
+        self,
+        cur: sqlite3.Cursor,
+        checkpoints: Sequence[Tuple[str, str, Checkpoint, Optional[str]]],
+    ) -> None:
+        """Reassemble the delta-encoded channel values of checkpoints, given as
+        (thread_id, checkpoint_ns, checkpoint, delta_channels), reading the blobs
+        of all of them together."""
+        missing = [
+            ((thread_id, checkpoint_ns, k, version), checkpoint)
+            for thread_id, checkpoint_ns, checkpoint, delta_channels in checkpoints
+            for k, version in delta_keys(checkpoint, delta_channels)
+        ]
+        if not missing:
+            return
+        deltas = self._read_blobs(cur, list({key for key, _ in missing}))
+        bases = self._read_blobs(
+            cur,
+            list(
+                {
+                    (thread_id, checkpoint_ns, channel, str(b))
+                    for (thread_id, checkpoint_ns, channel, _), v in deltas.items()
+                    for b in v.base
+                }
+            ),
+        )
+        for key, checkpoint in missing:
+            if (v := deltas.get(key)) is None:
+                continue
+            thread_id, checkpoint_ns, channel, version = key
+            base_keys = [(thread_id, checkpoint_ns, channel, str(b)) for b in v.base]
+            chain = [bases[b] for b in base_keys if b in bases]
+            checkpoint["channel_values"][channel] = load_delta(v, version, chain)
+
+    def _read_blobs(
+        self, cur: sqlite3.Cursor, keys: Sequence[Tuple[str, str, str, str]]
+    ) -> Dict[Tuple[str, str, str, str], Any]:
+        """Read the checkpoint_blobs rows of the given
+        (thread_id, checkpoint_ns, channel, version)."""
+        blobs: Dict[Tuple[str, str, str, str], Any] = {}
+        for query in blobs_queries(keys):
+            cur.execute(*query)
+            for thread_id, checkpoint_ns, channel, version, type, blob in cur:
+                blobs[(thread_id, checkpoint_ns, channel, version)] = (
+                    self.serde.loads_typed((type, blob))
+                )
+        return blobs
+
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -465,6 +788,17 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """
         raise NotImplementedError(_AIO_ERROR_MSG)
 
+    async def aget_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Get the checkpoint tuples of several configs from the database asynchronously.
+
+        Note:
+            This async method is not supported by the SqliteSaver class.
+            Use get_tuples() instead, or consider using [AsyncSqliteSaver][langgraph.checkpoint.sqlite.aio.AsyncSqliteSaver].
+        """
+        raise NotImplementedError(_AIO_ERROR_MSG)
+
     async def alist(
         self,
         config: Optional[RunnableConfig],
@@ -482,6 +816,23 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         raise NotImplementedError(_AIO_ERROR_MSG)
         yield
 
+    async def alist_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints from the database asynchronously.
+
+        Note:
+            This async method is not supported by the SqliteSaver class.
+            Use list_metadata() instead, or consider using [AsyncSqliteSaver][langgraph.checkpoint.sqlite.aio.AsyncSqliteSaver].
+        """
+        raise NotImplementedError(_AIO_ERROR_MSG)
+        yield
+
     async def aput(
         self,
         config: RunnableConfig,
@@ -497,6 +848,28 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """
         raise NotImplementedError(_AIO_ERROR_MSG)
 
+    async def aput_writes_many(
+        self, writes: Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]
+    ) -> None:
+        """Store the intermediate writes of several tasks at once, asynchronously.
+
+        Note:
+            This async method is not supported by the SqliteSaver class.
+            Use put_writes_many() instead, or consider using [AsyncSqliteSaver][langgraph.checkpoint.sqlite.aio.AsyncSqliteSaver].
+        """
+        raise NotImplementedError(_AIO_ERROR_MSG)
+
+    async def aprune(
+        self, thread_ids: Sequence[str], *, strategy: PruneStrategy
+    ) -> None:
+        """Delete old checkpoints of the given threads asynchronously.
+
+        Note:
+            This async method is not supported by the SqliteSaver class.
+            Use prune() instead, or consider using [AsyncSqliteSaver][langgraph.checkpoint.sqlite.aio.AsyncSqliteSaver].
+        """
+        raise NotImplementedError(_AIO_ERROR_MSG)
+
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         """Generate the next version ID for a channel.
 
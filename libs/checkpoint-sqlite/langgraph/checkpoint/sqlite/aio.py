@@ -1,16 +1,20 @@
 import asyncio
 import random
+from collections import defaultdict
 from contextlib import asynccontextmanager
 from typing import (
     Any,
     AsyncIterator,
     Callable,
+    Coroutine,
     Dict,
     Iterator,
+    List,
     Optional,
     Sequence,
     Tuple,
     TypeVar,
+    cast,
 )
 
 import aiosqlite
@@ -22,13 +26,31 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
+    PendingWrite,
+    PruneStrategy,
     SerializerProtocol,
     get_checkpoint_id,
+    load_delta,
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    INSERT_WRITES_SQL,
+    UPSERT_WRITES_SQL,
+    add_delta_channels_sql,
+    blobs_queries,
+    delta_keys,
+    prune_targets,
+    requested_checkpoints,
+    search_where,
+    split_deltas,
+    tuples_queries,
+    unreferenced_blobs,
+    writes_queries,
+    writes_rows,
+)
 
 T = TypeVar("T", bound=Callable)
 
@@ -169,6 +191,21 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             self.aget_tuple(config), self.loop
         ).result()
 
+    def get_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Get the checkpoint tuples of several configs from the database.
+
+        Args:
+            configs (Sequence[RunnableConfig]): The configs to use for retrieving the checkpoints.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The retrieved checkpoint tuples, in the order of the configs, with None for each checkpoint not found.
+        """  # noqa
+        return asyncio.run_coroutine_threadsafe(
+            self.aget_tuples(configs), self.loop
+        ).result()
+
     def list(
         self,
         config: Optional[RunnableConfig],
@@ -195,7 +232,36 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         while True:
             try:
                 yield asyncio.run_coroutine_threadsafe(
-                    anext(aiter_),
+                    cast(Coroutine[Any, Any, CheckpointTuple], anext(aiter_)),
+                    self.loop,
+                ).result()
+            except StopAsyncIteration:
+                break
+
+    def list_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints from the database.
+
+        Args:
+            config (Optional[RunnableConfig]): Base configuration for filtering checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata.
+            before (Optional[RunnableConfig]): If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            Iterator[CheckpointMetadataTuple]: An iterator of matching checkpoint metadata tuples.
+        """
+        aiter_ = self.alist_metadata(config, filter=filter, before=before, limit=limit)
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(
+                    cast(Coroutine[Any, Any, CheckpointMetadataTuple], anext(aiter_)),
                     self.loop,
                 ).result()
             except StopAsyncIteration:
@@ -233,6 +299,18 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
 
+    def put_writes_many(
+        self, writes: Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]
+    ) -> None:
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_many(writes), self.loop
+        ).result()
+
+    def prune(self, thread_ids: Sequence[str], *, strategy: PruneStrategy) -> None:
+        return asyncio.run_coroutine_threadsafe(
+            self.aprune(thread_ids, strategy=strategy), self.loop
+        ).result()
+
     async def setup(self) -> None:
         """Set up the checkpoint database asynchronously.
 
@@ -256,6 +334,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     type TEXT,
                     checkpoint BLOB,
                     metadata BLOB,
+                    delta_channels TEXT,
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
                 );
                 CREATE TABLE IF NOT EXISTS writes (
@@ -269,9 +348,24 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     value BLOB,
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
                 );
+                CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL DEFAULT '',
+                    channel TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    blob BLOB,
+                    base TEXT,
+                    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+                );
                 """
             ):
                 await self.conn.commit()
+            async with self.conn.execute("PRAGMA table_info(checkpoints)") as cur:
+                sql = add_delta_channels_sql([row[1] async for row in cur])
+            if sql:
+                await self.conn.execute(sql)
+                await self.conn.commit()
 
             self.is_setup = True
 
@@ -295,7 +389,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             # find the latest checkpoint for the thread_id
             if checkpoint_id := get_checkpoint_id(config):
                 await cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, delta_channels FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
                     (
                         str(config["configurable"]["thread_id"]),
                         checkpoint_ns,
@@ -304,7 +398,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 )
             else:
                 await cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, delta_channels FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
                     (str(config["configurable"]["thread_id"]), checkpoint_ns),
                 )
             # if a checkpoint is found, return it
@@ -316,6 +410,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     type,
                     checkpoint,
                     metadata,
+                    delta_channels,
                 ) = value
                 if not get_checkpoint_id(config):
                     config = {
@@ -325,6 +420,11 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # deserialize the checkpoint
+                loaded = self.serde.loads_typed((type, checkpoint))
+                await self._aload_blobs(
+                    cur, [(thread_id, checkpoint_ns, loaded, delta_channels)]
+                )
                 # find any pending writes
                 await cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -334,10 +434,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
+                # deserialize the metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -356,6 +456,91 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     ],
                 )
 
+    async def aget_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Get the checkpoint tuples of several configs from the database asynchronously.
+
+        Like `aget_tuple` for each config, but the checkpoints of all configs are
+        read with a single query, and their pending writes with another one.
+
+        Args:
+            configs (Sequence[RunnableConfig]): The configs to use for retrieving the checkpoints.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The retrieved checkpoint tuples, in the order of the configs, with None for each checkpoint not found.
+        """  # noqa
+        if not configs:
+            return []
+        await self.setup()
+        async with self.lock, self.conn.cursor() as cur:
+            rows = {}
+            for query in tuples_queries(configs):
+                await cur.execute(*query)
+                rows.update({tuple(row[:3]): row for row in await cur.fetchall()})
+            keys = requested_checkpoints(configs, rows)
+            found = list({key for key in keys if key})
+            writes: Dict[Tuple[str, str, str], List[PendingWrite]] = defaultdict(list)
+            for query in writes_queries(found):
+                await cur.execute(*query)
+                async for thread_id, checkpoint_ns, checkpoint_id, *write in cur:
+                    task_id, channel, type, value = write
+                    writes[(thread_id, checkpoint_ns, checkpoint_id)].append(
+                        (task_id, channel, self.serde.loads_typed((type, value)))
+                    )
+            tuples: Dict[Tuple[str, str, str], CheckpointTuple] = {}
+            for key in found:
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    parent_checkpoint_id,
+                    type,
+                    checkpoint,
+                    metadata,
+                    _,
+                ) = rows[key]
+                tuples[key] = CheckpointTuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    self.serde.loads_typed((type, checkpoint)),
+                    self.jsonplus_serde.loads(metadata) if metadata is not None else {},
+                    (
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
+                        }
+                        if parent_checkpoint_id
+                        else None
+                    ),
+                    writes[key],
+                )
+            # reassemble delta-encoded values, with the blobs of all checkpoints
+            await self._aload_blobs(
+                cur,
+                [
+                    (key[0], key[1], t.checkpoint, rows[key][7])
+                    for key, t in tuples.items()
+                ],
+            )
+        # configs with a checkpoint_id are returned as given, like in aget_tuple
+        return [
+            None
+            if key is None
+            else tuples[key]._replace(config=config)
+            if get_checkpoint_id(config)
+            else tuples[key]
+            for config, key in zip(configs, keys)
+        ]
+
     async def alist(
         self,
         config: Optional[RunnableConfig],
@@ -380,15 +565,17 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         """
         await self.setup()
         where, params = search_where(config, filter, before)
-        query = f"""SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata
+        query = f"""SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, delta_channels
         FROM checkpoints
         {where}
         ORDER BY checkpoint_id DESC"""
         if limit:
             query += f" LIMIT {limit}"
-        async with self.lock, self.conn.execute(
-            query, params
-        ) as cur, self.conn.cursor() as wcur:
+        async with (
+            self.lock,
+            self.conn.execute(query, params) as cur,
+            self.conn.cursor() as wcur,
+        ):
             async for (
                 thread_id,
                 checkpoint_ns,
@@ -397,7 +584,12 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 type,
                 checkpoint,
                 metadata,
+                delta_channels,
             ) in cur:
+                loaded = self.serde.loads_typed((type, checkpoint))
+                await self._aload_blobs(
+                    wcur, [(thread_id, checkpoint_ns, loaded, delta_channels)]
+                )
                 await wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -410,7 +602,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -429,6 +621,66 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     ],
                 )
 
+    async def alist_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints from the database asynchronously.
+
+        Like `alist`, but the checkpoints, their channel blobs and their pending writes
+        are not read from the database. Use `aget_tuple` to load a full checkpoint.
+
+        Args:
+            config (Optional[RunnableConfig]): Base configuration for filtering checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata.
+            before (Optional[RunnableConfig]): If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            AsyncIterator[CheckpointMetadataTuple]: An asynchronous iterator of matching checkpoint metadata tuples.
+        """
+        await self.setup()
+        where, params = search_where(config, filter, before)
+        query = f"""SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, metadata
+        FROM checkpoints
+        {where}
+        ORDER BY checkpoint_id DESC"""
+        if limit:
+            query += f" LIMIT {limit}"
+        async with self.lock, self.conn.execute(query, params) as cur:
+            async for (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                parent_checkpoint_id,
+                metadata,
+            ) in cur:
+                yield CheckpointMetadataTuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    self.jsonplus_serde.loads(metadata) if metadata is not None else {},
+                    (
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
+                        }
+                        if parent_checkpoint_id
+                        else None
+                    ),
+                )
+
     async def aput(
         self,
         config: RunnableConfig,
@@ -453,20 +705,30 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         await self.setup()
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        checkpoint, delta_channels, blobs = split_deltas(
+            self.serde, str(thread_id), checkpoint_ns, checkpoint
+        )
         type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
         serialized_metadata = self.jsonplus_serde.dumps(metadata)
-        async with self.lock, self.conn.execute(
-            "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (
-                str(config["configurable"]["thread_id"]),
-                checkpoint_ns,
-                checkpoint["id"],
-                config["configurable"].get("checkpoint_id"),
-                type_,
-                serialized_checkpoint,
-                serialized_metadata,
-            ),
-        ):
+        async with self.lock, self.conn.cursor() as cur:
+            if blobs:
+                await cur.executemany(
+                    "INSERT OR IGNORE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, base) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    blobs,
+                )
+            await cur.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, delta_channels) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(config["configurable"]["thread_id"]),
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    serialized_checkpoint,
+                    serialized_metadata,
+                    delta_channels,
+                ),
+            )
             await self.conn.commit()
         return {
             "configurable": {
@@ -476,6 +738,102 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             }
         }
 
+    async def aprune(
+        self, thread_ids: Sequence[str], *, strategy: PruneStrategy
+    ) -> None:
+        """Delete old checkpoints of the given threads from the database asynchronously.
+
+        The pending writes of deleted checkpoints, and any stored channel values
+        no longer referenced by a remaining checkpoint, are deleted too.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+        """
+        params = [str(thread_id) for thread_id in thread_ids]
+        if not params:
+            return
+        await self.setup()
+        in_threads = f"thread_id IN ({', '.join('?' * len(params))})"
+        async with self.lock, self.conn.cursor() as cur:
+            await cur.execute(
+                f"SELECT thread_id, checkpoint_ns, checkpoint_id, type, checkpoint FROM (SELECT *, row_number() OVER (PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC) AS rank FROM checkpoints WHERE {in_threads}) WHERE rank > ?",
+                (*params, strategy.keep or 0),
+            )
+            await cur.executemany(
+                "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                prune_targets(self.serde, strategy, await cur.fetchall()),
+            )
+            # keep the writes of the parents of remaining checkpoints,
+            # which hold their pending sends
+            await cur.execute(
+                f"DELETE FROM writes WHERE {in_threads} AND NOT EXISTS (SELECT 1 FROM checkpoints c WHERE c.thread_id = writes.thread_id AND c.checkpoint_ns = writes.checkpoint_ns AND writes.checkpoint_id IN (c.checkpoint_id, c.parent_checkpoint_id))",
+                params,
+            )
+            await cur.execute(
+                f"SELECT thread_id, checkpoint_ns, channel, version, base FROM checkpoint_blobs WHERE {in_threads}",
+                params,
+            )
+            if blobs := await cur.fetchall():
+                await cur.execute(
+                    f"SELECT thread_id, checkpoint_ns, type, checkpoint FROM checkpoints WHERE {in_threads}",
+                    params,
+                )
+                await cur.executemany(
+                    "DELETE FROM checkpoint_blobs WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+                    unreferenced_blobs(self.serde, await cur.fetchall(), blobs),
+                )
+            await self.conn.commit()
+
+    async def _aload_blobs(
+        self,
+        cur: aiosqlite.Cursor,
+        checkpoints: Sequence[Tuple[str, str, Checkpoint, Optional[str]]],
+    ) -> None:
+        """Reassemble the delta-encoded channel values of checkpoints, given as
+        (thread_id, checkpoint_ns, checkpoint, delta_channels), reading the blobs
+        of all of them together."""
+        missing = [
+            ((thread_id, checkpoint_ns, k, version), checkpoint)
+            for thread_id, checkpoint_ns, checkpoint, delta_channels in checkpoints
+            for k, version in delta_keys(checkpoint, delta_channels)
+        ]
+        if not missing:
+            return
+        deltas = await self._aread_blobs(cur, list({key for key, _ in missing}))
+        bases = await self._aread_blobs(
+            cur,
+            list(
+                {
+                    (thread_id, checkpoint_ns, channel, str(b))
+                    for (thread_id, checkpoint_ns, channel, _), v in deltas.items()
+                    for b in v.base
+                }
+            ),
+        )
+        for key, checkpoint in missing:
+            if (v := deltas.get(key)) is None:
+                continue
+            thread_id, checkpoint_ns, channel, version = key
+            base_keys = [(thread_id, checkpoint_ns, channel, str(b)) for b in v.base]
+            chain = [bases[b] for b in base_keys if b in bases]
+            checkpoint["channel_values"][channel] = load_delta(v, version, chain)
+
+    async def _aread_blobs(
+        self, cur: aiosqlite.Cursor, keys: Sequence[Tuple[str, str, str, str]]
+    ) -> Dict[Tuple[str, str, str, str], Any]:
+        """Read the checkpoint_blobs rows of the given
+        (thread_id, checkpoint_ns, channel, version)."""
+        blobs: Dict[Tuple[str, str, str, str], Any] = {}
+        for query in blobs_queries(keys):
+            await cur.execute(*query)
+            async for thread_id, checkpoint_ns, channel, version, type, blob in cur:
+                blobs[(thread_id, checkpoint_ns, channel, version)] = (
+                    self.serde.loads_typed((type, blob))
+                )
+        return blobs
+
     async def aput_writes(
         self,
         config: RunnableConfig,
@@ -514,6 +872,26 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 ],
             )
 
+    async def aput_writes_many(
+        self, writes: Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]
+    ) -> None:
+        """Store the intermediate writes of several tasks at once, asynchronously.
+
+        The writes are saved to the SQLite database in a single transaction.
+
+        Args:
+            writes (Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]):
+                (config, writes, task_id) tuples, as passed to `aput_writes`.
+        """
+        upserts, inserts = writes_rows(self.serde, writes)
+        await self.setup()
+        async with self.lock, self.conn.cursor() as cur:
+            if upserts:
+                await cur.executemany(UPSERT_WRITES_SQL, upserts)
+            if inserts:
+                await cur.executemany(INSERT_WRITES_SQL, inserts)
+            await self.conn.commit()
+
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         """Generate the next version ID for a channel.
 
@@ -1,9 +1,23 @@
 import json
-from typing import Any, Dict, Optional, Sequence, Tuple
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from langchain_core.runnables import RunnableConfig
 
-from langgraph.checkpoint.base import get_checkpoint_id
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    Checkpoint,
+    DeltaValue,
+    PruneStrategy,
+    SerializerProtocol,
+    dump_delta,
+    get_checkpoint_id,
+)
+
+# stay below SQLITE_MAX_VARIABLE_NUMBER, 999 in older versions, with 4 per key
+_MAX_BLOB_KEYS = 200
+# same, with at most 3 per config or checkpoint
+_MAX_CHECKPOINT_KEYS = 300
 
 
 def _metadata_predicate(
@@ -91,3 +105,240 @@ def search_where(
         param_values.append(get_checkpoint_id(before))
 
     return ("WHERE " + " AND ".join(wheres) if wheres else "", param_values)
+
+
+def split_deltas(
+    serde: SerializerProtocol,
+    thread_id: str,
+    checkpoint_ns: str,
+    checkpoint: Checkpoint,
+) -> Tuple[Checkpoint, Optional[str], List[Tuple[str, str, str, str, str, bytes, str]]]:
+    """Move delta-encoded channel values out of a checkpoint.
+
+    Returns the checkpoint to store, the value of its delta_channels column,
+    and the rows to insert into the checkpoint_blobs table, one for each
+    delta-encoded channel value.
+    """
+    values = checkpoint["channel_values"]
+    rows = [
+        (
+            thread_id,
+            checkpoint_ns,
+            k,
+            str(checkpoint["channel_versions"][k]),
+            *serde.dumps_typed(dump_delta(v)),
+            json.dumps([str(b) for b in v.base]),
+        )
+        for k, v in values.items()
+        if isinstance(v, DeltaValue)
+    ]
+    if not rows:
+        return checkpoint, None, rows
+    checkpoint = {
+        **checkpoint,
+        "channel_values": {
+            k: v for k, v in values.items() if not isinstance(v, DeltaValue)
+        },
+    }
+    return checkpoint, json.dumps([row[2] for row in rows]), rows
+
+
+def delta_keys(
+    checkpoint: Checkpoint, delta_channels: Optional[str]
+) -> List[Tuple[str, str]]:
+    """Return the (channel, version) of the delta-encoded channel values moved
+    out of a checkpoint by `split_deltas`, given its delta_channels column."""
+    if not delta_channels:
+        return []
+    return [
+        (k, str(checkpoint["channel_versions"][k])) for k in json.loads(delta_channels)
+    ]
+
+
+def blobs_queries(
+    keys: Sequence[Tuple[str, str, str, str]],
+) -> List[Tuple[str, List[Any]]]:
+    """Return the queries for the checkpoint_blobs rows of the given
+    (thread_id, checkpoint_ns, channel, version)."""
+    return [
+        (
+            "SELECT thread_id, checkpoint_ns, channel, version, type, blob FROM checkpoint_blobs "
+            "WHERE (thread_id, checkpoint_ns, channel, version) IN (VALUES "
+            + ", ".join("(?, ?, ?, ?)" for _ in chunk)
+            + ")",
+            [p for key in chunk for p in key],
+        )
+        for chunk in (
+            keys[i : i + _MAX_BLOB_KEYS] for i in range(0, len(keys), _MAX_BLOB_KEYS)
+        )
+    ]
+
+
+def tuples_queries(configs: Sequence[RunnableConfig]) -> List[Tuple[str, List[Any]]]:
+    """Return the queries for the checkpoints rows of several configs: the
+    checkpoint with the checkpoint_id of the config if it has one, otherwise the
+    latest checkpoint of its thread and namespace."""
+    return [
+        _tuples_query(configs[i : i + _MAX_CHECKPOINT_KEYS])
+        for i in range(0, len(configs), _MAX_CHECKPOINT_KEYS)
+    ]
+
+
+def _tuples_query(configs: Sequence[RunnableConfig]) -> Tuple[str, List[Any]]:
+    exact: List[Any] = []
+    latest: List[Any] = []
+    for config in configs:
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        if checkpoint_id := get_checkpoint_id(config):
+            exact.extend((thread_id, checkpoint_ns, checkpoint_id))
+        else:
+            latest.extend((thread_id, checkpoint_ns))
+    wheres = []
+    if exact:
+        wheres.append(
+            "(thread_id, checkpoint_ns, checkpoint_id) IN (VALUES "
+            + ", ".join("(?, ?, ?)" for _ in range(len(exact) // 3))
+            + ")"
+        )
+    if latest:
+        wheres.append(
+            "((thread_id, checkpoint_ns) IN (VALUES "
+            + ", ".join("(?, ?)" for _ in range(len(latest) // 2))
+            + ") AND checkpoint_id = (SELECT MAX(checkpoint_id) FROM checkpoints AS latest "
+            "WHERE latest.thread_id = checkpoints.thread_id AND latest.checkpoint_ns = checkpoints.checkpoint_ns))"
+        )
+    return (
+        "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, delta_channels "
+        "FROM checkpoints WHERE " + " OR ".join(wheres),
+        [*exact, *latest],
+    )
+
+
+def writes_queries(
+    keys: Sequence[Tuple[str, str, str]],
+) -> List[Tuple[str, List[Any]]]:
+    """Return the queries for the writes rows of several checkpoints, given as
+    (thread_id, checkpoint_ns, checkpoint_id)."""
+    return [
+        (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, task_id, channel, type, value FROM writes "
+            "WHERE (thread_id, checkpoint_ns, checkpoint_id) IN (VALUES "
+            + ", ".join("(?, ?, ?)" for _ in chunk)
+            + ") ORDER BY task_id, idx",
+            [p for key in chunk for p in key],
+        )
+        for chunk in (
+            keys[i : i + _MAX_CHECKPOINT_KEYS]
+            for i in range(0, len(keys), _MAX_CHECKPOINT_KEYS)
+        )
+    ]
+
+
+def requested_checkpoints(
+    configs: Sequence[RunnableConfig], found: Iterable[Tuple[str, str, str]]
+) -> List[Optional[Tuple[str, str, str]]]:
+    """Return the (thread_id, checkpoint_ns, checkpoint_id) of the checkpoint
+    requested by each config, among the found ones, or None if not found."""
+    found = set(found)
+    latest: Dict[Tuple[str, str], str] = {}
+    for thread_id, checkpoint_ns, checkpoint_id in found:
+        if checkpoint_id > latest.get((thread_id, checkpoint_ns), ""):
+            latest[(thread_id, checkpoint_ns)] = checkpoint_id
+    keys: List[Optional[Tuple[str, str, str]]] = []
+    for config in configs:
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        if checkpoint_id := get_checkpoint_id(config):
+            key = (thread_id, checkpoint_ns, checkpoint_id)
+            keys.append(key if key in found else None)
+        elif checkpoint_id := latest.get((thread_id, checkpoint_ns)):
+            keys.append((thread_id, checkpoint_ns, checkpoint_id))
+        else:
+            keys.append(None)
+    return keys
+
+
+def add_delta_channels_sql(columns: Iterable[str]) -> Optional[str]:
+    """Return the statement adding the delta_channels column to a checkpoints
+    table created by an older version, given its columns, if it's missing."""
+    if "delta_channels" in columns:
+        return None
+    return "ALTER TABLE checkpoints ADD COLUMN delta_channels TEXT"
+
+
+def prune_targets(
+    serde: SerializerProtocol,
+    strategy: PruneStrategy,
+    rows: Iterable[Sequence[Any]],
+) -> List[Tuple[str, str, str]]:
+    """Return the (thread_id, checkpoint_ns, checkpoint_id) of the checkpoints to
+    delete, given the rows of the checkpoints outside of the `keep` most recent
+    of each namespace, as (thread_id, checkpoint_ns, checkpoint_id, type,
+    checkpoint)."""
+    # compare datetimes, the timestamps may not have the same precision
+    before = (
+        datetime.fromisoformat(strategy.before) if strategy.before is not None else None
+    )
+    return [
+        (thread_id, checkpoint_ns, checkpoint_id)
+        for thread_id, checkpoint_ns, checkpoint_id, type_, checkpoint in rows
+        if before is None
+        or datetime.fromisoformat(serde.loads_typed((type_, checkpoint))["ts"]) < before
+    ]
+
+
+def unreferenced_blobs(
+    serde: SerializerProtocol,
+    checkpoints: Iterable[Sequence[Any]],
+    blobs: Iterable[Sequence[Any]],
+) -> List[Tuple[str, str, str, str]]:
+    """Return the keys of the checkpoint_blobs rows that are neither referenced by
+    one of the given checkpoints, as (thread_id, checkpoint_ns, type, checkpoint),
+    nor the base of a referenced row, given as (thread_id, checkpoint_ns,
+    channel, version, base)."""
+    referenced = {
+        (thread_id, checkpoint_ns, k, str(ver))
+        for thread_id, checkpoint_ns, type_, checkpoint in checkpoints
+        for k, ver in serde.loads_typed((type_, checkpoint))["channel_versions"].items()
+    }
+    rows = {
+        (thread_id, checkpoint_ns, channel, version): base
+        for thread_id, checkpoint_ns, channel, version, base in blobs
+    }
+    needed = {key for key in rows if key in referenced}
+    needed.update(
+        (*key[:3], b) for key in list(needed) for b in json.loads(rows[key] or "[]")
+    )
+    return [key for key in rows if key not in needed]
+
+
+UPSERT_WRITES_SQL = "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_WRITES_SQL = "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def writes_rows(
+    serde: SerializerProtocol,
+    writes: Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]],
+) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+    """Return the rows to insert into the writes table for the writes of several
+    tasks, given as (config, writes, task_id), split into the rows for
+    UPSERT_WRITES_SQL and the rows for INSERT_WRITES_SQL."""
+    upserts: List[Tuple[Any, ...]] = []
+    inserts: List[Tuple[Any, ...]] = []
+    for config, task_writes, task_id in writes:
+        (
+            upserts if all(w[0] in WRITES_IDX_MAP for w in task_writes) else inserts
+        ).extend(
+            (
+                str(config["configurable"]["thread_id"]),
+                str(config["configurable"]["checkpoint_ns"]),
+                str(config["configurable"]["checkpoint_id"]),
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *serde.dumps_typed(value),
+            )
+            for idx, (channel, value) in enumerate(task_writes)
+        )
+    return upserts, inserts
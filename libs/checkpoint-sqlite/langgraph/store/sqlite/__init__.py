@@ -0,0 +1,3 @@
+from langgraph.store.sqlite.base import SqliteStore
+
+__all__ = ["SqliteStore"]
@@ -0,0 +1,269 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, Optional, Sequence, cast
+
+import aiosqlite
+
+from langgraph.store.base import (
+    BaseStore,
+    GetOp,
+    IndexConfig,
+    ListNamespacesOp,
+    Op,
+    PutOp,
+    Result,
+    SearchOp,
+)
+from langgraph.store.sqlite.base import (
+    BaseSqliteStore,
+    _cosine_similarity,
+    _fill_placeholders,
+    _group_ops,
+    _list_namespaces,
+    _row_to_item,
+    _row_to_search_item,
+)
+
+
+class AsyncSqliteStore(BaseStore, BaseSqliteStore[aiosqlite.Connection]):
+    """Asynchronous SQLite-backed store with full-text search and optional vector search.
+
+    Writes go through `conn`, one batch at a time. Reads are served by the
+    `readers` connections when provided, so that they run concurrently with
+    writes and with each other, thanks to SQLite's WAL mode.
+
+    Searches with a `query` rank items by similarity to it when the store is
+    configured with an `index`, and with the FTS5 full-text index otherwise.
+
+    Tip:
+        Requires the [aiosqlite](https://pypi.org/project/aiosqlite/) package.
+        Install it with `pip install aiosqlite`.
+
+    Args:
+        conn (aiosqlite.Connection): The asynchronous SQLite database connection.
+        index (Optional[IndexConfig]): The embedding configuration, for vector search.
+        readers (Sequence[aiosqlite.Connection]): Connections to the same database
+            to serve reads with. Defaults to serving reads with `conn`.
+
+    Examples:
+
+        >>> from langgraph.store.sqlite.aio import AsyncSqliteStore
+        >>> async with AsyncSqliteStore.from_conn_string("store.sqlite") as store:
+        ...     await store.aput(("users", "123"), "prefs", {"theme": "dark"})
+        ...     await store.asearch(("users",), query="dark")
+    """
+
+    def __init__(
+        self,
+        conn: aiosqlite.Connection,
+        *,
+        index: Optional[IndexConfig] = None,
+        readers: Sequence[aiosqlite.Connection] = (),
+    ) -> None:
+        super().__init__()
+        self.conn = conn
+        self.is_setup = False
+        self.lock = asyncio.Lock()
+        self.loop = asyncio.get_running_loop()
+        self._init_index(index)
+        self._all_readers = list(readers)
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        for reader in readers:
+            self._readers.put_nowait(reader)
+
+    @classmethod
+    @asynccontextmanager
+    async def from_conn_string(
+        cls,
+        conn_string: str,
+        *,
+        index: Optional[IndexConfig] = None,
+        pool_size: int = 4,
+    ) -> AsyncIterator["AsyncSqliteStore"]:
+        """Create a new AsyncSqliteStore instance from a connection string.
+
+        Args:
+            conn_string (str): The SQLite connection string.
+            index (Optional[IndexConfig]): The embedding configuration, for vector search.
+            pool_size (int): The number of reader connections to open, for databases
+                stored on disk. Defaults to 4.
+
+        Yields:
+            AsyncSqliteStore: A new AsyncSqliteStore instance.
+        """
+        async with aiosqlite.connect(conn_string) as conn:
+            path = next(
+                (
+                    row[2]
+                    for row in await conn.execute_fetchall("PRAGMA database_list")
+                    if row[1] == "main"
+                ),
+                "",
+            )
+            readers = []
+            try:
+                for _ in range(pool_size if path else 0):
+                    reader = await aiosqlite.connect(path)
+                    readers.append(reader)
+                    await reader.execute("PRAGMA query_only=ON")
+                store = cls(conn, index=index, readers=readers)
+                await store.setup()
+                yield store
+            finally:
+                for reader in readers:
+                    await reader.close()
+
+    async def setup(self) -> None:
+        """Set up the store database asynchronously.
+
+        This method enables WAL mode, creates the necessary tables in the SQLite
+        database if they don't already exist and runs database migrations. It is
+        called automatically when needed and should not be called directly by the user.
+        """
+        if self.is_setup:
+            return
+        async with self.lock:
+            if self.is_setup:
+                return
+            for connection in (self.conn, *self._all_readers):
+                await connection.create_function(
+                    "store_cosine_similarity", 2, _cosine_similarity, deterministic=True
+                )
+            await self.conn.execute("PRAGMA journal_mode=WAL")
+            await self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS store_migrations (v INTEGER PRIMARY KEY)"
+            )
+            rows = await self.conn.execute_fetchall(
+                "SELECT MAX(v) FROM store_migrations"
+            )
+            version = next(iter(rows))[0]
+            version = -1 if version is None else version
+            for v, migration in enumerate(
+                self.MIGRATIONS[version + 1 :], start=version + 1
+            ):
+                await self.conn.execute(migration)
+                await self.conn.execute(
+                    "INSERT INTO store_migrations (v) VALUES (?)", (v,)
+                )
+            await self.conn.commit()
+            self.is_setup = True
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Get a connection to read from, waiting for one to be free."""
+        if not self._all_readers:
+            async with self.lock:
+                yield self.conn
+            return
+        reader = await self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put_nowait(reader)
+
+    async def abatch(self, ops: Iterable[Op]) -> list[Result]:
+        await self.setup()
+        grouped_ops, num_ops = _group_ops(ops)
+        results: list[Result] = [None] * num_ops
+
+        if any(t in grouped_ops for t in (GetOp, SearchOp, ListNamespacesOp)):
+            search_ops = cast(
+                Sequence[tuple[int, SearchOp]], grouped_ops.get(SearchOp, [])
+            )
+            vectors = await self._embed_search_queries(search_ops)
+            async with self._reader() as conn:
+                if GetOp in grouped_ops:
+                    await self._batch_get_ops(
+                        cast(Sequence[tuple[int, GetOp]], grouped_ops[GetOp]),
+                        results,
+                        conn,
+                    )
+                if search_ops:
+                    await self._batch_search_ops(search_ops, vectors, results, conn)
+                if ListNamespacesOp in grouped_ops:
+                    await self._batch_list_namespaces_ops(
+                        cast(
+                            Sequence[tuple[int, ListNamespacesOp]],
+                            grouped_ops[ListNamespacesOp],
+                        ),
+                        results,
+                        conn,
+                    )
+
+        if PutOp in grouped_ops:
+            await self._batch_put_ops(
+                cast(Sequence[tuple[int, PutOp]], grouped_ops[PutOp])
+            )
+
+        return results
+
+    def batch(self, ops: Iterable[Op]) -> list[Result]:
+        return asyncio.run_coroutine_threadsafe(self.abatch(ops), self.loop).result()
+
+    async def _embed_search_queries(
+        self, search_ops: Sequence[tuple[int, SearchOp]]
+    ) -> dict[str, list[float]]:
+        if not self.embeddings:
+            return {}
+        queries = list({op.query for _, op in search_ops if op.query})
+        vectors = await asyncio.gather(
+            *(self.embeddings.aembed_query(query) for query in queries)
+        )
+        return dict(zip(queries, vectors))
+
+    async def _batch_get_ops(
+        self,
+        get_ops: Sequence[tuple[int, GetOp]],
+        results: list[Result],
+        conn: aiosqlite.Connection,
+    ) -> None:
+        for query, params, namespace, items in self._get_batch_GET_ops_queries(get_ops):
+            rows = await conn.execute_fetchall(query, params)
+            key_to_row = {row[1]: row for row in rows}
+            for idx, key in items:
+                row = key_to_row.get(key)
+                results[idx] = _row_to_item(namespace, row) if row else None
+
+    async def _batch_put_ops(
+        self,
+        put_ops: Sequence[tuple[int, PutOp]],
+    ) -> None:
+        queries, to_embed = self._prepare_batch_PUT_queries(put_ops)
+        if to_embed and self.embeddings:
+            vectors = await self.embeddings.aembed_documents(
+                [text for *_, text in to_embed]
+            )
+            queries.append(self._get_vector_insert_query(to_embed, vectors))
+        async with self.lock:
+            try:
+                for query, params in queries:
+                    await self.conn.executemany(query, params)
+            except BaseException:
+                await self.conn.rollback()
+                raise
+            await self.conn.commit()
+
+    async def _batch_search_ops(
+        self,
+        search_ops: Sequence[tuple[int, SearchOp]],
+        vectors: dict[str, list[float]],
+        results: list[Result],
+        conn: aiosqlite.Connection,
+    ) -> None:
+        queries, embedding_requests = self._prepare_batch_search_queries(search_ops)
+        for idx, query in embedding_requests:
+            _fill_placeholders(queries[idx][1], vectors[query])
+        for (idx, _), (query, params) in zip(search_ops, queries):
+            rows = await conn.execute_fetchall(query, params)
+            results[idx] = [_row_to_search_item(row) for row in rows]
+
+    async def _batch_list_namespaces_ops(
+        self,
+        list_ops: Sequence[tuple[int, ListNamespacesOp]],
+        results: list[Result],
+        conn: aiosqlite.Connection,
+    ) -> None:
+        queries = self._get_batch_list_namespaces_queries(list_ops)
+        for (query, params), (idx, op) in zip(queries, list_ops):
+            rows = await conn.execute_fetchall(query, params)
+            results[idx] = _list_namespaces(op, (row[0] for row in rows))
@@ -0,0 +1,745 @@
+import asyncio
+import json
+import math
+import sqlite3
+import threading
+from array import array
+from collections import defaultdict
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+from importlib import util
+from queue import Queue
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from langgraph.store.base import (
+    BaseStore,
+    GetOp,
+    IndexConfig,
+    Item,
+    ListNamespacesOp,
+    MatchCondition,
+    Op,
+    PutOp,
+    Result,
+    SearchCursor,
+    SearchItem,
+    SearchOp,
+    ensure_embeddings,
+    get_text_at_path,
+    tokenize_path,
+)
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
+MIGRATIONS: Sequence[str] = [
+    """
+CREATE TABLE IF NOT EXISTS store (
+    -- 'id' is the rowid of the item, referenced by the full-text index
+    id INTEGER PRIMARY KEY,
+    -- 'prefix' represents the doc's 'namespace'
+    prefix TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    UNIQUE (prefix, key)
+);
+""",
+    """
+-- For keyset pagination of searches
+CREATE INDEX IF NOT EXISTS store_updated_at_idx ON store (updated_at DESC, prefix DESC, key DESC);
+""",
+    """
+-- Full-text index of the indexed fields of each item, by store rowid
+CREATE VIRTUAL TABLE IF NOT EXISTS store_fts USING fts5(content);
+""",
+    """
+CREATE TABLE IF NOT EXISTS store_vectors (
+    prefix TEXT NOT NULL,
+    key TEXT NOT NULL,
+    field_name TEXT NOT NULL,
+    embedding BLOB NOT NULL,
+    PRIMARY KEY (prefix, key, field_name)
+);
+""",
+]
+
+# stay well below SQLITE_MAX_VARIABLE_NUMBER
+_MAX_PARAMS = 500
+
+C = TypeVar("C")
+
+
+class BaseSqliteStore(Generic[C]):
+    MIGRATIONS = MIGRATIONS
+    conn: C
+    index_config: Optional[IndexConfig]
+    embeddings: Optional["Embeddings"]
+
+    def _init_index(self, index: Optional[IndexConfig]) -> None:
+        if index:
+            self.index_config = index.copy()
+            self.embeddings = ensure_embeddings(
+                self.index_config.get("embed"),
+                cache=self.index_config.get("cache"),
+            )
+            self.index_config["__tokenized_fields"] = [
+                (p, tokenize_path(p)) if p != "$" else (p, p)
+                for p in (self.index_config.get("fields") or ["$"])
+            ]
+        else:
+            self.index_config = None
+            self.embeddings = None
+
+    def _get_batch_GET_ops_queries(
+        self,
+        get_ops: Sequence[tuple[int, GetOp]],
+    ) -> list[tuple[str, Sequence, tuple[str, ...], list[tuple[int, str]]]]:
+        namespace_groups = defaultdict(list)
+        for idx, op in get_ops:
+            namespace_groups[op.namespace].append((idx, op.key))
+        results = []
+        for namespace, items in namespace_groups.items():
+            for i in range(0, len(items), _MAX_PARAMS):
+                chunk = items[i : i + _MAX_PARAMS]
+                keys_to_query = ",".join(["?"] * len(chunk))
+                query = f"""
+                    SELECT prefix, key, value, created_at, updated_at
+                    FROM store
+                    WHERE prefix = ? AND key IN ({keys_to_query})
+                """
+                params = (_namespace_to_text(namespace), *(key for _, key in chunk))
+                results.append((query, params, namespace, chunk))
+        return results
+
+    def _prepare_batch_PUT_queries(
+        self,
+        put_ops: Sequence[tuple[int, PutOp]],
+    ) -> tuple[
+        list[tuple[str, Sequence[tuple]]],
+        list[tuple[str, str, str, str]],
+    ]:
+        """Return the queries to run with executemany, and the (prefix, key,
+        field_name, text) of the fields to embed."""
+        # Last-write wins
+        dedupped_ops: dict[tuple[tuple[str, ...], str], PutOp] = {}
+        for _, op in put_ops:
+            dedupped_ops[(op.namespace, op.key)] = op
+
+        keys = [(_namespace_to_text(ns), key) for ns, key in dedupped_ops]
+        # Drop the index entries of all the items written, they are re-created below
+        queries: list[tuple[str, Sequence[tuple]]] = [
+            (
+                "DELETE FROM store_fts WHERE rowid IN "
+                "(SELECT rowid FROM store WHERE prefix = ? AND key = ?)",
+                keys,
+            ),
+            ("DELETE FROM store_vectors WHERE prefix = ? AND key = ?", keys),
+        ]
+        deletes = [
+            (_namespace_to_text(op.namespace), op.key)
+            for op in dedupped_ops.values()
+            if op.value is None
+        ]
+        if deletes:
+            queries.append(("DELETE FROM store WHERE prefix = ? AND key = ?", deletes))
+
+        inserts = [op for op in dedupped_ops.values() if op.value is not None]
+        to_embed: list[tuple[str, str, str, str]] = []
+        if inserts:
+            now = datetime.now(timezone.utc).isoformat(timespec="microseconds")
+            queries.append(
+                (
+                    """
+                    INSERT INTO store (prefix, key, value, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (prefix, key) DO UPDATE
+                    SET value = excluded.value, updated_at = excluded.updated_at
+                    """,
+                    [
+                        (_namespace_to_text(op.namespace), op.key, json.dumps(op.value))
+                        + (now, now)
+                        for op in inserts
+                    ],
+                )
+            )
+            fts_rows = []
+            for op in inserts:
+                ns = _namespace_to_text(op.namespace)
+                texts = self._get_texts(op)
+                if texts:
+                    fts_rows.append((" ".join(text for _, text in texts), ns, op.key))
+                if self.index_config:
+                    to_embed.extend((ns, op.key, path, text) for path, text in texts)
+            if fts_rows:
+                queries.append(
+                    (
+                        "INSERT INTO store_fts (rowid, content) "
+                        "SELECT rowid, ? FROM store WHERE prefix = ? AND key = ?",
+                        fts_rows,
+                    )
+                )
+
+        return queries, to_embed
+
+    def _get_texts(self, op: PutOp) -> list[tuple[str, str]]:
+        """Return the (field_name, text) of the fields of the item to index."""
+        if op.index is False:
+            return []
+        if op.index is not None:
+            paths: Sequence[tuple[str, Union[str, list[str]]]] = [
+                (ix, tokenize_path(ix)) for ix in op.index
+            ]
+        elif self.index_config:
+            paths = self.index_config["__tokenized_fields"]
+        else:
+            paths = [("$", "$")]
+        texts = []
+        for path, tokenized_path in paths:
+            found = get_text_at_path(op.value, tokenized_path)
+            for i, text in enumerate(found):
+                texts.append((f"{path}.{i}" if len(found) > 1 else path, text))
+        return texts
+
+    def _get_vector_insert_query(
+        self,
+        to_embed: Sequence[tuple[str, str, str, str]],
+        vectors: Sequence[Sequence[float]],
+    ) -> tuple[str, Sequence[tuple]]:
+        return (
+            "INSERT OR REPLACE INTO store_vectors (prefix, key, field_name, embedding) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (ns, key, path, _vector_to_blob(vector))
+                for (ns, key, path, _), vector in zip(to_embed, vectors)
+            ],
+        )
+
+    def _prepare_batch_search_queries(
+        self,
+        search_ops: Sequence[tuple[int, SearchOp]],
+    ) -> tuple[
+        list[tuple[str, list[Any]]],  # queries, params
+        list[tuple[int, str]],  # idx, query_text pairs to embed
+    ]:
+        queries = []
+        embedding_requests = []
+
+        for idx, (_, op) in enumerate(search_ops):
+            cursor = SearchCursor.decode(op.after) if op.after else None
+            conditions, params = _search_conditions(op)
+            if op.query:
+                if cursor is not None and cursor.score is None:
+                    raise ValueError(
+                        "Cannot continue a search with a query after the cursor "
+                        "of a search without one."
+                    )
+                if self.index_config:
+                    # Vector search, scoring each item by its best matching field
+                    embedding_requests.append((idx, op.query))
+                    source = f"""
+                        SELECT s.prefix, s.key, s.value, s.created_at, s.updated_at,
+                            MAX(store_cosine_similarity(sv.embedding, ?)) AS score
+                        FROM store_vectors sv
+                        JOIN store s ON s.prefix = sv.prefix AND s.key = sv.key
+                        {_where(conditions)}
+                        GROUP BY s.prefix, s.key
+                    """
+                    params.insert(0, _PLACEHOLDER)
+                else:
+                    # Full-text search, ranked by BM25
+                    if fts_query := _fts_query(op.query):
+                        conditions.insert(0, "store_fts MATCH ?")
+                        params.insert(0, fts_query)
+                    else:
+                        # A query without any words matches nothing
+                        conditions.insert(0, "0")
+                    source = f"""
+                        SELECT s.prefix, s.key, s.value, s.created_at, s.updated_at,
+                            -bm25(store_fts) AS score
+                        FROM store_fts
+                        JOIN store s ON s.rowid = store_fts.rowid
+                        {_where(conditions)}
+                    """
+                query = f"SELECT * FROM ({source})"
+                if cursor is not None:
+                    query += " WHERE (score, prefix, key) < (?, ?, ?)"
+                    params.extend(
+                        [cursor.score, _namespace_to_text(cursor.namespace), cursor.key]
+                    )
+                query += " ORDER BY score DESC, prefix DESC, key DESC"
+            else:
+                if cursor is not None:
+                    conditions.append("(s.updated_at, s.prefix, s.key) < (?, ?, ?)")
+                    params.extend(
+                        [
+                            cursor.updated_at.isoformat(timespec="microseconds"),
+                            _namespace_to_text(cursor.namespace),
+                            cursor.key,
+                        ]
+                    )
+                query = f"""
+                    SELECT s.prefix, s.key, s.value, s.created_at, s.updated_at
+                    FROM store s
+                    {_where(conditions)}
+                    ORDER BY s.updated_at DESC, s.prefix DESC, s.key DESC
+                """
+            query += " LIMIT ? OFFSET ?"
+            params.extend([op.limit, op.offset])
+            queries.append((query, params))
+
+        return queries, embedding_requests
+
+    def _get_batch_list_namespaces_queries(
+        self,
+        list_ops: Sequence[tuple[int, ListNamespacesOp]],
+    ) -> list[tuple[str, Sequence]]:
+        queries: list[tuple[str, Sequence]] = []
+        for _, op in list_ops:
+            # Narrow down the namespaces with the first prefix condition that has
+            # no wildcards, the match conditions are then checked on the results
+            prefix = next(
+                (
+                    condition.path
+                    for condition in op.match_conditions or ()
+                    if condition.match_type == "prefix" and "*" not in condition.path
+                ),
+                None,
+            )
+            if prefix:
+                conditions, params = _prefix_conditions(prefix)
+            else:
+                conditions, params = [], []
+            queries.append(
+                (
+                    f"SELECT DISTINCT prefix FROM store s {_where(conditions)}",
+                    params,
+                )
+            )
+        return queries
+
+
+class SqliteStore(BaseStore, BaseSqliteStore[sqlite3.Connection]):
+    """SQLite-backed store with full-text search and optional vector search.
+
+    Writes go through `conn`, one batch at a time. Reads are served by the
+    `readers` connections when provided, so that they run concurrently with
+    writes and with each other, thanks to SQLite's WAL mode.
+
+    Searches with a `query` rank items by similarity to it when the store is
+    configured with an `index`, and with the FTS5 full-text index otherwise.
+
+    Args:
+        conn (sqlite3.Connection): The SQLite database connection.
+        index (Optional[IndexConfig]): The embedding configuration, for vector search.
+        readers (Sequence[sqlite3.Connection]): Connections to the same database
+            to serve reads with. Defaults to serving reads with `conn`.
+
+    Examples:
+
+        >>> from langgraph.store.sqlite import SqliteStore
+        >>> with SqliteStore.from_conn_string("store.sqlite") as store:
+        ...     store.put(("users", "123"), "prefs", {"theme": "dark"})
+        ...     store.search(("users",), query="dark")
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        index: Optional[IndexConfig] = None,
+        readers: Sequence[sqlite3.Connection] = (),
+    ) -> None:
+        super().__init__()
+        self.conn = conn
+        self.is_setup = False
+        self.lock = threading.Lock()
+        self._init_index(index)
+        self._readers: Queue[sqlite3.Connection] = Queue()
+        for connection in (conn, *readers):
+            _configure(connection)
+        for reader in readers:
+            self._readers.put(reader)
+        self._has_readers = bool(readers)
+
+    @classmethod
+    @contextmanager
+    def from_conn_string(
+        cls,
+        conn_string: str,
+        *,
+        index: Optional[IndexConfig] = None,
+        pool_size: int = 4,
+    ) -> Iterator["SqliteStore"]:
+        """Create a new SqliteStore instance from a connection string.
+
+        Args:
+            conn_string (str): The SQLite connection string.
+            index (Optional[IndexConfig]): The embedding configuration, for vector search.
+            pool_size (int): The number of reader connections to open, for databases
+                stored on disk. Defaults to 4.
+
+        Yields:
+            SqliteStore: A new SqliteStore instance.
+        """
+        with closing(
+            sqlite3.connect(
+                conn_string,
+                # https://ricardoanderegg.com/posts/python-sqlite-thread-safety/
+                check_same_thread=False,
+            )
+        ) as conn:
+            path = _database_path(conn)
+            readers = [
+                sqlite3.connect(path, check_same_thread=False)
+                for _ in range(pool_size if path else 0)
+            ]
+            for reader in readers:
+                reader.execute("PRAGMA query_only=ON")
+            try:
+                store = cls(conn, index=index, readers=readers)
+                store.setup()
+                yield store
+            finally:
+                for reader in readers:
+                    reader.close()
+
+    def setup(self) -> None:
+        """Set up the store database.
+
+        This method enables WAL mode, creates the necessary tables in the SQLite
+        database if they don't already exist and runs database migrations. It is
+        called automatically when needed and should not be called directly by the user.
+        """
+        if self.is_setup:
+            return
+        with self.lock:
+            if self.is_setup:
+                return
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS store_migrations (v INTEGER PRIMARY KEY)"
+            )
+            row = self.conn.execute("SELECT MAX(v) FROM store_migrations").fetchone()
+            version = -1 if row[0] is None else row[0]
+            for v, migration in enumerate(
+                self.MIGRATIONS[version + 1 :], start=version + 1
+            ):
+                self.conn.execute(migration)
+                self.conn.execute("INSERT INTO store_migrations (v) VALUES (?)", (v,))
+            self.conn.commit()
+            self.is_setup = True
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Get a connection to read from, waiting for one to be free."""
+        if not self._has_readers:
+            with self.lock:
+                yield self.conn
+            return
+        reader = self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put(reader)
+
+    def batch(self, ops: Iterable[Op]) -> list[Result]:
+        self.setup()
+        grouped_ops, num_ops = _group_ops(ops)
+        results: list[Result] = [None] * num_ops
+
+        if any(t in grouped_ops for t in (GetOp, SearchOp, ListNamespacesOp)):
+            search_ops = cast(
+                Sequence[tuple[int, SearchOp]], grouped_ops.get(SearchOp, [])
+            )
+            vectors = self._embed_search_queries(search_ops)
+            with self._reader() as conn:
+                if GetOp in grouped_ops:
+                    self._batch_get_ops(
+                        cast(Sequence[tuple[int, GetOp]], grouped_ops[GetOp]),
+                        results,
+                        conn,
+                    )
+                if search_ops:
+                    self._batch_search_ops(search_ops, vectors, results, conn)
+                if ListNamespacesOp in grouped_ops:
+                    self._batch_list_namespaces_ops(
+                        cast(
+                            Sequence[tuple[int, ListNamespacesOp]],
+                            grouped_ops[ListNamespacesOp],
+                        ),
+                        results,
+                        conn,
+                    )
+
+        if PutOp in grouped_ops:
+            self._batch_put_ops(cast(Sequence[tuple[int, PutOp]], grouped_ops[PutOp]))
+
+        return results
+
+    async def abatch(self, ops: Iterable[Op]) -> list[Result]:
+        return await asyncio.get_running_loop().run_in_executor(None, self.batch, ops)
+
+    def _embed_search_queries(
+        self, search_ops: Sequence[tuple[int, SearchOp]]
+    ) -> dict[str, list[float]]:
+        if not self.embeddings:
+            return {}
+        return {
+            query: self.embeddings.embed_query(query)
+            for query in {op.query for _, op in search_ops if op.query}
+        }
+
+    def _batch_get_ops(
+        self,
+        get_ops: Sequence[tuple[int, GetOp]],
+        results: list[Result],
+        conn: sqlite3.Connection,
+    ) -> None:
+        for query, params, namespace, items in self._get_batch_GET_ops_queries(get_ops):
+            rows = conn.execute(query, params).fetchall()
+            key_to_row = {row[1]: row for row in rows}
+            for idx, key in items:
+                row = key_to_row.get(key)
+                results[idx] = _row_to_item(namespace, row) if row else None
+
+    def _batch_put_ops(
+        self,
+        put_ops: Sequence[tuple[int, PutOp]],
+    ) -> None:
+        queries, to_embed = self._prepare_batch_PUT_queries(put_ops)
+        if to_embed and self.embeddings:
+            vectors = self.embeddings.embed_documents([text for *_, text in to_embed])
+            queries.append(self._get_vector_insert_query(to_embed, vectors))
+        with self.lock:
+            try:
+                for query, params in queries:
+                    self.conn.executemany(query, params)
+            except BaseException:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+
+    def _batch_search_ops(
+        self,
+        search_ops: Sequence[tuple[int, SearchOp]],
+        vectors: dict[str, list[float]],
+        results: list[Result],
+        conn: sqlite3.Connection,
+    ) -> None:
+        queries, embedding_requests = self._prepare_batch_search_queries(search_ops)
+        for idx, query in embedding_requests:
+            _fill_placeholders(queries[idx][1], vectors[query])
+        for (idx, _), (query, params) in zip(search_ops, queries):
+            rows = conn.execute(query, params).fetchall()
+            results[idx] = [_row_to_search_item(row) for row in rows]
+
+    def _batch_list_namespaces_ops(
+        self,
+        list_ops: Sequence[tuple[int, ListNamespacesOp]],
+        results: list[Result],
+        conn: sqlite3.Connection,
+    ) -> None:
+        queries = self._get_batch_list_namespaces_queries(list_ops)
+        for (query, params), (idx, op) in zip(queries, list_ops):
+            rows = conn.execute(query, params).fetchall()
+            results[idx] = _list_namespaces(op, (row[0] for row in rows))
+
+
+def _configure(conn: Any) -> None:
+    conn.create_function(
+        "store_cosine_similarity", 2, _cosine_similarity, deterministic=True
+    )
+
+
+def _database_path(conn: sqlite3.Connection) -> str:
+    """Return the path of the main database file, or '' for in-memory databases."""
+    for _, name, path in conn.execute("PRAGMA database_list").fetchall():
+        if name == "main":
+            return path or ""
+    return ""
+
+
+def _group_ops(ops: Iterable[Op]) -> tuple[dict[type, list[tuple[int, Op]]], int]:
+    grouped_ops: dict[type, list[tuple[int, Op]]] = defaultdict(list)
+    tot = 0
+    for idx, op in enumerate(ops):
+        grouped_ops[type(op)].append((idx, op))
+        tot += 1
+    return grouped_ops, tot
+
+
+def _namespace_to_text(namespace: tuple[str, ...]) -> str:
+    """Convert namespace tuple to text string."""
+    return ".".join(namespace)
+
+
+def _prefix_conditions(namespace_prefix: tuple[str, ...]) -> tuple[list[str], list]:
+    """Return the conditions matching the namespaces under a prefix.
+
+    These are range conditions, so that they can be answered with the primary key
+    index."""
+    prefix = _namespace_to_text(namespace_prefix)
+    # '/' is the character following '.', the namespace separator
+    return (
+        ["(s.prefix = ? OR (s.prefix > ? AND s.prefix < ?))"],
+        [prefix, f"{prefix}.", f"{prefix}/"],
+    )
+
+
+def _search_conditions(op: SearchOp) -> tuple[list[str], list]:
+    """Return the conditions matching the namespace prefix and filter of a search."""
+    if op.namespace_prefix:
+        conditions, params = _prefix_conditions(op.namespace_prefix)
+    else:
+        conditions, params = [], []
+    for key, value in (op.filter or {}).items():
+        if isinstance(value, dict) and any(k.startswith("$") for k in value):
+            for op_name, val in value.items():
+                condition, val = _get_filter_condition(op_name, val)
+                conditions.append(condition)
+                params.extend([_json_path(key), val])
+        else:
+            conditions.append("json_extract(s.value, ?) IS ?")
+            params.extend([_json_path(key), _json_value(value)])
+    return conditions, params
+
+
+def _get_filter_condition(op: str, value: Any) -> tuple[str, Any]:
+    """Return the condition comparing a field to a value, given the path of the
+    field as its first parameter."""
+    if op == "$eq":
+        return "json_extract(s.value, ?) IS ?", _json_value(value)
+    elif op == "$ne":
+        return "json_extract(s.value, ?) IS NOT ?", _json_value(value)
+    elif op in _COMPARISON_OPERATORS:
+        operator = _COMPARISON_OPERATORS[op]
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return f"CAST(json_extract(s.value, ?) AS REAL) {operator} ?", value
+        # Anything else, e.g. strings, is compared as text
+        return f"CAST(json_extract(s.value, ?) AS TEXT) {operator} ?", str(value)
+    else:
+        raise ValueError(f"Unsupported operator: {op}")
+
+
+_COMPARISON_OPERATORS = {"$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+def _json_path(key: str) -> str:
+    return '$."' + key.replace('"', '""') + '"'
+
+
+def _json_value(value: Any) -> Any:
+    """Convert a filter value to what json_extract returns for it."""
+    if isinstance(value, (dict, list)):
+        # json_extract returns JSON text without whitespace for objects and arrays
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+def _where(conditions: Sequence[str]) -> str:
+    return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+
+def _fts_query(query: str) -> str:
+    """Convert a natural language query to an FTS5 query matching any of its words."""
+    return " OR ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+
+
+def _list_namespaces(
+    op: ListNamespacesOp, prefixes: Iterable[str]
+) -> list[tuple[str, ...]]:
+    namespaces: Iterable[tuple[str, ...]] = (
+        tuple(prefix.split(".")) for prefix in prefixes
+    )
+    if op.match_conditions:
+        namespaces = [
+            ns
+            for ns in namespaces
+            if all(_does_match(condition, ns) for condition in op.match_conditions)
+        ]
+    if op.max_depth is not None:
+        namespaces = {ns[: op.max_depth] for ns in namespaces}
+    return sorted(namespaces)[op.offset : op.offset + op.limit]
+
+
+def _does_match(match_condition: MatchCondition, key: tuple[str, ...]) -> bool:
+    """Whether a namespace key matches a match condition."""
+    path = match_condition.path
+    if len(key) < len(path):
+        return False
+    if match_condition.match_type == "prefix":
+        pairs = zip(key, path)
+    elif match_condition.match_type == "suffix":
+        pairs = zip(reversed(key), reversed(path))
+    else:
+        raise ValueError(f"Unsupported match type: {match_condition.match_type}")
+    return all(p_elem == "*" or k_elem == p_elem for k_elem, p_elem in pairs)
+
+
+def _row_to_item(namespace: tuple[str, ...], row: Sequence) -> Item:
+    _, key, value, created_at, updated_at = row[:5]
+    return Item(
+        value=json.loads(value),
+        key=key,
+        namespace=namespace,
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=datetime.fromisoformat(updated_at),
+    )
+
+
+def _row_to_search_item(row: Sequence) -> SearchItem:
+    prefix, key, value, created_at, updated_at = row[:5]
+    return SearchItem(
+        namespace=tuple(prefix.split(".")),
+        key=key,
+        value=json.loads(value),
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=datetime.fromisoformat(updated_at),
+        score=row[5] if len(row) > 5 else None,
+    )
+
+
+_PLACEHOLDER = object()
+
+
+def _fill_placeholders(params: list[Any], vector: Sequence[float]) -> None:
+    blob = _vector_to_blob(vector)
+    for i in range(len(params)):
+        if params[i] is _PLACEHOLDER:
+            params[i] = blob
+
+
+def _vector_to_blob(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+if util.find_spec("numpy"):
+    import numpy as np
+
+    def _cosine_similarity(a: bytes, b: bytes) -> Optional[float]:
+        x = np.frombuffer(a, dtype=np.float32)
+        y = np.frombuffer(b, dtype=np.float32)
+        norm = float(np.linalg.norm(x) * np.linalg.norm(y))
+        return float(np.dot(x, y)) / norm if norm else 0.0
+
+else:
+
+    def _cosine_similarity(a: bytes, b: bytes) -> Optional[float]:
+        x, y = array("f"), array("f")
+        x.frombytes(a)
+        y.frombytes(b)
+        norm = math.sqrt(sum(v * v for v in x)) * math.sqrt(sum(v * v for v in y))
+        return sum(u * v for u, v in zip(x, y)) / norm if norm else 0.0
@@ -6,8 +6,11 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
+    DeltaValue,
     create_checkpoint,
+    delete_thread,
     empty_checkpoint,
+    keep_since,
 )
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
@@ -98,3 +101,61 @@ class TestAsyncSqliteSaver:
             } == {"", "inner"}
 
             # TODO: test before and limit params
+
+    async def test_aprune(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            configs = []
+            items: list[int] = []
+            for i in range(1, 4):
+                items = [*items, i]
+                checkpoint = create_checkpoint(empty_checkpoint(), None, i)
+                checkpoint["channel_values"] = {
+                    "items": DeltaValue(
+                        items, tuple(str(b) for b in range(1, i)), i - 1
+                    )
+                }
+                checkpoint["channel_versions"] = {"items": str(i)}
+                # isoformat() omits the microseconds of whole seconds
+                checkpoint["ts"] = f"2024-01-0{i}T00:00:00+00:00"
+                config = await saver.aput(config, checkpoint, {}, {"items": str(i)})
+                configs.append(config)
+            ts = (await saver.aget_tuple(configs[1])).checkpoint["ts"]
+
+            await saver.aprune(["thread-1"], strategy=keep_since(ts))
+
+            remaining = [c async for c in saver.alist(None)]
+            assert [c.config for c in remaining] == [configs[2], configs[1]]
+            assert remaining[0].checkpoint["channel_values"]["items"].items == [1, 2, 3]
+
+            await saver.aprune(["thread-1"], strategy=delete_thread)
+
+            assert [c async for c in saver.alist(None)] == []
+            async with saver.conn.execute("SELECT * FROM checkpoint_blobs") as cur:
+                assert await cur.fetchall() == []
+
+    async def test_aget_tuples(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            config_1 = await saver.aput(
+                self.config_1, self.chkpnt_1, self.metadata_1, {}
+            )
+            await saver.aput_writes(config_1, [("foo", 1)], "task-1")
+            config_2 = await saver.aput(
+                self.config_2, self.chkpnt_2, self.metadata_2, {}
+            )
+
+            requested: list[RunnableConfig] = [
+                config_2,
+                {"configurable": {"thread_id": "thread-3"}},
+                {"configurable": {"thread_id": "thread-1"}},
+            ]
+            tuples = await saver.aget_tuples(requested)
+            assert [t.config if t else None for t in tuples] == [
+                config_2,
+                None,
+                config_1,
+            ]
+            assert tuples[2].pending_writes == [("task-1", "foo", 1)]
+            assert tuples == [await saver.aget_tuple(config) for config in requested]
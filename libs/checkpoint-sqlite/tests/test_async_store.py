@@ -0,0 +1,66 @@
+import asyncio
+import os
+import tempfile
+
+from langgraph.store.base import GetOp, PutOp, SearchOp
+from langgraph.store.sqlite.aio import AsyncSqliteStore
+from tests.embed_test_utils import CharacterEmbeddings
+
+
+async def test_abatch_ops() -> None:
+    async with AsyncSqliteStore.from_conn_string(":memory:") as store:
+        await store.aput(("test", "foo"), "key1", {"data": "value1"})
+        await store.aput(("test", "bar"), "key2", {"text": "the quick brown fox"})
+
+        results = await store.abatch(
+            [
+                GetOp(namespace=("test", "foo"), key="key1"),
+                PutOp(namespace=("test",), key="key3", value={"data": "value3"}),
+                SearchOp(namespace_prefix=("test",), query="quick"),
+                GetOp(namespace=("test",), key="key3"),
+            ]
+        )
+        assert results[0].value == {"data": "value1"}
+        assert results[1] is None
+        assert [item.key for item in results[2]] == ["key2"]
+        assert results[3] is None
+
+        assert (await store.aget(("test",), "key3")).value == {"data": "value3"}
+        assert await store.alist_namespaces(prefix=("test",)) == [
+            ("test",),
+            ("test", "bar"),
+            ("test", "foo"),
+        ]
+        await store.adelete(("test", "foo"), "key1")
+        assert await store.aget(("test", "foo"), "key1") is None
+
+
+async def test_avector_search() -> None:
+    embeddings = CharacterEmbeddings(dims=500)
+    async with AsyncSqliteStore.from_conn_string(
+        ":memory:", index={"dims": embeddings.dims, "embed": embeddings}
+    ) as store:
+        await store.aput(("docs",), "doc1", {"text": "zany zebra Xerxes"})
+        await store.aput(("docs",), "doc2", {"text": "something about dogs"})
+        await store.aput(("docs",), "doc3", {"text": "text about birds"})
+
+        results = await store.asearch(("docs",), query="Zany Xerxes")
+        assert results[0].key == "doc1"
+        assert results[0].score > results[-1].score
+
+        page1 = await store.asearch(("docs",), query="about", limit=2)
+        page2 = await store.asearch(("docs",), query="about", after=page1[-1].cursor)
+        assert page1 + page2 == await store.asearch(("docs",), query="about")
+
+
+async def test_aconcurrent_readers() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "store.sqlite")
+        async with AsyncSqliteStore.from_conn_string(path, pool_size=2) as store:
+            await asyncio.gather(
+                *(store.aput(("docs",), f"doc{i}", {"i": i}) for i in range(20))
+            )
+            counts = await asyncio.gather(
+                *(store.asearch(("docs",), limit=100) for _ in range(10))
+            )
+            assert [len(items) for items in counts] == [20] * 10
@@ -0,0 +1,27 @@
+import time
+
+from langgraph.cache.sqlite import SqliteCache
+
+
+def test_sqlite_cache() -> None:
+    with SqliteCache.from_conn_string(":memory:") as cache:
+        key = (("__pregel_ns_writes", "node"), "abc")
+        other = (("__pregel_ns_writes", "other"), "abc")
+        assert cache.get([key]) == {}
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        cache.set({key: ([("x", 1)], None), other: ([("y", 2)], 1)})
+        assert cache.get([key, other]) == {key: [["x", 1]], other: [["y", 2]]}
+        assert (cache.hits, cache.misses) == (2, 1)
+
+        # entries expire after their ttl
+        cache.set({other: ([("y", 2)], 0)})
+        time.sleep(0.01)
+        assert cache.get([other]) == {}
+
+        # clearing a namespace leaves others untouched
+        cache.set({other: ([("y", 2)], None)})
+        cache.clear([("__pregel_ns_writes", "node")])
+        assert cache.get([key, other]) == {other: [["y", 2]]}
+        cache.clear()
+        assert cache.get([key, other]) == {}
@@ -6,9 +6,15 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
+    DeltaValue,
     create_checkpoint,
+    delete_thread,
     empty_checkpoint,
+    keep_latest,
+    keep_since,
 )
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.checkpoint.sqlite import SqliteSaver
 from langgraph.checkpoint.sqlite.utils import _metadata_predicate, search_where
 
@@ -155,3 +161,249 @@ class TestSqliteSaver:
             with pytest.raises(NotImplementedError, match="AsyncSqliteSaver"):
                 async for _ in saver.alist(self.config_1):
                     pass
+
+    def test_prune(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            configs = []
+            for thread_id in ("thread-1", "thread-2"):
+                config: RunnableConfig = {
+                    "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+                }
+                items: list[int] = []
+                for i in range(1, 5):
+                    items = [*items, i]
+                    checkpoint = create_checkpoint(empty_checkpoint(), None, i)
+                    checkpoint["channel_values"] = {
+                        "items": DeltaValue(
+                            items, tuple(str(b) for b in range(1, i)), i - 1
+                        ),
+                    }
+                    checkpoint["channel_versions"] = {"items": str(i)}
+                    config = saver.put(config, checkpoint, {}, {"items": str(i)})
+                    saver.put_writes(config, [("items", i)], f"task-{i}")
+                    configs.append(config)
+
+            saver.prune(["thread-1"], strategy=keep_latest(2))
+
+            remaining = list(saver.list({"configurable": {"thread_id": "thread-1"}}))
+            assert [c.config for c in remaining] == [configs[3], configs[2]]
+            # delta-encoded values are still reassembled from their base blobs
+            assert remaining[0].checkpoint["channel_values"]["items"].items == [
+                1,
+                2,
+                3,
+                4,
+            ]
+            assert remaining[0].pending_writes == [("task-4", "items", 4)]
+            # writes of the parent of the oldest remaining checkpoint are kept
+            assert saver.conn.execute(
+                "SELECT checkpoint_id FROM writes WHERE thread_id = 'thread-1' ORDER BY checkpoint_id"
+            ).fetchall() == [
+                (c["configurable"]["checkpoint_id"],) for c in configs[1:4]
+            ]
+
+            # the latest checkpoint is kept, even if older
+            saver.prune(["thread-1"], strategy=keep_since("2999-01-01T00:00:00"))
+
+            assert [
+                c.config
+                for c in saver.list({"configurable": {"thread_id": "thread-1"}})
+            ] == [configs[3]]
+            assert saver.get_tuple(configs[3]).checkpoint["channel_values"][
+                "items"
+            ].items == [1, 2, 3, 4]
+            # other threads are not affected
+            assert (
+                len(list(saver.list({"configurable": {"thread_id": "thread-2"}}))) == 4
+            )
+
+            saver.prune(["thread-1", "thread-2"], strategy=delete_thread)
+
+            assert list(saver.list(None)) == []
+            for table in ("checkpoints", "writes", "checkpoint_blobs"):
+                assert saver.conn.execute(f"SELECT * FROM {table}").fetchall() == []
+
+    def test_delta_values(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            queries: list[str] = []
+            saver.conn.set_trace_callback(queries.append)
+            # channels with a version but no value don't need checkpoint_blobs
+            chkpnt = create_checkpoint(self.chkpnt_1, None, 1)
+            chkpnt["channel_values"] = {"count": 1}
+            chkpnt["channel_versions"] = {"count": "1", "empty": "1"}
+            config = saver.put(self.config_1, chkpnt, self.metadata_1, {})
+            queries.clear()
+            assert saver.get_tuple(config).checkpoint["channel_values"] == {"count": 1}
+            assert not any("checkpoint_blobs" in q for q in queries)
+
+            chkpnt = create_checkpoint(chkpnt, None, 2)
+            chkpnt["channel_values"] = {"count": 2, "items": DeltaValue([1, 2])}
+            chkpnt["channel_versions"] = {"count": "2", "empty": "1", "items": "2"}
+            config = saver.put(config, chkpnt, self.metadata_1, {})
+            loaded = saver.get_tuple(config).checkpoint
+            assert loaded == {
+                **chkpnt,
+                "channel_values": {"count": 2, "items": DeltaValue([1, 2])},
+                "pending_sends": [],
+            }
+            # the stored checkpoint holds no delta values nor foreign keys
+            type_, stored = saver.conn.execute(
+                "SELECT type, checkpoint FROM checkpoints WHERE checkpoint_id = ?",
+                (chkpnt["id"],),
+            ).fetchone()
+            assert saver.serde.loads_typed((type_, stored)) == {
+                **chkpnt,
+                "channel_values": {"count": 2},
+            }
+
+    def test_setup_adds_delta_channels(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            # a checkpoints table created before the delta_channels column
+            saver.conn.execute(
+                "CREATE TABLE checkpoints (thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL DEFAULT '', checkpoint_id TEXT NOT NULL, parent_checkpoint_id TEXT, type TEXT, checkpoint BLOB, metadata BLOB, PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))"
+            )
+            chkpnt = create_checkpoint(self.chkpnt_1, None, 1)
+            chkpnt["channel_values"] = {"items": DeltaValue([1])}
+            chkpnt["channel_versions"] = {"items": "1"}
+            config = saver.put(self.config_1, chkpnt, self.metadata_1, {})
+            assert saver.get_tuple(config).checkpoint["channel_values"] == {
+                "items": DeltaValue([1])
+            }
+
+    def test_list_metadata(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            chkpnt = create_checkpoint(self.chkpnt_1, {"count": 1}, 1)
+            chkpnt["channel_versions"] = {"count": "1"}
+            config = saver.put(self.config_1, chkpnt, self.metadata_1, {"count": "1"})
+            saver.put_writes(config, [("count", 2)], "task-1")
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+            listed = list(saver.list_metadata(None, filter={"source": "input"}))
+            assert len(listed) == 1
+            assert listed[0].config == config
+            assert listed[0].metadata == self.metadata_1
+            assert isinstance(listed[0], CheckpointMetadataTuple)
+
+            assert [c.config for c in saver.list_metadata(None, limit=1)] == [
+                c.config for c in saver.list(None, limit=1)
+            ]
+
+    def test_put_writes_many(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put_writes_many(
+                [
+                    (config, [("foo", 1), ("bar", 2)], "task-1"),
+                    (config, [("__error__", "boom")], "task-2"),
+                    (config, [("foo", 3)], "task-3"),
+                ]
+            )
+
+            assert saver.get_tuple(config).pending_writes == [
+                ("task-1", "foo", 1),
+                ("task-1", "bar", 2),
+                ("task-2", "__error__", "boom"),
+                ("task-3", "foo", 3),
+            ]
+
+    def test_get_tuples(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            assert saver.get_tuples([]) == []
+            config_1 = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put_writes(config_1, [("foo", 1)], "task-1")
+            config_2 = saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            config_3 = saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+            chkpnt_4 = create_checkpoint(self.chkpnt_1, {}, 2)
+            config_4 = saver.put(config_1, chkpnt_4, self.metadata_2, {})
+
+            requested: list[RunnableConfig] = [
+                {"configurable": {"thread_id": "thread-1"}},
+                config_1,
+                {"configurable": {"thread_id": "thread-2", "checkpoint_ns": "inner"}},
+                {"configurable": {"thread_id": "thread-3"}},
+                {**config_2, "configurable": {**config_2["configurable"], "x": 1}},
+            ]
+            tuples = saver.get_tuples(requested)
+            assert [t.config["configurable"] if t else None for t in tuples] == [
+                config_4["configurable"],
+                config_1["configurable"],
+                config_3["configurable"],
+                None,
+                {**config_2["configurable"], "x": 1},
+            ]
+            assert tuples[1].pending_writes == [("task-1", "foo", 1)]
+            assert tuples == [saver.get_tuple(config) for config in requested]
+
+    def test_get_tuples_matches_memory_saver(self) -> None:
+        memory = MemorySaver()
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            requested: list[RunnableConfig] = []
+            # more threads than fit in the parameters of a single query
+            for i in range(500):
+                for checkpoint_ns in ("", "inner"):
+                    config: RunnableConfig = {
+                        "configurable": {
+                            "thread_id": f"thread-{i}",
+                            "checkpoint_ns": checkpoint_ns,
+                        }
+                    }
+                    chkpnt = create_checkpoint(empty_checkpoint(), None, 1)
+                    for checkpointer in (memory, saver):
+                        saved = checkpointer.put(config, chkpnt, {"step": i}, {})
+                        checkpointer.put_writes(saved, [("foo", i)], "task-1")
+                requested.extend(
+                    [
+                        {"configurable": {"thread_id": f"thread-{i}"}},
+                        saved,
+                        {
+                            "configurable": {
+                                "thread_id": f"thread-{i}",
+                                "checkpoint_ns": "inner",
+                                "checkpoint_id": "missing",
+                            }
+                        },
+                        {"configurable": {"thread_id": f"missing-{i}"}},
+                    ]
+                )
+
+            expected = memory.get_tuples(requested)
+            tuples = saver.get_tuples(requested)
+            assert [t is None for t in tuples] == [t is None for t in expected]
+            assert [t.config if t else None for t in tuples] == [
+                t.config if t else None for t in expected
+            ]
+            assert [t.checkpoint if t else None for t in tuples] == [
+                t.checkpoint if t else None for t in expected
+            ]
+            assert [t.pending_writes if t else None for t in tuples] == [
+                t.pending_writes if t else None for t in expected
+            ]
+
+    def test_get_tuples_delta_values(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            requested: list[RunnableConfig] = []
+            for i in range(300):
+                config: RunnableConfig = {
+                    "configurable": {"thread_id": f"thread-{i}", "checkpoint_ns": ""}
+                }
+                for version, value in (
+                    (1, DeltaValue([i])),
+                    (2, DeltaValue([i, i], ("1",), 1)),
+                ):
+                    chkpnt = create_checkpoint(empty_checkpoint(), None, version)
+                    chkpnt["channel_values"] = {"items": value}
+                    chkpnt["channel_versions"] = {"items": str(version)}
+                    config = saver.put(config, chkpnt, {}, {})
+                requested.append(config)
+
+            queries: list[str] = []
+            saver.conn.set_trace_callback(queries.append)
+            tuples = saver.get_tuples(requested)
+            assert [t.checkpoint["channel_values"]["items"] for t in tuples] == [
+                DeltaValue([i, i]) for i in range(300)
+            ]
+            # the blobs of all checkpoints are read together, then their bases,
+            # in chunks within the limit of 999 parameters per query
+            assert len([q for q in queries if "checkpoint_blobs" in q]) == 4
+            saver.conn.set_trace_callback(None)
+            assert tuples == [saver.get_tuple(config) for config in requested]
@@ -0,0 +1,189 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+import pytest
+
+from langgraph.store.base import GetOp, ListNamespacesOp, PutOp, SearchOp
+from langgraph.store.sqlite import SqliteStore
+from tests.embed_test_utils import CharacterEmbeddings
+
+
+@pytest.fixture
+def fake_embeddings() -> CharacterEmbeddings:
+    return CharacterEmbeddings(dims=500)
+
+
+@pytest.fixture
+def store() -> Iterator[SqliteStore]:
+    with SqliteStore.from_conn_string(":memory:") as store:
+        yield store
+
+
+def test_batch_ops(store: SqliteStore) -> None:
+    store.put(("test", "foo"), "key1", {"data": "value1"})
+    store.put(("test", "bar"), "key2", {"data": "value2"})
+
+    results = store.batch(
+        [
+            GetOp(namespace=("test", "foo"), key="key1"),
+            PutOp(namespace=("test", "bar"), key="key3", value={"data": "value3"}),
+            SearchOp(namespace_prefix=("test",), filter={"data": "value2"}),
+            ListNamespacesOp(match_conditions=None, max_depth=None),
+            GetOp(namespace=("test",), key="key4"),
+        ]
+    )
+    assert results[0].value == {"data": "value1"}
+    assert results[1] is None
+    assert [item.key for item in results[2]] == ["key2"]
+    assert results[3] == [("test", "bar"), ("test", "foo")]
+    assert results[4] is None
+
+    # writes are applied after the reads of the batch
+    assert store.get(("test", "bar"), "key3").value == {"data": "value3"}
+
+    created_at = store.get(("test", "foo"), "key1").created_at
+    store.put(("test", "foo"), "key1", {"data": "updated"})
+    item = store.get(("test", "foo"), "key1")
+    assert item.value == {"data": "updated"}
+    assert item.created_at == created_at
+    assert item.updated_at > created_at
+
+    store.delete(("test", "foo"), "key1")
+    assert store.get(("test", "foo"), "key1") is None
+
+
+def test_search_filters(store: SqliteStore) -> None:
+    docs = [
+        ("doc1", {"color": "red", "score": 4.5, "tags": ["a", "b"], "active": True}),
+        ("doc2", {"color": "blue", "score": 3.0, "tags": ["b"], "active": False}),
+        ("doc3", {"color": "red", "score": 2.0, "nested": {"x": 1}}),
+    ]
+    for key, value in docs:
+        store.put(("docs", "sub"), key, value)
+    store.put(("docsother",), "doc4", {"color": "red"})
+
+    def keys(**kwargs) -> list[str]:
+        return sorted(item.key for item in store.search(("docs",), **kwargs))
+
+    assert keys() == ["doc1", "doc2", "doc3"]
+    assert keys(filter={"color": "red"}) == ["doc1", "doc3"]
+    assert keys(filter={"score": {"$gt": 2.5}}) == ["doc1", "doc2"]
+    assert keys(filter={"score": {"$gte": 3.0, "$lt": 4.5}}) == ["doc2"]
+    assert keys(filter={"color": {"$gt": "blue"}}) == ["doc1", "doc3"]
+    assert keys(filter={"color": {"$lte": "blue"}}) == ["doc2"]
+    assert keys(filter={"color": {"$ne": "red"}}) == ["doc2"]
+    assert keys(filter={"tags": ["b"]}) == ["doc2"]
+    assert keys(filter={"active": True}) == ["doc1"]
+    assert keys(filter={"nested": {"x": 1}}) == ["doc3"]
+    assert keys(filter={"missing": None}) == ["doc1", "doc2", "doc3"]
+
+    assert store.list_namespaces(prefix=("docs",)) == [("docs", "sub")]
+    assert store.list_namespaces(suffix=("sub",)) == [("docs", "sub")]
+    assert store.list_namespaces(prefix=("*", "sub")) == [("docs", "sub")]
+    assert store.list_namespaces(max_depth=1) == [("docs",), ("docsother",)]
+    assert store.list_namespaces(limit=1, offset=1) == [("docsother",)]
+
+
+def test_full_text_search(store: SqliteStore) -> None:
+    store.put(("docs",), "doc1", {"text": "the quick brown fox"})
+    store.put(("docs",), "doc2", {"text": "the lazy dog sleeps"})
+    store.put(("docs",), "doc3", {"text": "a quick dog"})
+    store.put(("docs",), "doc4", {"text": "quick but unindexed"}, index=False)
+
+    results = store.search(("docs",), query="quick fox")
+    assert [item.key for item in results] == ["doc1", "doc3"]
+    assert results[0].score > results[1].score
+
+    assert [item.key for item in store.search(("docs",), query="dog's")] == []
+    assert [item.key for item in store.search(("docs",), query="sleeps")] == ["doc2"]
+    assert store.search(("docs",), query="  ") == []
+
+    # the full-text index follows updates and deletes
+    store.put(("docs",), "doc2", {"text": "the lazy dog is awake"})
+    assert store.search(("docs",), query="sleeps") == []
+    store.delete(("docs",), "doc3")
+    assert [item.key for item in store.search(("docs",), query="quick")] == ["doc1"]
+
+
+def test_vector_search(fake_embeddings: CharacterEmbeddings) -> None:
+    with SqliteStore.from_conn_string(
+        ":memory:",
+        index={
+            "dims": fake_embeddings.dims,
+            "embed": fake_embeddings,
+            "fields": ["text"],
+        },
+    ) as store:
+        store.put(("docs",), "doc1", {"text": "zany zebra Xerxes"})
+        store.put(("docs",), "doc2", {"text": "something about dogs"})
+        store.put(("docs",), "doc3", {"text": "text about birds"})
+        store.put(("docs",), "doc4", {"text": "zany zebra Xerxes"}, index=False)
+
+        results = store.search(("docs",), query="Zany Xerxes")
+        assert [item.key for item in results][:1] == ["doc1"]
+        assert "doc4" not in [item.key for item in results]
+        assert results[0].score > results[-1].score
+
+        store.put(("docs",), "doc1", {"text": "new text about dogs"})
+        results = store.search(("docs",), query="new text about dogs")
+        assert results[0].key == "doc1"
+        assert results[0].score == pytest.approx(1.0)
+
+        # fields can be chosen per item
+        store.put(
+            ("docs",),
+            "doc5",
+            {"title": "zany zebra Xerxes", "body": "birds"},
+            index=["title"],
+        )
+        assert store.search(("docs",), query="zany zebra Xerxes")[0].key == "doc5"
+
+        # and the vector search supports filters and cursors
+        results = store.search(
+            ("docs",), query="about", filter={"text": "text about birds"}
+        )
+        assert [item.key for item in results] == ["doc3"]
+        expected = store.search(("docs",), query="about", limit=10)
+        page1 = store.search(("docs",), query="about", limit=2)
+        page2 = store.search(("docs",), query="about", limit=10, after=page1[-1].cursor)
+        assert page1 + page2 == expected
+
+
+def test_search_cursor(store: SqliteStore) -> None:
+    for i in range(7):
+        store.put(("docs", str(i % 2)), f"doc{i}", {"text": f"document {i}"})
+
+    for query in (None, "document"):
+        expected = store.search(("docs",), query=query, limit=100)
+        assert len(expected) == 7
+        pages = []
+        after = None
+        while page := store.search(("docs",), query=query, limit=3, after=after):
+            pages.append(page)
+            after = page[-1].cursor
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert [item for page in pages for item in page] == expected
+
+
+def test_concurrent_readers() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "store.sqlite")
+        with SqliteStore.from_conn_string(path, pool_size=2) as store:
+            assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+            def write(i: int) -> None:
+                store.put(("docs",), f"doc{i}", {"i": i})
+
+            def read(i: int) -> int:
+                return len(store.search(("docs",), limit=100))
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(write, range(50)))
+                counts = list(executor.map(read, range(20)))
+            assert counts == [50] * 20
+
+        # data is persisted across connections
+        with SqliteStore.from_conn_string(path) as store:
+            assert store.get(("docs",), "doc7").value == {"i": 7}
@@ -0,0 +1,90 @@
+"""Base classes and types for LangGraph node caches.
+
+A cache stores the writes produced by a node for a given input, so that
+identical invocations of the same node can be replayed without being
+re-executed. Entries are addressed by a namespace (a tuple of strings) and a key.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Generic, Mapping, Optional, Sequence, TypeVar
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+ValueT = TypeVar("ValueT")
+
+Namespace = tuple[str, ...]
+"""Hierarchical path under which cache entries are grouped."""
+
+FullKey = tuple[Namespace, str]
+"""Fully qualified cache key, a (namespace, key) pair."""
+
+
+class BaseCache(ABC, Generic[ValueT]):
+    """Base class for a cache of node writes.
+
+    Implementations must provide `get`, `set` and `clear`. The async variants
+    default to calling the sync methods, which is appropriate for caches that
+    never block on I/O.
+
+    Attributes:
+        serde (SerializerProtocol): Serializer used to encode cached values.
+        hits (int): Number of keys found in the cache since it was created.
+        misses (int): Number of keys requested but not found in the cache.
+    """
+
+    serde: SerializerProtocol = JsonPlusSerializer()
+
+    def __init__(self, *, serde: Optional[SerializerProtocol] = None) -> None:
+        self.serde = serde or self.serde
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Get the cached values for the given keys.
+
+        Args:
+            keys: The keys to look up.
+
+        Returns:
+            A mapping from each key found (and not expired) to its value.
+            Keys that are missing or expired are omitted.
+        """
+
+    @abstractmethod
+    def set(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        """Set the cached values for the given keys.
+
+        Args:
+            pairs: A mapping from key to a (value, ttl) tuple. The ttl is the
+                number of seconds the entry stays valid, or None to never expire.
+        """
+
+    @abstractmethod
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Delete cached values.
+
+        Args:
+            namespaces: The namespaces to clear. If None, clears all namespaces.
+        """
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Asynchronously get the cached values for the given keys."""
+        return self.get(keys)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        """Asynchronously set the cached values for the given keys."""
+        return self.set(pairs)
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Asynchronously delete cached values."""
+        return self.clear(namespaces)
+
+    def _record(self, requested: int, found: int) -> None:
+        """Update the hit/miss counters after a lookup."""
+        self.hits += found
+        self.misses += requested - found
+
+
+__all__ = ["BaseCache", "FullKey", "Namespace", "ValueT"]
@@ -0,0 +1,98 @@
+"""In-memory LRU cache for node writes.
+
+!!! example "Examples"
+    ```python
+    from langgraph.cache.memory import InMemoryCache
+    from langgraph.graph import StateGraph
+    from langgraph.types import CachePolicy
+
+    builder = StateGraph(dict)
+    builder.add_node("retrieve", retrieve, cache_policy=CachePolicy(ttl=60))
+    ...
+    graph = builder.compile(cache=InMemoryCache(maxsize=1024))
+    ```
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Mapping, Optional, Sequence
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace, ValueT
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+
+class InMemoryCache(BaseCache[ValueT]):
+    """A thread-safe, in-memory cache with least-recently-used eviction.
+
+    Values are stored serialized, so that cached writes can't be mutated
+    by the nodes or reducers that consume them.
+
+    Args:
+        maxsize (Optional[int]): Maximum number of entries to keep. When exceeded,
+            the least recently used entries are evicted. Defaults to None (unbounded).
+        serde (Optional[SerializerProtocol]): The serializer to use for cached values.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: Optional[int] = None,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be a positive integer or None")
+        self.maxsize = maxsize
+        self._data: OrderedDict[FullKey, tuple[tuple[str, bytes], Optional[float]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Get the cached values for the given keys."""
+        now = time.time()
+        values: dict[FullKey, Any] = {}
+        with self._lock:
+            for key in keys:
+                if (entry := self._data.get(key)) is None:
+                    continue
+                data, expiry = entry
+                if expiry is not None and expiry <= now:
+                    del self._data[key]
+                    continue
+                self._data.move_to_end(key)
+                values[key] = data
+            self._record(len(keys), len(values))
+        return {k: self.serde.loads_typed(v) for k, v in values.items()}
+
+    def set(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        """Set the cached values for the given keys."""
+        now = time.time()
+        entries = {
+            key: (self.serde.dumps_typed(value), now + ttl if ttl is not None else None)
+            for key, (value, ttl) in pairs.items()
+        }
+        with self._lock:
+            for key, entry in entries.items():
+                self._data[key] = entry
+                self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Delete the cached values for the given namespaces, or all if None."""
+        with self._lock:
+            if namespaces is None:
+                self._data.clear()
+            else:
+                prefixes = set(namespaces)
+                for key in [k for k in self._data if k[0] in prefixes]:
+                    del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+__all__ = ["InMemoryCache"]
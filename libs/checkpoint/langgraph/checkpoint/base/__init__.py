@@ -1,13 +1,16 @@
+import dataclasses
 from datetime import datetime, timezone
 from typing import (
     Any,
     AsyncIterator,
+    Collection,
     Dict,
     Generic,
     Iterator,
     List,
     Literal,
     Mapping,
+    MutableMapping,
     NamedTuple,
     Optional,
     Sequence,
@@ -126,24 +129,202 @@ def copy_checkpoint(checkpoint: Checkpoint) -> Checkpoint:
     )
 
 
+@dataclasses.dataclass(frozen=True)
+class DeltaValue:
+    """Snapshot of an append-mostly channel, which can be stored incrementally.
+
+    Savers that support it store only the items appended since the blobs listed
+    in `base` (see `dump_delta`), and reassemble the full list on load (see
+    `load_delta`). Other savers can store it as is, since `items` always holds
+    the full list of items. Values holding the same items compare equal, however
+    they are stored.
+    """
+
+    items: list[Any]
+    """All the items in the channel."""
+    base: tuple[Union[str, int, float], ...] = dataclasses.field(
+        default=(), compare=False
+    )
+    """Versions of previously stored blobs of this channel, oldest first, which
+    together hold the first `base_len` items. Empty for a full snapshot."""
+    base_len: int = dataclasses.field(default=0, compare=False)
+    """Number of leading items already stored in the `base` blobs."""
+
+
+def dump_delta(value: DeltaValue) -> DeltaValue:
+    """Get the part of a delta value that needs to be stored, ie. the items
+    appended since its base blobs."""
+    if not value.base:
+        return value
+    return dataclasses.replace(value, items=value.items[value.base_len :])
+
+
+def load_delta(
+    value: DeltaValue, version: Union[str, int, float], bases: Sequence[DeltaValue]
+) -> DeltaValue:
+    """Reassemble a delta value stored with `dump_delta`.
+
+    Args:
+        value: The stored value.
+        version: The version of the channel the value was stored under.
+        bases: The stored values for each version in `value.base`, in order.
+
+    Returns:
+        The full value, based on all blobs up to and including this one.
+    """
+    items = [item for base in bases for item in base.items]
+    if len(items) != value.base_len:
+        raise ValueError(
+            f"Incomplete delta chain for version {version}: expected "
+            f"{value.base_len} base items, found {len(items)}"
+        )
+    items.extend(value.items)
+    return DeltaValue(items, (*value.base, version), len(items))
+
+
+class LazyChannelValues(MutableMapping[str, Any]):
+    """Channel values of a checkpoint, each deserialized the first time it's read.
+
+    Savers which store each channel value separately can return this as the
+    `channel_values` of a checkpoint, so that only the channels a graph run
+    actually reads are deserialized. Values that were never read are carried over
+    in serialized form by `copy` and `create_checkpoint`, so they can be saved
+    again without a round trip through the serializer.
+    """
+
+    __slots__ = ("serde", "serialized", "loaded")
+
+    def __init__(
+        self,
+        serde: SerializerProtocol,
+        serialized: Optional[dict[str, tuple[str, bytes]]] = None,
+        loaded: Optional[dict[str, Any]] = None,
+    ) -> None:
+        self.serde = serde
+        self.serialized = serialized if serialized is not None else {}
+        """Values not deserialized yet, as (type, bytes) tuples."""
+        self.loaded = loaded if loaded is not None else {}
+        """Values deserialized or set since this mapping was created."""
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self.loaded[key]
+        except KeyError:
+            pass
+        value = self.serde.loads_typed(self.serialized[key])
+        # another thread may have loaded it in the meantime
+        value = self.loaded.setdefault(key, value)
+        self.serialized.pop(key, None)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.loaded[key] = value
+        self.serialized.pop(key, None)
+
+    def __delitem__(self, key: str) -> None:
+        if key in self.loaded:
+            del self.loaded[key]
+            self.serialized.pop(key, None)
+        else:
+            del self.serialized[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.loaded or key in self.serialized
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.loaded
+        yield from (k for k in list(self.serialized) if k not in self.loaded)
+
+    def __len__(self) -> int:
+        return len(self.loaded.keys() | self.serialized.keys())
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def copy(self) -> "LazyChannelValues":
+        return LazyChannelValues(self.serde, self.serialized.copy(), self.loaded.copy())
+
+    def carry(self, keys: Collection[str]) -> "LazyChannelValues":
+        """Copy the values of the given keys, without deserializing them."""
+        return LazyChannelValues(
+            self.serde,
+            {k: self.serialized[k] for k in keys if k in self.serialized},
+            {k: self.loaded[k] for k in keys if k in self.loaded},
+        )
+
+
+class PruneStrategy(NamedTuple):
+    """Which checkpoints of a thread to delete when pruning it.
+
+    Use `keep_latest`, `keep_since` or `delete_thread` to create one. Checkpoints
+    are deleted if they are not among the `keep` most recent checkpoints of their
+    namespace, and were created before `before`.
+    """
+
+    keep: Optional[int] = None
+    """Number of most recent checkpoints to keep in each namespace, or None to
+    delete all of them."""
+    before: Optional[str] = None
+    """ISO 8601 timestamp, in UTC. If set, only checkpoints created before it
+    are deleted."""
+
+
+def keep_latest(n: int) -> PruneStrategy:
+    """Keep the `n` most recent checkpoints of each namespace of a thread."""
+    if n < 1:
+        raise ValueError("n must be a positive integer")
+    return PruneStrategy(keep=n)
+
+
+def keep_since(ts: Union[str, datetime]) -> PruneStrategy:
+    """Keep the checkpoints created at or after `ts`, and the most recent
+    checkpoint of each namespace, so that the thread can still be resumed.
+
+    Args:
+        ts: A datetime or ISO 8601 timestamp. Naive values are assumed to be in UTC.
+    """
+    if isinstance(ts, str):
+        ts = datetime.fromisoformat(ts)
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return PruneStrategy(
+        keep=1, before=ts.astimezone(timezone.utc).isoformat(timespec="microseconds")
+    )
+
+
+delete_thread = PruneStrategy()
+"""Delete all checkpoints of a thread."""
+
+
 def create_checkpoint(
     checkpoint: Checkpoint,
     channels: Optional[Mapping[str, ChannelProtocol]],
     step: int,
     *,
     id: Optional[str] = None,
+    unchanged: Collection[str] = (),
 ) -> Checkpoint:
-    """Create a checkpoint for the given channels."""
+    """Create a checkpoint for the given channels.
+
+    The values of the channels in `unchanged` are copied from `checkpoint` as is,
+    without reading the channels, eg. for channels that were never restored from it.
+    """
     ts = datetime.now(timezone.utc).isoformat()
     if channels is None:
         values = checkpoint["channel_values"]
     else:
-        values = {}
-        for k, v in channels.items():
-            if k not in checkpoint["channel_versions"]:
+        previous = checkpoint["channel_values"]
+        unchanged = {k for k in unchanged if k in checkpoint["channel_versions"]}
+        values = (
+            previous.carry(unchanged)
+            if isinstance(previous, LazyChannelValues)
+            else {k: previous[k] for k in unchanged if k in previous}
+        )
+        for k in channels:
+            if k not in checkpoint["channel_versions"] or k in unchanged:
                 continue
             try:
-                values[k] = v.checkpoint()
+                values[k] = channels[k].checkpoint()
             except EmptyChannelError:
                 pass
     return Checkpoint(
@@ -167,6 +348,14 @@ class CheckpointTuple(NamedTuple):
     pending_writes: Optional[List[PendingWrite]] = None
 
 
+class CheckpointMetadataTuple(NamedTuple):
+    """A tuple containing the config and metadata of a checkpoint, without its values."""
+
+    config: RunnableConfig
+    metadata: CheckpointMetadata
+    parent_config: Optional[RunnableConfig] = None
+
+
 CheckpointThreadId = ConfigurableFieldSpec(
     id="thread_id",
     annotation=str,
@@ -253,6 +442,25 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    def get_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Fetch the checkpoint tuples of several configurations at once.
+
+        Args:
+            configs (Sequence[RunnableConfig]): Configurations specifying which checkpoints
+                to retrieve, as passed to `get_tuple`.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The requested checkpoint tuples, in the order of
+                `configs`, with None for each checkpoint not found.
+
+        Note:
+            Defaults to calling `get_tuple` for each configuration. Override this method
+            in your custom checkpoint saver to fetch them in a single round-trip.
+        """
+        return [self.get_tuple(config) for config in configs]
+
     def list(
         self,
         config: Optional[RunnableConfig],
@@ -277,6 +485,35 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    def list_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints that match the given criteria.
+
+        Like `list`, but the checkpoints themselves are not loaded. Use `get_tuple`
+        with the config of a tuple to load the full checkpoint when it's needed.
+
+        Args:
+            config (Optional[RunnableConfig]): Base configuration for filtering checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria.
+            before (Optional[RunnableConfig]): List checkpoints created before this configuration.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Returns:
+            Iterator[CheckpointMetadataTuple]: Iterator of matching checkpoint metadata tuples.
+
+        Note:
+            Defaults to calling `list`, which loads the full checkpoints. Override
+            this method in your custom checkpoint saver to avoid that.
+        """
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield CheckpointMetadataTuple(item.config, item.metadata, item.parent_config)
+
     def put(
         self,
         config: RunnableConfig,
@@ -318,6 +555,22 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    def put_writes_many(
+        self, writes: Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]
+    ) -> None:
+        """Store the intermediate writes of several tasks at once.
+
+        Args:
+            writes (Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]):
+                (config, writes, task_id) tuples, as passed to `put_writes`.
+
+        Note:
+            Defaults to calling `put_writes` for each task. Override this method
+            in your custom checkpoint saver to store them in a single round-trip.
+        """
+        for config, task_writes, task_id in writes:
+            self.put_writes(config, task_writes, task_id)
+
     async def aget(self, config: RunnableConfig) -> Optional[Checkpoint]:
         """Asynchronously fetch a checkpoint using the given configuration.
 
@@ -344,6 +597,25 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    async def aget_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Asynchronously fetch the checkpoint tuples of several configurations at once.
+
+        Args:
+            configs (Sequence[RunnableConfig]): Configurations specifying which checkpoints
+                to retrieve, as passed to `aget_tuple`.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The requested checkpoint tuples, in the order of
+                `configs`, with None for each checkpoint not found.
+
+        Note:
+            Defaults to calling `aget_tuple` for each configuration. Override this method
+            in your custom checkpoint saver to fetch them in a single round-trip.
+        """
+        return [await self.aget_tuple(config) for config in configs]
+
     async def alist(
         self,
         config: Optional[RunnableConfig],
@@ -369,6 +641,36 @@ class BaseCheckpointSaver(Generic[V]):
         raise NotImplementedError
         yield
 
+    async def alist_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """Asynchronously list the configs and metadata of checkpoints that match
+        the given criteria.
+
+        Like `alist`, but the checkpoints themselves are not loaded. Use `aget_tuple`
+        with the config of a tuple to load the full checkpoint when it's needed.
+
+        Args:
+            config (Optional[RunnableConfig]): Base configuration for filtering checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata.
+            before (Optional[RunnableConfig]): List checkpoints created before this configuration.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Returns:
+            AsyncIterator[CheckpointMetadataTuple]: Async iterator of matching checkpoint metadata tuples.
+
+        Note:
+            Defaults to calling `alist`, which loads the full checkpoints. Override
+            this method in your custom checkpoint saver to avoid that.
+        """
+        async for item in self.alist(config, filter=filter, before=before, limit=limit):
+            yield CheckpointMetadataTuple(item.config, item.metadata, item.parent_config)
+
     async def aput(
         self,
         config: RunnableConfig,
@@ -410,6 +712,53 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    async def aput_writes_many(
+        self, writes: Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]
+    ) -> None:
+        """Asynchronously store the intermediate writes of several tasks at once.
+
+        Args:
+            writes (Sequence[Tuple[RunnableConfig, Sequence[Tuple[str, Any]], str]]):
+                (config, writes, task_id) tuples, as passed to `aput_writes`.
+
+        Note:
+            Defaults to calling `aput_writes` for each task. Override this method
+            in your custom checkpoint saver to store them in a single round-trip.
+        """
+        for config, task_writes, task_id in writes:
+            await self.aput_writes(config, task_writes, task_id)
+
+    def prune(self, thread_ids: Sequence[str], *, strategy: PruneStrategy) -> None:
+        """Delete old checkpoints of the given threads.
+
+        The pending writes of deleted checkpoints, and any stored channel values
+        no longer referenced by a remaining checkpoint, are deleted too.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+
+        Raises:
+            NotImplementedError: Implement this method in your custom checkpoint saver.
+        """
+        raise NotImplementedError
+
+    async def aprune(
+        self, thread_ids: Sequence[str], *, strategy: PruneStrategy
+    ) -> None:
+        """Asynchronously delete old checkpoints of the given threads.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+
+        Raises:
+            NotImplementedError: Implement this method in your custom checkpoint saver.
+        """
+        raise NotImplementedError
+
     def get_next_version(self, current: Optional[V], channel: ChannelProtocol) -> V:
         """Generate the next version ID for a channel.
 
@@ -6,9 +6,21 @@ import random
 import shutil
 from collections import defaultdict
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, ExitStack
+from datetime import datetime
 from functools import partial
 from types import TracebackType
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from langchain_core.runnables import RunnableConfig
 
@@ -18,9 +30,14 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
+    DeltaValue,
+    PruneStrategy,
     SerializerProtocol,
+    dump_delta,
     get_checkpoint_id,
+    load_delta,
 )
 from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
 
@@ -69,6 +86,8 @@ class MemorySaver(
     writes: defaultdict[
         tuple[str, str, str], dict[tuple[str, int], tuple[str, str, tuple[str, bytes]]]
     ]
+    # (thread ID, checkpoint NS, channel, version) -> delta-encoded channel value
+    blobs: dict[tuple[str, str, str, Union[str, int, float]], tuple[str, bytes]]
 
     def __init__(
         self,
@@ -79,10 +98,12 @@ class MemorySaver(
         super().__init__(serde=serde)
         self.storage = factory(lambda: defaultdict(dict))
         self.writes = factory(dict)
+        self.blobs = factory()
         self.stack = ExitStack()
         if factory is not defaultdict:
             self.stack.enter_context(self.storage)  # type: ignore[arg-type]
             self.stack.enter_context(self.writes)  # type: ignore[arg-type]
+            self.stack.enter_context(self.blobs)  # type: ignore[arg-type]
 
     def __enter__(self) -> "MemorySaver":
         return self.stack.__enter__()
@@ -138,10 +159,9 @@ class MemorySaver(
                     sends = []
                 return CheckpointTuple(
                     config=config,
-                    checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                    },
+                    checkpoint=self._load_checkpoint(
+                        thread_id, checkpoint_ns, checkpoint, sends
+                    ),
                     metadata=self.serde.loads_typed(metadata),
                     pending_writes=[
                         (id, c, self.serde.loads_typed(v)) for id, c, v in writes
@@ -179,10 +199,9 @@ class MemorySaver(
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                    },
+                    checkpoint=self._load_checkpoint(
+                        thread_id, checkpoint_ns, checkpoint, sends
+                    ),
                     metadata=self.serde.loads_typed(metadata),
                     pending_writes=[
                         (id, c, self.serde.loads_typed(v)) for id, c, v in writes
@@ -220,6 +239,117 @@ class MemorySaver(
         Yields:
             Iterator[CheckpointTuple]: An iterator of matching checkpoint tuples.
         """
+        for (
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            checkpoint,
+            metadata,
+            parent_checkpoint_id,
+        ) in self._search(config, filter, before, limit):
+            writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
+
+            if parent_checkpoint_id:
+                sends = [
+                    w[2]
+                    for w in self.writes[
+                        (thread_id, checkpoint_ns, parent_checkpoint_id)
+                    ].values()
+                    if w[1] == TASKS
+                ]
+            else:
+                sends = []
+
+            yield CheckpointTuple(
+                config={
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint_id,
+                    }
+                },
+                checkpoint=self._load_checkpoint(
+                    thread_id, checkpoint_ns, checkpoint, sends
+                ),
+                metadata=metadata,
+                parent_config={
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None,
+                pending_writes=[
+                    (id, c, self.serde.loads_typed(v)) for id, c, v in writes
+                ],
+            )
+
+    def list_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the configs and metadata of checkpoints from the in-memory storage.
+
+        The checkpoints and their pending writes are not deserialized. Use `get_tuple`
+        to load a full checkpoint.
+
+        Args:
+            config (Optional[RunnableConfig]): Base configuration for filtering checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata.
+            before (Optional[RunnableConfig]): List checkpoints created before this configuration.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            Iterator[CheckpointMetadataTuple]: An iterator of matching checkpoint metadata tuples.
+        """
+        for (
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            _,
+            metadata,
+            parent_checkpoint_id,
+        ) in self._search(config, filter, before, limit):
+            yield CheckpointMetadataTuple(
+                config={
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint_id,
+                    }
+                },
+                metadata=metadata,
+                parent_config={
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None,
+            )
+
+    def _search(
+        self,
+        config: Optional[RunnableConfig],
+        filter: Optional[Dict[str, Any]],
+        before: Optional[RunnableConfig],
+        limit: Optional[int],
+    ) -> Iterator[
+        tuple[str, str, str, tuple[str, bytes], CheckpointMetadata, Optional[str]]
+    ]:
+        """Find the stored checkpoints matching the arguments of `list`, newest first.
+
+        Yields (thread_id, checkpoint_ns, checkpoint_id, checkpoint, metadata,
+        parent_checkpoint_id) tuples, with the metadata deserialized.
+        """
         thread_ids = (config["configurable"]["thread_id"],) if config else self.storage
         config_checkpoint_ns = (
             config["configurable"].get("checkpoint_ns") if config else None
@@ -268,46 +398,13 @@ class MemorySaver(
                     elif limit is not None:
                         limit -= 1
 
-                    writes = self.writes[
-                        (thread_id, checkpoint_ns, checkpoint_id)
-                    ].values()
-
-                    if parent_checkpoint_id:
-                        sends = [
-                            w[2]
-                            for w in self.writes[
-                                (thread_id, checkpoint_ns, parent_checkpoint_id)
-                            ].values()
-                            if w[1] == TASKS
-                        ]
-                    else:
-                        sends = []
-
-                    yield CheckpointTuple(
-                        config={
-                            "configurable": {
-                                "thread_id": thread_id,
-                                "checkpoint_ns": checkpoint_ns,
-                                "checkpoint_id": checkpoint_id,
-                            }
-                        },
-                        checkpoint={
-                            **self.serde.loads_typed(checkpoint),
-                            "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                        },
-                        metadata=metadata,
-                        parent_config={
-                            "configurable": {
-                                "thread_id": thread_id,
-                                "checkpoint_ns": checkpoint_ns,
-                                "checkpoint_id": parent_checkpoint_id,
-                            }
-                        }
-                        if parent_checkpoint_id
-                        else None,
-                        pending_writes=[
-                            (id, c, self.serde.loads_typed(v)) for id, c, v in writes
-                        ],
+                    yield (
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint_id,
+                        checkpoint,
+                        metadata,
+                        parent_checkpoint_id,
                     )
 
     def put(
@@ -335,6 +432,16 @@ class MemorySaver(
         c.pop("pending_sends")  # type: ignore[misc]
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        # store delta-encoded channel values once per version, outside the checkpoint
+        if any(isinstance(v, DeltaValue) for v in c["channel_values"].values()):
+            c["channel_values"] = c["channel_values"].copy()
+            for k, v in checkpoint["channel_values"].items():
+                if not isinstance(v, DeltaValue):
+                    continue
+                key = (thread_id, checkpoint_ns, k, checkpoint["channel_versions"][k])
+                if key not in self.blobs:
+                    self.blobs[key] = self.serde.dumps_typed(dump_delta(v))
+                del c["channel_values"][k]
         self.storage[thread_id][checkpoint_ns].update(
             {
                 checkpoint["id"]: (
@@ -352,6 +459,30 @@ class MemorySaver(
             }
         }
 
+    def _load_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint: tuple[str, bytes],
+        sends: Sequence[tuple[str, bytes]],
+    ) -> Checkpoint:
+        loaded: Checkpoint = {
+            **self.serde.loads_typed(checkpoint),
+            "pending_sends": [self.serde.loads_typed(s) for s in sends],
+        }
+        # reassemble delta-encoded channel values
+        for k, ver in loaded["channel_versions"].items():
+            if (blob := self.blobs.get((thread_id, checkpoint_ns, k, ver))) is None:
+                continue
+            value = self.serde.loads_typed(blob)
+            bases = [
+                self.serde.loads_typed(base)
+                for b in value.base
+                if (base := self.blobs.get((thread_id, checkpoint_ns, k, b)))
+            ]
+            loaded["channel_values"][k] = load_delta(value, ver, bases)
+        return loaded
+
     def put_writes(
         self,
         config: RunnableConfig,
@@ -399,6 +530,24 @@ class MemorySaver(
             None, self.get_tuple, config
         )
 
+    async def aget_tuples(
+        self, configs: Sequence[RunnableConfig]
+    ) -> List[Optional[CheckpointTuple]]:
+        """Asynchronous version of get_tuples.
+
+        This method is an asynchronous wrapper around get_tuples that runs the synchronous
+        method in a separate thread using asyncio.
+
+        Args:
+            configs (Sequence[RunnableConfig]): The configs to use for retrieving the checkpoints.
+
+        Returns:
+            List[Optional[CheckpointTuple]]: The retrieved checkpoint tuples, with None for each checkpoint not found.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.get_tuples, configs
+        )
+
     async def alist(
         self,
         config: Optional[RunnableConfig],
@@ -437,6 +586,27 @@ class MemorySaver(
             else:
                 break
 
+    async def alist_metadata(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """Asynchronous version of list_metadata.
+
+        Args:
+            config (RunnableConfig): The config to use for listing the checkpoints.
+
+        Yields:
+            AsyncIterator[CheckpointMetadataTuple]: An asynchronous iterator of checkpoint metadata tuples.
+        """
+        for item in self.list_metadata(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield item
+
     async def aput(
         self,
         config: RunnableConfig,
@@ -479,6 +649,90 @@ class MemorySaver(
             None, self.put_writes, config, writes, task_id
         )
 
+    def prune(self, thread_ids: Sequence[str], *, strategy: PruneStrategy) -> None:
+        """Delete old checkpoints of the given threads from the in-memory storage.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+        """
+        # compare datetimes, the timestamps may not have the same precision
+        before = (
+            datetime.fromisoformat(strategy.before)
+            if strategy.before is not None
+            else None
+        )
+        for thread_id in thread_ids:
+            if thread_id not in self.storage:
+                continue
+            namespaces = self.storage[thread_id]
+            for checkpoint_ns, checkpoints in list(namespaces.items()):
+                ids = sorted(checkpoints, reverse=True)
+                for checkpoint_id in ids[strategy.keep :] if strategy.keep else ids:
+                    if (
+                        before is not None
+                        and datetime.fromisoformat(
+                            self.serde.loads_typed(checkpoints[checkpoint_id][0])["ts"]
+                        )
+                        >= before
+                    ):
+                        continue
+                    del checkpoints[checkpoint_id]
+                if not checkpoints:
+                    del namespaces[checkpoint_ns]
+            if not namespaces:
+                del self.storage[thread_id]
+            # keep the writes of remaining checkpoints and of their parents,
+            # which hold the pending sends of the remaining checkpoints
+            referenced = {
+                (checkpoint_ns, id)
+                for checkpoint_ns, checkpoints in namespaces.items()
+                for checkpoint_id, (_, _, parent_id) in checkpoints.items()
+                for id in (checkpoint_id, parent_id)
+            }
+            for key in [
+                k
+                for k in self.writes
+                if k[0] == thread_id and (k[1], k[2]) not in referenced
+            ]:
+                del self.writes[key]
+            # keep the delta-encoded values of remaining checkpoints and their bases
+            blobs = {
+                (checkpoint_ns, k, ver)
+                for checkpoint_ns, checkpoints in namespaces.items()
+                for checkpoint, _, _ in checkpoints.values()
+                for k, ver in self.serde.loads_typed(checkpoint)[
+                    "channel_versions"
+                ].items()
+                if (thread_id, checkpoint_ns, k, ver) in self.blobs
+            }
+            blobs.update(
+                (checkpoint_ns, k, b)
+                for checkpoint_ns, k, ver in list(blobs)
+                for b in self.serde.loads_typed(
+                    self.blobs[(thread_id, checkpoint_ns, k, ver)]
+                ).base
+            )
+            for key in [
+                k for k in self.blobs if k[0] == thread_id and k[1:] not in blobs
+            ]:
+                del self.blobs[key]
+
+    async def aprune(
+        self, thread_ids: Sequence[str], *, strategy: PruneStrategy
+    ) -> None:
+        """Asynchronous version of prune.
+
+        Args:
+            thread_ids (Sequence[str]): The threads to prune.
+            strategy (PruneStrategy): Which checkpoints to delete, one of
+                `keep_latest(n)`, `keep_since(ts)` or `delete_thread`.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(self.prune, thread_ids, strategy=strategy)
+        )
+
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         if current is None:
             current_v = 0
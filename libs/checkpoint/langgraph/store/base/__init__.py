@@ -9,20 +9,36 @@ Core types:
     - Op: Get/Put/Search/List operations
 """
 
+import base64
+import json
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Iterable, Literal, NamedTuple, Optional, TypedDict, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Literal,
+    NamedTuple,
+    Optional,
+    TypedDict,
+    Union,
+    cast,
+)
 
 from langchain_core.embeddings import Embeddings
 
 from langgraph.store.base.embed import (
     AEmbeddingsFunc,
+    CachedEmbeddings,
     EmbeddingsFunc,
     ensure_embeddings,
     get_text_at_path,
     tokenize_path,
 )
 
+if TYPE_CHECKING:
+    from langgraph.cache.base import BaseCache
+
 
 class Item:
     """Represents a stored item with metadata.
@@ -126,6 +142,64 @@ class SearchItem(Item):
         result["score"] = self.score
         return result
 
+    @property
+    def cursor(self) -> str:
+        """Opaque token to pass as `after` to fetch the results following this item."""
+        return SearchCursor(
+            self.namespace, self.key, self.updated_at, self.score
+        ).encode()
+
+
+class SearchCursor(NamedTuple):
+    """Position of an item in the results of a search, for keyset pagination.
+
+    Search results are ordered by descending score for natural language searches,
+    and by descending `updated_at` otherwise, with ties broken by descending
+    namespace and key. Searching `after` a cursor returns the items that follow
+    it in that order, without having to skip over the preceding ones.
+    """
+
+    namespace: tuple[str, ...]
+    """Namespace of the item."""
+
+    key: str
+    """Key of the item."""
+
+    updated_at: datetime
+    """When the item was last updated."""
+
+    score: Optional[float] = None
+    """Relevance/similarity score of the item, if from a natural language search."""
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque token."""
+        return base64.urlsafe_b64encode(
+            json.dumps(
+                [
+                    list(self.namespace),
+                    self.key,
+                    self.updated_at.isoformat(),
+                    self.score,
+                ]
+            ).encode()
+        ).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "SearchCursor":
+        """Decode a token returned by `encode`."""
+        try:
+            namespace, key, updated_at, score = json.loads(
+                base64.urlsafe_b64decode(token.encode())
+            )
+            return cls(
+                tuple(namespace),
+                key,
+                datetime.fromisoformat(updated_at),
+                float(score) if score is not None else None,
+            )
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid search cursor: {token!r}") from e
+
 
 class GetOp(NamedTuple):
     """Operation to retrieve a specific item by its namespace and key.
@@ -170,7 +244,7 @@ class SearchOp(NamedTuple):
 
     This operation supports both structured filtering and natural language search
     within a given namespace prefix. It provides pagination through limit and offset
-    parameters.
+    parameters, or through an `after` cursor for deep pagination.
 
     Note:
         Natural language search support depends on your store implementation.
@@ -186,6 +260,15 @@ class SearchOp(NamedTuple):
         )
         ```
 
+        Keyset pagination:
+        ```python
+        SearchOp(
+            namespace_prefix=("documents",),
+            limit=5,
+            after=previous_page[-1].cursor
+        )
+        ```
+
         Natural language search:
         ```python
         SearchOp(
@@ -258,6 +341,13 @@ class SearchOp(NamedTuple):
         - "machine learning papers from 2023"
     """
 
+    after: Optional[str] = None
+    """Cursor of the last item of the previous page, as returned by `SearchItem.cursor`.
+
+    When set, only the items following it in the search order are returned. Unlike
+    `offset`, the cost of fetching a page does not grow with its depth.
+    """
+
 
 # Type representing a namespace path that can include wildcards
 NamespacePath = tuple[Union[str, Literal["*"]], ...]
@@ -593,6 +683,30 @@ class IndexConfig(TypedDict, total=False):
         - Complex nested paths are supported (e.g., "a.b[*].c.d")
     """
 
+    cache: "BaseCache[list[float]]"
+    """Optional cache of computed embeddings.
+
+    When provided, texts are only embedded if they were not embedded before, so
+    unchanged fields of updated items and repeated search queries don't call
+    the embedding model again. Entries are keyed by the hash of the text.
+
+    ???+ example "Examples"
+        ```python
+        import sqlite3
+
+        from langgraph.cache.memory import InMemoryCache
+        from langgraph.cache.sqlite import SqliteCache
+
+        # LRU cache local to the process
+        cache = InMemoryCache(maxsize=10_000)
+
+        # Persistent cache, shared across restarts
+        cache = SqliteCache(
+            sqlite3.connect("embeddings.sqlite", check_same_thread=False)
+        )
+        ```
+    """
+
 
 class BaseStore(ABC):
     """Abstract base class for persistent key-value stores.
@@ -657,6 +771,7 @@ class BaseStore(ABC):
         filter: Optional[dict[str, Any]] = None,
         limit: int = 10,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[SearchItem]:
         """Search for items within a namespace prefix.
 
@@ -666,6 +781,8 @@ class BaseStore(ABC):
             filter: Key-value pairs to filter results.
             limit: Maximum number of items to return.
             offset: Number of items to skip before returning results.
+            after: Cursor of the last item of the previous page (`SearchItem.cursor`).
+                Only items following it are returned.
 
         Returns:
             List of items matching the search criteria.
@@ -703,7 +820,9 @@ class BaseStore(ABC):
             Note: Natural language search support depends on your store implementation
             and requires proper embedding configuration.
         """
-        return self.batch([SearchOp(namespace_prefix, filter, limit, offset, query)])[0]
+        return self.batch(
+            [SearchOp(namespace_prefix, filter, limit, offset, query, after)]
+        )[0]
 
     def put(
         self,
@@ -840,6 +959,7 @@ class BaseStore(ABC):
         filter: Optional[dict[str, Any]] = None,
         limit: int = 10,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[SearchItem]:
         """Asynchronously search for items within a namespace prefix.
 
@@ -849,6 +969,8 @@ class BaseStore(ABC):
             filter: Key-value pairs to filter results.
             limit: Maximum number of items to return.
             offset: Number of items to skip before returning results.
+            after: Cursor of the last item of the previous page (`SearchItem.cursor`).
+                Only items following it are returned.
 
         Returns:
             List of items matching the search criteria.
@@ -888,7 +1010,7 @@ class BaseStore(ABC):
         """
         return (
             await self.abatch(
-                [SearchOp(namespace_prefix, filter, limit, offset, query)]
+                [SearchOp(namespace_prefix, filter, limit, offset, query, after)]
             )
         )[0]
 
@@ -1046,11 +1168,13 @@ __all__ = [
     "PutOp",
     "GetOp",
     "SearchOp",
+    "SearchCursor",
     "ListNamespacesOp",
     "MatchCondition",
     "NamespacePath",
     "NamespaceMatchType",
     "Embeddings",
+    "CachedEmbeddings",
     "ensure_embeddings",
     "tokenize_path",
     "get_text_at_path",
@@ -1,5 +1,9 @@
 import asyncio
+import threading
+import time
 import weakref
+from dataclasses import dataclass
+from itertools import islice
 from typing import Any, Literal, Optional, Union
 
 from langgraph.store.base import (
@@ -17,27 +21,77 @@ from langgraph.store.base import (
 )
 
 
+@dataclass
+class BatchStats:
+    """Counters of the batches run by an AsyncBatchedBaseStore."""
+
+    batches: int = 0
+    """Number of batches flushed."""
+    ops: int = 0
+    """Number of operations flushed, before deduplication."""
+    queue_wait: float = 0.0
+    """Total time operations spent in the queue, in seconds."""
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.ops / self.batches if self.batches else 0.0
+
+    @property
+    def mean_queue_wait(self) -> float:
+        return self.queue_wait / self.ops if self.ops else 0.0
+
+
 class AsyncBatchedBaseStore(BaseStore):
-    """Efficiently batch operations in a background task."""
+    """Efficiently batch operations in a background task.
 
-    __slots__ = ("_loop", "_aqueue", "_task")
+    The background task sleeps until an operation is queued, then runs all the
+    operations queued in the meantime in a single call to `abatch`.
 
-    def __init__(self) -> None:
+    Args:
+        max_batch_size: Maximum number of operations per call to `abatch`.
+            Larger batches are split. Defaults to no limit.
+        max_linger_ms: How long to wait for more operations to be queued
+            before running a batch, unless it is full. Defaults to 0, ie. only
+            operations queued concurrently are batched together.
+    """
+
+    __slots__ = ("_loop", "_aqueue", "_aevent", "_task", "batch_stats")
+
+    def __init__(
+        self, *, max_batch_size: Optional[int] = None, max_linger_ms: float = 0
+    ) -> None:
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
         self._loop = asyncio.get_running_loop()
-        self._aqueue: dict[asyncio.Future, Op] = {}
-        self._task = self._loop.create_task(_run(self._aqueue, weakref.ref(self)))
+        self._aqueue: dict[asyncio.Future, tuple[Op, float]] = {}
+        self._aevent = asyncio.Event()
+        self.batch_stats = BatchStats()
+        self._task = self._loop.create_task(
+            _run(
+                self._aqueue,
+                self._aevent,
+                self.batch_stats,
+                weakref.ref(self),
+                max_batch_size,
+                max_linger_ms / 1000,
+            )
+        )
 
     def __del__(self) -> None:
         self._task.cancel()
 
+    def _enqueue(self, op: Op) -> asyncio.Future:
+        fut = self._loop.create_future()
+        self._aqueue[fut] = (op, self._loop.time())
+        self._aevent.set()
+        return fut
+
     async def aget(
         self,
         namespace: tuple[str, ...],
         key: str,
     ) -> Optional[Item]:
-        fut = self._loop.create_future()
-        self._aqueue[fut] = GetOp(namespace, key)
-        return await fut
+        return await self._enqueue(GetOp(namespace, key))
 
     async def asearch(
         self,
@@ -48,10 +102,11 @@ class AsyncBatchedBaseStore(BaseStore):
         filter: Optional[dict[str, Any]] = None,
         limit: int = 10,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[SearchItem]:
-        fut = self._loop.create_future()
-        self._aqueue[fut] = SearchOp(namespace_prefix, filter, limit, offset, query)
-        return await fut
+        return await self._enqueue(
+            SearchOp(namespace_prefix, filter, limit, offset, query, after)
+        )
 
     async def aput(
         self,
@@ -61,18 +116,14 @@ class AsyncBatchedBaseStore(BaseStore):
         index: Optional[Union[Literal[False], list[str]]] = None,
     ) -> None:
         _validate_namespace(namespace)
-        fut = self._loop.create_future()
-        self._aqueue[fut] = PutOp(namespace, key, value, index)
-        return await fut
+        return await self._enqueue(PutOp(namespace, key, value, index))
 
     async def adelete(
         self,
         namespace: tuple[str, ...],
         key: str,
     ) -> None:
-        fut = self._loop.create_future()
-        self._aqueue[fut] = PutOp(namespace, key, None)
-        return await fut
+        return await self._enqueue(PutOp(namespace, key, None))
 
     async def alist_namespaces(
         self,
@@ -83,21 +134,171 @@ class AsyncBatchedBaseStore(BaseStore):
         limit: int = 100,
         offset: int = 0,
     ) -> list[tuple[str, ...]]:
-        fut = self._loop.create_future()
-        match_conditions = []
-        if prefix:
-            match_conditions.append(MatchCondition(match_type="prefix", path=prefix))
-        if suffix:
-            match_conditions.append(MatchCondition(match_type="suffix", path=suffix))
-
-        op = ListNamespacesOp(
-            match_conditions=tuple(match_conditions),
-            max_depth=max_depth,
-            limit=limit,
-            offset=offset,
+        return await self._enqueue(
+            _list_namespaces_op(prefix, suffix, max_depth, limit, offset)
         )
-        self._aqueue[fut] = op
-        return await fut
+
+
+class SyncBatchedBaseStore(BaseStore):
+    """Coalesce the operations of concurrent threads into shared batches.
+
+    The first thread to queue an operation runs a batch with all operations
+    queued until then, while the others wait for their results. Operations
+    queued while a batch is running are run in the next one, by the first
+    thread that queued them.
+
+    Args:
+        max_batch_size: Maximum number of operations per call to `batch`.
+            Larger batches are split. Defaults to no limit.
+        max_linger_ms: How long to wait for more operations to be queued
+            before running a batch, unless it is full. Defaults to 0, ie. only
+            operations queued while the previous batch runs are batched together.
+    """
+
+    __slots__ = ("_squeue", "_slock", "_sleading", "_max_batch_size", "_max_linger")
+
+    def __init__(
+        self, *, max_batch_size: Optional[int] = None, max_linger_ms: float = 0
+    ) -> None:
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._squeue: list[_PendingOp] = []
+        self._slock = threading.Lock()
+        self._sleading = False
+        self._max_batch_size = max_batch_size
+        self._max_linger = max_linger_ms / 1000
+
+    def get(
+        self,
+        namespace: tuple[str, ...],
+        key: str,
+    ) -> Optional[Item]:
+        return self._submit(GetOp(namespace, key))
+
+    def search(
+        self,
+        namespace_prefix: tuple[str, ...],
+        /,
+        *,
+        query: Optional[str] = None,
+        filter: Optional[dict[str, Any]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> list[SearchItem]:
+        return self._submit(
+            SearchOp(namespace_prefix, filter, limit, offset, query, after)
+        )
+
+    def put(
+        self,
+        namespace: tuple[str, ...],
+        key: str,
+        value: dict[str, Any],
+        index: Optional[Union[Literal[False], list[str]]] = None,
+    ) -> None:
+        _validate_namespace(namespace)
+        return self._submit(PutOp(namespace, key, value, index))
+
+    def delete(
+        self,
+        namespace: tuple[str, ...],
+        key: str,
+    ) -> None:
+        return self._submit(PutOp(namespace, key, None))
+
+    def list_namespaces(
+        self,
+        *,
+        prefix: Optional[NamespacePath] = None,
+        suffix: Optional[NamespacePath] = None,
+        max_depth: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[tuple[str, ...]]:
+        return self._submit(
+            _list_namespaces_op(prefix, suffix, max_depth, limit, offset)
+        )
+
+    def _submit(self, op: Op) -> Any:
+        pending = _PendingOp(op)
+        with self._slock:
+            self._squeue.append(pending)
+            if not self._sleading:
+                self._sleading = pending.leading = True
+        if not pending.leading:
+            # wait for the result, or to be handed the lead
+            pending.event.wait()
+        if pending.leading:
+            self._lead()
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _lead(self) -> None:
+        """Run the next batch, which includes the operation of the calling thread,
+        then hand the lead to the first thread still waiting, if any."""
+        if self._max_linger > 0:
+            deadline = time.monotonic() + self._max_linger
+            while (
+                self._max_batch_size is None or len(self._squeue) < self._max_batch_size
+            ) and (remaining := deadline - time.monotonic()) > 0:
+                time.sleep(min(remaining, 0.001))
+        with self._slock:
+            taken = self._squeue[: self._max_batch_size]
+            del self._squeue[: self._max_batch_size]
+        try:
+            listen, dedupped = _dedupe_ops([p.op for p in taken])
+            results = self.batch(dedupped)
+            if listen is not None:
+                results = [results[ix] for ix in listen]
+            for pending, result in zip(taken, results):
+                pending.result = result
+        except Exception as e:
+            for pending in taken:
+                pending.error = e
+        finally:
+            with self._slock:
+                if self._squeue:
+                    self._squeue[0].leading = True
+                    self._squeue[0].event.set()
+                else:
+                    self._sleading = False
+            for pending in taken:
+                pending.leading = False
+                pending.event.set()
+
+
+class _PendingOp:
+    __slots__ = ("op", "event", "leading", "result", "error")
+
+    def __init__(self, op: Op) -> None:
+        self.op = op
+        self.event = threading.Event()
+        self.leading = False
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+
+
+def _list_namespaces_op(
+    prefix: Optional[NamespacePath],
+    suffix: Optional[NamespacePath],
+    max_depth: Optional[int],
+    limit: int,
+    offset: int,
+) -> ListNamespacesOp:
+    match_conditions = []
+    if prefix:
+        match_conditions.append(MatchCondition(match_type="prefix", path=prefix))
+    if suffix:
+        match_conditions.append(MatchCondition(match_type="suffix", path=suffix))
+
+    return ListNamespacesOp(
+        match_conditions=tuple(match_conditions),
+        max_depth=max_depth,
+        limit=limit,
+        offset=offset,
+    )
 
 
 def _dedupe_ops(values: list[Op]) -> tuple[Optional[list[int]], list[Op]]:
@@ -144,18 +345,48 @@ def _dedupe_ops(values: list[Op]) -> tuple[Optional[list[int]], list[Op]]:
 
 
 async def _run(
-    aqueue: dict[asyncio.Future, Op], store: weakref.ReferenceType[BaseStore]
+    aqueue: dict[asyncio.Future, tuple[Op, float]],
+    aevent: asyncio.Event,
+    stats: BatchStats,
+    store: weakref.ReferenceType[BaseStore],
+    max_batch_size: Optional[int],
+    max_linger: float,
 ) -> None:
+    loop = asyncio.get_running_loop()
     while True:
+        # sleep until an operation is queued
+        await aevent.wait()
+        # let operations queued concurrently join the batch
         await asyncio.sleep(0)
+        if max_linger > 0:
+            deadline = loop.time() + max_linger
+            while max_batch_size is None or len(aqueue) < max_batch_size:
+                if (remaining := deadline - loop.time()) <= 0:
+                    break
+                aevent.clear()
+                try:
+                    await asyncio.wait_for(aevent.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+        aevent.clear()
         if not aqueue:
             continue
         if s := store():
-            # get the operations to run
-            taken = aqueue.copy()
+            # get the operations to run, splitting oversized batches
+            taken = dict(islice(aqueue.items(), max_batch_size))
+            # remove the operations from the queue
+            for fut in taken:
+                del aqueue[fut]
+            if aqueue:
+                # run the rest in the next batch
+                aevent.set()
+            now = loop.time()
+            stats.batches += 1
+            stats.ops += len(taken)
+            stats.queue_wait += sum(now - queued_at for _, queued_at in taken.values())
             # action each operation
             try:
-                values = list(taken.values())
+                values = [op for op, _ in taken.values()]
                 listen, dedupped = _dedupe_ops(values)
                 results = await s.abatch(dedupped)
                 if listen is not None:
@@ -163,13 +394,12 @@ async def _run(
 
                 # set the results of each operation
                 for fut, result in zip(taken, results):
-                    fut.set_result(result)
+                    if not fut.done():
+                        fut.set_result(result)
             except Exception as e:
                 for fut in taken:
-                    fut.set_exception(e)
-            # remove the operations from the queue
-            for fut in taken:
-                del aqueue[fut]
+                    if not fut.done():
+                        fut.set_exception(e)
         else:
             break
         # remove strong ref to store
@@ -7,11 +7,23 @@ asynchronous operations.
 """
 
 import asyncio
+import hashlib
 import json
-from typing import Any, Awaitable, Callable, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from langchain_core.embeddings import Embeddings
 
+if TYPE_CHECKING:
+    from langgraph.cache.base import BaseCache, FullKey, Namespace
+
 EmbeddingsFunc = Callable[[Sequence[str]], list[list[float]]]
 """Type for synchronous embedding functions.
 
@@ -29,6 +41,8 @@ Similar to EmbeddingsFunc, but returns an awaitable that resolves to the embeddi
 
 def ensure_embeddings(
     embed: Union[Embeddings, EmbeddingsFunc, AEmbeddingsFunc, None],
+    *,
+    cache: Optional["BaseCache[list[float]]"] = None,
 ) -> Embeddings:
     """Ensure that an embedding function conforms to LangChain's Embeddings interface.
 
@@ -40,6 +54,8 @@ def ensure_embeddings(
         embed: Either an existing Embeddings instance, or a function that converts
             text to embeddings. If the function is async, it will be used for both
             sync and async operations.
+        cache: Optional cache of computed embeddings. If provided, the returned
+            instance only embeds texts that are not in the cache already.
 
     Returns:
         An Embeddings instance that wraps the provided function(s).
@@ -65,9 +81,10 @@ def ensure_embeddings(
     """
     if embed is None:
         raise ValueError("embed must be provided")
-    if isinstance(embed, Embeddings):
-        return embed
-    return EmbeddingsLambda(embed)
+    embeddings = embed if isinstance(embed, Embeddings) else EmbeddingsLambda(embed)
+    if cache is not None:
+        return CachedEmbeddings(embeddings, cache)
+    return embeddings
 
 
 class EmbeddingsLambda(Embeddings):
@@ -191,6 +208,134 @@ class EmbeddingsLambda(Embeddings):
         return (await afunc([text]))[0]
 
 
+class CachedEmbeddings(Embeddings):
+    """Wrapper that caches the embeddings computed by another Embeddings instance.
+
+    Cache entries are keyed by the SHA-256 hash of the embedded text, so texts
+    that were embedded before, such as unchanged fields of updated items or
+    repeated search queries, are not sent to the embedding model again.
+    Documents and queries are cached separately, as some models embed them
+    differently.
+
+    Args:
+        embeddings: The Embeddings instance to wrap.
+        cache: Where to keep the computed embeddings. Use an InMemoryCache for an
+            LRU cache local to the process, or a persistent cache such as
+            SqliteCache to reuse embeddings across restarts.
+        namespace: Namespace of the cache entries. Use a distinct namespace for
+            each embedding model sharing the same cache.
+        ttl: Number of seconds cache entries stay valid, or None to never expire.
+
+    ??? example "Examples"
+        ```python
+        from langgraph.cache.memory import InMemoryCache
+        from langgraph.store.memory import InMemoryStore
+
+        store = InMemoryStore(
+            index={
+                "dims": 1536,
+                "embed": init_embeddings("openai:text-embedding-3-small"),
+                "cache": InMemoryCache(maxsize=10_000),
+            }
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        cache: "BaseCache[list[float]]",
+        *,
+        namespace: "Namespace" = ("embeddings",),
+        ttl: Optional[int] = None,
+    ) -> None:
+        self.embeddings = embeddings
+        self.cache = cache
+        self.namespace = namespace
+        self.ttl = ttl
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed a list of texts into vectors, using cached vectors when available.
+
+        Args:
+            texts: list of texts to convert to embeddings.
+
+        Returns:
+            list of embeddings, one per input text.
+        """
+        keys = [self._key("documents", text) for text in texts]
+        found = self.cache.get(list(dict.fromkeys(keys)))
+        if missing := _missing(texts, keys, found):
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            computed = dict(zip(missing, vectors))
+            self.cache.set({k: (v, self.ttl) for k, v in computed.items()})
+            found.update(computed)
+        return [found[k] for k in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a single piece of text, using the cached vector when available.
+
+        Args:
+            text: Text to convert to an embedding.
+
+        Returns:
+            Embedding vector as a list of floats.
+        """
+        key = self._key("query", text)
+        if (vector := self.cache.get([key]).get(key)) is None:
+            vector = self.embeddings.embed_query(text)
+            self.cache.set({key: (vector, self.ttl)})
+        return vector
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Asynchronously embed a list of texts into vectors, using cached vectors
+        when available.
+
+        Args:
+            texts: list of texts to convert to embeddings.
+
+        Returns:
+            list of embeddings, one per input text.
+        """
+        keys = [self._key("documents", text) for text in texts]
+        found = await self.cache.aget(list(dict.fromkeys(keys)))
+        if missing := _missing(texts, keys, found):
+            vectors = await self.embeddings.aembed_documents(list(missing.values()))
+            computed = dict(zip(missing, vectors))
+            await self.cache.aset({k: (v, self.ttl) for k, v in computed.items()})
+            found.update(computed)
+        return [found[k] for k in keys]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Asynchronously embed a single piece of text, using the cached vector
+        when available.
+
+        Args:
+            text: Text to convert to an embedding.
+
+        Returns:
+            Embedding vector as a list of floats.
+        """
+        key = self._key("query", text)
+        if (vector := (await self.cache.aget([key])).get(key)) is None:
+            vector = await self.embeddings.aembed_query(text)
+            await self.cache.aset({key: (vector, self.ttl)})
+        return vector
+
+    def _key(self, kind: str, text: str) -> "FullKey":
+        return (
+            (*self.namespace, kind),
+            hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest(),
+        )
+
+
+def _missing(
+    texts: list[str], keys: list["FullKey"], found: dict["FullKey", list[float]]
+) -> dict["FullKey", str]:
+    """Return the distinct texts not found in the cache, by cache key."""
+    return {k: text for k, text in zip(keys, texts) if k not in found}
+
+
 def get_text_at_path(obj: Any, path: Union[str, list[str]]) -> list[str]:
     """Extract text from an object using a path expression or pre-tokenized path.
 
@@ -375,6 +520,7 @@ def _is_async_callable(
 
 __all__ = [
     "ensure_embeddings",
+    "CachedEmbeddings",
     "EmbeddingsFunc",
     "AEmbeddingsFunc",
 ]
@@ -88,6 +88,17 @@
     results = await store.asearch(("docs",), query="python programming")
     ```
 
+    Approximate vector search for large collections (requires numpy):
+    ```python
+    store = InMemoryStore(
+        index={
+            "dims": 1536,
+            "embed": init_embeddings("openai:text-embedding-3-small"),
+            "ann_index_config": {"kind": "ivf", "nprobe": 16},
+        }
+    )
+    ```
+
 Warning:
     This store keeps all data in memory. Data is lost when the process exits.
     For persistence, use a database-backed store like PostgresStore.
@@ -103,12 +114,15 @@ import asyncio
 import concurrent.futures as cf
 import functools
 import logging
+import math
 from collections import defaultdict
 from datetime import datetime, timezone
 from importlib import util
-from typing import Any, Iterable, Optional
+from itertools import chain
+from typing import Any, Iterable, Iterator, Literal, Optional, cast
 
 from langchain_core.embeddings import Embeddings
+from typing_extensions import TypedDict
 
 from langgraph.store.base import (
     BaseStore,
@@ -120,6 +134,7 @@ from langgraph.store.base import (
     Op,
     PutOp,
     Result,
+    SearchCursor,
     SearchItem,
     SearchOp,
     ensure_embeddings,
@@ -130,6 +145,31 @@ from langgraph.store.base import (
 logger = logging.getLogger(__name__)
 
 
+class ANNIndexConfig(TypedDict, total=False):
+    """Configuration for the approximate nearest neighbour index of the InMemoryStore."""
+
+    kind: Literal["ivf", "flat"]
+    """Type of index to use: 'ivf' for Inverted File, or 'flat' for exact search
+    over all stored vectors (default). The 'ivf' index requires numpy."""
+    nlist: int
+    """Number of inverted lists (clusters) for the IVF index.
+    
+    Defaults to the square root of the number of vectors when the index is trained.
+    """
+    nprobe: int
+    """Number of lists searched per query. Higher is better for recall, lower is
+    better for speed. Defaults to the square root of the number of lists."""
+    min_size: int
+    """Number of vectors below which search stays exact. Default is 10,000."""
+
+
+class InMemoryIndexConfig(IndexConfig, total=False):
+    """Configuration for vector embeddings in the InMemoryStore."""
+
+    ann_index_config: ANNIndexConfig
+    """Specific configuration for the approximate nearest neighbour index."""
+
+
 class InMemoryStore(BaseStore):
     """In-memory dictionary-backed store with optional vector search.
 
@@ -173,6 +213,8 @@ class InMemoryStore(BaseStore):
     __slots__ = (
         "_data",
         "_vectors",
+        "_namespaces",
+        "_ann",
         "index_config",
         "embeddings",
     )
@@ -185,20 +227,42 @@ class InMemoryStore(BaseStore):
         self._vectors: dict[tuple[str, ...], dict[str, dict[str, list[float]]]] = (
             defaultdict(lambda: defaultdict(dict))
         )
+        self._namespaces = _NamespaceIndex()
         self.index_config = index
         if self.index_config:
             self.index_config = self.index_config.copy()
             self.embeddings: Optional[Embeddings] = ensure_embeddings(
                 self.index_config.get("embed"),
+                cache=self.index_config.get("cache"),
             )
             self.index_config["__tokenized_fields"] = [
                 (p, tokenize_path(p)) if p != "$" else (p, p)
                 for p in (self.index_config.get("fields") or ["$"])
             ]
+            ann_config = (
+                cast(InMemoryIndexConfig, self.index_config).get("ann_index_config")
+                or {}
+            )
+            if ann_config.get("kind", "flat") == "flat":
+                self._ann: Optional[_IVFIndex] = None
+            elif ann_config["kind"] != "ivf":
+                raise ValueError(f"Unsupported index kind: {ann_config['kind']}")
+            elif _check_numpy():
+                self._ann = _IVFIndex(
+                    nlist=ann_config.get("nlist"),
+                    nprobe=ann_config.get("nprobe"),
+                    min_size=ann_config.get("min_size", 10_000),
+                )
+            else:
+                raise ImportError(
+                    "The 'ivf' index of the InMemoryStore requires numpy. "
+                    "Please install it with `pip install numpy`."
+                )
 
         else:
             self.index_config = None
             self.embeddings = None
+            self._ann = None
 
     def batch(self, ops: Iterable[Op]) -> list[Result]:
         # The batch/abatch methods are treated as internal.
@@ -209,10 +273,12 @@ class InMemoryStore(BaseStore):
             self._batch_search(search_ops, queryinmem_store, results)
 
         to_embed = self._extract_texts(put_ops)
+        embeddings: Optional[list[list[float]]] = None
         if to_embed and self.index_config and self.embeddings:
             embeddings = self.embeddings.embed_documents(list(to_embed))
-            self._insertinmem_store(to_embed, embeddings)
         self._apply_put_ops(put_ops)
+        if embeddings is not None:
+            self._insertinmem_store(to_embed, embeddings)
         return results
 
     async def abatch(self, ops: Iterable[Op]) -> list[Result]:
@@ -224,38 +290,22 @@ class InMemoryStore(BaseStore):
             self._batch_search(search_ops, queryinmem_store, results)
 
         to_embed = self._extract_texts(put_ops)
+        embeddings: Optional[list[list[float]]] = None
         if to_embed and self.index_config and self.embeddings:
             embeddings = await self.embeddings.aembed_documents(list(to_embed))
-            self._insertinmem_store(to_embed, embeddings)
         self._apply_put_ops(put_ops)
+        if embeddings is not None:
+            self._insertinmem_store(to_embed, embeddings)
         return results
 
     # Helpers
 
     def _filter_items(self, op: SearchOp) -> list[tuple[Item, list[list[float]]]]:
         """Filter items by namespace and filter function, return items with their embeddings."""
-        namespace_prefix = op.namespace_prefix
-
-        def filter_func(item: Item) -> bool:
-            if not op.filter:
-                return True
-
-            return all(
-                _compare_values(item.value.get(key), filter_value)
-                for key, filter_value in op.filter.items()
-            )
-
         filtered = []
-        for namespace in self._data:
-            if not (
-                namespace[: len(namespace_prefix)] == namespace_prefix
-                if len(namespace) >= len(namespace_prefix)
-                else False
-            ):
-                continue
-
+        for namespace in self._namespace_index().match(op.namespace_prefix):
             for key, item in self._data[namespace].items():
-                if filter_func(item):
+                if _matches_filter(op, item):
                     if op.query and (embeddings := self._vectors[namespace].get(key)):
                         filtered.append((item, list(embeddings.values())))
                     else:
@@ -304,6 +354,24 @@ class InMemoryStore(BaseStore):
     ) -> None:
         """Perform batch similarity search for multiple queries."""
         for i, (op, candidates) in ops.items():
+            cursor = SearchCursor.decode(op.after) if op.after else None
+            if op.query and self._use_ann(op):
+                ann_kept = self._ann_search(op, queryinmem_store[op.query], cursor)
+                if ann_kept is not None:
+                    results[i] = [
+                        SearchItem(
+                            namespace=item.namespace,
+                            key=item.key,
+                            value=item.value,
+                            created_at=item.created_at,
+                            updated_at=item.updated_at,
+                            score=score,
+                        )
+                        for score, item in ann_kept
+                    ]
+                    continue
+                # not enough matches in the probed lists, fall back to exact search
+                candidates = self._filter_items(op)
             if not candidates:
                 results[i] = []
                 continue
@@ -320,14 +388,21 @@ class InMemoryStore(BaseStore):
 
                 scores = _cosine_similarity(query_embedding, flat_vectors)
                 sorted_results = sorted(
-                    zip(scores, flat_items), key=lambda x: x[0], reverse=True
+                    zip(scores, flat_items),
+                    key=lambda x: (x[0], x[1].namespace, x[1].key),
+                    reverse=True,
                 )
                 # max pooling
                 seen: set[tuple[tuple[str, ...], str]] = set()
+                # items whose best score is before the cursor
+                passed: set[tuple[tuple[str, ...], str]] = set()
                 kept: list[tuple[Optional[float], Item]] = []
                 for score, item in sorted_results:
                     key = (item.namespace, item.key)
-                    if key in seen:
+                    if key in seen or key in passed:
+                        continue
+                    if not _follows(cursor, item, score):
+                        passed.add(key)
                         continue
                     ix = len(seen)
                     seen.add(key)
@@ -340,6 +415,11 @@ class InMemoryStore(BaseStore):
                 if scoreless and len(kept) < op.limit:
                     # Corner case: if we request more items than what we have embedded,
                     # fill the rest with non-scored items
+                    scoreless = [
+                        item
+                        for item in sorted(scoreless, key=_recency, reverse=True)
+                        if _follows(cursor, item)
+                    ]
                     kept.extend(
                         (None, item) for item in scoreless[: op.limit - len(kept)]
                     )
@@ -356,6 +436,11 @@ class InMemoryStore(BaseStore):
                     for score, item in kept
                 ]
             else:
+                items = sorted(
+                    (item for item, _ in candidates if _follows(cursor, item)),
+                    key=_recency,
+                    reverse=True,
+                )
                 results[i] = [
                     SearchItem(
                         namespace=item.namespace,
@@ -364,9 +449,46 @@ class InMemoryStore(BaseStore):
                         created_at=item.created_at,
                         updated_at=item.updated_at,
                     )
-                    for (item, _) in candidates[op.offset : op.offset + op.limit]
+                    for item in items[op.offset : op.offset + op.limit]
                 ]
 
+    def _use_ann(self, op: SearchOp) -> bool:
+        return bool(op.query and self._ann is not None and self._ann.trained)
+
+    def _ann_search(
+        self,
+        op: SearchOp,
+        query_embedding: list[float],
+        cursor: Optional[SearchCursor] = None,
+    ) -> Optional[list[tuple[float, Item]]]:
+        """Search the vectors in the lists of the ANN index closest to the query.
+
+        Returns None if they contain fewer than offset + limit matching items."""
+        seen: set[tuple[tuple[str, ...], str]] = set()
+        passed: set[tuple[tuple[str, ...], str]] = set()
+        kept: list[tuple[float, Item]] = []
+        for score, (namespace, key, _) in cast(_IVFIndex, self._ann).search(
+            query_embedding
+        ):
+            if len(seen) >= op.offset + op.limit:
+                break
+            if (
+                (namespace, key) in seen
+                or (namespace, key) in passed
+                or not _in_namespace(op, namespace)
+            ):
+                continue
+            item = self._data.get(namespace, {}).get(key)
+            if item is None or not _matches_filter(op, item):
+                continue
+            if not _follows(cursor, item, score):
+                passed.add((namespace, key))
+                continue
+            if len(seen) >= op.offset:
+                kept.append((score, item))
+            seen.add((namespace, key))
+        return kept if len(seen) >= op.offset + op.limit else None
+
     def _prepare_ops(
         self, ops: Iterable[Op]
     ) -> tuple[
@@ -381,10 +503,14 @@ class InMemoryStore(BaseStore):
         ] = {}
         for i, op in enumerate(ops):
             if isinstance(op, GetOp):
-                item = self._data[op.namespace].get(op.key)
+                item = self._data.get(op.namespace, {}).get(op.key)
                 results.append(item)
             elif isinstance(op, SearchOp):
-                search_ops[i] = (op, self._filter_items(op))
+                # candidates of ANN searches are looked up in _batch_search
+                search_ops[i] = (
+                    op,
+                    [] if self._use_ann(op) else self._filter_items(op),
+                )
                 results.append(None)
             elif isinstance(op, ListNamespacesOp):
                 results.append(self._handle_list_namespaces(op))
@@ -397,11 +523,26 @@ class InMemoryStore(BaseStore):
         return results, put_ops, search_ops
 
     def _apply_put_ops(self, put_ops: dict[tuple[tuple[str, ...], str], PutOp]) -> None:
+        namespaces = self._namespace_index()
         for (namespace, key), op in put_ops.items():
+            # drop the vectors of the previous value, the new ones are inserted after
+            if namespace in self._vectors:
+                vectors = self._vectors[namespace].pop(key, None)
+                if vectors and self._ann is not None:
+                    for path in vectors:
+                        self._ann.remove((namespace, key, path))
+                if not self._vectors[namespace]:
+                    del self._vectors[namespace]
             if op.value is None:
+                if namespace not in self._data:
+                    continue
                 self._data[namespace].pop(key, None)
-                self._vectors[namespace].pop(key, None)
+                if not self._data[namespace]:
+                    del self._data[namespace]
+                    namespaces.remove(namespace)
             else:
+                if namespace not in self._data:
+                    namespaces.add(namespace)
                 self._data[namespace][key] = Item(
                     value=op.value,
                     key=key,
@@ -409,6 +550,8 @@ class InMemoryStore(BaseStore):
                     created_at=datetime.now(timezone.utc),
                     updated_at=datetime.now(timezone.utc),
                 )
+        if self._ann is not None:
+            self._ann.maybe_train()
 
     def _extract_texts(
         self, put_ops: dict[tuple[tuple[str, ...], str], PutOp]
@@ -451,25 +594,328 @@ class InMemoryStore(BaseStore):
             )
         for embedding, (ns, key, path) in zip(embeddings, indices):
             self._vectors[ns][key][path] = embedding
+            if self._ann is not None:
+                self._ann.add((ns, key, path), embedding)
+        if self._ann is not None:
+            self._ann.maybe_train()
 
     def _handle_list_namespaces(self, op: ListNamespacesOp) -> list[tuple[str, ...]]:
-        all_namespaces = list(
-            self._data.keys()
-        )  # Avoid collection size changing while iterating
-        namespaces = all_namespaces
-        if op.match_conditions:
-            namespaces = [
-                ns
-                for ns in namespaces
-                if all(_does_match(condition, ns) for condition in op.match_conditions)
-            ]
-
+        index = self._namespace_index()
+        if not op.match_conditions:
+            if op.max_depth is not None:
+                namespaces = sorted(index.truncated(op.max_depth))
+            else:
+                namespaces = sorted(index.match(()))
+            return namespaces[op.offset : op.offset + op.limit]
+
+        # narrow down the candidates with the first condition,
+        # then check the others against each candidate
+        first, *rest = op.match_conditions
+        if first.match_type not in ("prefix", "suffix"):
+            raise ValueError(f"Unsupported match type: {first.match_type}")
+        namespaces = [
+            ns
+            for ns in index.match(first.path, suffix=first.match_type == "suffix")
+            if all(_does_match(condition, ns) for condition in rest)
+        ]
         if op.max_depth is not None:
             namespaces = sorted({ns[: op.max_depth] for ns in namespaces})
         else:
             namespaces = sorted(namespaces)
         return namespaces[op.offset : op.offset + op.limit]
 
+    def _namespace_index(self) -> "_NamespaceIndex":
+        if len(self._namespaces) != len(self._data):
+            # _data was modified directly, eg. when restored from disk
+            self._namespaces = _NamespaceIndex(self._data)
+        return self._namespaces
+
+
+class _TrieNode:
+    __slots__ = ("children", "is_namespace")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.is_namespace = False
+
+
+class _NamespaceIndex:
+    """Tries of the namespaces of a store, by prefix and by suffix.
+
+    Lookups walk the labels of the path, so they take time proportional to its
+    length plus the number of namespaces matched, instead of the total number
+    of namespaces."""
+
+    __slots__ = ("prefixes", "suffixes", "size")
+
+    def __init__(self, namespaces: Iterable[tuple[str, ...]] = ()) -> None:
+        self.prefixes = _TrieNode()
+        self.suffixes = _TrieNode()
+        self.size = 0
+        for namespace in namespaces:
+            self.add(namespace)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, namespace: tuple[str, ...]) -> None:
+        for root, labels in (
+            (self.prefixes, namespace),
+            (self.suffixes, reversed(namespace)),
+        ):
+            node = root
+            for label in labels:
+                node = node.children.setdefault(label, _TrieNode())
+            if root is self.prefixes and not node.is_namespace:
+                self.size += 1
+            node.is_namespace = True
+
+    def remove(self, namespace: tuple[str, ...]) -> None:
+        for root, labels in (
+            (self.prefixes, tuple(namespace)),
+            (self.suffixes, tuple(reversed(namespace))),
+        ):
+            path = [root]
+            for label in labels:
+                if (node := path[-1].children.get(label)) is None:
+                    return
+                path.append(node)
+            if not path[-1].is_namespace:
+                return
+            path[-1].is_namespace = False
+            if root is self.prefixes:
+                self.size -= 1
+            # prune the nodes left without namespaces
+            for label, parent, node in zip(
+                reversed(labels), reversed(path[:-1]), reversed(path[1:])
+            ):
+                if node.children or node.is_namespace:
+                    break
+                del parent.children[label]
+
+    def match(
+        self, path: Iterable[str], *, suffix: bool = False
+    ) -> Iterator[tuple[str, ...]]:
+        """Yield the namespaces starting (or ending) with the given path, where
+        "*" matches any label."""
+        nodes: list[tuple[tuple[str, ...], _TrieNode]] = [
+            ((), self.suffixes if suffix else self.prefixes)
+        ]
+        for label in reversed(tuple(path)) if suffix else path:
+            if label == "*":
+                nodes = [
+                    ((*labels, child_label), child)
+                    for labels, node in nodes
+                    for child_label, child in node.children.items()
+                ]
+            else:
+                nodes = [
+                    ((*labels, label), node.children[label])
+                    for labels, node in nodes
+                    if label in node.children
+                ]
+        for labels, node in nodes:
+            for namespace in _walk(labels, node):
+                yield tuple(reversed(namespace)) if suffix else namespace
+
+    def truncated(self, max_depth: int) -> Iterator[tuple[str, ...]]:
+        """Yield the distinct namespaces truncated to max_depth labels."""
+        return _walk((), self.prefixes, max_depth) if self.size else iter(())
+
+
+def _walk(
+    labels: tuple[str, ...], node: _TrieNode, max_depth: Optional[int] = None
+) -> Iterator[tuple[str, ...]]:
+    """Yield the namespaces of a trie node and its descendants, truncated to
+    max_depth labels."""
+    if max_depth is not None and len(labels) >= max_depth:
+        yield labels
+        return
+    if node.is_namespace:
+        yield labels
+    for label, child in node.children.items():
+        yield from _walk((*labels, label), child, max_depth)
+
+
+# (namespace, key, path) of a stored vector
+VectorId = tuple[tuple[str, ...], str, str]
+
+
+class _IVFIndex:
+    """Inverted file index over unit-normalized vectors.
+
+    Vectors are clustered with spherical k-means once there are at least
+    `min_size` of them, and the index is re-trained whenever the number of
+    vectors doubles. In between, new vectors are added to the list of their
+    closest centroid. A search only scores the vectors of the `nprobe` lists
+    whose centroids are closest to the query."""
+
+    __slots__ = (
+        "nlist",
+        "nprobe",
+        "min_size",
+        "trained_size",
+        "ids",
+        "rows",
+        "free",
+        "matrix",
+        "centroids",
+        "lists",
+        "assignments",
+    )
+
+    def __init__(
+        self, *, nlist: Optional[int], nprobe: Optional[int], min_size: int
+    ) -> None:
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.min_size = min_size
+        self.trained_size = 0
+        self.ids: list[Optional[VectorId]] = []
+        self.rows: dict[VectorId, int] = {}
+        self.free: list[int] = []
+        self.matrix: Any = None
+        self.centroids: Any = None
+        self.lists: list[set[int]] = []
+        self.assignments: dict[int, int] = {}
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    def add(self, id: VectorId, vector: list[float]) -> None:
+        import numpy as np
+
+        vec = np.asarray(vector, dtype=np.float32)
+        if norm := float(np.linalg.norm(vec)):
+            vec = vec / norm
+        if self.matrix is None:
+            self.matrix = np.zeros((64, len(vec)), dtype=np.float32)
+        if (row := self.rows.get(id)) is not None:
+            self._unassign(row)
+        elif self.free:
+            row = self.free.pop()
+        else:
+            row = len(self.ids)
+            self.ids.append(None)
+            if row >= len(self.matrix):
+                self.matrix = np.concatenate([self.matrix, np.zeros_like(self.matrix)])
+        self.rows[id] = row
+        self.ids[row] = id
+        self.matrix[row] = vec
+        if self.centroids is not None:
+            self._assign(row, int(np.argmax(self.centroids @ vec)))
+
+    def remove(self, id: VectorId) -> None:
+        if (row := self.rows.pop(id, None)) is not None:
+            self._unassign(row)
+            self.ids[row] = None
+            self.free.append(row)
+
+    def maybe_train(self) -> None:
+        size = len(self.rows)
+        if size >= max(self.min_size, 2 * self.trained_size, 1):
+            self._train()
+        elif self.trained and size < self.min_size // 2:
+            # collection shrunk, exact search is cheap again
+            self.centroids = None
+            self.trained_size = 0
+            self.lists = []
+            self.assignments.clear()
+
+    def search(self, query: list[float]) -> list[tuple[float, VectorId]]:
+        """Return the scored ids of the vectors in the lists closest to the query,
+        sorted by descending cosine similarity."""
+        import numpy as np
+
+        vec = np.asarray(query, dtype=np.float32)
+        if norm := float(np.linalg.norm(vec)):
+            vec = vec / norm
+        nprobe = self.nprobe or max(1, round(math.sqrt(len(self.lists))))
+        probes = np.argsort(-(self.centroids @ vec))[:nprobe]
+        rows = np.fromiter(
+            chain.from_iterable(self.lists[p] for p in probes), dtype=np.int64
+        )
+        scores = self.matrix[rows] @ vec
+        order = np.argsort(-scores)
+        return [(float(scores[i]), self.ids[rows[i]]) for i in order]
+
+    def _train(self) -> None:
+        import numpy as np
+
+        live = np.fromiter(self.rows.values(), dtype=np.int64)
+        nlist = min(self.nlist or round(math.sqrt(len(live))), len(live))
+        rng = np.random.default_rng(0)
+        sample = self.matrix[
+            rng.choice(live, size=min(len(live), nlist * 64), replace=False)
+        ]
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)]
+        for _ in range(10):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # keep the previous centroid for empty clusters
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+        self.centroids = centroids
+        self.trained_size = len(live)
+        self.lists = [set() for _ in range(nlist)]
+        self.assignments.clear()
+        for start in range(0, len(live), 8192):
+            chunk = live[start : start + 8192]
+            labels = np.argmax(self.matrix[chunk] @ centroids.T, axis=1)
+            for row, label in zip(chunk.tolist(), labels.tolist()):
+                self._assign(row, label)
+
+    def _assign(self, row: int, label: int) -> None:
+        self.lists[label].add(row)
+        self.assignments[row] = label
+
+    def _unassign(self, row: int) -> None:
+        if (label := self.assignments.pop(row, None)) is not None:
+            self.lists[label].discard(row)
+
+
+def _in_namespace(op: SearchOp, namespace: tuple[str, ...]) -> bool:
+    """Whether a namespace is within the namespace prefix of a search."""
+    return namespace[: len(op.namespace_prefix)] == op.namespace_prefix
+
+
+def _matches_filter(op: SearchOp, item: Item) -> bool:
+    """Whether an item matches the filter of a search."""
+    if not op.filter:
+        return True
+
+    return all(
+        _compare_values(item.value.get(key), filter_value)
+        for key, filter_value in op.filter.items()
+    )
+
+
+def _recency(item: Item) -> tuple[datetime, tuple[str, ...], str]:
+    """Sort key of an item in searches without a query."""
+    return (item.updated_at, item.namespace, item.key)
+
+
+def _follows(
+    cursor: Optional[SearchCursor], item: Item, score: Optional[float] = None
+) -> bool:
+    """Whether an item comes after the cursor in the results of a search.
+
+    Scored items are ordered by descending score, and come before the items
+    without a score, which are ordered by descending recency."""
+    if cursor is None:
+        return True
+    if cursor.score is not None:
+        return score is None or (score, item.namespace, item.key) < (
+            cursor.score,
+            cursor.namespace,
+            cursor.key,
+        )
+    if score is not None:
+        return False
+    return _recency(item) < (cursor.updated_at, cursor.namespace, cursor.key)
+
 
 @functools.lru_cache(maxsize=1)
 def _check_numpy() -> bool:
@@ -493,7 +939,7 @@ def _cosine_similarity(X: list[float], Y: list[list[float]]) -> list[float]:
     if not Y:
         return []
     if _check_numpy():
-        import numpy as np  # type: ignore
+        import numpy as np
 
         X_arr = np.array(X) if not isinstance(X, np.ndarray) else X
         Y_arr = np.array(Y) if not isinstance(Y, np.ndarray) else Y
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import Any
 
 import pytest
@@ -6,8 +7,13 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
+    DeltaValue,
     create_checkpoint,
+    delete_thread,
     empty_checkpoint,
+    keep_latest,
+    keep_since,
 )
 from langgraph.checkpoint.memory import MemorySaver
 
@@ -138,3 +144,144 @@ class TestMemorySaver:
             c async for c in self.memory_saver.alist(None, filter=query_4)
         ]
         assert len(search_results_4) == 0
+
+    def _put_history(self, thread_id: str, n: int) -> list[RunnableConfig]:
+        configs: list[RunnableConfig] = []
+        config: RunnableConfig = {
+            "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+        }
+        items: list[int] = []
+        base: tuple[int, ...] = ()
+        for i in range(1, n + 1):
+            items = [*items, i]
+            checkpoint = create_checkpoint(empty_checkpoint(), None, i)
+            checkpoint["channel_values"] = {
+                "items": DeltaValue(items, base, len(items) - 1),
+                "count": i,
+            }
+            checkpoint["channel_versions"] = {"items": i, "count": i}
+            config = self.memory_saver.put(config, checkpoint, {}, {"items": i})
+            self.memory_saver.put_writes(config, [("count", i)], f"task-{i}")
+            configs.append(config)
+            base = (*base, i)
+        return configs
+
+    async def test_prune(self) -> None:
+        configs = self._put_history("thread-1", 5)
+        self._put_history("thread-2", 2)
+
+        self.memory_saver.prune(["thread-1"], strategy=keep_latest(2))
+
+        remaining = list(
+            self.memory_saver.list({"configurable": {"thread_id": "thread-1"}})
+        )
+        assert [c.config for c in remaining] == configs[:2:-1]
+        # delta-encoded values are still reassembled from their base blobs
+        assert remaining[0].checkpoint["channel_values"]["items"].items == [
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+        assert remaining[0].pending_writes == [("task-5", "count", 5)]
+        # writes of the parent of the oldest remaining checkpoint are kept
+        assert {k[2] for k in self.memory_saver.writes if k[0] == "thread-1"} == {
+            c["configurable"]["checkpoint_id"] for c in configs[2:]
+        }
+        # other threads are not affected
+        assert (
+            len(
+                list(
+                    self.memory_saver.list({"configurable": {"thread_id": "thread-2"}})
+                )
+            )
+            == 2
+        )
+
+        self.memory_saver.prune(["thread-1", "thread-2"], strategy=delete_thread)
+
+        assert list(self.memory_saver.list(None)) == []
+        assert not self.memory_saver.writes
+        assert not self.memory_saver.blobs
+
+    async def test_aprune_keep_since(self) -> None:
+        configs = self._put_history("thread-1", 3)
+        ts = self.memory_saver.get_tuple(configs[1]).checkpoint["ts"]
+
+        await self.memory_saver.aprune(["thread-1"], strategy=keep_since(ts))
+
+        remaining = [c async for c in self.memory_saver.alist(None)]
+        assert [c.config for c in remaining] == configs[:0:-1]
+
+        # the latest checkpoint is kept, even if older
+        await self.memory_saver.aprune(
+            ["thread-1"], strategy=keep_since("2999-01-01T00:00:00")
+        )
+
+        remaining = [c async for c in self.memory_saver.alist(None)]
+        assert [c.config for c in remaining] == configs[:1:-1]
+        assert remaining[0].checkpoint["channel_values"]["items"].items == [1, 2, 3]
+
+    def test_prune_keep_since_whole_seconds(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+        }
+        configs = []
+        for i in range(1, 4):
+            checkpoint = create_checkpoint(empty_checkpoint(), None, i)
+            # isoformat() omits the microseconds of whole seconds
+            checkpoint["ts"] = f"2024-01-0{i}T00:00:00+00:00"
+            config = self.memory_saver.put(config, checkpoint, {}, {})
+            configs.append(config)
+
+        self.memory_saver.prune(
+            ["thread-1"], strategy=keep_since(datetime(2024, 1, 2, tzinfo=timezone.utc))
+        )
+
+        remaining = list(self.memory_saver.list(None))
+        assert [c.config for c in remaining] == configs[:0:-1]
+
+    async def test_list_metadata(self) -> None:
+        configs = self._put_history("thread-1", 3)
+
+        listed = list(
+            self.memory_saver.list_metadata(
+                {"configurable": {"thread_id": "thread-1"}}, limit=2
+            )
+        )
+        full = list(
+            self.memory_saver.list({"configurable": {"thread_id": "thread-1"}}, limit=2)
+        )
+        assert [c.config for c in listed] == configs[:0:-1]
+        assert [c.parent_config for c in listed] == [c.parent_config for c in full]
+        assert [c.metadata for c in listed] == [c.metadata for c in full]
+        assert all(isinstance(c, CheckpointMetadataTuple) for c in listed)
+
+        alisted = [
+            c
+            async for c in self.memory_saver.alist_metadata(
+                None, filter={"source": "input"}
+            )
+        ]
+        assert alisted == []
+
+    async def test_get_tuples(self) -> None:
+        configs = self._put_history("thread-1", 3)
+        other = self._put_history("thread-2", 1)
+        requested: list[RunnableConfig] = [
+            {"configurable": {"thread_id": "thread-2"}},
+            configs[0],
+            {"configurable": {"thread_id": "thread-3"}},
+            {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}},
+        ]
+
+        tuples = self.memory_saver.get_tuples(requested)
+        assert [t.config if t else None for t in tuples] == [
+            other[-1],
+            configs[0],
+            None,
+            configs[-1],
+        ]
+        assert tuples == [self.memory_saver.get_tuple(c) for c in requested]
+        assert await self.memory_saver.aget_tuples(requested) == tuples
@@ -1,12 +1,16 @@
 # mypy: disable-error-code="operator"
 import asyncio
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Iterable
 
 import pytest
 from pytest_mock import MockerFixture
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.store.base import (
     GetOp,
     InvalidNamespaceError,
@@ -14,9 +18,11 @@ from langgraph.store.base import (
     Op,
     PutOp,
     Result,
+    SearchCursor,
+    SearchItem,
     get_text_at_path,
 )
-from langgraph.store.base.batch import AsyncBatchedBaseStore
+from langgraph.store.base.batch import AsyncBatchedBaseStore, SyncBatchedBaseStore
 from langgraph.store.memory import InMemoryStore
 from tests.embed_test_utils import CharacterEmbeddings
 
@@ -353,6 +359,32 @@ def test_list_namespaces_empty_store() -> None:
     assert result == []
 
 
+def test_list_namespaces_after_delete() -> None:
+    store = InMemoryStore()
+
+    store.put(("a", "b", "c"), "id_0", {"data": "value_00"})
+    store.put(("a", "b", "c"), "id_1", {"data": "value_01"})
+    store.put(("a", "d"), "id_2", {"data": "value_02"})
+    assert store.get(("x", "y"), "id_3") is None
+
+    store.delete(("a", "b", "c"), "id_0")
+    assert store.list_namespaces() == [("a", "b", "c"), ("a", "d")]
+
+    store.delete(("a", "b", "c"), "id_1")
+    assert store.list_namespaces() == [("a", "d")]
+    assert store.list_namespaces(suffix=("c",)) == []
+    assert store.list_namespaces(max_depth=1) == [("a",)]
+    assert store.search(("a", "b")) == []
+
+    # the namespace index is rebuilt if the data is modified directly
+    store._data[("e", "f")] = dict(store._data[("a", "d")])
+    assert store.list_namespaces(prefix=("e",)) == [("e", "f")]
+
+    store.delete(("a", "d"), "id_2")
+    store.delete(("e", "f"), "id_2")
+    assert store.list_namespaces(max_depth=1) == []
+
+
 async def test_cannot_put_empty_namespace() -> None:
     store = InMemoryStore()
     doc = {"foo": "bar"}
@@ -506,6 +538,92 @@ async def test_async_batch_store_deduplication(mocker: MockerFixture) -> None:
     abatch.reset_mock()
 
 
+async def test_async_batch_store_max_batch_size_and_linger(
+    mocker: MockerFixture,
+) -> None:
+    abatch = mocker.spy(InMemoryStore, "batch")
+
+    class LingeringStore(MockAsyncBatchedStore):
+        def __init__(self) -> None:
+            AsyncBatchedBaseStore.__init__(self, max_batch_size=3, max_linger_ms=50)
+            self._store = InMemoryStore()
+
+    store = LingeringStore()
+
+    # oversized batches are split
+    await asyncio.gather(
+        *(store.aput(("test",), f"key{i}", {"value": i}) for i in range(7))
+    )
+    assert [len(list(c.args[1])) for c in abatch.call_args_list] == [3, 3, 1]
+    assert store.batch_stats.batches == 3
+    assert store.batch_stats.ops == 7
+    assert store.batch_stats.mean_batch_size == 7 / 3
+
+    abatch.reset_mock()
+
+    # operations queued within the linger time are batched together
+    async def delayed_get(i: int) -> Any:
+        await asyncio.sleep(0.01 * i)
+        return await store.aget(("test",), f"key{i}")
+
+    results = await asyncio.gather(*(delayed_get(i) for i in range(2)))
+    assert [r.value for r in results] == [{"value": 0}, {"value": 1}]
+    assert len(abatch.call_args_list) == 1
+    assert store.batch_stats.mean_queue_wait > 0
+
+    # the batching task sleeps while the queue is empty
+    await asyncio.sleep(0.01)
+    assert not store._task.done()
+    assert not store._aevent.is_set()
+
+
+def test_sync_batch_store_coalesces_threads() -> None:
+    calls: list[list[Op]] = []
+    started = threading.Event()
+    release = threading.Event()
+
+    class MockSyncBatchedStore(SyncBatchedBaseStore):
+        def __init__(self) -> None:
+            super().__init__(max_batch_size=4)
+            self._store = InMemoryStore()
+
+        def batch(self, ops: Iterable[Op]) -> list[Result]:
+            ops = list(ops)
+            calls.append(ops)
+            if len(calls) == 1:
+                started.set()
+                release.wait()
+            return self._store.batch(ops)
+
+        async def abatch(self, ops: Iterable[Op]) -> list[Result]:
+            return self.batch(ops)
+
+    store = MockSyncBatchedStore()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # the first put runs alone, while the others queue up
+        first = executor.submit(store.put, ("test",), "key0", {"value": 0})
+        started.wait()
+        futs = [
+            executor.submit(store.put, ("test",), f"key{i}", {"value": i})
+            for i in range(1, 6)
+        ]
+        while len(store._squeue) < 5:
+            time.sleep(0.001)
+        release.set()
+        for fut in [first, *futs]:
+            assert fut.result() is None
+
+    # queued operations are run together, in batches of at most 4
+    assert [len(c) for c in calls] == [1, 4, 1]
+    assert store.get(("test",), "key5") == store._store.get(("test",), "key5")
+    assert sorted(item.key for item in store.search(("test",), limit=10)) == [
+        f"key{i}" for i in range(6)
+    ]
+
+    with pytest.raises(InvalidNamespaceError):
+        store.put((), "key", {"value": 0})
+
+
 @pytest.fixture
 def fake_embeddings() -> CharacterEmbeddings:
     return CharacterEmbeddings(dims=500)
@@ -822,6 +940,35 @@ def test_vector_search_pagination(fake_embeddings: CharacterEmbeddings) -> None:
     assert len(all_results) == 5
 
 
+def test_search_cursor_pagination(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test paging through search results with `after` cursors."""
+    store = InMemoryStore(
+        index={"dims": fake_embeddings.dims, "embed": fake_embeddings}
+    )
+    for i in range(7):
+        store.put(("test", str(i % 2)), f"doc{i}", {"text": f"document number {i}"})
+    store.put(("test",), "unindexed", {"text": "not embedded"}, index=False)
+
+    for query in (None, "document"):
+        expected = store.search(("test",), query=query, limit=100)
+        assert len(expected) == 8
+        pages: list[list[SearchItem]] = []
+        after = None
+        while page := store.search(("test",), query=query, limit=3, after=after):
+            pages.append(page)
+            after = page[-1].cursor
+        assert [len(page) for page in pages] == [3, 3, 2]
+        assert [item for page in pages for item in page] == expected
+
+    recent = store.search(("test",), limit=8)
+    assert [item.key for item in recent[:2]] == ["unindexed", "doc6"]
+
+    cursor = SearchCursor.decode(recent[0].cursor)
+    assert cursor == SearchCursor(("test",), "unindexed", recent[0].updated_at, None)
+    with pytest.raises(ValueError, match="Invalid search cursor"):
+        store.search(("test",), after="not-a-cursor")
+
+
 async def test_async_vector_search_pagination(
     fake_embeddings: CharacterEmbeddings,
 ) -> None:
@@ -947,3 +1094,106 @@ async def test_embed_with_path(fake_embeddings: CharacterEmbeddings) -> None:
     assert len(results) == 3
     doc5_result = next(r for r in results if r.key == "doc5")
     assert doc5_result.score is None
+
+
+def test_vector_search_ann_index(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test approximate vector search matches exact search when probing all lists."""
+    pytest.importorskip("numpy")
+    exact = InMemoryStore(
+        index={"dims": fake_embeddings.dims, "embed": fake_embeddings}
+    )
+    ann = InMemoryStore(
+        index={
+            "dims": fake_embeddings.dims,
+            "embed": fake_embeddings,
+            "ann_index_config": {
+                "kind": "ivf",
+                "nlist": 4,
+                "nprobe": 4,
+                "min_size": 20,
+            },
+        }
+    )
+    words = ["apple", "banana", "cherry", "grape", "lemon", "mango", "peach"]
+    for store in (exact, ann):
+        for i in range(40):
+            store.put(
+                ("docs", str(i % 2)),
+                f"doc{i}",
+                {"text": f"{words[i % 7]} {words[i % 5]} {i}", "even": i % 2 == 0},
+            )
+        store.delete(("docs", "0"), "doc0")
+    assert ann._ann is not None and ann._ann.trained
+
+    for kwargs in (
+        {"query": "banana"},
+        {"query": "cherry lemon", "limit": 5, "offset": 3},
+        {"query": "grape", "filter": {"even": True}},
+    ):
+        expected = exact.search(("docs",), **kwargs)
+        results = ann.search(("docs",), **kwargs)
+        assert [r.key for r in results] == [r.key for r in expected]
+        assert [r.score for r in results] == pytest.approx(
+            [r.score for r in expected], abs=1e-5
+        )
+
+    # fewer matches than the limit falls back to exact search
+    results = ann.search(("docs", "1"), query="peach", limit=100)
+    assert len(results) == 20
+
+    # updates and deletes drop the vectors of the previous value
+    ann.put(("docs", "1"), "doc1", {"text": "apple", "title": "pie"}, index=["title"])
+    assert list(ann._vectors[("docs", "1")]["doc1"]) == ["title"]
+    ann.delete(("docs", "1"), "doc3")
+    assert "doc3" not in ann._vectors[("docs", "1")]
+    assert len(ann._ann.rows) == sum(
+        len(paths) for keys in ann._vectors.values() for paths in keys.values()
+    )
+
+
+def test_vector_search_ann_index_requires_numpy(
+    fake_embeddings: CharacterEmbeddings, mocker: MockerFixture
+) -> None:
+    mocker.patch("langgraph.store.memory._check_numpy", return_value=False)
+    with pytest.raises(ImportError, match="numpy"):
+        InMemoryStore(
+            index={
+                "dims": fake_embeddings.dims,
+                "embed": fake_embeddings,
+                "ann_index_config": {"kind": "ivf"},
+            }
+        )
+
+
+async def test_embeddings_cache(
+    fake_embeddings: CharacterEmbeddings, mocker: MockerFixture
+) -> None:
+    embed_documents = mocker.spy(fake_embeddings, "embed_documents")
+    embed_query = mocker.spy(fake_embeddings, "embed_query")
+    aembed_documents = mocker.spy(fake_embeddings, "aembed_documents")
+    cache = InMemoryCache()
+    store = InMemoryStore(
+        index={"dims": fake_embeddings.dims, "embed": fake_embeddings, "cache": cache}
+    )
+
+    store.put(("docs",), "doc1", {"text": "hello", "title": "greeting"})
+    store.put(("docs",), "doc2", {"text": "hello", "title": "greeting"})
+    assert embed_documents.call_count == 1
+    assert embed_documents.call_args.args[0] == [
+        json.dumps({"text": "hello", "title": "greeting"}, sort_keys=True)
+    ]
+    store.put(("docs",), "doc2", {"text": "hello"}, index=["text"])
+    assert embed_documents.call_args.args[0] == ["hello"]
+
+    # unchanged texts are not embedded again
+    await store.aput(("docs",), "doc1", {"text": "hello", "title": "greeting"})
+    await store.aput(("docs",), "doc3", {"text": "hello"}, index=["text"])
+    assert embed_documents.call_count == 2
+    assert aembed_documents.call_count == 0
+
+    # neither are repeated queries
+    first = store.search(("docs",), query="hi")
+    second = store.search(("docs",), query="hi")
+    assert embed_query.call_count == 1
+    assert [(r.key, r.score) for r in first] == [(r.key, r.score) for r in second]
+    assert cache.hits > 0
@@ -7,6 +7,7 @@ from uvloop import new_event_loop
 
 from bench.fanout_to_subgraph import fanout_to_subgraph, fanout_to_subgraph_sync
 from bench.react_agent import react_agent
+from bench.send_fanout import send_fanout
 from bench.wide_state import wide_state
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.pregel import Pregel
@@ -212,3 +213,7 @@ for name, agraph, graph, input in benchmarks:
     r.bench_async_func(name, arun, agraph, input, loop_factory=new_event_loop)
     if graph is not None:
         r.bench_func(name + "_sync", run, graph, input)
+
+# task preparation only, run with --tracemalloc to measure allocations per step
+for n in (100, 1000):
+    r.bench_func(f"send_fanout_{n}x_prepare", send_fanout(n))
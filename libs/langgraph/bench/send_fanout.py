@@ -0,0 +1,60 @@
+from typing import Callable
+from uuid import uuid4
+
+from langgraph.channels.last_value import LastValue
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.constants import PUSH, Send
+from langgraph.pregel import Channel
+from langgraph.pregel.algo import prepare_next_tasks
+from langgraph.pregel.manager import ChannelsManager
+from langgraph.utils.config import ensure_config
+
+
+def send_fanout(n: int) -> Callable[[], int]:
+    """Returns a function preparing the executable tasks for a step with `n`
+    pending Sends, without running them. Run with `--tracemalloc` to measure
+    the memory allocated per step, ie. per `n` tasks."""
+    processes = {"node": Channel.subscribe_to("input") | (lambda x: x)}
+    checkpoint = empty_checkpoint()
+    # sends written by a single task of the current step
+    task_id = str(uuid4())
+    pending_writes = [(task_id, PUSH, Send("node", i)) for i in range(n)]
+    config = ensure_config(
+        {
+            "configurable": {"thread_id": "1", "user_id": "2"},
+            "metadata": {"source": "bench"},
+            "tags": ["bench"],
+        }
+    )
+
+    def prepare() -> int:
+        with ChannelsManager({"input": LastValue(int)}, checkpoint, config) as (
+            channels,
+            managed,
+        ):
+            tasks = prepare_next_tasks(
+                checkpoint,
+                pending_writes,
+                processes,
+                channels,
+                managed,
+                config,
+                1,
+                for_execution=True,
+                store=None,
+                checkpointer=None,
+                manager=None,
+            )
+        return len(tasks)
+
+    return prepare
+
+
+if __name__ == "__main__":
+    import tracemalloc
+
+    prepare = send_fanout(10000)
+    tracemalloc.start()
+    prepare()
+    _, peak = tracemalloc.get_traced_memory()
+    print(f"{peak / 10000:.0f} bytes per task")
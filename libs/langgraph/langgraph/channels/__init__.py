@@ -3,6 +3,7 @@ from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
 from langgraph.channels.ephemeral_value import EphemeralValue
 from langgraph.channels.last_value import LastValue
+from langgraph.channels.messages import DeltaMessages
 from langgraph.channels.topic import Topic
 from langgraph.channels.untracked_value import UntrackedValue
 
@@ -14,4 +15,5 @@ __all__ = [
     "UntrackedValue",
     "EphemeralValue",
     "AnyValue",
+    "DeltaMessages",
 ]
@@ -13,6 +13,11 @@ C = TypeVar("C")
 class BaseChannel(Generic[Value, Update, C], ABC):
     __slots__ = ("key", "typ")
 
+    notify_on_step: bool = True
+    """Whether the channel must receive an empty update at the end of each step
+    it wasn't written to. Channels for which an empty update is a no-op should set
+    this to False, so that Pregel can skip them."""
+
     def __init__(self, typ: Type[Any], key: str = "") -> None:
         self.typ = typ
         self.key = key
@@ -47,7 +52,8 @@ class BaseChannel(Generic[Value, Update, C], ABC):
         """Update the channel's value with the given sequence of updates.
         The order of the updates in the sequence is arbitrary.
         This method is called by Pregel for all channels at the end of each step.
-        If there are no updates, it is called with an empty sequence.
+        If there are no updates, it is called with an empty sequence, unless
+        `notify_on_step` is False.
         Raises InvalidUpdateError if the sequence of updates is invalid.
         Returns True if the channel was updated, False otherwise."""
 
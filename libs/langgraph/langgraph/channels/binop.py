@@ -36,6 +36,8 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("value", "operator")
 
+    notify_on_step = False
+
     def __init__(self, typ: Type[Value], operator: Callable[[Value, Value], Value]):
         super().__init__(typ)
         self.operator = operator
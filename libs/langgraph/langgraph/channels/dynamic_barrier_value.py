@@ -24,6 +24,8 @@ class DynamicBarrierValue(
 
     __slots__ = ("names", "seen")
 
+    notify_on_step = False
+
     names: Optional[set[Value]]
     seen: set[Value]
 
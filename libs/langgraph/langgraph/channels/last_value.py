@@ -16,6 +16,8 @@ class LastValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("value",)
 
+    notify_on_step = False
+
     def __eq__(self, value: object) -> bool:
         return isinstance(value, LastValue)
 
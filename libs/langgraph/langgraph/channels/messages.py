@@ -0,0 +1,148 @@
+import uuid
+from typing import Any, Optional, Sequence, Type, Union, cast
+
+from langchain_core.messages import (
+    AnyMessage,
+    BaseMessage,
+    BaseMessageChunk,
+    MessageLikeRepresentation,
+    RemoveMessage,
+    convert_to_messages,
+    message_chunk_to_message,
+)
+from typing_extensions import Self
+
+from langgraph.channels.base import BaseChannel
+from langgraph.checkpoint.base import DeltaValue
+
+Messages = Union[list[MessageLikeRepresentation], MessageLikeRepresentation]
+
+
+def _coerce_messages(value: Messages) -> list[BaseMessage]:
+    """Convert a message-like value, or a list of them, to messages with ids."""
+    if not isinstance(value, list):
+        value = [value]
+    messages = [
+        message_chunk_to_message(cast(BaseMessageChunk, m))
+        for m in convert_to_messages(value)
+    ]
+    for m in messages:
+        if m.id is None:
+            m.id = str(uuid.uuid4())
+    return messages
+
+
+class DeltaMessages(BaseChannel[list[AnyMessage], Messages, DeltaValue]):
+    """A list of messages, merged by id like `add_messages`, which is checkpointed
+    incrementally.
+
+    Unlike `Annotated[list, add_messages]`, updates only convert the new messages,
+    and the index of messages by id is kept across steps. Checkpoint savers that
+    support it store only the messages appended since the previous checkpoint,
+    plus a full snapshot every `max_deltas` checkpoints or whenever an existing
+    message is replaced or removed.
+
+    To opt in, add it to the annotation of a messages key:
+
+    ```python
+    class State(TypedDict):
+        messages: Annotated[list[AnyMessage], add_messages, DeltaMessages]
+    ```
+    """
+
+    __slots__ = ("value", "index", "base", "base_len", "shared")
+
+    notify_on_step = False
+
+    max_deltas: int = 50
+    """Maximum number of checkpoints stored as deltas before a full snapshot."""
+
+    def __init__(self, typ: Type[Any] = list, key: str = "") -> None:
+        super().__init__(typ, key)
+        self.value: list[BaseMessage] = []
+        self.index: dict[str, int] = {}
+        self.base: tuple[Union[str, int, float], ...] = ()
+        self.base_len = 0
+        # whether self.value has been handed out, and must be copied before changing
+        self.shared = False
+
+    def __eq__(self, value: object) -> bool:
+        return isinstance(value, DeltaMessages)
+
+    @property
+    def ValueType(self) -> Any:
+        """The type of the value stored in the channel."""
+        return self.typ
+
+    @property
+    def UpdateType(self) -> Any:
+        """The type of the update received by the channel."""
+        return Messages
+
+    def checkpoint(self) -> DeltaValue:
+        if len(self.base) >= self.max_deltas:
+            self._reset_base()
+        self.shared = True
+        return DeltaValue(self.value, self.base, self.base_len)
+
+    def from_checkpoint(self, checkpoint: Optional[DeltaValue]) -> Self:
+        empty = self.__class__(self.typ)
+        empty.key = self.key
+        if isinstance(checkpoint, DeltaValue):
+            empty.value = checkpoint.items
+            empty.base = tuple(checkpoint.base)
+            empty.base_len = checkpoint.base_len
+        elif checkpoint is not None:
+            # eg. a list of messages saved by `add_messages`
+            empty.value = checkpoint
+        empty.index = {cast(str, m.id): i for i, m in enumerate(empty.value)}
+        empty.shared = True
+        return empty
+
+    def update(self, values: Sequence[Messages]) -> bool:
+        if not values:
+            return False
+        if self.shared:
+            self.value = self.value.copy()
+            self.shared = False
+        for value in values:
+            self._merge(_coerce_messages(value))
+        return True
+
+    def get(self) -> list[AnyMessage]:
+        self.shared = True
+        return cast(list[AnyMessage], self.value)
+
+    def checkpointed(self, version: Union[str, int, float]) -> None:
+        """Record that the last checkpoint of this channel was stored under `version`,
+        so that the next checkpoint can be stored as a delta from it."""
+        self.base = (*self.base, version)
+        self.base_len = len(self.value)
+
+    def _merge(self, messages: list[BaseMessage]) -> None:
+        # mirrors add_messages, for the messages in a single update
+        existing = len(self.value)
+        to_remove: set[str] = set()
+        for m in messages:
+            if (idx := self.index.get(cast(str, m.id))) is not None and idx < existing:
+                if isinstance(m, RemoveMessage):
+                    to_remove.add(cast(str, m.id))
+                else:
+                    self.value[idx] = m
+                    if idx < self.base_len:
+                        self._reset_base()
+            elif isinstance(m, RemoveMessage):
+                raise ValueError(
+                    f"Attempting to delete a message with an ID that doesn't exist ('{m.id}')"
+                )
+            else:
+                self.index[cast(str, m.id)] = len(self.value)
+                self.value.append(m)
+        if to_remove:
+            self.value = [m for m in self.value if m.id not in to_remove]
+            self.index = {cast(str, m.id): i for i, m in enumerate(self.value)}
+            self._reset_base()
+
+    def _reset_base(self) -> None:
+        self.base = ()
+        self.base_len = 0
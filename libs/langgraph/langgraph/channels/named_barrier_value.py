@@ -11,6 +11,8 @@ class NamedBarrierValue(Generic[Value], BaseChannel[Value, Value, set[Value]]):
 
     __slots__ = ("names", "seen")
 
+    notify_on_step = False
+
     names: set[Value]
     seen: set[Value]
 
@@ -77,6 +77,8 @@ CONFIG_KEY_WRITES = sys.intern("__pregel_writes")
 # read-only list of existing task writes
 CONFIG_KEY_SCRATCHPAD = sys.intern("__pregel_scratchpad")
 # holds a mutable dict for temporary storage scoped to the current task
+CONFIG_KEY_SKIP_CALLBACKS = sys.intern("__pregel_skip_callbacks")
+# holds a boolean indicating whether tasks run without callback managers
 
 # --- Other constants ---
 PUSH = sys.intern("__pregel_push")
@@ -93,6 +95,8 @@ FF_SEND_V2 = getenv("LANGGRAPH_FF_SEND_V2", "false").lower() == "true"
 # temporary flag to enable new Send semantics
 NULL_TASK_ID = sys.intern("00000000-0000-0000-0000-000000000000")
 # the task_id to use for writes that are not associated with a task
+CACHE_NS_WRITES = sys.intern("__pregel_ns_writes")
+# cache namespace for node writes
 
 RESERVED = {
     TAG_HIDDEN,
@@ -120,10 +124,12 @@ RESERVED = {
     CONFIG_KEY_CHECKPOINT_MAP,
     CONFIG_KEY_CHECKPOINT_ID,
     CONFIG_KEY_CHECKPOINT_NS,
+    CONFIG_KEY_SKIP_CALLBACKS,
     # other constants
     PUSH,
     PULL,
     NS_SEP,
     NS_END,
     CONF,
+    CACHE_NS_WRITES,
 }
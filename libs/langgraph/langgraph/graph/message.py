@@ -1,18 +1,17 @@
-import uuid
-from typing import Annotated, TypedDict, Union, cast
-
-from langchain_core.messages import (
-    AnyMessage,
-    BaseMessageChunk,
-    MessageLikeRepresentation,
-    RemoveMessage,
-    convert_to_messages,
-    message_chunk_to_message,
-)
+from typing import Annotated, TypedDict
 
+from langchain_core.messages import AnyMessage, RemoveMessage
+
+from langgraph.channels.messages import DeltaMessages, Messages, _coerce_messages
 from langgraph.graph.state import StateGraph
 
-Messages = Union[list[MessageLikeRepresentation], MessageLikeRepresentation]
+__all__ = [
+    "DeltaMessages",
+    "Messages",
+    "MessageGraph",
+    "MessagesState",
+    "add_messages",
+]
 
 
 def add_messages(left: Messages, right: Messages) -> Messages:
@@ -61,27 +60,9 @@ def add_messages(left: Messages, right: Messages) -> Messages:
         ```
 
     """
-    # coerce to list
-    if not isinstance(left, list):
-        left = [left]  # type: ignore[assignment]
-    if not isinstance(right, list):
-        right = [right]  # type: ignore[assignment]
-    # coerce to message
-    left = [
-        message_chunk_to_message(cast(BaseMessageChunk, m))
-        for m in convert_to_messages(left)
-    ]
-    right = [
-        message_chunk_to_message(cast(BaseMessageChunk, m))
-        for m in convert_to_messages(right)
-    ]
-    # assign missing ids
-    for m in left:
-        if m.id is None:
-            m.id = str(uuid.uuid4())
-    for m in right:
-        if m.id is None:
-            m.id = str(uuid.uuid4())
+    # coerce to list of messages, and assign missing ids
+    left = _coerce_messages(left)
+    right = _coerce_messages(right)
     # merge
     left_idx_by_id = {m.id: i for i, m in enumerate(left)}
     merged = left.copy()
@@ -42,6 +42,7 @@ from langchain_core.tracers._streaming import _StreamingCallbackHandler
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import (
     BaseChannel,
 )
@@ -85,6 +86,7 @@ from langgraph.managed.base import ManagedValueSpec
 from langgraph.pregel.algo import (
     PregelTaskWrites,
     apply_writes,
+    build_trigger_to_nodes,
     local_read,
     local_write,
     prepare_next_tasks,
@@ -93,12 +95,17 @@ from langgraph.pregel.debug import tasks_w_writes
 from langgraph.pregel.io import read_channels
 from langgraph.pregel.loop import AsyncPregelLoop, StreamProtocol, SyncPregelLoop
 from langgraph.pregel.manager import AsyncChannelsManager, ChannelsManager
-from langgraph.pregel.messages import StreamMessagesHandler
+from langgraph.pregel.messages import StreamBackpressureHandler, StreamMessagesHandler
 from langgraph.pregel.protocol import PregelProtocol
 from langgraph.pregel.read import PregelNode
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.pregel.runner import PregelRunner
-from langgraph.pregel.utils import find_subgraph_pregel, get_new_channel_versions
+from langgraph.pregel.utils import (
+    coalesce_chunks,
+    find_subgraph_pregel,
+    get_new_channel_versions,
+    is_droppable_chunk,
+)
 from langgraph.pregel.validate import validate_graph, validate_keys
 from langgraph.pregel.write import ChannelWrite, ChannelWriteEntry
 from langgraph.store.base import BaseStore
@@ -106,9 +113,12 @@ from langgraph.types import (
     All,
     Checkpointer,
     LoopProtocol,
+    PregelExecutableTask,
     StateSnapshot,
     StreamChunk,
+    StreamMessagesMetadata,
     StreamMode,
+    StreamOverflow,
 )
 from langgraph.utils.config import (
     ensure_config,
@@ -122,6 +132,9 @@ from langgraph.utils.queue import AsyncQueue, SyncQueue  # type: ignore[attr-def
 
 WriteValue = Union[Callable[[Input], Output], Any]
 
+HISTORY_PAGE_SIZE = 100
+"""Number of checkpoints fetched at a time when listing the state history."""
+
 
 class Channel:
     @overload
@@ -217,6 +230,38 @@ class Pregel(PregelProtocol):
     step_timeout: Optional[float] = None
     """Maximum time to wait for a step to complete, in seconds. Defaults to None."""
 
+    stream_buffer_size: Optional[int] = None
+    """Maximum number of chunks buffered by stream() and astream() while the
+    consumer is busy, see `stream_overflow`. Defaults to None, ie. unbounded.
+
+    Nodes running in threads wait for room when emitting chunks. In astream(),
+    chat models streaming in async nodes wait for room after each token instead.
+    Chunks emitted by the graph itself between steps are accepted past the bound
+    once `stream_overflow` can't make room, as waiting would block the consumer."""
+
+    stream_overflow: StreamOverflow = "block"
+    """What stream() and astream() do when their buffer is full. Defaults to 'block'."""
+
+    stream_messages_flush_tokens: Optional[int] = None
+    """Maximum number of token chunks of a chat model merged into each output of
+    stream_mode="messages". Defaults to None, ie. no limit."""
+
+    stream_messages_flush_interval: Optional[float] = None
+    """Maximum time token chunks of a chat model are held back to be merged into
+    each output of stream_mode="messages", in seconds. Defaults to None, ie. no
+    limit. When both this and `stream_messages_flush_tokens` are None, each token
+    chunk is output as is."""
+
+    stream_messages_metadata: StreamMessagesMetadata = "full"
+    """Whether each output of stream_mode="messages" carries the full metadata of
+    its run, or only the first one does. Defaults to 'full'."""
+
+    trace_tasks: Optional[bool] = None
+    """Whether to run tasks with callback managers. Defaults to None, ie. only when
+    there are callback handlers to call, including those added by tracing and by
+    stream_mode="messages". Set to False to always skip them, or True to always
+    create them."""
+
     debug: bool
     """Whether to print debug information during execution. Defaults to False."""
 
@@ -226,6 +271,9 @@ class Pregel(PregelProtocol):
     store: Optional[BaseStore] = None
     """Memory store to use for SharedValues. Defaults to None."""
 
+    cache: Optional[BaseCache] = None
+    """Cache to use for storing node writes. Defaults to None."""
+
     retry_policy: Optional[RetryPolicy] = None
     """Retry policy to use when running tasks. Set to None to disable."""
 
@@ -235,6 +283,9 @@ class Pregel(PregelProtocol):
 
     name: str = "LangGraph"
 
+    trigger_to_nodes: Mapping[str, Sequence[str]]
+    """Nodes subscribed to each channel, built by `validate()`."""
+
     def __init__(
         self,
         *,
@@ -248,13 +299,21 @@ class Pregel(PregelProtocol):
         interrupt_before_nodes: Union[All, Sequence[str]] = (),
         input_channels: Union[str, Sequence[str]],
         step_timeout: Optional[float] = None,
+        stream_buffer_size: Optional[int] = None,
+        stream_overflow: StreamOverflow = "block",
+        stream_messages_flush_tokens: Optional[int] = None,
+        stream_messages_flush_interval: Optional[float] = None,
+        stream_messages_metadata: StreamMessagesMetadata = "full",
+        trace_tasks: Optional[bool] = None,
         debug: Optional[bool] = None,
         checkpointer: Optional[BaseCheckpointSaver] = None,
         store: Optional[BaseStore] = None,
+        cache: Optional[BaseCache] = None,
         retry_policy: Optional[RetryPolicy] = None,
         config_type: Optional[Type[Any]] = None,
         config: Optional[RunnableConfig] = None,
         name: str = "LangGraph",
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
     ) -> None:
         self.nodes = nodes
         self.channels = channels or {}
@@ -265,13 +324,21 @@ class Pregel(PregelProtocol):
         self.interrupt_before_nodes = interrupt_before_nodes
         self.input_channels = input_channels
         self.step_timeout = step_timeout
+        self.stream_buffer_size = stream_buffer_size
+        self.stream_overflow = stream_overflow
+        self.stream_messages_flush_tokens = stream_messages_flush_tokens
+        self.stream_messages_flush_interval = stream_messages_flush_interval
+        self.stream_messages_metadata = stream_messages_metadata
+        self.trace_tasks = trace_tasks
         self.debug = debug if debug is not None else get_debug()
         self.checkpointer = checkpointer
         self.store = store
+        self.cache = cache
         self.retry_policy = retry_policy
         self.config_type = config_type
         self.config = config
         self.name = name
+        self.trigger_to_nodes = trigger_to_nodes or {}
         if auto_validate:
             self.validate()
 
@@ -304,6 +371,7 @@ class Pregel(PregelProtocol):
             self.interrupt_after_nodes,
             self.interrupt_before_nodes,
         )
+        self.trigger_to_nodes = build_trigger_to_nodes(self.nodes)
         return self
 
     @property
@@ -476,7 +544,8 @@ class Pregel(PregelProtocol):
             ),
             skip_context=True,
         ) as (channels, managed):
-            # tasks for this checkpoint
+            # tasks for this checkpoint, only executable ones if writes are
+            # to be applied to them
             next_tasks = prepare_next_tasks(
                 saved.checkpoint,
                 saved.pending_writes or [],
@@ -485,13 +554,13 @@ class Pregel(PregelProtocol):
                 managed,
                 saved.config,
                 saved.metadata.get("step", -1) + 1,
-                for_execution=True,
+                for_execution=apply_pending_writes,
                 store=self.store,
                 checkpointer=self.checkpointer or None,
                 manager=None,
             )
             # get the subgraphs
-            subgraphs = dict(self.get_subgraphs())
+            subgraphs = dict(self.get_subgraphs()) if next_tasks else {}
             parent_ns = saved.config[CONF].get(CONFIG_KEY_CHECKPOINT_NS, "")
             task_states: dict[str, Union[RunnableConfig, StateSnapshot]] = {}
             for task in next_tasks.values():
@@ -536,15 +605,25 @@ class Pregel(PregelProtocol):
                 for tid, k, v in saved.pending_writes:
                     if k in (ERROR, INTERRUPT, SCHEDULED):
                         continue
-                    if tid not in next_tasks:
+                    if not isinstance(
+                        exec_task := next_tasks.get(tid), PregelExecutableTask
+                    ):
                         continue
-                    next_tasks[tid].writes.append((k, v))
-                if tasks := [t for t in next_tasks.values() if t.writes]:
+                    exec_task.writes.append((k, v))
+                if tasks := [
+                    t
+                    for t in next_tasks.values()
+                    if isinstance(t, PregelExecutableTask) and t.writes
+                ]:
                     apply_writes(saved.checkpoint, channels, tasks, None)
             # assemble the state snapshot
             return StateSnapshot(
                 read_channels(channels, self.stream_channels_asis),
-                tuple(t.name for t in next_tasks.values() if not t.writes),
+                tuple(
+                    t.name
+                    for t in next_tasks.values()
+                    if not isinstance(t, PregelExecutableTask) or not t.writes
+                ),
                 patch_checkpoint_map(saved.config, saved.metadata),
                 saved.metadata,
                 saved.checkpoint["ts"],
@@ -588,7 +667,8 @@ class Pregel(PregelProtocol):
             channels,
             managed,
         ):
-            # tasks for this checkpoint
+            # tasks for this checkpoint, only executable ones if writes are
+            # to be applied to them
             next_tasks = prepare_next_tasks(
                 saved.checkpoint,
                 saved.pending_writes or [],
@@ -597,13 +677,15 @@ class Pregel(PregelProtocol):
                 managed,
                 saved.config,
                 saved.metadata.get("step", -1) + 1,
-                for_execution=True,
+                for_execution=apply_pending_writes,
                 store=self.store,
                 checkpointer=self.checkpointer or None,
                 manager=None,
             )
             # get the subgraphs
-            subgraphs = {n: g async for n, g in self.aget_subgraphs()}
+            subgraphs = (
+                {n: g async for n, g in self.aget_subgraphs()} if next_tasks else {}
+            )
             parent_ns = saved.config[CONF].get(CONFIG_KEY_CHECKPOINT_NS, "")
             task_states: dict[str, Union[RunnableConfig, StateSnapshot]] = {}
             for task in next_tasks.values():
@@ -648,15 +730,25 @@ class Pregel(PregelProtocol):
                 for tid, k, v in saved.pending_writes:
                     if k in (ERROR, INTERRUPT, SCHEDULED):
                         continue
-                    if tid not in next_tasks:
+                    if not isinstance(
+                        exec_task := next_tasks.get(tid), PregelExecutableTask
+                    ):
                         continue
-                    next_tasks[tid].writes.append((k, v))
-                if tasks := [t for t in next_tasks.values() if t.writes]:
+                    exec_task.writes.append((k, v))
+                if tasks := [
+                    t
+                    for t in next_tasks.values()
+                    if isinstance(t, PregelExecutableTask) and t.writes
+                ]:
                     apply_writes(saved.checkpoint, channels, tasks, None)
             # assemble the state snapshot
             return StateSnapshot(
                 read_channels(channels, self.stream_channels_asis),
-                tuple(t.name for t in next_tasks.values() if not t.writes),
+                tuple(
+                    t.name
+                    for t in next_tasks.values()
+                    if not isinstance(t, PregelExecutableTask) or not t.writes
+                ),
                 patch_checkpoint_map(saved.config, saved.metadata),
                 saved.metadata,
                 saved.checkpoint["ts"],
@@ -743,6 +835,85 @@ class Pregel(PregelProtocol):
             apply_pending_writes=CONFIG_KEY_CHECKPOINT_ID not in config[CONF],
         )
 
+    def get_states(
+        self, configs: Sequence[RunnableConfig], *, subgraphs: bool = False
+    ) -> list[StateSnapshot]:
+        """Get the current state of the graph for several configs, eg. one per thread.
+
+        Like `get_state` for each config, but the checkpoints are fetched from the
+        checkpointer with a single `get_tuples` call."""
+        snapshots: dict[int, StateSnapshot] = {}
+        batched: list[tuple[int, RunnableConfig]] = []
+        for idx, config in enumerate(configs):
+            configurable = ensure_config(config)[CONF]
+            if (
+                configurable.get(CONFIG_KEY_CHECKPOINT_NS)
+                or CONFIG_KEY_CHECKPOINTER in configurable
+            ):
+                # subgraph states are resolved one at a time
+                snapshots[idx] = self.get_state(config, subgraphs=subgraphs)
+            else:
+                batched.append(
+                    (idx, merge_configs(self.config, config) if self.config else config)
+                )
+        if batched:
+            checkpointer = self.checkpointer
+            if not isinstance(checkpointer, BaseCheckpointSaver):
+                raise ValueError("No checkpointer set")
+            saved = checkpointer.get_tuples([config for _, config in batched])
+            for (idx, config), saved_tuple in zip(batched, saved):
+                snapshots[idx] = self._prepare_state_snapshot(
+                    config,
+                    saved_tuple,
+                    recurse=checkpointer if subgraphs else None,
+                    apply_pending_writes=CONFIG_KEY_CHECKPOINT_ID not in config[CONF],
+                )
+        return [snapshots[idx] for idx in range(len(configs))]
+
+    async def aget_states(
+        self, configs: Sequence[RunnableConfig], *, subgraphs: bool = False
+    ) -> list[StateSnapshot]:
+        """Get the current state of the graph for several configs, eg. one per thread.
+
+        Like `aget_state` for each config, but the checkpoints are fetched from the
+        checkpointer with a single `aget_tuples` call, and the snapshots are
+        assembled concurrently."""
+        fallback: list[tuple[int, RunnableConfig]] = []
+        batched: list[tuple[int, RunnableConfig]] = []
+        for idx, config in enumerate(configs):
+            configurable = ensure_config(config)[CONF]
+            if (
+                configurable.get(CONFIG_KEY_CHECKPOINT_NS)
+                or CONFIG_KEY_CHECKPOINTER in configurable
+            ):
+                # subgraph states are resolved one at a time
+                fallback.append((idx, config))
+            else:
+                batched.append(
+                    (idx, merge_configs(self.config, config) if self.config else config)
+                )
+        if batched:
+            checkpointer = self.checkpointer
+            if not isinstance(checkpointer, BaseCheckpointSaver):
+                raise ValueError("No checkpointer set")
+            saved = await checkpointer.aget_tuples([config for _, config in batched])
+        else:
+            checkpointer, saved = None, []
+        results = await asyncio.gather(
+            *(
+                self._aprepare_state_snapshot(
+                    config,
+                    saved_tuple,
+                    recurse=checkpointer if subgraphs else None,
+                    apply_pending_writes=CONFIG_KEY_CHECKPOINT_ID not in config[CONF],
+                )
+                for (_, config), saved_tuple in zip(batched, saved)
+            ),
+            *(self.aget_state(config, subgraphs=subgraphs) for _, config in fallback),
+        )
+        snapshots = dict(zip([idx for idx, _ in (*batched, *fallback)], results))
+        return [snapshots[idx] for idx in range(len(configs))]
+
     def get_state_history(
         self,
         config: RunnableConfig,
@@ -785,13 +956,22 @@ class Pregel(PregelProtocol):
             config,
             {CONF: {CONFIG_KEY_CHECKPOINT_NS: checkpoint_ns}},
         )
-        # eagerly consume list() to avoid holding up the db cursor
-        for checkpoint_tuple in list(
-            checkpointer.list(config, before=before, limit=limit, filter=filter)
-        ):
-            yield self._prepare_state_snapshot(
-                checkpoint_tuple.config, checkpoint_tuple
+        # consume list() one page at a time to avoid holding up the db cursor,
+        # preparing each snapshot only when it is requested
+        while limit is None or limit > 0:
+            page_size = min(limit or HISTORY_PAGE_SIZE, HISTORY_PAGE_SIZE)
+            page = list(
+                checkpointer.list(config, before=before, limit=page_size, filter=filter)
             )
+            for checkpoint_tuple in page:
+                yield self._prepare_state_snapshot(
+                    checkpoint_tuple.config, checkpoint_tuple
+                )
+            if len(page) < page_size:
+                break
+            before = page[-1].config
+            if limit is not None:
+                limit -= len(page)
 
     async def aget_state_history(
         self,
@@ -836,16 +1016,25 @@ class Pregel(PregelProtocol):
             config,
             {CONF: {CONFIG_KEY_CHECKPOINT_NS: checkpoint_ns}},
         )
-        # eagerly consume list() to avoid holding up the db cursor
-        for checkpoint_tuple in [
-            c
-            async for c in checkpointer.alist(
-                config, before=before, limit=limit, filter=filter
-            )
-        ]:
-            yield await self._aprepare_state_snapshot(
-                checkpoint_tuple.config, checkpoint_tuple
-            )
+        # consume alist() one page at a time to avoid holding up the db cursor,
+        # preparing each snapshot only when it is requested
+        while limit is None or limit > 0:
+            page_size = min(limit or HISTORY_PAGE_SIZE, HISTORY_PAGE_SIZE)
+            page = [
+                c
+                async for c in checkpointer.alist(
+                    config, before=before, limit=page_size, filter=filter
+                )
+            ]
+            for checkpoint_tuple in page:
+                yield await self._aprepare_state_snapshot(
+                    checkpoint_tuple.config, checkpoint_tuple
+                )
+            if len(page) < page_size:
+                break
+            before = page[-1].config
+            if limit is not None:
+                limit -= len(page)
 
     def update_state(
         self,
@@ -1107,7 +1296,9 @@ class Pregel(PregelProtocol):
                 checkpoint, channels, [task], checkpointer.get_next_version
             )
             assert not mv_writes, "Can't write to SharedValues from update_state"
-            checkpoint = create_checkpoint(checkpoint, channels, step + 1)
+            checkpoint = create_checkpoint(
+                checkpoint, channels, step + 1, unchanged=channels.unloaded
+            )
             next_config = checkpointer.put(
                 checkpoint_config,
                 checkpoint,
@@ -1384,7 +1575,9 @@ class Pregel(PregelProtocol):
                 checkpoint, channels, [task], checkpointer.get_next_version
             )
             assert not mv_writes, "Can't write to SharedValues from update_state"
-            checkpoint = create_checkpoint(checkpoint, channels, step + 1)
+            checkpoint = create_checkpoint(
+                checkpoint, channels, step + 1, unchanged=channels.unloaded
+            )
             # save checkpoint, after applying writes
             next_config = await checkpointer.aput(
                 checkpoint_config,
@@ -1542,7 +1735,12 @@ class Pregel(PregelProtocol):
             ```
         """
 
-        stream = SyncQueue()
+        stream = SyncQueue(
+            self.stream_buffer_size or 0,
+            overflow=self.stream_overflow,
+            droppable=is_droppable_chunk,
+            merge=coalesce_chunks,
+        )
 
         def output() -> Iterator:
             while True:
@@ -1588,26 +1786,40 @@ class Pregel(PregelProtocol):
             # set up messages stream mode
             if "messages" in stream_modes:
                 run_manager.inheritable_handlers.append(
-                    StreamMessagesHandler(stream.put)
+                    StreamMessagesHandler(
+                        stream.put,
+                        flush_tokens=self.stream_messages_flush_tokens,
+                        flush_interval=self.stream_messages_flush_interval,
+                        metadata_mode=self.stream_messages_metadata,
+                    )
                 )
             # set up custom stream mode
             if "custom" in stream_modes:
                 config[CONF][CONFIG_KEY_STREAM_WRITER] = lambda c: stream.put(
                     ((), "custom", c)
                 )
+            # skip callback managers for tasks if there are no handlers to call
+            skip_callbacks = (
+                not run_manager.inheritable_handlers
+                if self.trace_tasks is None
+                else not self.trace_tasks
+            )
             with SyncPregelLoop(
                 input,
                 stream=StreamProtocol(stream.put, stream_modes),
                 config=config,
                 store=store,
+                cache=self.cache,
                 checkpointer=checkpointer,
                 nodes=self.nodes,
+                trigger_to_nodes=self.trigger_to_nodes,
                 specs=self.channels,
                 output_keys=output_keys,
                 stream_keys=self.stream_channels_asis,
                 interrupt_before=interrupt_before_,
                 interrupt_after=interrupt_after_,
                 manager=run_manager,
+                skip_callbacks=skip_callbacks,
                 debug=debug,
             ) as loop:
                 # create runner
@@ -1617,6 +1829,8 @@ class Pregel(PregelProtocol):
                     schedule_task=loop.accept_push,
                     node_finished=config[CONF].get(CONFIG_KEY_NODE_FINISHED),
                 )
+                # unblock producers waiting for room in the stream on exit
+                loop.stack.callback(stream.close)
                 # enable subgraph streaming
                 if subgraphs:
                     loop.config[CONF][CONFIG_KEY_STREAM] = loop.stream
@@ -1646,6 +1860,7 @@ class Pregel(PregelProtocol):
                 # channels are guaranteed to be immutable for the duration of the step,
                 # with channel updates applied only at the transition between steps
                 while loop.tick(input_keys=self.input_channels):
+                    loop.match_cached_writes()
                     for _ in runner.tick(
                         loop.tasks.values(),
                         timeout=self.step_timeout,
@@ -1753,12 +1968,23 @@ class Pregel(PregelProtocol):
             ```
         """
 
-        stream = AsyncQueue()
-        aioloop = asyncio.get_running_loop()
-        stream_put = cast(
-            Callable[[StreamChunk], None],
-            partial(aioloop.call_soon_threadsafe, stream.put_nowait),
+        stream = AsyncQueue(
+            self.stream_buffer_size or 0,
+            overflow=self.stream_overflow,
+            droppable=is_droppable_chunk,
+            merge=coalesce_chunks,
         )
+        aioloop = asyncio.get_running_loop()
+
+        def stream_put(chunk: StreamChunk) -> None:
+            if stream.maxsize <= 0:
+                aioloop.call_soon_threadsafe(stream.put_nowait, chunk)
+            elif _in_event_loop(aioloop):
+                # producers in the event loop wait for room afterwards, if they can
+                stream.put_nowait(chunk)
+            else:
+                # wait for room in the stream, when called from another thread
+                asyncio.run_coroutine_threadsafe(stream.put(chunk), aioloop).result()
 
         def output() -> Iterator:
             while True:
@@ -1813,28 +2039,45 @@ class Pregel(PregelProtocol):
             # set up messages stream mode
             if "messages" in stream_modes:
                 run_manager.inheritable_handlers.append(
-                    StreamMessagesHandler(stream_put)
+                    StreamMessagesHandler(
+                        stream_put,
+                        flush_tokens=self.stream_messages_flush_tokens,
+                        flush_interval=self.stream_messages_flush_interval,
+                        metadata_mode=self.stream_messages_metadata,
+                    )
                 )
+                # make models streaming in the event loop wait for room
+                if stream.maxsize > 0:
+                    run_manager.inheritable_handlers.append(
+                        StreamBackpressureHandler(aioloop, stream.wait_for_room)
+                    )
             # set up custom stream mode
             if "custom" in stream_modes:
-                config[CONF][CONFIG_KEY_STREAM_WRITER] = (
-                    lambda c: aioloop.call_soon_threadsafe(
-                        stream.put_nowait, ((), "custom", c)
-                    )
+                config[CONF][CONFIG_KEY_STREAM_WRITER] = lambda c: stream_put(
+                    ((), "custom", c)
                 )
+            # skip callback managers for tasks if there are no handlers to call
+            skip_callbacks = (
+                not run_manager.inheritable_handlers
+                if self.trace_tasks is None
+                else not self.trace_tasks
+            )
             async with AsyncPregelLoop(
                 input,
                 stream=StreamProtocol(stream.put_nowait, stream_modes),
                 config=config,
                 store=store,
+                cache=self.cache,
                 checkpointer=checkpointer,
                 nodes=self.nodes,
+                trigger_to_nodes=self.trigger_to_nodes,
                 specs=self.channels,
                 output_keys=output_keys,
                 stream_keys=self.stream_channels_asis,
                 interrupt_before=interrupt_before_,
                 interrupt_after=interrupt_after_,
                 manager=run_manager,
+                skip_callbacks=skip_callbacks,
                 debug=debug,
             ) as loop:
                 # create runner
@@ -1845,6 +2088,8 @@ class Pregel(PregelProtocol):
                     use_astream=do_stream is not None,
                     node_finished=config[CONF].get(CONFIG_KEY_NODE_FINISHED),
                 )
+                # unblock producers waiting for room in the stream on exit
+                loop.stack.callback(stream.close)
                 # enable subgraph streaming
                 if subgraphs:
                     loop.config[CONF][CONFIG_KEY_STREAM] = StreamProtocol(
@@ -1864,6 +2109,7 @@ class Pregel(PregelProtocol):
                 # channels are guaranteed to be immutable for the duration of the step,
                 # with channel updates applied only at the transition between steps
                 while loop.tick(input_keys=self.input_channels):
+                    await loop.amatch_cached_writes()
                     async for _ in runner.atick(
                         loop.tasks.values(),
                         timeout=self.step_timeout,
@@ -1997,3 +2243,10 @@ class Pregel(PregelProtocol):
             return latest
         else:
             return chunks
+
+
+def _in_event_loop(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
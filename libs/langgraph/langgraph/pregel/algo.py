@@ -31,6 +31,7 @@ from langgraph.checkpoint.base import (
     copy_checkpoint,
 )
 from langgraph.constants import (
+    CACHE_NS_WRITES,
     CONF,
     CONFIG_KEY_CHECKPOINT_ID,
     CONFIG_KEY_CHECKPOINT_MAP,
@@ -39,6 +40,7 @@ from langgraph.constants import (
     CONFIG_KEY_READ,
     CONFIG_KEY_SCRATCHPAD,
     CONFIG_KEY_SEND,
+    CONFIG_KEY_SKIP_CALLBACKS,
     CONFIG_KEY_STORE,
     CONFIG_KEY_TASK_ID,
     CONFIG_KEY_WRITES,
@@ -60,11 +62,17 @@ from langgraph.errors import EmptyChannelError, InvalidUpdateError
 from langgraph.managed.base import ManagedValueMapping
 from langgraph.pregel.io import read_channel, read_channels
 from langgraph.pregel.log import logger
-from langgraph.pregel.manager import ChannelsManager
+from langgraph.pregel.manager import ChannelsManager, LazyChannels
 from langgraph.pregel.read import PregelNode
 from langgraph.store.base import BaseStore
-from langgraph.types import All, LoopProtocol, PregelExecutableTask, PregelTask
-from langgraph.utils.config import merge_configs, patch_config
+from langgraph.types import (
+    All,
+    CacheKey,
+    LoopProtocol,
+    PregelExecutableTask,
+    PregelTask,
+)
+from langgraph.utils.config import layer_config
 
 GetNextVersion = Callable[[Optional[V], BaseChannel], V]
 SUPPORTS_EXC_NOTES = sys.version_info >= (3, 11)
@@ -157,13 +165,19 @@ def local_read(
         updated = set(select).intersection(c for c, _ in task.writes)
     if fresh and updated:
         with ChannelsManager(
-            {k: v for k, v in channels.items() if k in updated},
+            {k: channels[k] for k in updated if k in channels},
             checkpoint,
             LoopProtocol(config=config, step=step, stop=step + 1),
             skip_context=True,
         ) as (local_channels, _):
             apply_writes(copy_checkpoint(checkpoint), local_channels, [task], None)
-            values = read_channels({**channels, **local_channels}, select)
+            values = read_channels(
+                {
+                    k: local_channels[k] if k in local_channels else channels[k]
+                    for k in ([select] if isinstance(select, str) else select)
+                },
+                select,
+            )
     else:
         values = read_channels(channels, select)
     if managed_keys:
@@ -197,10 +211,15 @@ def apply_writes(
     channels: Mapping[str, BaseChannel],
     tasks: Iterable[WritesProtocol],
     get_next_version: Optional[GetNextVersion],
+    notify_channels: Optional[Iterable[str]] = None,
 ) -> dict[str, list[Any]]:
     """Apply writes from a set of tasks (usually the tasks from a Pregel step)
     to the checkpoint and channels, and return managed values writes to be applied
-    externally."""
+    externally.
+
+    `notify_channels` can be passed to precompute the channels that need to be
+    notified of a new step (see `BaseChannel.notify_on_step`), otherwise they are
+    looked up in `channels`."""
     # sort tasks on path, to ensure deterministic order for update application
     # any path parts after the 3rd are ignored for sorting
     # (we use them for eg. task ids which aren't good for sorting)
@@ -275,7 +294,9 @@ def apply_writes(
 
     # Channels that weren't updated in this step are notified of a new step
     if bump_step:
-        for chan in channels:
+        if notify_channels is None:
+            notify_channels = get_notify_channels(channels)
+        for chan in notify_channels:
             if chan not in updated_channels:
                 if channels[chan].update([]) and get_next_version is not None:
                     checkpoint["channel_versions"][chan] = get_next_version(
@@ -287,6 +308,25 @@ def apply_writes(
     return pending_writes_by_managed
 
 
+def get_notify_channels(channels: Mapping[str, BaseChannel]) -> list[str]:
+    """Get the channels that need to be notified of each new step."""
+    if isinstance(channels, LazyChannels):
+        # channels are of the same type as their specs, no need to load them
+        channels = channels.specs
+    return [k for k, v in channels.items() if v.notify_on_step]
+
+
+def build_trigger_to_nodes(
+    processes: Mapping[str, PregelNode],
+) -> dict[str, list[str]]:
+    """Build an index from each channel to the nodes it triggers, in graph order."""
+    trigger_to_nodes: dict[str, list[str]] = defaultdict(list)
+    for name, proc in processes.items():
+        for chan in dict.fromkeys(proc.triggers):
+            trigger_to_nodes[chan].append(name)
+    return dict(trigger_to_nodes)
+
+
 @overload
 def prepare_next_tasks(
     checkpoint: Checkpoint,
@@ -301,6 +341,9 @@ def prepare_next_tasks(
     store: Literal[None] = None,
     checkpointer: Literal[None] = None,
     manager: Literal[None] = None,
+    skip_callbacks: bool = False,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> dict[str, PregelTask]: ...
 
 
@@ -318,9 +361,32 @@ def prepare_next_tasks(
     store: Optional[BaseStore],
     checkpointer: Optional[BaseCheckpointSaver],
     manager: Union[None, ParentRunManager, AsyncParentRunManager],
+    skip_callbacks: bool = False,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> dict[str, PregelExecutableTask]: ...
 
 
+@overload
+def prepare_next_tasks(
+    checkpoint: Checkpoint,
+    pending_writes: Sequence[PendingWrite],
+    processes: Mapping[str, PregelNode],
+    channels: Mapping[str, BaseChannel],
+    managed: ManagedValueMapping,
+    config: RunnableConfig,
+    step: int,
+    *,
+    for_execution: bool,
+    store: Optional[BaseStore],
+    checkpointer: Optional[BaseCheckpointSaver],
+    manager: Union[None, ParentRunManager, AsyncParentRunManager],
+    skip_callbacks: bool = False,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    updated_channels: Optional[set[str]] = None,
+) -> Union[dict[str, PregelTask], dict[str, PregelExecutableTask]]: ...
+
+
 def prepare_next_tasks(
     checkpoint: Checkpoint,
     pending_writes: Sequence[PendingWrite],
@@ -334,11 +400,29 @@ def prepare_next_tasks(
     store: Optional[BaseStore] = None,
     checkpointer: Optional[BaseCheckpointSaver] = None,
     manager: Union[None, ParentRunManager, AsyncParentRunManager] = None,
+    skip_callbacks: bool = False,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> Union[dict[str, PregelTask], dict[str, PregelExecutableTask]]:
     """Prepare the set of tasks that will make up the next Pregel step.
     This is the union of all PUSH tasks (Sends) and PULL tasks (nodes triggered
-    by edges)."""
+    by edges).
+
+    When both `trigger_to_nodes` and `updated_channels` are passed, only the nodes
+    subscribed to a channel updated in the previous step are considered for PULL
+    tasks, instead of checking every node in `processes`.
+
+    When `skip_callbacks` is True, tasks are run without callback managers, and
+    `manager` is not used."""
     tasks: list[Union[PregelTask, PregelExecutableTask]] = []
+    # index pending writes by task id, shared by all tasks prepared below
+    pending_writes_by_task = _pending_writes_by_task(pending_writes)
+    # config values shared by all tasks prepared below
+    step_config = (
+        _step_config(config, checkpoint, store, checkpointer, skip_callbacks)
+        if for_execution
+        else None
+    )
     # Consume pending_sends from previous step (legacy version of Send)
     for idx, _ in enumerate(checkpoint["pending_sends"]):  # TODO: remove branch in 1.0
         if task := prepare_single_task(
@@ -346,6 +430,8 @@ def prepare_next_tasks(
             None,
             checkpoint=checkpoint,
             pending_writes=pending_writes,
+            pending_writes_by_task=pending_writes_by_task,
+            step_config=step_config,
             processes=processes,
             channels=channels,
             managed=managed,
@@ -355,16 +441,25 @@ def prepare_next_tasks(
             store=store,
             checkpointer=checkpointer,
             manager=manager,
+            skip_callbacks=skip_callbacks,
         ):
             tasks.append(task)
     # Check if any processes should be run in next step
     # If so, prepare the values to be passed to them
-    for name in processes:
+    if updated_channels is not None and trigger_to_nodes:
+        candidate_nodes: Iterable[str] = _triggered_nodes(
+            processes, trigger_to_nodes, updated_channels
+        )
+    else:
+        candidate_nodes = processes
+    for name in candidate_nodes:
         if task := prepare_single_task(
             (PULL, name),
             None,
             checkpoint=checkpoint,
             pending_writes=pending_writes,
+            pending_writes_by_task=pending_writes_by_task,
+            step_config=step_config,
             processes=processes,
             channels=channels,
             managed=managed,
@@ -374,21 +469,20 @@ def prepare_next_tasks(
             store=store,
             checkpointer=checkpointer,
             manager=manager,
+            skip_callbacks=skip_callbacks,
         ):
             tasks.append(task)
     # Consume pending Sends from this step (new version of Send)
     if any(c == PUSH for _, c, _ in pending_writes):
         # group writes by task id
-        grouped_by_task = defaultdict(list)
-        for tid, c, _ in pending_writes:
-            grouped_by_task[tid].append(c)
+        grouped_by_task = dict(pending_writes_by_task)
         # prepare send tasks from grouped writes
         # 1. start from sends originating from existing tasks
         tidx = 0
         while tidx < len(tasks):
             task = tasks[tidx]
             if twrites := grouped_by_task.pop(task.id, None):
-                for idx, c in enumerate(twrites):
+                for idx, (_, c, _) in enumerate(twrites):
                     if c != PUSH:
                         continue
                     if next_task := prepare_single_task(
@@ -396,6 +490,8 @@ def prepare_next_tasks(
                         None,
                         checkpoint=checkpoint,
                         pending_writes=pending_writes,
+                        pending_writes_by_task=pending_writes_by_task,
+                        step_config=step_config,
                         processes=processes,
                         channels=channels,
                         managed=managed,
@@ -405,6 +501,7 @@ def prepare_next_tasks(
                         store=store,
                         checkpointer=checkpointer,
                         manager=manager,
+                        skip_callbacks=skip_callbacks,
                     ):
                         tasks.append(next_task)
             tidx += 1
@@ -413,7 +510,7 @@ def prepare_next_tasks(
         # 2. create new tasks for remaining sends (eg. from update_state)
         for tid, writes in grouped_by_task.items():
             task = task_map.get(tid)
-            for idx, c in enumerate(writes):
+            for idx, (_, c, _) in enumerate(writes):
                 if c != PUSH:
                     continue
                 if next_task := prepare_single_task(
@@ -421,6 +518,8 @@ def prepare_next_tasks(
                     None,
                     checkpoint=checkpoint,
                     pending_writes=pending_writes,
+                    pending_writes_by_task=pending_writes_by_task,
+                    step_config=step_config,
                     processes=processes,
                     channels=channels,
                     managed=managed,
@@ -430,6 +529,7 @@ def prepare_next_tasks(
                     store=store,
                     checkpointer=checkpointer,
                     manager=manager,
+                    skip_callbacks=skip_callbacks,
                 ):
                     task_map[next_task.id] = next_task
     else:
@@ -452,12 +552,21 @@ def prepare_single_task(
     store: Optional[BaseStore] = None,
     checkpointer: Optional[BaseCheckpointSaver] = None,
     manager: Union[None, ParentRunManager, AsyncParentRunManager] = None,
+    skip_callbacks: bool = False,
+    pending_writes_by_task: Optional[Mapping[str, Sequence[PendingWrite]]] = None,
+    step_config: Optional[RunnableConfig] = None,
 ) -> Union[None, PregelTask, PregelExecutableTask]:
     """Prepares a single task for the next Pregel step, given a task path, which
-    uniquely identifies a PUSH or PULL task within the graph."""
+    uniquely identifies a PUSH or PULL task within the graph.
+
+    `pending_writes_by_task` is `pending_writes` grouped by task id, and
+    `step_config` the config layer shared by all tasks of the step, both are
+    built here when not passed in."""
     checkpoint_id = UUID(checkpoint["id"]).bytes
     configurable = config.get(CONF, {})
     parent_ns = configurable.get(CONFIG_KEY_CHECKPOINT_NS, "")
+    if pending_writes_by_task is None:
+        pending_writes_by_task = _pending_writes_by_task(pending_writes)
 
     if task_path[0] == PUSH:
         if len(task_path) == 2:  # TODO: remove branch in 1.0
@@ -494,7 +603,7 @@ def prepare_single_task(
             # new PUSH tasks, executed in superstep n
             # (PUSH, parent task path, idx of PUSH write, id of parent task)
             task_path_t = cast(tuple[str, tuple, int, str], task_path)
-            writes_for_path = [w for w in pending_writes if w[0] == task_path_t[3]]
+            writes_for_path = pending_writes_by_task.get(task_path_t[3], ())
             if task_path_t[2] >= len(writes_for_path):
                 logger.warning(
                     f"Ignoring invalid write index {task_path[2]} in pending writes"
@@ -549,13 +658,18 @@ def prepare_single_task(
                     packet.arg,
                     node,
                     writes,
-                    patch_config(
-                        merge_configs(
-                            config, {"metadata": metadata, "tags": proc.tags}
+                    layer_config(
+                        step_config
+                        or _step_config(
+                            config, checkpoint, store, checkpointer, skip_callbacks
                         ),
+                        metadata=metadata,
+                        tags=proc.tags,
                         run_name=packet.node,
                         callbacks=(
-                            manager.get_child(f"graph:step:{step}") if manager else None
+                            manager.get_child(f"graph:step:{step}")
+                            if manager and not skip_callbacks
+                            else None
                         ),
                         configurable={
                             CONFIG_KEY_TASK_ID: task_id,
@@ -576,34 +690,26 @@ def prepare_single_task(
                                 ),
                                 config,
                             ),
-                            CONFIG_KEY_STORE: (
-                                store or configurable.get(CONFIG_KEY_STORE)
-                            ),
-                            CONFIG_KEY_CHECKPOINTER: (
-                                checkpointer
-                                or configurable.get(CONFIG_KEY_CHECKPOINTER)
-                            ),
-                            CONFIG_KEY_CHECKPOINT_MAP: {
-                                **configurable.get(CONFIG_KEY_CHECKPOINT_MAP, {}),
-                                parent_ns: checkpoint["id"],
-                            },
-                            CONFIG_KEY_CHECKPOINT_ID: None,
                             CONFIG_KEY_CHECKPOINT_NS: task_checkpoint_ns,
                             CONFIG_KEY_WRITES: [
-                                w
-                                for w in pending_writes
-                                + configurable.get(CONFIG_KEY_WRITES, [])
-                                if w[0] in (NULL_TASK_ID, task_id)
+                                *pending_writes_by_task.get(NULL_TASK_ID, ()),
+                                *pending_writes_by_task.get(task_id, ()),
+                                *(
+                                    w
+                                    for w in configurable.get(CONFIG_KEY_WRITES, [])
+                                    if w[0] in (NULL_TASK_ID, task_id)
+                                ),
                             ],
                             CONFIG_KEY_SCRATCHPAD: {},
                         },
                     ),
                     triggers,
                     proc.retry_policy,
-                    None,
+                    proc.cache_policy,
                     task_id,
                     task_path,
                     writers=proc.flat_writers,
+                    cache_key=_cache_key(proc, packet.node, parent_ns, packet.arg),
                 )
 
         else:
@@ -672,14 +778,17 @@ def prepare_single_task(
                         val,
                         node,
                         writes,
-                        patch_config(
-                            merge_configs(
-                                config, {"metadata": metadata, "tags": proc.tags}
+                        layer_config(
+                            step_config
+                            or _step_config(
+                                config, checkpoint, store, checkpointer, skip_callbacks
                             ),
+                            metadata=metadata,
+                            tags=proc.tags,
                             run_name=name,
                             callbacks=(
                                 manager.get_child(f"graph:step:{step}")
-                                if manager
+                                if manager and not skip_callbacks
                                 else None
                             ),
                             configurable={
@@ -699,39 +808,72 @@ def prepare_single_task(
                                     PregelTaskWrites(task_path, name, writes, triggers),
                                     config,
                                 ),
-                                CONFIG_KEY_STORE: (
-                                    store or configurable.get(CONFIG_KEY_STORE)
-                                ),
-                                CONFIG_KEY_CHECKPOINTER: (
-                                    checkpointer
-                                    or configurable.get(CONFIG_KEY_CHECKPOINTER)
-                                ),
-                                CONFIG_KEY_CHECKPOINT_MAP: {
-                                    **configurable.get(CONFIG_KEY_CHECKPOINT_MAP, {}),
-                                    parent_ns: checkpoint["id"],
-                                },
-                                CONFIG_KEY_CHECKPOINT_ID: None,
                                 CONFIG_KEY_CHECKPOINT_NS: task_checkpoint_ns,
                                 CONFIG_KEY_WRITES: [
-                                    w
-                                    for w in pending_writes
-                                    + configurable.get(CONFIG_KEY_WRITES, [])
-                                    if w[0] in (NULL_TASK_ID, task_id)
+                                    *pending_writes_by_task.get(NULL_TASK_ID, ()),
+                                    *pending_writes_by_task.get(task_id, ()),
+                                    *(
+                                        w
+                                        for w in configurable.get(CONFIG_KEY_WRITES, [])
+                                        if w[0] in (NULL_TASK_ID, task_id)
+                                    ),
                                 ],
                                 CONFIG_KEY_SCRATCHPAD: {},
                             },
                         ),
                         triggers,
                         proc.retry_policy,
-                        None,
+                        proc.cache_policy,
                         task_id,
                         task_path,
                         writers=proc.flat_writers,
+                        cache_key=_cache_key(proc, name, parent_ns, val),
                     )
             else:
                 return PregelTask(task_id, name, task_path)
 
 
+def _step_config(
+    config: RunnableConfig,
+    checkpoint: Checkpoint,
+    store: Optional[BaseStore],
+    checkpointer: Optional[BaseCheckpointSaver],
+    skip_callbacks: bool,
+) -> RunnableConfig:
+    """Layer the configurable values shared by all tasks of a step over the
+    graph config, for the task configs to be layered over in turn."""
+    configurable = config.get(CONF, {})
+    step_config = layer_config(
+        config,
+        configurable={
+            CONFIG_KEY_STORE: store or configurable.get(CONFIG_KEY_STORE),
+            CONFIG_KEY_CHECKPOINTER: (
+                checkpointer or configurable.get(CONFIG_KEY_CHECKPOINTER)
+            ),
+            CONFIG_KEY_CHECKPOINT_MAP: {
+                **configurable.get(CONFIG_KEY_CHECKPOINT_MAP, {}),
+                configurable.get(CONFIG_KEY_CHECKPOINT_NS, ""): checkpoint["id"],
+            },
+            CONFIG_KEY_CHECKPOINT_ID: None,
+            CONFIG_KEY_SKIP_CALLBACKS: skip_callbacks,
+        },
+    )
+    if skip_callbacks:
+        # don't let runnables within tasks start runs for the graph's callbacks
+        step_config.pop("callbacks", None)
+    return step_config
+
+
+def _pending_writes_by_task(
+    pending_writes: Sequence[PendingWrite],
+) -> dict[str, list[PendingWrite]]:
+    """Group pending writes by task id, keeping their relative order."""
+    grouped: defaultdict[str, list[PendingWrite]] = defaultdict(list)
+    for w in pending_writes:
+        grouped[w[0]].append(w)
+    return grouped
+
+
 def _proc_input(
     proc: PregelNode,
     managed: ManagedValueMapping,
@@ -778,6 +920,45 @@ def _proc_input(
     yield val
 
 
+def _triggered_nodes(
+    processes: Mapping[str, PregelNode],
+    trigger_to_nodes: Mapping[str, Sequence[str]],
+    updated_channels: set[str],
+) -> Sequence[str]:
+    """Get the nodes subscribed to any of the updated channels, in graph order."""
+    if len(updated_channels) == 1:
+        return trigger_to_nodes.get(next(iter(updated_channels)), EMPTY_SEQ)
+    triggered = {
+        node
+        for chan in updated_channels
+        for node in trigger_to_nodes.get(chan, EMPTY_SEQ)
+    }
+    if not triggered:
+        return EMPTY_SEQ
+    return [node for node in processes if node in triggered]
+
+
+def _cache_key(
+    proc: PregelNode, name: str, parent_ns: str, input: Any
+) -> Optional[CacheKey]:
+    """Compute the cache key for a task, if the node has a cache policy."""
+    if proc.cache_policy is None:
+        return None
+    key = proc.cache_policy.key_func(input)
+    return CacheKey(
+        ns=(
+            CACHE_NS_WRITES,
+            # drop task ids from the namespace, so it is stable across runs
+            *(part.split(NS_END)[0] for part in parent_ns.split(NS_SEP) if part),
+            name,
+        ),
+        key=sha1(
+            key.encode() if isinstance(key, str) else key, usedforsecurity=False
+        ).hexdigest(),
+        ttl=proc.cache_policy.ttl,
+    )
+
+
 def _uuid5_str(namespace: bytes, *parts: str) -> str:
     """Generate a UUID from the SHA-1 hash of a namespace UUID and a name."""
 
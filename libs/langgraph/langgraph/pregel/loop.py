@@ -1,5 +1,6 @@
 import asyncio
 import concurrent.futures
+import threading
 from collections import defaultdict, deque
 from contextlib import AsyncExitStack, ExitStack
 from types import TracebackType
@@ -24,7 +25,9 @@ from langchain_core.callbacks import AsyncParentRunManager, ParentRunManager
 from langchain_core.runnables import RunnableConfig
 from typing_extensions import ParamSpec, Self
 
+from langgraph.cache.base import BaseCache, FullKey
 from langgraph.channels.base import BaseChannel
+from langgraph.channels.messages import DeltaMessages
 from langgraph.checkpoint.base import (
     WRITES_IDX_MAP,
     BaseCheckpointSaver,
@@ -76,6 +79,7 @@ from langgraph.pregel.algo import (
     GetNextVersion,
     PregelTaskWrites,
     apply_writes,
+    get_notify_channels,
     increment,
     prepare_next_tasks,
     prepare_single_task,
@@ -102,7 +106,11 @@ from langgraph.pregel.io import (
     read_channels,
     single,
 )
-from langgraph.pregel.manager import AsyncChannelsManager, ChannelsManager
+from langgraph.pregel.manager import (
+    AsyncChannelsManager,
+    ChannelsManager,
+    LazyChannels,
+)
 from langgraph.pregel.read import PregelNode
 from langgraph.pregel.utils import get_new_channel_versions
 from langgraph.store.base import BaseStore
@@ -119,6 +127,8 @@ from langgraph.utils.config import patch_configurable
 V = TypeVar("V")
 P = ParamSpec("P")
 
+WritesT = Sequence[tuple[str, Any]]
+
 INPUT_DONE = object()
 INPUT_RESUMING = object()
 SPECIAL_CHANNELS = (ERROR, INTERRUPT, SCHEDULED)
@@ -133,22 +143,41 @@ def DuplexStream(*streams: StreamProtocol) -> StreamProtocol:
     return StreamProtocol(__call__, {mode for s in streams for mode in s.modes})
 
 
+def _index_pending_writes(
+    pending_writes: Sequence[PendingWrite],
+) -> dict[tuple[str, str], int]:
+    """Map (task id, channel) to the position of the first write of each task to
+    a special channel, ie. the writes replaced rather than appended by
+    `PregelLoop.put_writes`."""
+    idx: dict[tuple[str, str], int] = {}
+    for i, (tid, c, _) in enumerate(pending_writes):
+        if c in WRITES_IDX_MAP:
+            idx.setdefault((tid, c), i)
+    return idx
+
+
 class PregelLoop(LoopProtocol):
     input: Optional[Any]
     checkpointer: Optional[BaseCheckpointSaver]
     nodes: Mapping[str, PregelNode]
+    trigger_to_nodes: Mapping[str, Sequence[str]]
     specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]]
     output_keys: Union[str, Sequence[str]]
     stream_keys: Union[str, Sequence[str]]
     skip_done_tasks: bool
     is_nested: bool
     manager: Union[None, AsyncParentRunManager, ParentRunManager]
+    skip_callbacks: bool
     interrupt_after: Union[All, Sequence[str]]
     interrupt_before: Union[All, Sequence[str]]
 
     checkpointer_get_next_version: GetNextVersion
-    checkpointer_put_writes: Optional[
-        Callable[[RunnableConfig, Sequence[tuple[str, Any]], str], Any]
+    checkpointer_put_writes_many: Optional[
+        Callable[[Sequence[tuple[RunnableConfig, Sequence[tuple[str, Any]], str]]], Any]
+    ]
+    cache: Optional[BaseCache[WritesT]]
+    cache_set: Optional[
+        Callable[[Mapping[FullKey, tuple[WritesT, Optional[int]]]], Any]
     ]
     _checkpointer_put_after_previous: Optional[
         Callable[
@@ -162,16 +191,22 @@ class PregelLoop(LoopProtocol):
             Any,
         ]
     ]
+    _put_writes_queue: deque[tuple[RunnableConfig, Sequence[tuple[str, Any]], str]]
+    _put_writes_lock: threading.Lock
+    _put_writes_flushing: bool
     submit: Submit
-    channels: Mapping[str, BaseChannel]
+    channels: LazyChannels
+    notify_channels: Sequence[str]
     managed: ManagedValueMapping
     checkpoint: Checkpoint
     checkpoint_ns: tuple[str, ...]
     checkpoint_config: RunnableConfig
     checkpoint_metadata: CheckpointMetadata
     checkpoint_pending_writes: List[PendingWrite]
+    _pending_writes_idx: dict[tuple[str, str], int]
     checkpoint_previous_versions: dict[str, Union[str, float, int]]
     prev_checkpoint_config: Optional[RunnableConfig]
+    updated_channels: Optional[set[str]] = None
 
     status: Literal[
         "pending", "done", "interrupt_before", "interrupt_after", "out_of_steps"
@@ -190,13 +225,16 @@ class PregelLoop(LoopProtocol):
         config: RunnableConfig,
         store: Optional[BaseStore],
         checkpointer: Optional[BaseCheckpointSaver],
+        cache: Optional[BaseCache[WritesT]] = None,
         nodes: Mapping[str, PregelNode],
         specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]],
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
         output_keys: Union[str, Sequence[str]],
         stream_keys: Union[str, Sequence[str]],
         interrupt_after: Union[All, Sequence[str]] = EMPTY_SEQ,
         interrupt_before: Union[All, Sequence[str]] = EMPTY_SEQ,
         manager: Union[None, AsyncParentRunManager, ParentRunManager] = None,
+        skip_callbacks: bool = False,
         check_subgraphs: bool = True,
         debug: bool = False,
     ) -> None:
@@ -209,13 +247,16 @@ class PregelLoop(LoopProtocol):
         )
         self.input = input
         self.checkpointer = checkpointer
+        self.cache = cache
         self.nodes = nodes
+        self.trigger_to_nodes = trigger_to_nodes or {}
         self.specs = specs
         self.output_keys = output_keys
         self.stream_keys = stream_keys
         self.interrupt_after = interrupt_after
         self.interrupt_before = interrupt_before
         self.manager = manager
+        self.skip_callbacks = skip_callbacks
         self.is_nested = CONFIG_KEY_TASK_ID in self.config.get(CONF, {})
         self.skip_done_tasks = (
             CONFIG_KEY_CHECKPOINT_ID not in config[CONF]
@@ -259,8 +300,13 @@ class PregelLoop(LoopProtocol):
             else ()
         )
         self.prev_checkpoint_config = None
+        self._put_writes_queue = deque()
+        self._put_writes_lock = threading.Lock()
+        self._put_writes_flushing = False
 
-    def put_writes(self, task_id: str, writes: Sequence[tuple[str, Any]]) -> None:
+    def put_writes(
+        self, task_id: str, writes: Sequence[tuple[str, Any]], *, cached: bool = False
+    ) -> None:
         """Put writes for a task, to be read by the next tick."""
         if not writes:
             return
@@ -269,42 +315,54 @@ class PregelLoop(LoopProtocol):
             writes = list({w[0]: w for w in writes}.values())
         # save writes
         for c, v in writes:
-            if (
-                c in WRITES_IDX_MAP
-                and (
-                    idx := next(
-                        (
-                            i
-                            for i, w in enumerate(self.checkpoint_pending_writes)
-                            if w[0] == task_id and w[1] == c
-                        ),
-                        None,
-                    )
-                )
-                is not None
-            ):
+            if c not in WRITES_IDX_MAP:
+                self.checkpoint_pending_writes.append((task_id, c, v))
+            elif (idx := self._pending_writes_idx.get((task_id, c))) is not None:
                 self.checkpoint_pending_writes[idx] = (task_id, c, v)
             else:
+                self._pending_writes_idx[(task_id, c)] = len(
+                    self.checkpoint_pending_writes
+                )
                 self.checkpoint_pending_writes.append((task_id, c, v))
-        if self.checkpointer_put_writes is not None:
-            self.submit(
-                self.checkpointer_put_writes,
-                {
-                    **self.checkpoint_config,
-                    CONF: {
-                        **self.checkpoint_config[CONF],
-                        CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
-                            CONFIG_KEY_CHECKPOINT_NS, ""
-                        ),
-                        CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
-                    },
+        if self.checkpointer_put_writes_many is not None:
+            config: RunnableConfig = {
+                **self.checkpoint_config,
+                CONF: {
+                    **self.checkpoint_config[CONF],
+                    CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
+                        CONFIG_KEY_CHECKPOINT_NS, ""
+                    ),
+                    CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
                 },
-                writes,
-                task_id,
-            )
+            }
+            # queue the writes, and start a flush if none is in flight, otherwise
+            # the running flush will pick them up in its next batch
+            with self._put_writes_lock:
+                self._put_writes_queue.append((config, writes, task_id))
+                flush = not self._put_writes_flushing
+                self._put_writes_flushing = True
+            if flush:
+                self.submit(self._flush_writes)
+        # save writes to cache
+        if not cached and self.cache_set is not None and hasattr(self, "tasks"):
+            if (
+                (task := self.tasks.get(task_id)) is not None
+                and task.cache_key is not None
+                and all(w[0] not in (ERROR, INTERRUPT, RESUME) for w in writes)
+            ):
+                self.submit(
+                    self.cache_set,
+                    {
+                        (task.cache_key.ns, task.cache_key.key): (
+                            list(writes),
+                            task.cache_key.ttl,
+                        )
+                    },
+                    __reraise_on_exit__=False,
+                )
         # output writes
         if hasattr(self, "tasks"):
-            self._output_writes(task_id, writes)
+            self._output_writes(task_id, writes, cached=cached)
 
     def accept_push(
         self, task: PregelExecutableTask, write_idx: int
@@ -333,6 +391,7 @@ class PregelLoop(LoopProtocol):
                 store=self.store,
                 checkpointer=self.checkpointer,
                 manager=self.manager,
+                skip_callbacks=self.skip_callbacks,
             ),
         ):
             # don't start if we should interrupt *before* the new task
@@ -383,11 +442,13 @@ class PregelLoop(LoopProtocol):
                     ),
                 )
             # all tasks have finished
+            prev_versions = self.checkpoint["channel_versions"].copy()
             mv_writes = apply_writes(
                 self.checkpoint,
                 self.channels,
                 self.tasks.values(),
                 self.checkpointer_get_next_version,
+                self.notify_channels,
             )
             # apply writes to managed values
             for key, values in mv_writes.items():
@@ -398,8 +459,15 @@ class PregelLoop(LoopProtocol):
             )
             # clear pending writes
             self.checkpoint_pending_writes.clear()
+            self._pending_writes_idx.clear()
             # "not skip_done_tasks" only applies to first tick after resuming
             self.skip_done_tasks = True
+            # only nodes subscribed to updated channels can be triggered next
+            self.updated_channels = set(
+                get_new_channel_versions(
+                    prev_versions, self.checkpoint["channel_versions"]
+                )
+            )
             # save checkpoint
             self._put_checkpoint(
                 {
@@ -435,9 +503,12 @@ class PregelLoop(LoopProtocol):
                 self.channels,
                 [PregelTaskWrites((), INPUT, null_writes, [])],
                 self.checkpointer_get_next_version,
+                self.notify_channels,
             )
             for key, values in mv_writes.items():
                 self._update_mv(key, values)
+            # null writes may trigger any node
+            self.updated_channels = None
         # prepare next tasks
         self.tasks = prepare_next_tasks(
             self.checkpoint,
@@ -449,8 +520,11 @@ class PregelLoop(LoopProtocol):
             self.step,
             for_execution=True,
             manager=self.manager,
+            skip_callbacks=self.skip_callbacks,
             store=self.store,
             checkpointer=self.checkpointer,
+            trigger_to_nodes=self.trigger_to_nodes,
+            updated_channels=self.updated_channels,
         )
         self.to_interrupt = []
 
@@ -519,6 +593,23 @@ class PregelLoop(LoopProtocol):
 
     # private
 
+    def _match_cached_writes(
+        self, cached: Mapping[FullKey, WritesT], by_key: Mapping[FullKey, list[str]]
+    ) -> None:
+        for key, writes in cached.items():
+            for task_id in by_key[key]:
+                task = self.tasks[task_id]
+                task.writes.extend((c, v) for c, v in writes)
+                self.put_writes(task_id, task.writes, cached=True)
+
+    def _cached_tasks(self) -> dict[FullKey, list[str]]:
+        """Group the tasks of the current step that can be served from cache."""
+        by_key: dict[FullKey, list[str]] = defaultdict(list)
+        for task in self.tasks.values():
+            if task.cache_key is not None and not task.writes:
+                by_key[(task.cache_key.ns, task.cache_key.key)].append(task.id)
+        return by_key
+
     def _match_writes(self, tasks: Mapping[str, PregelExecutableTask]) -> None:
         for tid, k, v in self.checkpoint_pending_writes:
             if k in (ERROR, INTERRUPT, RESUME):
@@ -600,6 +691,7 @@ class PregelLoop(LoopProtocol):
                     PregelTaskWrites((), INPUT, input_writes, []),
                 ],
                 self.checkpointer_get_next_version,
+                self.notify_channels,
             )
             assert not mv_writes, "Can't write to SharedValues in graph input"
             # save input checkpoint
@@ -632,7 +724,13 @@ class PregelLoop(LoopProtocol):
                 ),
             )
         # create new checkpoint
-        self.checkpoint = create_checkpoint(self.checkpoint, self.channels, self.step)
+        self.checkpoint = create_checkpoint(
+            self.checkpoint,
+            self.channels,
+            self.step,
+            # channels never read or written keep their value as restored
+            unchanged=self.channels.unloaded,
+        )
         # bail if no checkpointer
         if self._checkpointer_put_after_previous is not None:
             self.checkpoint_metadata = metadata
@@ -670,6 +768,10 @@ class PregelLoop(LoopProtocol):
                 self.checkpoint_metadata,
                 new_versions,
             )
+            # channels stored incrementally can build on the versions just saved
+            for k, version in new_versions.items():
+                if isinstance(channel := self.channels.get(k), DeltaMessages):
+                    channel.checkpointed(version)
             self.checkpoint_config = {
                 **self.checkpoint_config,
                 CONF: {
@@ -683,6 +785,9 @@ class PregelLoop(LoopProtocol):
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         raise NotImplementedError
 
+    def _flush_writes(self) -> Any:
+        raise NotImplementedError
+
     def _suppress_interrupt(
         self,
         exc_type: Optional[Type[BaseException]],
@@ -705,6 +810,7 @@ class PregelLoop(LoopProtocol):
                     self.channels,
                     self.tasks.values(),
                     self.checkpointer_get_next_version,
+                    self.notify_channels,
                 )
                 for key, values in mv_writes.items():
                     self._update_mv(key, values)
@@ -772,9 +878,12 @@ class SyncPregelLoop(PregelLoop, ContextManager):
         config: RunnableConfig,
         store: Optional[BaseStore],
         checkpointer: Optional[BaseCheckpointSaver],
+        cache: Optional[BaseCache[WritesT]] = None,
         nodes: Mapping[str, PregelNode],
         specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]],
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
         manager: Union[None, AsyncParentRunManager, ParentRunManager] = None,
+        skip_callbacks: bool = False,
         interrupt_after: Union[All, Sequence[str]] = EMPTY_SEQ,
         interrupt_before: Union[All, Sequence[str]] = EMPTY_SEQ,
         output_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
@@ -788,24 +897,28 @@ class SyncPregelLoop(PregelLoop, ContextManager):
             config=config,
             checkpointer=checkpointer,
             store=store,
+            cache=cache,
             nodes=nodes,
             specs=specs,
+            trigger_to_nodes=trigger_to_nodes,
             output_keys=output_keys,
             stream_keys=stream_keys,
             interrupt_after=interrupt_after,
             interrupt_before=interrupt_before,
             check_subgraphs=check_subgraphs,
             manager=manager,
+            skip_callbacks=skip_callbacks,
             debug=debug,
         )
         self.stack = ExitStack()
         if checkpointer:
             self.checkpointer_get_next_version = checkpointer.get_next_version
-            self.checkpointer_put_writes = checkpointer.put_writes
+            self.checkpointer_put_writes_many = checkpointer.put_writes_many
         else:
             self.checkpointer_get_next_version = increment
             self._checkpointer_put_after_previous = None  # type: ignore[assignment]
-            self.checkpointer_put_writes = None
+            self.checkpointer_put_writes_many = None
+        self.cache_set = cache.set if cache is not None else None
 
     def _checkpointer_put_after_previous(
         self,
@@ -823,9 +936,31 @@ class SyncPregelLoop(PregelLoop, ContextManager):
                 config, checkpoint, metadata, new_versions
             )
 
+    def _flush_writes(self) -> None:
+        try:
+            while True:
+                with self._put_writes_lock:
+                    if not self._put_writes_queue:
+                        self._put_writes_flushing = False
+                        return
+                    batch = list(self._put_writes_queue)
+                    self._put_writes_queue.clear()
+                cast(Callable, self.checkpointer_put_writes_many)(batch)
+        except BaseException:
+            with self._put_writes_lock:
+                self._put_writes_flushing = False
+            raise
+
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         return self.submit(cast(WritableManagedValue, self.managed[key]).update, values)
 
+    def match_cached_writes(self) -> None:
+        """Apply cached writes to the tasks of the current step, if any."""
+        if self.cache is None:
+            return
+        if by_key := self._cached_tasks():
+            self._match_cached_writes(self.cache.get(list(by_key)), by_key)
+
     # context manager
 
     def __enter__(self) -> Self:
@@ -872,11 +1007,13 @@ class SyncPregelLoop(PregelLoop, ContextManager):
             if saved.pending_writes is not None
             else []
         )
+        self._pending_writes_idx = _index_pending_writes(self.checkpoint_pending_writes)
 
         self.submit = self.stack.enter_context(BackgroundExecutor(self.config))
         self.channels, self.managed = self.stack.enter_context(
             ChannelsManager(self.specs, self.checkpoint, self)
         )
+        self.notify_channels = get_notify_channels(self.channels)
         self.stack.push(self._suppress_interrupt)
         self.status = "pending"
         self.step = self.checkpoint_metadata["step"] + 1
@@ -904,11 +1041,14 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         config: RunnableConfig,
         store: Optional[BaseStore],
         checkpointer: Optional[BaseCheckpointSaver],
+        cache: Optional[BaseCache[WritesT]] = None,
         nodes: Mapping[str, PregelNode],
         specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]],
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
         interrupt_after: Union[All, Sequence[str]] = EMPTY_SEQ,
         interrupt_before: Union[All, Sequence[str]] = EMPTY_SEQ,
         manager: Union[None, AsyncParentRunManager, ParentRunManager] = None,
+        skip_callbacks: bool = False,
         output_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         stream_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         check_subgraphs: bool = True,
@@ -920,24 +1060,28 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
             config=config,
             checkpointer=checkpointer,
             store=store,
+            cache=cache,
             nodes=nodes,
             specs=specs,
+            trigger_to_nodes=trigger_to_nodes,
             output_keys=output_keys,
             stream_keys=stream_keys,
             interrupt_after=interrupt_after,
             interrupt_before=interrupt_before,
             check_subgraphs=check_subgraphs,
             manager=manager,
+            skip_callbacks=skip_callbacks,
             debug=debug,
         )
         self.stack = AsyncExitStack()
         if checkpointer:
             self.checkpointer_get_next_version = checkpointer.get_next_version
-            self.checkpointer_put_writes = checkpointer.aput_writes
+            self.checkpointer_put_writes_many = checkpointer.aput_writes_many
         else:
             self.checkpointer_get_next_version = increment
             self._checkpointer_put_after_previous = None  # type: ignore[assignment]
-            self.checkpointer_put_writes = None
+            self.checkpointer_put_writes_many = None
+        self.cache_set = cache.aset if cache is not None else None
 
     async def _checkpointer_put_after_previous(
         self,
@@ -955,11 +1099,33 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
                 config, checkpoint, metadata, new_versions
             )
 
+    async def _flush_writes(self) -> None:
+        try:
+            while True:
+                with self._put_writes_lock:
+                    if not self._put_writes_queue:
+                        self._put_writes_flushing = False
+                        return
+                    batch = list(self._put_writes_queue)
+                    self._put_writes_queue.clear()
+                await cast(Callable, self.checkpointer_put_writes_many)(batch)
+        except BaseException:
+            with self._put_writes_lock:
+                self._put_writes_flushing = False
+            raise
+
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         return self.submit(
             cast(WritableManagedValue, self.managed[key]).aupdate, values
         )
 
+    async def amatch_cached_writes(self) -> None:
+        """Apply cached writes to the tasks of the current step, if any."""
+        if self.cache is None:
+            return
+        if by_key := self._cached_tasks():
+            self._match_cached_writes(await self.cache.aget(list(by_key)), by_key)
+
     # context manager
 
     async def __aenter__(self) -> Self:
@@ -1006,6 +1172,7 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
             if saved.pending_writes is not None
             else []
         )
+        self._pending_writes_idx = _index_pending_writes(self.checkpoint_pending_writes)
 
         self.submit = await self.stack.enter_async_context(
             AsyncBackgroundExecutor(self.config)
@@ -1013,6 +1180,7 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         self.channels, self.managed = await self.stack.enter_async_context(
             AsyncChannelsManager(self.specs, self.checkpoint, self)
         )
+        self.notify_channels = get_notify_channels(self.channels)
         self.stack.push(self._suppress_interrupt)
         self.status = "pending"
         self.step = self.checkpoint_metadata["step"] + 1
@@ -1,6 +1,6 @@
 import asyncio
 from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
-from typing import AsyncIterator, Iterator, Mapping, Union
+from typing import Any, AsyncIterator, Iterator, Mapping, Union
 
 from langgraph.channels.base import BaseChannel
 from langgraph.checkpoint.base import Checkpoint
@@ -13,6 +13,43 @@ from langgraph.managed.context import Context
 from langgraph.types import LoopProtocol
 
 
+class LazyChannels(Mapping[str, BaseChannel]):
+    """Channels restored from a checkpoint, each created from its checkpointed
+    value the first time it's accessed."""
+
+    __slots__ = ("specs", "checkpoint_values", "loaded")
+
+    def __init__(
+        self, specs: Mapping[str, BaseChannel], values: Mapping[str, Any]
+    ) -> None:
+        self.specs = specs
+        self.checkpoint_values = values
+        self.loaded: dict[str, BaseChannel] = {}
+
+    def __getitem__(self, key: str) -> BaseChannel:
+        try:
+            return self.loaded[key]
+        except KeyError:
+            pass
+        channel = self.specs[key].from_checkpoint(self.checkpoint_values.get(key))
+        # another thread may have loaded it in the meantime
+        return self.loaded.setdefault(key, channel)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.specs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.specs)
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    @property
+    def unloaded(self) -> set[str]:
+        """Keys of the channels that were never accessed."""
+        return self.specs.keys() - self.loaded.keys()
+
+
 @contextmanager
 def ChannelsManager(
     specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]],
@@ -20,7 +57,7 @@ def ChannelsManager(
     loop: LoopProtocol,
     *,
     skip_context: bool = False,
-) -> Iterator[tuple[Mapping[str, BaseChannel], ManagedValueMapping]]:
+) -> Iterator[tuple[LazyChannels, ManagedValueMapping]]:
     """Manage channels for the lifetime of a Pregel invocation (multiple steps)."""
     channel_specs: dict[str, BaseChannel] = {}
     managed_specs: dict[str, ManagedValueSpec] = {}
@@ -35,10 +72,7 @@ def ChannelsManager(
             managed_specs[k] = v
     with ExitStack() as stack:
         yield (
-            {
-                k: v.from_checkpoint(checkpoint["channel_values"].get(k))
-                for k, v in channel_specs.items()
-            },
+            LazyChannels(channel_specs, checkpoint["channel_values"]),
             ManagedValueMapping(
                 {
                     key: stack.enter_context(
@@ -59,7 +93,7 @@ async def AsyncChannelsManager(
     loop: LoopProtocol,
     *,
     skip_context: bool = False,
-) -> AsyncIterator[tuple[Mapping[str, BaseChannel], ManagedValueMapping]]:
+) -> AsyncIterator[tuple[LazyChannels, ManagedValueMapping]]:
     """Manage channels for the lifetime of a Pregel invocation (multiple steps)."""
     channel_specs: dict[str, BaseChannel] = {}
     managed_specs: dict[str, ManagedValueSpec] = {}
@@ -88,11 +122,8 @@ async def AsyncChannelsManager(
         else:
             done = set()
         yield (
-            # channels: enter each channel with checkpoint
-            {
-                k: v.from_checkpoint(checkpoint["channel_values"].get(k))
-                for k, v in channel_specs.items()
-            },
+            # channels: enter each channel with checkpoint, when first accessed
+            LazyChannels(channel_specs, checkpoint["channel_values"]),
             # managed: build mapping from spec to result
             ManagedValueMapping({tasks[task]: task.result() for task in done}),
         )
@@ -1,6 +1,10 @@
+import asyncio
+import time
+from collections import OrderedDict
 from typing import (
     Any,
     AsyncIterator,
+    Awaitable,
     Callable,
     Dict,
     Iterator,
@@ -13,15 +17,18 @@ from typing import (
 from uuid import UUID, uuid4
 
 from langchain_core.callbacks import BaseCallbackHandler
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import BaseMessage, BaseMessageChunk
 from langchain_core.outputs import ChatGenerationChunk, LLMResult
 from langchain_core.tracers._streaming import T, _StreamingCallbackHandler
 
 from langgraph.constants import NS_SEP, TAG_HIDDEN, TAG_NOSTREAM
-from langgraph.types import StreamChunk
+from langgraph.types import StreamChunk, StreamMessagesMetadata
 
 Meta = tuple[tuple[str, ...], dict[str, Any]]
 
+# chunks of a model run not emitted yet: merged message, count, time of first chunk
+Pending = tuple[BaseMessageChunk, int, float]
+
 
 class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
     """A callback handler that implements stream_mode=messages.
@@ -30,19 +37,79 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
     run_inline = True
     """We want this callback to run in the main thread, to avoid order/locking issues."""
 
-    def __init__(self, stream: Callable[[StreamChunk], None]):
+    def __init__(
+        self,
+        stream: Callable[[StreamChunk], None],
+        *,
+        flush_tokens: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        metadata_mode: StreamMessagesMetadata = "full",
+        max_seen: int = 10_000,
+    ):
+        """Create a handler emitting to `stream`.
+
+        Args:
+            stream: The function to emit chunks with.
+            flush_tokens: Merge up to this many token chunks of a model run
+                into each emitted message chunk. Defaults to None, ie. no limit.
+            flush_interval: Merge the token chunks of a model run received within
+                this many seconds of the first one into each emitted message
+                chunk. Defaults to None, ie. no limit. When both `flush_tokens`
+                and `flush_interval` are None, each token chunk is emitted as is.
+            metadata_mode: Whether each emitted message carries the full metadata
+                of its run, or only the first one does, see `StreamMessagesMetadata`.
+            max_seen: Maximum number of message ids remembered to avoid emitting
+                the same message twice. Defaults to 10,000.
+        """
         self.stream = stream
+        self.flush_tokens = flush_tokens
+        self.flush_interval = flush_interval
+        self.metadata_mode = metadata_mode
+        self.max_seen = max_seen
         self.metadata: dict[UUID, Meta] = {}
-        self.seen: set[Union[int, str]] = set()
+        self.pending: dict[UUID, Pending] = {}
+        self.sent: set[UUID] = set()
+        self.seen: OrderedDict[Union[int, str], None] = OrderedDict()
 
-    def _emit(self, meta: Meta, message: BaseMessage, *, dedupe: bool = False) -> None:
-        if dedupe and message.id in self.seen:
+    def _emit(
+        self,
+        run_id: UUID,
+        meta: Meta,
+        message: BaseMessage,
+        *,
+        dedupe: bool = False,
+    ) -> None:
+        if dedupe and message.id is not None and message.id in self.seen:
+            # keep messages that keep being output from being forgotten
+            self.seen.move_to_end(message.id)
             return
         else:
             if message.id is None:
                 message.id = str(uuid4())
-            self.seen.add(message.id)
-            self.stream((meta[0], "messages", (message, meta[1])))
+            self.seen[message.id] = None
+            self.seen.move_to_end(message.id)
+            if len(self.seen) > self.max_seen:
+                self.seen.popitem(last=False)
+            self.stream((meta[0], "messages", (message, self._metadata(run_id, meta))))
+
+    def _metadata(self, run_id: UUID, meta: Meta) -> dict[str, Any]:
+        if self.metadata_mode == "full":
+            return meta[1]
+        elif run_id in self.sent:
+            return {"langgraph_run_id": str(run_id)}
+        else:
+            self.sent.add(run_id)
+            return {**meta[1], "langgraph_run_id": str(run_id)}
+
+    def _flush(self, run_id: UUID) -> None:
+        if pending := self.pending.pop(run_id, None):
+            if meta := self.metadata.get(run_id):
+                self._emit(run_id, meta, pending[0])
+
+    def _end(self, run_id: UUID) -> None:
+        self._flush(run_id)
+        self.metadata.pop(run_id, None)
+        self.sent.discard(run_id)
 
     def tap_output_aiter(
         self, run_id: UUID, output: AsyncIterator[T]
@@ -81,7 +148,26 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
         if not isinstance(chunk, ChatGenerationChunk):
             return
         if meta := self.metadata.get(run_id):
-            self._emit(meta, chunk.message)
+            message = chunk.message
+            if (
+                self.flush_tokens is None and self.flush_interval is None
+            ) or not isinstance(message, BaseMessageChunk):
+                self._flush(run_id)
+                self._emit(run_id, meta, message)
+                return
+            now = time.monotonic()
+            if pending := self.pending.get(run_id):
+                merged, count, since = pending
+                merged, count = merged + message, count + 1
+            else:
+                merged, count, since = message, 1, now
+            if (self.flush_tokens is not None and count >= self.flush_tokens) or (
+                self.flush_interval is not None and now - since >= self.flush_interval
+            ):
+                self.pending.pop(run_id, None)
+                self._emit(run_id, meta, merged)
+            else:
+                self.pending[run_id] = (merged, count, since)
 
     def on_llm_end(
         self,
@@ -91,7 +177,7 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
         parent_run_id: Optional[UUID] = None,
         **kwargs: Any,
     ) -> Any:
-        self.metadata.pop(run_id, None)
+        self._end(run_id)
 
     def on_llm_error(
         self,
@@ -101,7 +187,7 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
         parent_run_id: Optional[UUID] = None,
         **kwargs: Any,
     ) -> Any:
-        self.metadata.pop(run_id, None)
+        self._end(run_id)
 
     def on_chain_start(
         self,
@@ -134,31 +220,32 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
     ) -> Any:
         if meta := self.metadata.pop(run_id, None):
             if isinstance(response, BaseMessage):
-                self._emit(meta, response, dedupe=True)
+                self._emit(run_id, meta, response, dedupe=True)
             elif isinstance(response, Sequence):
                 for value in response:
                     if isinstance(value, BaseMessage):
-                        self._emit(meta, value, dedupe=True)
+                        self._emit(run_id, meta, value, dedupe=True)
             elif isinstance(response, dict):
                 for value in response.values():
                     if isinstance(value, BaseMessage):
-                        self._emit(meta, value, dedupe=True)
+                        self._emit(run_id, meta, value, dedupe=True)
                     elif isinstance(value, Sequence):
                         for item in value:
                             if isinstance(item, BaseMessage):
-                                self._emit(meta, item, dedupe=True)
+                                self._emit(run_id, meta, item, dedupe=True)
             elif hasattr(response, "__dir__") and callable(response.__dir__):
                 for key in dir(response):
                     try:
                         value = getattr(response, key)
                         if isinstance(value, BaseMessage):
-                            self._emit(meta, value, dedupe=True)
+                            self._emit(run_id, meta, value, dedupe=True)
                         elif isinstance(value, Sequence):
                             for item in value:
                                 if isinstance(item, BaseMessage):
-                                    self._emit(meta, item, dedupe=True)
+                                    self._emit(run_id, meta, item, dedupe=True)
                     except AttributeError:
                         pass
+            self.sent.discard(run_id)
 
     def on_chain_error(
         self,
@@ -169,3 +256,49 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
         **kwargs: Any,
     ) -> Any:
         self.metadata.pop(run_id, None)
+        self.sent.discard(run_id)
+
+
+class StreamBackpressureHandler(BaseCallbackHandler):
+    """A callback handler that makes chat models streaming in the event loop wait
+    for room in the bounded stream of astream() after each token, as emitting
+    the token with StreamMessagesHandler can't wait itself."""
+
+    run_inline = True
+    """Run after StreamMessagesHandler emitted the token, in the same order."""
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, wait: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Create a handler waiting with `wait` in the event loop `loop`.
+
+        Args:
+            loop: The event loop running astream().
+            wait: The function waiting for room in the stream.
+        """
+        self.loop = loop
+        self.wait = wait
+
+    def _in_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    @property
+    def ignore_llm(self) -> bool:
+        # models running in other threads already wait for room when emitting
+        return not self._in_loop()
+
+    async def on_llm_new_token(
+        self,
+        token: str,
+        *,
+        chunk: Optional[ChatGenerationChunk] = None,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        # a sync callback manager runs this in a new event loop
+        if self._in_loop():
+            await self.wait()
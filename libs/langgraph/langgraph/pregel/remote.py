@@ -4,6 +4,7 @@ from typing import (
     AsyncIterator,
     Iterator,
     Literal,
+    Mapping,
     Optional,
     Sequence,
     Union,
@@ -301,7 +302,7 @@ class RemoteGraph(PregelProtocol):
 
         def _sanitize_obj(obj: Any) -> Any:
             """Remove non-JSON serializable fields from the given object."""
-            if isinstance(obj, dict):
+            if isinstance(obj, Mapping):
                 return {k: _sanitize_obj(v) for k, v in obj.items()}
             elif isinstance(obj, list):
                 return [_sanitize_obj(v) for v in obj]
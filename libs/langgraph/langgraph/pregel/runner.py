@@ -94,7 +94,8 @@ class PregelRunner:
                         )
                     ] = next_task
 
-        tasks = tuple(tasks)
+        # skip tasks with writes already applied, eg. from pending or cached writes
+        tasks = tuple(t for t in tasks if not t.writes)
         futures: dict[concurrent.futures.Future, Optional[PregelExecutableTask]] = {}
         # give control back to the caller
         yield
@@ -211,7 +212,8 @@ class PregelRunner:
                     ] = next_task
 
         loop = asyncio.get_event_loop()
-        tasks = tuple(tasks)
+        # skip tasks with writes already applied, eg. from pending or cached writes
+        tasks = tuple(t for t in tasks if not t.writes)
         futures: dict[asyncio.Future, Optional[PregelExecutableTask]] = {}
         # give control back to the caller
         yield
@@ -1,10 +1,12 @@
 from typing import Optional
 
+from langchain_core.messages import BaseMessageChunk
 from langchain_core.runnables import RunnableLambda, RunnableSequence
 from langchain_core.runnables.utils import get_function_nonlocals
 
 from langgraph.checkpoint.base import ChannelVersions
 from langgraph.pregel.protocol import PregelProtocol
+from langgraph.types import StreamChunk
 from langgraph.utils.runnable import Runnable, RunnableCallable, RunnableSeq
 
 
@@ -55,3 +57,24 @@ def find_subgraph_pregel(candidate: Runnable) -> Optional[Runnable]:
                 )
 
     return None
+
+
+def is_droppable_chunk(chunk: StreamChunk) -> bool:
+    """Whether a stream chunk can be dropped from a full stream buffer."""
+    return chunk[1] in ("messages", "custom", "debug")
+
+
+def coalesce_chunks(prev: StreamChunk, chunk: StreamChunk) -> Optional[StreamChunk]:
+    """Merge two consecutive 'messages' chunks of the same message, if possible."""
+    if prev[1] != "messages" or chunk[1] != "messages" or prev[0] != chunk[0]:
+        return None
+    prev_msg, meta = prev[2]
+    msg, _ = chunk[2]
+    if (
+        isinstance(prev_msg, BaseMessageChunk)
+        and isinstance(msg, BaseMessageChunk)
+        and prev_msg.id is not None
+        and prev_msg.id == msg.id
+    ):
+        return (prev[0], "messages", (prev_msg + msg, meta))
+    return None
@@ -1,4 +1,5 @@
 import dataclasses
+import pickle
 import sys
 from collections import deque
 from typing import (
@@ -50,6 +51,24 @@ StreamMode = Literal["values", "updates", "debug", "messages", "custom"]
 - 'custom': Emit custom output `write: StreamWriter` kwarg of each node.
 """
 
+StreamOverflow = Literal["block", "drop_oldest", "coalesce"]
+"""What the stream method does when its buffer is full, see `Pregel.stream_buffer_size`.
+
+- 'block': Nodes wait for the consumer to catch up before emitting more output.
+- 'drop_oldest': Drop the oldest 'messages', 'custom' or 'debug' output,
+    falling back to 'block' when there is none.
+- 'coalesce': Merge consecutive 'messages' chunks of the same message,
+    falling back to 'block' when the output can't be merged.
+"""
+
+StreamMessagesMetadata = Literal["full", "ref"]
+"""How stream_mode="messages" outputs metadata, see `Pregel.stream_messages_metadata`.
+
+- 'full': Each output carries the metadata of the node or chat model run.
+- 'ref': Only the first output of each run carries the full metadata, later
+    outputs carry just its 'langgraph_run_id' to refer back to it.
+"""
+
 StreamWriter = Callable[[Any], None]
 """Callable that accepts a single argument and writes it to the output stream.
 Always injected into nodes if requested as a keyword argument, but it's a no-op
@@ -111,10 +130,30 @@ class RetryPolicy(NamedTuple):
     """List of exception classes that should trigger a retry, or a callable that returns True for exceptions that should trigger a retry."""
 
 
+def default_cache_key(input: Any) -> bytes:
+    """Default cache key function, pickles the node input."""
+    return pickle.dumps(input, protocol=5)
+
+
 class CachePolicy(NamedTuple):
     """Configuration for caching nodes."""
 
-    pass
+    key_func: Callable[[Any], Union[str, bytes]] = default_cache_key
+    """Function to generate a cache key from the node input.
+    Defaults to pickling the input."""
+    ttl: Optional[int] = None
+    """Time to live for the cache entry, in seconds. If None, the entry never expires."""
+
+
+class CacheKey(NamedTuple):
+    """Cache key for a task, derived from the node's cache policy and input."""
+
+    ns: tuple[str, ...]
+    """Namespace of the cache entry."""
+    key: str
+    """Key of the cache entry, within the namespace."""
+    ttl: Optional[int]
+    """Time to live for the cache entry, in seconds."""
 
 
 @dataclasses.dataclass(**_DC_KWARGS)
@@ -148,6 +187,7 @@ class PregelExecutableTask(NamedTuple):
     path: tuple[Union[str, int, tuple], ...]
     scheduled: bool = False
     writers: Sequence[Runnable] = ()
+    cache_key: Optional[CacheKey] = None
 
 
 class StateSnapshot(NamedTuple):
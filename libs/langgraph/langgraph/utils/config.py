@@ -1,7 +1,7 @@
 import asyncio
 import sys
 from collections import ChainMap
-from typing import Any, Optional, Sequence, cast
+from typing import Any, Mapping, MutableMapping, Optional, Sequence, cast
 
 from langchain_core.callbacks import (
     AsyncCallbackManager,
@@ -175,6 +175,72 @@ def patch_config(
     return config
 
 
+def layer_config(
+    config: RunnableConfig,
+    *,
+    metadata: Optional[dict[str, Any]] = None,
+    tags: Optional[Sequence[str]] = None,
+    callbacks: Optional[Callbacks] = None,
+    run_name: Optional[str] = None,
+    configurable: Optional[dict[str, Any]] = None,
+) -> RunnableConfig:
+    """Create a child config, with the given values layered over a parent config.
+
+    Equivalent to `patch_config(merge_configs(config, {"metadata": metadata,
+    "tags": tags}), callbacks=callbacks, run_name=run_name,
+    configurable=configurable)`, except that `metadata` and `configurable` are
+    `ChainMap` views with the child's values in front of the parent's. The
+    parent's mappings are shared instead of copied, and writes to the child's
+    views only ever modify the child's own layer.
+
+    Args:
+        config (RunnableConfig): The parent config, which is not modified.
+        metadata (Optional[dict[str, Any]], optional): The metadata to add.
+          Defaults to None.
+        tags (Optional[Sequence[str]], optional): The tags to add.
+          Defaults to None.
+        callbacks (Optional[BaseCallbackManager], optional): The callbacks to set.
+          Defaults to None.
+        run_name (Optional[str], optional): The run name to set. Defaults to None.
+        configurable (Optional[Dict[str, Any]], optional): The configurable
+          values to add. Defaults to None.
+
+    Returns:
+        RunnableConfig: The child config.
+    """
+    child = config.copy()
+    if metadata:
+        child["metadata"] = _layer(metadata, config.get("metadata"))
+    if tags:
+        if base_tags := config.get("tags"):
+            child["tags"] = [*base_tags, *tags]
+        else:
+            child["tags"] = tags
+    if callbacks is not None:
+        # If we're replacing callbacks, we need to unset run_name
+        # As that should apply only to the same run as the original callbacks
+        child["callbacks"] = callbacks
+        child.pop("run_name", None)
+        child.pop("run_id", None)
+    if run_name is not None:
+        child["run_name"] = run_name
+    child[CONF] = _layer(configurable or {}, config.get(CONF))
+    return child
+
+
+def _layer(
+    values: dict[str, Any], parent: Optional[Mapping[str, Any]]
+) -> Mapping[str, Any]:
+    if not parent:
+        return ChainMap(values)
+    elif isinstance(parent, ChainMap):
+        # keep a single flat chain, rather than nesting one per generation
+        return ChainMap(values, *parent.maps)
+    else:
+        # only the first map is ever written to, the parent is left as is
+        return ChainMap(values, cast(MutableMapping[str, Any], parent))
+
+
 def get_callback_manager_for_config(
     config: RunnableConfig, tags: Optional[Sequence[str]] = None
 ) -> CallbackManager:
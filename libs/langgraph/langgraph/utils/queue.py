@@ -12,10 +12,100 @@ from typing import Optional
 PY_310 = sys.version_info >= (3, 10)
 
 
+def _make_room(buffer, item, overflow, droppable, merge):
+    """Apply the overflow policy for an item put on a full buffer.
+
+    Returns True if the policy took care of the item, either by dropping an
+    item or by merging it into the last one, and False if the producer should
+    wait for room instead.
+    """
+    if overflow == "drop_oldest" and droppable is not None:
+        for i, queued in enumerate(buffer):
+            if droppable(queued):
+                del buffer[i]
+                buffer.append(item)
+                return True
+        if droppable(item):
+            return True
+    elif overflow == "coalesce" and merge is not None and buffer:
+        merged = merge(buffer[-1], item)
+        if merged is not None:
+            buffer[-1] = merged
+            return True
+    return False
+
+
 class AsyncQueue(asyncio.Queue):
-    """Async unbounded FIFO queue with a wait() method.
+    """Async FIFO queue with a wait() method.
+
+    Subclassed from asyncio.Queue, adding a wait() method.
+
+    When bounded with `maxsize`, a full queue applies its `overflow` policy:
+    - "block": producers wait for room.
+    - "drop_oldest": the oldest item for which `droppable(item)` is true is
+        dropped to make room.
+    - "coalesce": the item is merged into the last one with `merge(last, item)`,
+        unless it returns None.
+    Producers wait for room when the policy can't make any. Items put with
+    put_nowait() never wait, and are accepted past the bound instead, their
+    producers can then wait for them to be consumed with wait_for_room().
+    """
 
-    Subclassed from asyncio.Queue, adding a wait() method."""
+    def __init__(self, maxsize=0, *, overflow="block", droppable=None, merge=None):
+        super().__init__(maxsize)
+        self.overflow = overflow
+        self.droppable = droppable
+        self.merge = merge
+
+    async def put(self, item):
+        if self.full() and _make_room(
+            self._queue, item, self.overflow, self.droppable, self.merge
+        ):
+            return
+        return await super().put(item)
+
+    def put_nowait(self, item):
+        if self.full() and _make_room(
+            self._queue, item, self.overflow, self.droppable, self.merge
+        ):
+            return
+        self._put(item)
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    async def wait_for_room(self) -> None:
+        """If items were put past the bound of the queue, wait until they're
+        consumed. Doesn't wait for items the overflow policy took care of.
+        """
+        while 0 < self._maxsize < self.qsize():
+            if PY_310:
+                putter = self._get_loop().create_future()
+            else:
+                putter = self._loop.create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except:
+                putter.cancel()  # Just in case putter is not done yet.
+                try:
+                    # Clean self._putters from canceled putters.
+                    self._putters.remove(putter)
+                except ValueError:
+                    # The putter could be removed from self._putters by a
+                    # previous get_nowait call.
+                    pass
+                if not self.full() and not putter.cancelled():
+                    # We were woken up by get_nowait(), but can't take
+                    # the call.  Wake up the next in line.
+                    self._wakeup_next(self._putters)
+                raise
+
+    def close(self) -> None:
+        """Unbound the queue, waking up all producers waiting for room."""
+        self._maxsize = 0
+        while self._putters:
+            self._wakeup_next(self._putters)
 
     async def wait(self) -> None:
         """If queue is empty, wait until an item is available.
@@ -74,21 +164,45 @@ class Semaphore(threading.Semaphore):
 
 
 class SyncQueue:
-    """Unbounded FIFO queue with a wait() method.
+    """FIFO queue with a wait() method.
     Adapted from pure Python implementation of queue.SimpleQueue.
+
+    Unbounded by default. When bounded with `maxsize`, a full queue applies its
+    `overflow` policy, as documented in AsyncQueue. The thread consuming the
+    queue never waits for room, as that would never come.
     """
 
-    def __init__(self):
+    def __init__(self, maxsize=0, *, overflow="block", droppable=None, merge=None):
         self._queue = deque()
         self._count = Semaphore(0)
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.droppable = droppable
+        self.merge = merge
+        self._not_full = threading.Condition(threading.Lock())
+        self._consumer = threading.get_ident()
 
     def put(self, item, block=True, timeout=None):
         """Put the item on the queue.
 
-        The optional 'block' and 'timeout' arguments are ignored, as this method
-        never blocks.  They are provided for compatibility with the Queue class.
+        If the queue is bounded and full, and the overflow policy can't make
+        room, wait for room if 'block' is true, unless called from the thread
+        consuming the queue. The optional 'timeout' argument is ignored.
         """
-        self._queue.append(item)
+        if self.maxsize <= 0:
+            self._queue.append(item)
+            self._count.release()
+            return
+        with self._not_full:
+            while 0 < self.maxsize <= len(self._queue):
+                if _make_room(
+                    self._queue, item, self.overflow, self.droppable, self.merge
+                ):
+                    return
+                if not block or threading.get_ident() == self._consumer:
+                    break
+                self._not_full.wait()
+            self._queue.append(item)
         self._count.release()
 
     def get(self, block=True, timeout=None):
@@ -106,6 +220,15 @@ class SyncQueue:
             raise ValueError("'timeout' must be a non-negative number")
         if not self._count.acquire(block, timeout):
             raise queue.Empty
+        if self.maxsize > 0:
+            with self._not_full:
+                self._consumer = threading.get_ident()
+                try:
+                    item = self._queue.popleft()
+                except IndexError:
+                    raise queue.Empty
+                self._not_full.notify()
+                return item
         try:
             return self._queue.popleft()
         except IndexError:
@@ -127,6 +250,12 @@ class SyncQueue:
         """Return the approximate size of the queue (not reliable!)."""
         return len(self._queue)
 
+    def close(self):
+        """Unbound the queue, waking up all producers waiting for room."""
+        with self._not_full:
+            self.maxsize = 0
+            self._not_full.notify_all()
+
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
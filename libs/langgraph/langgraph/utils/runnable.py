@@ -34,7 +34,12 @@ from langchain_core.runnables.utils import Input
 from langchain_core.tracers._streaming import _StreamingCallbackHandler
 from typing_extensions import TypeGuard
 
-from langgraph.constants import CONF, CONFIG_KEY_STORE, CONFIG_KEY_STREAM_WRITER
+from langgraph.constants import (
+    CONF,
+    CONFIG_KEY_SKIP_CALLBACKS,
+    CONFIG_KEY_STORE,
+    CONFIG_KEY_STREAM_WRITER,
+)
 from langgraph.store.base import BaseStore
 from langgraph.types import StreamWriter
 from langgraph.utils.config import (
@@ -160,8 +165,7 @@ class RunnableCallable(Runnable):
             elif kwargs.get(kw) is None:
                 kwargs[kw] = _conf.get(ck, defv)
 
-        context = copy_context()
-        if self.trace:
+        if self.trace and not _conf.get(CONFIG_KEY_SKIP_CALLBACKS):
             callback_manager = get_callback_manager_for_config(config, self.tags)
             run_manager = callback_manager.on_chain_start(
                 None,
@@ -180,6 +184,7 @@ class RunnableCallable(Runnable):
             else:
                 run_manager.on_chain_end(ret)
         else:
+            context = copy_context()
             context.run(_set_config_context, config)
             ret = context.run(self.func, input, **kwargs)
         if isinstance(ret, Runnable) and self.recurse:
@@ -208,7 +213,7 @@ class RunnableCallable(Runnable):
             elif kwargs.get(kw) is None:
                 kwargs[kw] = _conf.get(ck, defv)
         context = copy_context()
-        if self.trace:
+        if self.trace and not _conf.get(CONFIG_KEY_SKIP_CALLBACKS):
             callback_manager = get_async_callback_manager_for_config(config, self.tags)
             run_manager = await callback_manager.on_chain_start(
                 None,
@@ -387,6 +392,16 @@ class RunnableSeq(Runnable):
     ) -> Any:
         if config is None:
             config = ensure_config()
+        if config.get(CONF, {}).get(CONFIG_KEY_SKIP_CALLBACKS):
+            # invoke all steps in sequence, without starting runs
+            for i, step in enumerate(self.steps):
+                context = copy_context()
+                context.run(_set_config_context, config)
+                if i == 0:
+                    input = context.run(step.invoke, input, config, **kwargs)
+                else:
+                    input = context.run(step.invoke, input, config)
+            return input
         # setup callbacks and context
         callback_manager = get_callback_manager_for_config(config)
         # start the root run
@@ -426,6 +441,20 @@ class RunnableSeq(Runnable):
     ) -> Any:
         if config is None:
             config = ensure_config()
+        if config.get(CONF, {}).get(CONFIG_KEY_SKIP_CALLBACKS):
+            # invoke all steps in sequence, without starting runs
+            for i, step in enumerate(self.steps):
+                context = copy_context()
+                context.run(_set_config_context, config)
+                if i == 0:
+                    coro = step.ainvoke(input, config, **kwargs)
+                else:
+                    coro = step.ainvoke(input, config)
+                if ASYNCIO_ACCEPTS_CONTEXT:
+                    input = await asyncio.create_task(coro, context=context)
+                else:
+                    input = await coro
+            return input
         # setup callbacks
         callback_manager = get_async_callback_manager_for_config(config)
         # start the root run
@@ -1,5 +1,22 @@
-from langgraph.checkpoint.base import empty_checkpoint
-from langgraph.pregel.algo import prepare_next_tasks
+from typing import Optional
+
+from langgraph.channels.last_value import LastValue
+from langgraph.checkpoint.base import (
+    LazyChannelValues,
+    create_checkpoint,
+    empty_checkpoint,
+)
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.constants import (
+    CONF,
+    CONFIG_KEY_WRITES,
+    NULL_TASK_ID,
+    PUSH,
+    RESUME,
+    Send,
+)
+from langgraph.pregel import Channel
+from langgraph.pregel.algo import build_trigger_to_nodes, prepare_next_tasks
 from langgraph.pregel.manager import ChannelsManager
 
 
@@ -40,3 +57,133 @@ def test_prepare_next_tasks() -> None:
         )
 
         # TODO: add more tests
+
+
+def test_prepare_next_tasks_updated_channels() -> None:
+    config = {}
+    processes = {
+        "one": Channel.subscribe_to("a") | (lambda x: x),
+        "two": Channel.subscribe_to("b") | (lambda x: x),
+        "three": Channel.subscribe_to(["a", "b"]) | (lambda x: x),
+    }
+    trigger_to_nodes = build_trigger_to_nodes(processes)
+    assert trigger_to_nodes == {"a": ["one", "three"], "b": ["two", "three"]}
+
+    checkpoint = empty_checkpoint()
+    specs = {"a": LastValue(int), "b": LastValue(int)}
+    with ChannelsManager(specs, checkpoint, config) as (channels, managed):
+        channels["a"].update([1])
+        channels["b"].update([2])
+        checkpoint["channel_versions"] = {"a": 1, "b": 1}
+
+        def next_nodes(updated_channels: Optional[set[str]]) -> list[str]:
+            tasks = prepare_next_tasks(
+                checkpoint,
+                [],
+                processes,
+                channels,
+                managed,
+                config,
+                0,
+                for_execution=False,
+                trigger_to_nodes=trigger_to_nodes,
+                updated_channels=updated_channels,
+            )
+            return [t.name for t in tasks.values()]
+
+        assert next_nodes(None) == ["one", "two", "three"]
+        assert next_nodes({"b"}) == ["two", "three"]
+        assert next_nodes({"b", "a"}) == ["one", "two", "three"]
+        assert next_nodes(set()) == []
+
+
+def test_prepare_next_tasks_sends() -> None:
+    config = {}
+    processes = {"one": Channel.subscribe_to("a") | (lambda x: x)}
+    checkpoint = empty_checkpoint()
+    pending_writes = [
+        (NULL_TASK_ID, "a", 1),
+        *((NULL_TASK_ID, PUSH, Send("one", i)) for i in range(100)),
+        (NULL_TASK_ID, PUSH, Send("missing", 100)),
+    ]
+
+    with ChannelsManager({"a": LastValue(int)}, checkpoint, config) as (
+        channels,
+        managed,
+    ):
+        tasks = prepare_next_tasks(
+            checkpoint,
+            pending_writes,
+            processes,
+            channels,
+            managed,
+            config,
+            0,
+            for_execution=True,
+            checkpointer=None,
+            store=None,
+            manager=None,
+        )
+        # one task per valid send, with the index of the write in the task path
+        assert [t.input for t in tasks.values()] == list(range(100))
+        assert [t.path[2] for t in tasks.values()] == list(range(1, 101))
+
+        # each task sees the null writes and its own writes
+        task_id = list(tasks)[5]
+        pending_writes.append((task_id, RESUME, ["resumed"]))
+        tasks = prepare_next_tasks(
+            checkpoint,
+            pending_writes,
+            processes,
+            channels,
+            managed,
+            config,
+            0,
+            for_execution=True,
+            checkpointer=None,
+            store=None,
+            manager=None,
+        )
+        for tid, task in tasks.items():
+            assert task.config[CONF][CONFIG_KEY_WRITES] == [
+                *pending_writes[:-1],
+                *([(task_id, RESUME, ["resumed"])] if tid == task_id else []),
+            ]
+
+
+def test_channels_manager_lazy_values() -> None:
+    serde = JsonPlusSerializer()
+    loads = []
+
+    class CountingSerde(JsonPlusSerializer):
+        def loads_typed(self, data):
+            loads.append(data)
+            return serde.loads_typed(data)
+
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = LazyChannelValues(
+        CountingSerde(), {k: serde.dumps_typed(k) for k in ("a", "b", "c")}
+    )
+    checkpoint["channel_versions"] = {"a": 1, "b": 1, "c": 1}
+    specs = {k: LastValue(str) for k in ("a", "b", "c")}
+
+    with ChannelsManager(specs, checkpoint, {}) as (channels, _):
+        # channels are only restored when accessed
+        assert not loads
+        assert set(channels) == {"a", "b", "c"}
+        assert channels["a"].get() == "a"
+        assert len(loads) == 1
+        assert channels["a"] is channels["a"]
+        channels["b"].update(["B"])
+        assert channels.unloaded == {"c"}
+
+        new = create_checkpoint(checkpoint, channels, 1, unchanged=channels.unloaded)
+
+    # unchanged values are carried over without being deserialized
+    assert len(loads) == 2
+    assert new["channel_values"].serialized == {"c": serde.dumps_typed("c")}
+    assert new["channel_values"] == {"a": "a", "b": "B", "c": "c"}
+
+    # and they support the whole mapping interface
+    with ChannelsManager(specs, new, {}) as (channels, _):
+        assert [c.get() for c in channels.values()] == ["a", "B", "c"]
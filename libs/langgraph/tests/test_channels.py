@@ -4,9 +4,13 @@ from typing import Sequence, Union
 import pytest
 
 from langgraph.channels.binop import BinaryOperatorAggregate
+from langgraph.channels.ephemeral_value import EphemeralValue
 from langgraph.channels.last_value import LastValue
+from langgraph.channels.named_barrier_value import NamedBarrierValue
 from langgraph.channels.topic import Topic
+from langgraph.channels.untracked_value import UntrackedValue
 from langgraph.errors import EmptyChannelError, InvalidUpdateError
+from langgraph.pregel.algo import get_notify_channels
 
 pytestmark = pytest.mark.anyio
 
@@ -86,3 +90,22 @@ def test_binop() -> None:
     checkpoint = channel.checkpoint()
     channel = BinaryOperatorAggregate(int, operator.add).from_checkpoint(checkpoint)
     assert channel.get() == 10
+
+
+def test_notify_on_step() -> None:
+    channels = {
+        "last": LastValue(int).from_checkpoint(4),
+        "binop": BinaryOperatorAggregate(int, operator.add).from_checkpoint(4),
+        "barrier": NamedBarrierValue(str, {"a", "b"}).from_checkpoint({"a", "b"}),
+        "untracked": UntrackedValue(int).from_checkpoint(None),
+        "ephemeral": EphemeralValue(int).from_checkpoint(4),
+        "topic": Topic(int).from_checkpoint([4]),
+    }
+    assert get_notify_channels(channels) == ["ephemeral", "topic"]
+    # channels that opt out must not change on an empty update
+    channels["untracked"].update([4])
+    for key, channel in channels.items():
+        if not channel.notify_on_step:
+            before = channel.get()
+            assert not channel.update([])
+            assert channel.get() == before, key
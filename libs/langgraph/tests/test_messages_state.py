@@ -11,11 +11,15 @@ from langchain_core.messages import (
 )
 from pydantic import BaseModel
 from pydantic.v1 import BaseModel as BaseModelV1
+from pytest_mock import MockerFixture
+from typing_extensions import TypedDict
 
+from langgraph.checkpoint.base import DeltaValue
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import add_messages
-from langgraph.graph.message import MessagesState
+from langgraph.graph.message import DeltaMessages, MessagesState
 from langgraph.graph.state import END, START, StateGraph
-from tests.conftest import IS_LANGCHAIN_CORE_030_OR_GREATER
+from tests.conftest import ALL_CHECKPOINTERS_SYNC, IS_LANGCHAIN_CORE_030_OR_GREATER
 from tests.messages import _AnyIdHumanMessage
 
 
@@ -178,3 +182,67 @@ def test_messages_state(state_schema):
             _AnyIdHumanMessage(content="foo"),
         ]
     }
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_delta_messages(
+    request: pytest.FixtureRequest, mocker: MockerFixture, checkpointer_name: str
+) -> None:
+    checkpointer = request.getfixturevalue(f"checkpointer_{checkpointer_name}")
+    mocker.patch.object(DeltaMessages, "max_deltas", 4)
+
+    class State(TypedDict):
+        messages: Annotated[list[AnyMessage], add_messages, DeltaMessages]
+
+    def respond(state: State):
+        return {"messages": [AIMessage(f"reply {len(state['messages'])}")]}
+
+    builder = StateGraph(State)
+    builder.add_node(respond)
+    builder.add_edge(START, "respond")
+    app = builder.compile(checkpointer=checkpointer)
+    config = {"configurable": {"thread_id": "1"}}
+
+    expected: list[AnyMessage] = []
+    for i in range(4):
+        human = HumanMessage(f"hi {i}", id=f"h{i}")
+        expected = add_messages(expected, [human])
+        expected = add_messages(expected, [AIMessage(f"reply {len(expected)}")])
+        result = app.invoke({"messages": [human]}, config)
+        assert [m.content for m in result["messages"]] == [m.content for m in expected]
+
+    state = app.get_state(config)
+    assert [m.content for m in state.values["messages"]] == [
+        m.content for m in expected
+    ]
+    # each past checkpoint is reassembled from its own deltas
+    history = [s.values["messages"] for s in app.get_state_history(config)]
+    assert [len(m) for m in history] == [8, 7, 6, 6, 5, 4, 4, 3, 2, 2, 1, 0]
+    assert history[3] == history[2][:6]
+
+    if isinstance(checkpointer, MemorySaver):
+        stored = [
+            checkpointer.serde.loads_typed(b) for b in checkpointer.blobs.values()
+        ]
+        assert all(isinstance(v, DeltaValue) for v in stored)
+        # appends are stored as deltas, with a full snapshot every max_deltas
+        assert [len(v.items) for v in stored] == [1, 1, 1, 1, 5, 1, 1, 1]
+
+    # replacing or removing an already checkpointed message stores a full snapshot
+    app.update_state(config, {"messages": [HumanMessage("bye 0", id="h0")]})
+    app.update_state(config, {"messages": [RemoveMessage(id="h1")]})
+    result = app.invoke({"messages": [HumanMessage("hi 4", id="h4")]}, config)
+    assert [m.content for m in result["messages"]] == [
+        "bye 0",
+        "reply 1",
+        "reply 3",
+        "hi 2",
+        "reply 5",
+        "hi 3",
+        "reply 7",
+        "hi 4",
+        "reply 8",
+    ]
+    assert [m.content for m in app.get_state(config).values["messages"]] == [
+        m.content for m in result["messages"]
+    ]
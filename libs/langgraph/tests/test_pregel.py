@@ -9,6 +9,7 @@ import warnings
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import replace
 from random import randrange
 from typing import (
@@ -42,6 +43,7 @@ from pydantic import BaseModel
 from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
@@ -58,6 +60,7 @@ from langgraph.checkpoint.base import (
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.constants import (
     CONFIG_KEY_NODE_FINISHED,
+    CONFIG_KEY_SKIP_CALLBACKS,
     ERROR,
     FF_SEND_V2,
     PULL,
@@ -71,10 +74,12 @@ from langgraph.managed.shared_value import SharedValue
 from langgraph.prebuilt.chat_agent_executor import create_tool_calling_executor
 from langgraph.prebuilt.tool_node import ToolNode
 from langgraph.pregel import Channel, GraphRecursionError, Pregel, StateSnapshot
+from langgraph.pregel.messages import StreamMessagesHandler
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.store.base import BaseStore
 from langgraph.store.memory import InMemoryStore
 from langgraph.types import (
+    CachePolicy,
     Command,
     Interrupt,
     PregelTask,
@@ -642,6 +647,64 @@ def test_invoke_single_process_in_dict_out_dict(mocker: MockerFixture) -> None:
     assert app.invoke({"input": 2}) == {"output": 3}
 
 
+def test_invoke_skip_callbacks() -> None:
+    seen: list[bool] = []
+
+    def add_one(x: int, config: RunnableConfig) -> int:
+        seen.append(config["configurable"][CONFIG_KEY_SKIP_CALLBACKS])
+        return x + 1
+
+    chain = Channel.subscribe_to("input") | add_one | Channel.write_to("output")
+
+    app = Pregel(
+        nodes={"one": chain},
+        channels={"input": LastValue(int), "output": LastValue(int)},
+        input_channels="input",
+        output_channels="output",
+    )
+    # no handlers to call, tasks run without callback managers
+    assert app.invoke(2) == 3
+    assert seen == [True]
+
+    tracer = FakeTracer()
+    assert app.invoke(2, {"callbacks": [tracer]}) == 3
+    assert seen == [True, False]
+    assert [r.name for r in tracer.runs[0].child_runs] == ["one"]
+    assert [r.name for r in tracer.runs[0].child_runs[0].child_runs] == [
+        "add_one",
+        "ChannelWrite<output>",
+    ]
+
+    # tracing can be forced either way
+    app.trace_tasks = True
+    assert app.invoke(2) == 3
+    app.trace_tasks = False
+    tracer = FakeTracer()
+    assert app.invoke(2, {"callbacks": [tracer]}) == 3
+    assert seen == [True, False, False, True]
+    assert tracer.runs[0].child_runs == []
+
+
+def test_invoke_skip_callbacks_context() -> None:
+    var: ContextVar[str] = ContextVar("var", default="unset")
+
+    class State(TypedDict):
+        my_key: str
+
+    def set_var(state: State) -> State:
+        var.set("leaked")
+        return {"my_key": "done"}
+
+    builder = StateGraph(State)
+    builder.add_node("set_var", set_var)
+    builder.add_edge(START, "set_var")
+    app = builder.compile()
+
+    # context vars set by nodes don't leak to the caller without callbacks
+    assert app.invoke({"my_key": ""}) == {"my_key": "done"}
+    assert var.get() == "unset"
+
+
 def test_invoke_two_processes_in_out(mocker: MockerFixture) -> None:
     add_one = mocker.Mock(side_effect=lambda x: x + 1)
     one = Channel.subscribe_to("input") | add_one | Channel.write_to("inbox")
@@ -3171,6 +3234,89 @@ def test_invoke_checkpoint_three(
     assert app.get_state(thread_1) == app.get_state(thread_1_next_config)
 
 
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_get_state_history_pages(
+    mocker: MockerFixture, request: pytest.FixtureRequest, checkpointer_name: str
+) -> None:
+    checkpointer = request.getfixturevalue(f"checkpointer_{checkpointer_name}")
+    mocker.patch("langgraph.pregel.HISTORY_PAGE_SIZE", 2)
+
+    app = Pregel(
+        nodes={
+            "one": Channel.subscribe_to("input") | Channel.write_to("output"),
+        },
+        channels={"input": LastValue(int), "output": LastValue(int)},
+        input_channels="input",
+        output_channels="output",
+        checkpointer=checkpointer,
+    )
+    thread_1 = {"configurable": {"thread_id": "1"}}
+    for i in range(3):
+        assert app.invoke(i, thread_1) == i
+
+    list_spy = mocker.spy(checkpointer, "list")
+    history = list(app.get_state_history(thread_1))
+    # each run saves an input and a loop checkpoint, fetched two at a time
+    assert len(history) == 6
+    assert list_spy.call_count == 4
+    assert [s.values.get("output") for s in history] == [2, 1, 1, 0, 0, None]
+    assert [s.next for s in history] == [(), ("one",)] * 3
+    assert [t.name for s in history for t in s.tasks] == ["one"] * 3
+    assert len({s.config["configurable"]["checkpoint_id"] for s in history}) == 6
+
+    # snapshots are only prepared as they are consumed
+    list_spy.reset_mock()
+    assert next(app.get_state_history(thread_1)) == history[0]
+    assert list_spy.call_count == 1
+
+    # limit and before are respected across pages
+    assert list(app.get_state_history(thread_1, limit=3)) == history[:3]
+    assert (
+        list(app.get_state_history(thread_1, limit=3, before=history[1].config))
+        == history[2:5]
+    )
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_get_states(
+    mocker: MockerFixture, request: pytest.FixtureRequest, checkpointer_name: str
+) -> None:
+    checkpointer = request.getfixturevalue(f"checkpointer_{checkpointer_name}")
+
+    class State(TypedDict):
+        value: Annotated[int, operator.add]
+
+    def node(state: State) -> State:
+        return {"value": 1}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node)
+    builder.add_edge(START, "node")
+    graph = builder.compile(checkpointer=checkpointer, interrupt_before=["node"])
+
+    configs: list = [{"configurable": {"thread_id": str(i)}} for i in range(3)]
+    for i, config in enumerate(configs):
+        graph.invoke({"value": i}, config)
+    graph.invoke(None, configs[1])
+
+    get_tuples = mocker.spy(checkpointer, "get_tuples")
+    states = graph.get_states([*configs, {"configurable": {"thread_id": "missing"}}])
+    assert get_tuples.call_count == 1
+    assert states == [
+        *(graph.get_state(config) for config in configs),
+        graph.get_state({"configurable": {"thread_id": "missing"}}),
+    ]
+    assert [s.values for s in states] == [{"value": 0}, {"value": 2}, {"value": 2}, {}]
+    assert [s.next for s in states] == [("node",), (), ("node",), ()]
+
+    # configs pointing at a specific checkpoint are supported too
+    history = list(graph.get_state_history(configs[1]))
+    assert graph.get_states([history[1].config, configs[0]]) == [
+        history[1],
+        states[0],
+    ]
+
+
 def test_invoke_two_processes_two_in_join_two_out(mocker: MockerFixture) -> None:
     add_one = mocker.Mock(side_effect=lambda x: x + 1)
     add_10_each = mocker.Mock(side_effect=lambda x: sorted(y + 10 for y in x))
@@ -10912,6 +11058,109 @@ def test_stream_buffering_single_node(
     ]
 
 
+def test_stream_buffer_size() -> None:
+    class State(TypedDict):
+        my_key: Annotated[str, operator.add]
+
+    produced: list[int] = []
+
+    def node(state: State, writer: StreamWriter):
+        for i in range(20):
+            writer(i)
+            produced.append(i)
+        return {"my_key": "done"}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node)
+    builder.add_edge(START, "node")
+    graph = builder.compile().copy(update={"stream_buffer_size": 3})
+
+    # the node waits for the slow consumer
+    chunks = []
+    for c in graph.stream({"my_key": ""}, stream_mode="custom"):
+        time.sleep(0.01)
+        assert len(produced) <= c + 4
+        chunks.append(c)
+    assert chunks == list(range(20))
+
+    # or the oldest output is dropped
+    graph = graph.copy(update={"stream_overflow": "drop_oldest"})
+    produced.clear()
+    chunks = []
+    for c in graph.stream({"my_key": ""}, stream_mode=["custom", "updates"]):
+        if not chunks:
+            time.sleep(0.2)
+        chunks.append(c)
+    assert len(chunks) < 21
+    assert chunks[-2:] == [("custom", 19), ("updates", {"node": {"my_key": "done"}})]
+
+
+def test_stream_messages_coalesce() -> None:
+    from langchain_core.messages import AIMessage, AIMessageChunk
+
+    model = FakeChatModel(messages=[AIMessage(content="a b c d")])
+
+    def call_model(state: MessagesState):
+        return {"messages": model.invoke(state["messages"])}
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("call_model", call_model)
+    builder.add_edge(START, "call_model")
+    graph = builder.compile()
+
+    def stream(**update: Any) -> list[tuple[str, dict[str, Any]]]:
+        return [
+            (m.content, meta)
+            for m, meta in graph.copy(update=update).stream(
+                {"messages": []}, stream_mode="messages"
+            )
+        ]
+
+    metadata = {
+        "langgraph_step": 1,
+        "langgraph_node": "call_model",
+        "langgraph_triggers": ["start:call_model"],
+        "langgraph_path": (PULL, "call_model"),
+        "langgraph_checkpoint_ns": AnyStr("call_model:"),
+        "checkpoint_ns": AnyStr("call_model:"),
+        "ls_provider": "fakechatmodel",
+        "ls_model_type": "chat",
+    }
+    assert stream() == [(c, metadata) for c in ["a", " ", "b", " ", "c", " ", "d"]]
+    # token chunks are merged, the remainder is flushed when the model ends
+    assert stream(stream_messages_flush_tokens=3) == [
+        ("a b", metadata),
+        (" c ", metadata),
+        ("d", metadata),
+    ]
+    assert [c for c, _ in stream(stream_messages_flush_interval=10)] == ["a b c d"]
+
+    # only the first output of a run carries the full metadata
+    chunks = stream(stream_messages_flush_tokens=3, stream_messages_metadata="ref")
+    run_id = chunks[0][1]["langgraph_run_id"]
+    assert chunks[0] == ("a b", {**metadata, "langgraph_run_id": run_id})
+    assert chunks[1:] == [
+        (" c ", {"langgraph_run_id": run_id}),
+        ("d", {"langgraph_run_id": run_id}),
+    ]
+
+    # and the ids of messages already output are bounded
+    output: list = []
+    handler = StreamMessagesHandler(output.append, max_seen=2)
+    run_id = uuid.uuid4()
+    handler.on_chain_start(
+        {},
+        {},
+        run_id=run_id,
+        metadata={"langgraph_node": "node", "langgraph_checkpoint_ns": "node:1"},
+        name="node",
+    )
+    messages = [AIMessageChunk(content=str(i), id=str(i)) for i in range(3)]
+    handler.on_chain_end({"messages": messages}, run_id=run_id)
+    assert list(handler.seen) == ["1", "2"]
+    assert len(output) == 3
+
+
 @pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
 def test_nested_graph_interrupts_parallel(
     request: pytest.FixtureRequest, checkpointer_name: str
@@ -14819,3 +15068,66 @@ def test_interrupt_loop(request: pytest.FixtureRequest, checkpointer_name: str):
     assert [event for event in graph.stream(Command(resume="19"), thread1)] == [
         {"node": {"age": 19}},
     ]
+
+
+def test_node_cache() -> None:
+    call_count = 0
+
+    class State(TypedDict):
+        x: int
+        results: Annotated[list[int], operator.add]
+
+    def double(state: State) -> dict:
+        nonlocal call_count
+        call_count += 1
+        return {"results": [state["x"] * 2]}
+
+    builder = StateGraph(State)
+    builder.add_node("double", double, cache_policy=CachePolicy(ttl=60))
+    builder.add_edge(START, "double")
+    cache = InMemoryCache()
+    graph = builder.compile(cache=cache)
+
+    assert graph.invoke({"x": 2}) == {"x": 2, "results": [4]}
+    assert call_count == 1
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # same input is served from the cache, and marked as such
+    assert [*graph.stream({"x": 2})] == [
+        {"double": {"results": [4]}, "__metadata__": {"cached": True}},
+    ]
+    assert call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # different input runs the node
+    assert graph.invoke({"x": 3}) == {"x": 3, "results": [6]}
+    assert call_count == 2
+
+    # custom key function
+    builder = StateGraph(State)
+    builder.add_node(
+        "double", double, cache_policy=CachePolicy(key_func=lambda s: "constant")
+    )
+    builder.add_edge(START, "double")
+    graph = builder.compile(cache=InMemoryCache())
+    assert graph.invoke({"x": 2}) == {"x": 2, "results": [4]}
+    assert graph.invoke({"x": 5}) == {"x": 5, "results": [4]}
+    assert call_count == 3
+
+    # expired entries are ignored
+    builder = StateGraph(State)
+    builder.add_node("double", double, cache_policy=CachePolicy(ttl=0))
+    builder.add_edge(START, "double")
+    graph = builder.compile(cache=InMemoryCache())
+    graph.invoke({"x": 2})
+    graph.invoke({"x": 2})
+    assert call_count == 5
+
+
+def test_node_cache_lru() -> None:
+    cache: InMemoryCache = InMemoryCache(maxsize=2)
+    cache.set({(("ns",), str(i)): (i, None) for i in range(3)})
+    assert len(cache) == 2
+    assert cache.get([(("ns",), "0"), (("ns",), "2")]) == {(("ns",), "2"): 2}
+    cache.clear([("ns",)])
+    assert len(cache) == 0
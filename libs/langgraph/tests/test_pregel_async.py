@@ -7,6 +7,7 @@ import sys
 import uuid
 from collections import Counter
 from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import replace
 from time import perf_counter
 from typing import (
@@ -40,6 +41,7 @@ from pydantic import BaseModel
 from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
@@ -72,6 +74,7 @@ from langgraph.pregel.retry import RetryPolicy
 from langgraph.store.base import BaseStore
 from langgraph.store.memory import InMemoryStore
 from langgraph.types import (
+    CachePolicy,
     Command,
     Interrupt,
     PregelTask,
@@ -847,6 +850,73 @@ async def test_node_not_cancelled_on_other_node_interrupted(
         assert awhiles == 1
 
 
+async def test_stream_buffer_size() -> None:
+    class State(TypedDict):
+        my_key: Annotated[str, operator.add]
+
+    produced: list[int] = []
+
+    def sync_node(state: State, writer: StreamWriter):
+        for i in range(20):
+            writer(i)
+            produced.append(i)
+        return {"my_key": "sync"}
+
+    async def async_node(state: State, writer: StreamWriter):
+        # custom chunks of nodes running in the event loop don't wait for room
+        for i in range(20, 30):
+            writer(i)
+        return {"my_key": "async"}
+
+    builder = StateGraph(State)
+    builder.add_node("sync_node", sync_node)
+    builder.add_node("async_node", async_node)
+    builder.add_edge(START, "sync_node")
+    builder.add_edge("sync_node", "async_node")
+    graph = builder.compile().copy(update={"stream_buffer_size": 3})
+
+    chunks = []
+    async for c in graph.astream({"my_key": ""}, stream_mode="custom"):
+        await asyncio.sleep(0.01)
+        if c < 20:
+            assert len(produced) <= c + 4
+        chunks.append(c)
+    assert chunks == list(range(30))
+
+
+async def test_stream_buffer_size_chat_model() -> None:
+    from langchain_core.callbacks import BaseCallbackHandler
+    from langchain_core.messages import AIMessage
+
+    produced: list[str] = []
+
+    class TokenCounter(BaseCallbackHandler):
+        def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+            produced.append(token)
+
+    model = FakeChatModel(messages=[AIMessage(" ".join(map(str, range(20))))])
+
+    async def call_model(state: MessagesState):
+        return {"messages": await model.ainvoke(state["messages"])}
+
+    builder = StateGraph(MessagesState)
+    builder.add_node(call_model)
+    builder.add_edge(START, "call_model")
+    graph = builder.compile().copy(update={"stream_buffer_size": 3})
+
+    # async models wait for room after each token
+    tokens = []
+    async for msg, _ in graph.astream(
+        {"messages": "hi"},
+        {"callbacks": [TokenCounter()]},
+        stream_mode="messages",
+    ):
+        await asyncio.sleep(0.01)
+        tokens.append(msg.content)
+        assert len(produced) <= len(tokens) + 4
+    assert "".join(tokens) == " ".join(map(str, range(20)))
+
+
 async def test_step_timeout_on_stream_hang() -> None:
     inner_task_cancelled = False
 
@@ -1265,6 +1335,26 @@ async def test_invoke_single_process_in_dict_out_dict(mocker: MockerFixture) ->
     assert await app.ainvoke({"input": 2}) == {"output": 3}
 
 
+async def test_invoke_skip_callbacks_context() -> None:
+    var: ContextVar[str] = ContextVar("var", default="unset")
+
+    class State(TypedDict):
+        my_key: str
+
+    async def set_var(state: State) -> State:
+        var.set("leaked")
+        return {"my_key": "done"}
+
+    builder = StateGraph(State)
+    builder.add_node("set_var", set_var)
+    builder.add_edge(START, "set_var")
+    app = builder.compile()
+
+    # context vars set by nodes don't leak to the caller without callbacks
+    assert await app.ainvoke({"my_key": ""}) == {"my_key": "done"}
+    assert var.get() == "unset"
+
+
 async def test_invoke_two_processes_in_out(mocker: MockerFixture) -> None:
     add_one = mocker.Mock(side_effect=lambda x: x + 1)
     one = Channel.subscribe_to("input") | add_one | Channel.write_to("inbox")
@@ -3958,6 +4048,51 @@ async def test_invoke_checkpoint_three(
         )
 
 
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_ASYNC)
+async def test_aget_states(mocker: MockerFixture, checkpointer_name: str) -> None:
+    class State(TypedDict):
+        value: Annotated[int, operator.add]
+
+    async def node(state: State) -> State:
+        return {"value": 1}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node)
+    builder.add_edge(START, "node")
+
+    async with awith_checkpointer(checkpointer_name) as checkpointer:
+        graph = builder.compile(checkpointer=checkpointer, interrupt_before=["node"])
+
+        configs: list = [{"configurable": {"thread_id": str(i)}} for i in range(3)]
+        for i, config in enumerate(configs):
+            await graph.ainvoke({"value": i}, config)
+        await graph.ainvoke(None, configs[1])
+
+        aget_tuples = mocker.spy(checkpointer, "aget_tuples")
+        states = await graph.aget_states(
+            [*configs, {"configurable": {"thread_id": "missing"}}]
+        )
+        assert aget_tuples.call_count == 1
+        assert states == [
+            *[await graph.aget_state(config) for config in configs],
+            await graph.aget_state({"configurable": {"thread_id": "missing"}}),
+        ]
+        assert [s.values for s in states] == [
+            {"value": 0},
+            {"value": 2},
+            {"value": 2},
+            {},
+        ]
+        assert [s.next for s in states] == [("node",), (), ("node",), ()]
+
+        # configs pointing at a specific checkpoint are supported too
+        history = [c async for c in graph.aget_state_history(configs[1])]
+        assert await graph.aget_states([history[1].config, configs[0]]) == [
+            history[1],
+            states[0],
+        ]
+
+
 async def test_invoke_two_processes_two_in_join_two_out(mocker: MockerFixture) -> None:
     add_one = mocker.Mock(side_effect=lambda x: x + 1)
     add_10_each = mocker.Mock(side_effect=lambda x: sorted(y + 10 for y in x))
@@ -13050,3 +13185,37 @@ async def test_interrupt_loop(checkpointer_name: str):
         ] == [
             {"node": {"age": 19}},
         ]
+
+
+async def test_node_cache() -> None:
+    call_count = 0
+
+    class State(TypedDict):
+        x: int
+        results: Annotated[list[int], operator.add]
+
+    async def double(state: State) -> dict:
+        nonlocal call_count
+        call_count += 1
+        return {"results": [state["x"] * 2]}
+
+    builder = StateGraph(State)
+    builder.add_node("double", double, cache_policy=CachePolicy(ttl=60))
+    builder.add_edge(START, "double")
+    cache = InMemoryCache()
+    graph = builder.compile(cache=cache)
+
+    assert await graph.ainvoke({"x": 2}) == {"x": 2, "results": [4]}
+    assert call_count == 1
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # same input is served from the cache, and marked as such
+    assert [c async for c in graph.astream({"x": 2})] == [
+        {"double": {"results": [4]}, "__metadata__": {"cached": True}},
+    ]
+    assert call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # different input runs the node
+    assert await graph.ainvoke({"x": 3}) == {"x": 3, "results": [6]}
+    assert call_count == 2
@@ -1,5 +1,7 @@
 import functools
 import sys
+import threading
+import time
 import uuid
 from typing import (
     Any,
@@ -17,11 +19,20 @@ from unittest.mock import patch
 
 import langsmith
 import pytest
+from langchain_core.messages import AIMessageChunk
 from typing_extensions import Annotated, NotRequired, Required
 
 from langgraph.graph import END, StateGraph
 from langgraph.graph.graph import CompiledGraph
+from langgraph.pregel.utils import coalesce_chunks, is_droppable_chunk
+from langgraph.utils.config import (
+    ensure_config,
+    layer_config,
+    merge_configs,
+    patch_config,
+)
 from langgraph.utils.fields import _is_optional_type, get_field_default
+from langgraph.utils.queue import SyncQueue
 from langgraph.utils.runnable import is_async_callable, is_async_generator
 
 pytestmark = pytest.mark.anyio
@@ -227,3 +238,97 @@ def test_is_required():
     assert get_field_default("val_12", gcannos["val_12"], MyGrandChildDict) is None
     assert get_field_default("val_9", gcannos["val_9"], MyGrandChildDict) is None
     assert get_field_default("val_13", gcannos["val_13"], MyGrandChildDict) == ...
+
+
+def test_sync_queue_bounded() -> None:
+    # the consuming thread never waits for room
+    q = SyncQueue(2)
+    for i in range(3):
+        q.put(i)
+    assert q.qsize() == 3
+
+    # other threads wait for the consumer to make room
+    q = SyncQueue(2)
+    t = threading.Thread(target=lambda: [q.put(i) for i in range(5)])
+    t.start()
+    received = []
+    while len(received) < 5:
+        time.sleep(0.01)
+        assert q.qsize() <= 2
+        received.append(q.get())
+    t.join()
+    assert received == [0, 1, 2, 3, 4]
+
+    # closing the queue wakes up producers waiting for room
+    q = SyncQueue(1)
+    q._consumer = None
+    t = threading.Thread(target=lambda: [q.put(i) for i in range(3)])
+    t.start()
+    time.sleep(0.05)
+    assert t.is_alive()
+    q.close()
+    t.join(timeout=1)
+    assert not t.is_alive()
+    assert q.qsize() == 3
+
+
+def test_sync_queue_overflow() -> None:
+    q = SyncQueue(2, overflow="drop_oldest", droppable=is_droppable_chunk)
+    q.put(((), "values", 1))
+    q.put(((), "custom", 2))
+    q.put(((), "custom", 3))
+    q.put(((), "custom", 4))
+    assert [q.get() for _ in range(q.qsize())] == [
+        ((), "values", 1),
+        ((), "custom", 4),
+    ]
+
+    q = SyncQueue(1, overflow="coalesce", merge=coalesce_chunks)
+    meta = {"langgraph_node": "a"}
+    for content in ("a", "b", "c"):
+        q.put(((), "messages", (AIMessageChunk(content, id="1"), meta)))
+    q.put(((), "messages", (AIMessageChunk("d", id="2"), meta)))
+    assert q.qsize() == 2
+    assert q.get() == ((), "messages", (AIMessageChunk("abc", id="1"), meta))
+    assert q.get() == ((), "messages", (AIMessageChunk("d", id="2"), meta))
+
+
+def test_layer_config() -> None:
+    parent = ensure_config(
+        {
+            "configurable": {"thread_id": "1", "checkpoint_ns": ""},
+            "metadata": {"source": "test"},
+            "tags": ["parent"],
+            "run_name": "parent",
+            "run_id": uuid.uuid4(),
+            "recursion_limit": 10,
+        }
+    )
+    kwargs = {
+        "run_name": "child",
+        "callbacks": [],
+        "configurable": {"checkpoint_ns": "child", "task_id": "2"},
+    }
+    child = layer_config(parent, metadata={"node": "a"}, tags=["child"], **kwargs)
+    assert child == patch_config(
+        merge_configs(parent, {"metadata": {"node": "a"}, "tags": ["child"]}),
+        **kwargs,
+    )
+    assert child["configurable"]["thread_id"] == "1"
+    assert child["configurable"]["checkpoint_ns"] == "child"
+    assert child["metadata"]["source"] == "test"
+    assert child["tags"] == ["parent", "child"]
+    assert "run_id" not in child
+
+    # writes to the child only modify its own layer
+    child["configurable"]["thread_id"] = "3"
+    child["metadata"]["source"] = "child"
+    assert parent["configurable"]["thread_id"] == "1"
+    assert parent["metadata"]["source"] == "test"
+
+    # layers are flattened, rather than nested once per generation
+    grandchild = layer_config(child, configurable={"task_id": "4"})
+    assert len(grandchild["configurable"].maps) == 3
+    assert grandchild["configurable"]["thread_id"] == "3"
+    assert grandchild["configurable"]["task_id"] == "4"
+    assert grandchild["metadata"] is child["metadata"]
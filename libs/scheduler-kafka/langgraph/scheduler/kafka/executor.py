@@ -1,5 +1,6 @@
 import asyncio
 import concurrent.futures
+import threading
 from contextlib import (
     AbstractAsyncContextManager,
     AbstractContextManager,
@@ -7,7 +8,7 @@ from contextlib import (
     ExitStack,
 )
 from functools import partial
-from typing import Any, Optional, Sequence
+from typing import Any, NamedTuple, Optional, Sequence
 from uuid import UUID
 
 import orjson
@@ -15,8 +16,11 @@ from langchain_core.runnables import RunnableConfig
 from typing_extensions import Self
 
 import langgraph.scheduler.kafka.serde as serde
+from langgraph.channels.base import BaseChannel
+from langgraph.checkpoint.base import BaseCheckpointSaver, CheckpointTuple
 from langgraph.constants import CONFIG_KEY_DELEGATE, ERROR, NS_END, NS_SEP
 from langgraph.errors import CheckpointNotLatest, GraphDelegate, TaskNotFound
+from langgraph.managed.base import ManagedValueSpec
 from langgraph.pregel import Pregel
 from langgraph.pregel.algo import prepare_single_task
 from langgraph.pregel.executor import (
@@ -24,7 +28,11 @@ from langgraph.pregel.executor import (
     BackgroundExecutor,
     Submit,
 )
-from langgraph.pregel.manager import AsyncChannelsManager, ChannelsManager
+from langgraph.pregel.manager import (
+    AsyncChannelsManager,
+    ChannelsManager,
+    LazyChannels,
+)
 from langgraph.pregel.runner import PregelRunner
 from langgraph.scheduler.kafka.retry import aretry, retry
 from langgraph.scheduler.kafka.types import (
@@ -42,6 +50,103 @@ from langgraph.types import LoopProtocol, PregelExecutableTask, RetryPolicy
 from langgraph.utils.config import patch_configurable
 
 
+class CheckpointRead(NamedTuple):
+    """The latest checkpoint of a thread and namespace, with its channels."""
+
+    saved: CheckpointTuple
+    channels: LazyChannels
+
+
+def _read_key(config: RunnableConfig) -> tuple[str, str, str]:
+    configurable = config["configurable"]
+    return (
+        configurable["thread_id"],
+        configurable.get("checkpoint_ns", ""),
+        configurable["checkpoint_id"],
+    )
+
+
+def _read_channels(graph: Pregel, saved: CheckpointTuple) -> LazyChannels:
+    return LazyChannels(
+        {k: v for k, v in graph.channels.items() if isinstance(v, BaseChannel)},
+        saved.checkpoint["channel_values"],
+    )
+
+
+def _managed_specs(graph: Pregel) -> dict[str, ManagedValueSpec]:
+    return {k: v for k, v in graph.channels.items() if not isinstance(v, BaseChannel)}
+
+
+class AsyncCheckpointReads:
+    """Checkpoints read for a batch of messages. Each checkpoint is read once, and
+    its channels are shared by the tasks of the batch, which only read them.
+    Managed values are entered by each task, with its own config.
+    A failed read is attempted again by the next task asking for it."""
+
+    def __init__(self, checkpointer: BaseCheckpointSaver) -> None:
+        self.checkpointer = checkpointer
+        self.reads: dict[tuple[str, str, str], asyncio.Future[CheckpointRead]] = {}
+
+    async def get(self, graph: Pregel, config: RunnableConfig) -> CheckpointRead:
+        key = _read_key(config)
+        fut = self.reads.get(key)
+        if fut is None or (fut.done() and fut.exception() is not None):
+            fut = self.reads[key] = asyncio.ensure_future(self._read(graph, config))
+        # don't cancel the read shared with other tasks if this one is cancelled
+        return await asyncio.shield(fut)
+
+    async def _read(self, graph: Pregel, config: RunnableConfig) -> CheckpointRead:
+        saved = await self.checkpointer.aget_tuple(
+            patch_configurable(config, {"checkpoint_id": None})
+        )
+        if saved is None:
+            raise RuntimeError("Checkpoint not found")
+        if saved.checkpoint["id"] != config["configurable"]["checkpoint_id"]:
+            raise CheckpointNotLatest()
+        return CheckpointRead(saved, _read_channels(graph, saved))
+
+
+class CheckpointReads:
+    """Checkpoints read for a batch of messages. Each checkpoint is read once, and
+    its channels are shared by the tasks of the batch, which only read them.
+    Managed values are entered by each task, with its own config.
+    A failed read is attempted again by the next task asking for it."""
+
+    def __init__(self, checkpointer: BaseCheckpointSaver) -> None:
+        self.checkpointer = checkpointer
+        self.lock = threading.Lock()
+        self.reads: dict[
+            tuple[str, str, str], concurrent.futures.Future[CheckpointRead]
+        ] = {}
+
+    def get(self, graph: Pregel, config: RunnableConfig) -> CheckpointRead:
+        key = _read_key(config)
+        with self.lock:
+            fut = self.reads.get(key)
+            if fut is None or (fut.done() and fut.exception() is not None):
+                fut = self.reads[key] = concurrent.futures.Future()
+                owner = True
+            else:
+                owner = False
+        if owner:
+            # read in this thread, while other tasks wait for the result
+            try:
+                fut.set_result(self._read(graph, config))
+            except BaseException as exc:
+                fut.set_exception(exc)
+        return fut.result()
+
+    def _read(self, graph: Pregel, config: RunnableConfig) -> CheckpointRead:
+        saved = self.checkpointer.get_tuple(
+            patch_configurable(config, {"checkpoint_id": None})
+        )
+        if saved is None:
+            raise RuntimeError("Checkpoint not found")
+        if saved.checkpoint["id"] != config["configurable"]["checkpoint_id"]:
+            raise CheckpointNotLatest()
+        return CheckpointRead(saved, _read_channels(graph, saved))
+
+
 class AsyncKafkaExecutor(AbstractAsyncContextManager):
     consumer: AsyncConsumer
 
@@ -112,16 +217,17 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
         msgs: list[MessageToExecutor] = [
             serde.loads(msg.value) for msgs in recs.values() for msg in msgs
         ]
-        # process batch
-        await asyncio.gather(*(self.each(msg) for msg in msgs))
+        # process batch, reading each checkpoint once
+        reads = AsyncCheckpointReads(self.graph.checkpointer)
+        await asyncio.gather(*(self.each(msg, reads) for msg in msgs))
         # commit offsets
         await self.consumer.commit()
         # return message
         return msgs
 
-    async def each(self, msg: MessageToExecutor) -> None:
+    async def each(self, msg: MessageToExecutor, reads: AsyncCheckpointReads) -> None:
         try:
-            await aretry(self.retry_policy, self.attempt, msg)
+            await aretry(self.retry_policy, self.attempt, msg, reads)
         except CheckpointNotLatest:
             pass
         except GraphDelegate as exc:
@@ -161,7 +267,9 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
             )
             await fut
 
-    async def attempt(self, msg: MessageToExecutor) -> None:
+    async def attempt(
+        self, msg: MessageToExecutor, reads: AsyncCheckpointReads
+    ) -> None:
         # find graph
         if checkpoint_ns := msg["config"]["configurable"].get("checkpoint_ns"):
             # remove task_ids from checkpoint_ns
@@ -176,15 +284,9 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
         else:
             graph = self.graph
         # process message
-        saved = await self.graph.checkpointer.aget_tuple(
-            patch_configurable(msg["config"], {"checkpoint_id": None})
-        )
-        if saved is None:
-            raise RuntimeError("Checkpoint not found")
-        if saved.checkpoint["id"] != msg["config"]["configurable"]["checkpoint_id"]:
-            raise CheckpointNotLatest()
+        saved, channels = await reads.get(graph, msg["config"])
         async with AsyncChannelsManager(
-            graph.channels,
+            _managed_specs(graph),
             saved.checkpoint,
             LoopProtocol(
                 config=msg["config"],
@@ -192,7 +294,7 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
                 step=saved.metadata["step"] + 1,
                 stop=saved.metadata["step"] + 2,
             ),
-        ) as (channels, managed), AsyncBackgroundExecutor(msg["config"]) as submit:
+        ) as (_, managed), AsyncBackgroundExecutor(msg["config"]) as submit:
             if task := await asyncio.to_thread(
                 prepare_single_task,
                 msg["task"]["path"],
@@ -325,16 +427,17 @@ class KafkaExecutor(AbstractContextManager):
         msgs: list[MessageToExecutor] = [
             serde.loads(msg.value) for msgs in recs.values() for msg in msgs
         ]
-        # process batch
-        concurrent.futures.wait(self.submit(self.each, msg) for msg in msgs)
+        # process batch, reading each checkpoint once
+        reads = CheckpointReads(self.graph.checkpointer)
+        concurrent.futures.wait(self.submit(self.each, msg, reads) for msg in msgs)
         # commit offsets
         self.consumer.commit()
         # return message
         return msgs
 
-    def each(self, msg: MessageToExecutor) -> None:
+    def each(self, msg: MessageToExecutor, reads: CheckpointReads) -> None:
         try:
-            retry(self.retry_policy, self.attempt, msg)
+            retry(self.retry_policy, self.attempt, msg, reads)
         except CheckpointNotLatest:
             pass
         except GraphDelegate as exc:
@@ -374,7 +477,7 @@ class KafkaExecutor(AbstractContextManager):
             )
             fut.result()
 
-    def attempt(self, msg: MessageToExecutor) -> None:
+    def attempt(self, msg: MessageToExecutor, reads: CheckpointReads) -> None:
         # find graph
         if checkpoint_ns := msg["config"]["configurable"].get("checkpoint_ns"):
             # remove task_ids from checkpoint_ns
@@ -389,15 +492,9 @@ class KafkaExecutor(AbstractContextManager):
         else:
             graph = self.graph
         # process message
-        saved = self.graph.checkpointer.get_tuple(
-            patch_configurable(msg["config"], {"checkpoint_id": None})
-        )
-        if saved is None:
-            raise RuntimeError("Checkpoint not found")
-        if saved.checkpoint["id"] != msg["config"]["configurable"]["checkpoint_id"]:
-            raise CheckpointNotLatest()
+        saved, channels = reads.get(graph, msg["config"])
         with ChannelsManager(
-            graph.channels,
+            _managed_specs(graph),
             saved.checkpoint,
             LoopProtocol(
                 config=msg["config"],
@@ -405,7 +502,7 @@ class KafkaExecutor(AbstractContextManager):
                 step=saved.metadata["step"] + 1,
                 stop=saved.metadata["step"] + 2,
             ),
-        ) as (channels, managed), BackgroundExecutor({}) as submit:
+        ) as (_, managed), BackgroundExecutor({}) as submit:
             if task := prepare_single_task(
                 msg["task"]["path"],
                 msg["task"]["id"],
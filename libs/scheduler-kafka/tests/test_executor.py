@@ -0,0 +1,83 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypedDict
+
+import pytest
+from langchain_core.runnables import RunnableConfig
+from pytest_mock import MockerFixture
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.constants import START
+from langgraph.errors import CheckpointNotLatest
+from langgraph.graph.state import CompiledStateGraph, StateGraph
+from langgraph.scheduler.kafka.executor import AsyncCheckpointReads, CheckpointReads
+
+
+class State(TypedDict):
+    x: int
+
+
+def mk_graph() -> tuple[CompiledStateGraph, MemorySaver, RunnableConfig]:
+    builder = StateGraph(State)
+    builder.add_node("n", lambda state: {"x": state["x"] + 1})
+    builder.add_edge(START, "n")
+    checkpointer = MemorySaver()
+    graph = builder.compile(checkpointer=checkpointer)
+    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
+    graph.invoke({"x": 1}, config)
+    saved = checkpointer.get_tuple(config)
+    assert saved is not None
+    return graph, checkpointer, saved.config
+
+
+def test_checkpoint_reads(mocker: MockerFixture) -> None:
+    graph, checkpointer, latest = mk_graph()
+    get_tuple = mocker.spy(checkpointer, "get_tuple")
+    reads = CheckpointReads(checkpointer)
+
+    # concurrent tasks of the batch share a single read
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: reads.get(graph, latest), range(20)))
+    assert get_tuple.call_count == 1
+    assert all(r is results[0] for r in results)
+    assert results[0].channels["x"].get() == 2
+
+    # failed reads are not cached, each attempt reads again
+    stale: RunnableConfig = {
+        "configurable": {**latest["configurable"], "checkpoint_id": "stale"}
+    }
+    for _ in range(2):
+        with pytest.raises(CheckpointNotLatest):
+            reads.get(graph, stale)
+    assert get_tuple.call_count == 3
+
+    saved = checkpointer.get_tuple(latest)
+    mocker.patch.object(
+        checkpointer, "get_tuple", side_effect=[ConnectionError("down"), saved]
+    )
+    reads = CheckpointReads(checkpointer)
+    with pytest.raises(ConnectionError):
+        reads.get(graph, latest)
+    assert reads.get(graph, latest).saved == saved
+
+
+@pytest.mark.anyio
+async def test_async_checkpoint_reads(mocker: MockerFixture) -> None:
+    graph, checkpointer, latest = mk_graph()
+    aget_tuple = mocker.spy(checkpointer, "aget_tuple")
+    reads = AsyncCheckpointReads(checkpointer)
+
+    # concurrent tasks of the batch share a single read
+    results = await asyncio.gather(*(reads.get(graph, latest) for _ in range(20)))
+    assert aget_tuple.call_count == 1
+    assert all(r is results[0] for r in results)
+    assert results[0].channels["x"].get() == 2
+
+    # failed reads are not cached, each attempt reads again
+    stale: RunnableConfig = {
+        "configurable": {**latest["configurable"], "checkpoint_id": "stale"}
+    }
+    for _ in range(2):
+        with pytest.raises(CheckpointNotLatest):
+            await reads.get(graph, stale)
+    assert aget_tuple.call_count == 3
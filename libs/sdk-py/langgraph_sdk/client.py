@@ -2209,6 +2209,7 @@ class StoreClient:
         limit: int = 10,
         offset: int = 0,
         query: Optional[str] = None,
+        after: Optional[str] = None,
     ) -> SearchItemsResponse:
         """Search for items within a namespace prefix.
 
@@ -2218,6 +2219,8 @@ class StoreClient:
             limit: Maximum number of items to return (default is 10).
             offset: Number of items to skip before returning results (default is 0).
             query: Optional query for natural language search.
+            after: Optional cursor of the last item of the previous page. Only the
+                items following it are returned.
 
         Returns:
             List[Item]: A list of items matching the search criteria.
@@ -2256,6 +2259,7 @@ class StoreClient:
             "limit": limit,
             "offset": offset,
             "query": query,
+            "after": after,
         }
 
         return await self.http.post("/store/items/search", json=_provided_vals(payload))
@@ -4332,6 +4336,7 @@ class SyncStoreClient:
         limit: int = 10,
         offset: int = 0,
         query: Optional[str] = None,
+        after: Optional[str] = None,
     ) -> SearchItemsResponse:
         """Search for items within a namespace prefix.
 
@@ -4341,6 +4346,8 @@ class SyncStoreClient:
             limit: Maximum number of items to return (default is 10).
             offset: Number of items to skip before returning results (default is 0).
             query: Optional query for natural language search.
+            after: Optional cursor of the last item of the previous page. Only the
+                items following it are returned.
 
         Returns:
             List[Item]: A list of items matching the search criteria.
@@ -4379,6 +4386,7 @@ class SyncStoreClient:
             "limit": limit,
             "offset": offset,
             "query": query,
+            "after": after,
         }
         return self.http.post("/store/items/search", json=_provided_vals(payload))
 
@@ -346,9 +346,12 @@ class SearchItem(Item, total=False):
     Attributes:
         score (Optional[float]): Relevance/similarity score. Included when
             searching a compatible store with a natural language query.
+        cursor (str): Opaque token to pass as `after` to fetch the results
+            following this item. Included when supported by the server.
     """
 
     score: Optional[float]
+    cursor: str
 
 
 class SearchItemsResponse(TypedDict):